@@ -0,0 +1,49 @@
+# apps/accounts/authentication.py
+"""
+토큰 클레임만으로 사용자를 복원하는 JWT 인증 (출퇴근처럼 요청이 몰리는 API용)
+
+로그인 시 issue_tokens가 role·employee_id 클레임을 토큰에 넣는다.
+TokenClaimsAuthentication은 이 클레임이 있으면 users 테이블을 조회하지 않고 ClaimsUser를 돌려주며,
+클레임이 없는 이전 토큰은 기본 JWTAuthentication과 같이 DB에서 사용자를 읽는다.
+토큰 갱신(ClaimsTokenRefreshSerializer)은 사용자를 DB에서 다시 읽어 비활성·삭제 계정을 거부하고
+role·employee_id를 현재 값으로 다시 넣는다. 따라서 역할·직원 연결 변경과 계정 비활성화는
+이미 발급된 액세스 토큰이 만료될 때(기본 30분)까지만 늦게 반영된다.
+"""
+from django.utils.functional import cached_property
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.tokens import RefreshToken
+
+CLAIMS = ('role', 'employee_id')
+
+
+def stamp_claims(token, user):
+    """user의 현재 role·employee_id를 token에 넣는다."""
+    for claim in CLAIMS:
+        token[claim] = getattr(user, claim)
+    return token
+
+
+def issue_tokens(user) -> RefreshToken:
+    """리프레시 토큰 (액세스 토큰은 .access_token, 클레임을 그대로 물려받는다)."""
+    return stamp_claims(RefreshToken.for_user(user), user)
+
+
+class ClaimsUser(TokenUser):
+    """토큰 클레임 기반 사용자. DB 행이 없으므로 request.user.employee 등 관계는 쓸 수 없다."""
+
+    @cached_property
+    def role(self) -> str:
+        return self.token['role']
+
+    @cached_property
+    def employee_id(self):
+        return self.token['employee_id']
+
+
+class TokenClaimsAuthentication(JWTAuthentication):
+
+    def get_user(self, validated_token):
+        if all(claim in validated_token for claim in CLAIMS):
+            return ClaimsUser(validated_token)
+        return super().get_user(validated_token)
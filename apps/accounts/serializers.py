@@ -1,7 +1,11 @@
 # apps/accounts/serializers.py
 
 from rest_framework import serializers
+from rest_framework.exceptions import AuthenticationFailed
 from django.contrib.auth import authenticate
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from .authentication import stamp_claims
 from .models import CustomUser
 
 
@@ -28,3 +32,31 @@ class UserInfoSerializer(serializers.ModelSerializer):
     class Meta:
         model  = CustomUser
         fields = ['id', 'username', 'role', 'role_display', 'employee_id']
+
+
+class ClaimsTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    토큰 갱신 (settings.SIMPLE_JWT['TOKEN_REFRESH_SERIALIZER']).
+    기본 serializer는 리프레시 토큰의 클레임을 새 토큰에 그대로 복사하므로, 사용자를 DB에서 다시 읽어
+    비활성·삭제 계정은 거부하고 role·employee_id를 현재 값으로 다시 넣은 뒤 발급한다.
+    """
+
+    def validate(self, attrs):
+        refresh = self.token_class(attrs['refresh'])
+        user = CustomUser.objects.filter(
+            **{api_settings.USER_ID_FIELD: refresh.payload.get(api_settings.USER_ID_CLAIM)}
+        ).first()
+        if user is None or not api_settings.USER_AUTHENTICATION_RULE(user):
+            raise AuthenticationFailed(self.error_messages['no_active_account'], 'no_active_account')
+        stamp_claims(refresh, user)
+
+        data = {'access': str(refresh.access_token)}
+        if api_settings.ROTATE_REFRESH_TOKENS:
+            if api_settings.BLACKLIST_AFTER_ROTATION:
+                refresh.blacklist()
+            refresh.set_jti()
+            refresh.set_exp()
+            refresh.set_iat()
+            refresh.outstand()
+            data['refresh'] = str(refresh)
+        return data
@@ -25,6 +25,13 @@ class LoginTest(APITestCase):
         self.assertIn('access', res.data['data'])
         self.assertIn('refresh', res.data['data'])
 
+    def test_login_token_carries_role_and_employee_claims(self):
+        from rest_framework_simplejwt.tokens import AccessToken
+        res = self.client.post(LOGIN_URL, {'username': 'testuser', 'password': 'testpass123'})
+        token = AccessToken(res.data['data']['access'])
+        self.assertEqual(token['role'], self.user.role)
+        self.assertIsNone(token['employee_id'])
+
     def test_login_wrong_password(self):
         res = self.client.post(LOGIN_URL, {'username': 'testuser', 'password': 'wrong'})
         self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
@@ -84,3 +91,34 @@ class MeTest(APITestCase):
     def test_me_without_auth(self):
         res = self.client.get(ME_URL)
         self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class RefreshTest(APITestCase):
+
+    def setUp(self):
+        self.user = create_user(role='HR_MANAGER')
+        res = self.client.post(LOGIN_URL, {'username': 'testuser', 'password': 'testpass123'})
+        self.refresh = res.data['data']['refresh']
+
+    def test_refresh_restamps_claims_from_db(self):
+        from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+        self.user.role = 'EMPLOYEE'
+        self.user.save()
+        res = self.client.post(REFRESH_URL, {'refresh': self.refresh})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(AccessToken(res.data['access'])['role'], 'EMPLOYEE')
+        # 회전된 리프레시 토큰도 현재 값을 갖는다
+        self.assertEqual(RefreshToken(res.data['refresh'])['role'], 'EMPLOYEE')
+        # 이전 리프레시 토큰은 폐기
+        res = self.client.post(REFRESH_URL, {'refresh': self.refresh})
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_refresh_rejects_inactive_or_deleted_user(self):
+        self.user.is_active = False
+        self.user.save()
+        res = self.client.post(REFRESH_URL, {'refresh': self.refresh})
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+        self.user.delete()
+        res = self.client.post(REFRESH_URL, {'refresh': self.refresh})
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
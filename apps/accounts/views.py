@@ -7,6 +7,7 @@ from rest_framework import status
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.views import TokenRefreshView
 
+from .authentication import issue_tokens
 from .serializers import LoginSerializer, UserInfoSerializer
 
 
@@ -34,7 +35,7 @@ class LoginView(APIView):
             return error_response(str(serializer.errors))
 
         user    = serializer.validated_data['user']
-        refresh = RefreshToken.for_user(user)
+        refresh = issue_tokens(user)
 
         return success_response(data={
             "access" : str(refresh.access_token),
@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from .models import AttendanceRecord, AttendanceLeave
+from .models import AttendanceRecord, AttendanceLeave, MonthlyAttendanceSummary, PunchEvent, PunchFoldWatermark
 
 
 @admin.register(AttendanceRecord)
@@ -16,3 +16,32 @@ class AttendanceLeaveAdmin(admin.ModelAdmin):
     list_display  = ('employee', 'leave_type', 'start_date', 'end_date', 'status', 'approver')
     list_filter   = ('status', 'leave_type')
     search_fields = ('employee__name', 'employee__employee_no')
+
+
+@admin.register(MonthlyAttendanceSummary)
+class MonthlyAttendanceSummaryAdmin(admin.ModelAdmin):
+    list_display  = ('employee', 'year', 'month', 'days_worked', 'work_minutes', 'overtime_minutes', 'last_updated')
+    list_filter   = ('year', 'month')
+    search_fields = ('employee__name', 'employee__employee_no')
+    readonly_fields = ('last_updated',)
+
+
+@admin.register(PunchEvent)
+class PunchEventAdmin(admin.ModelAdmin):
+    """추가 전용: 관리 화면에서도 수정·삭제하지 않는다 (정정은 CORRECTION 이벤트로)."""
+    list_display  = ('id', 'employee', 'work_date', 'timestamp', 'kind', 'source', 'created_at')
+    list_filter   = ('kind', 'source', 'work_date')
+    search_fields = ('employee__name', 'employee__employee_no')
+    raw_id_fields = ('employee',)
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(PunchFoldWatermark)
+class PunchFoldWatermarkAdmin(admin.ModelAdmin):
+    list_display    = ('name', 'last_event_id', 'updated_at')
+    readonly_fields = ('updated_at',)
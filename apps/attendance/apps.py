@@ -5,4 +5,7 @@ class AttendanceConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.attendance'
     label = 'attendance'
-    verbose_name = '근태관리'
\ No newline at end of file
+    verbose_name = '근태관리'
+
+    def ready(self):
+        from . import jobs, signals  # noqa: F401
@@ -0,0 +1,234 @@
+"""
+출퇴근 기록 일괄 적재 (근태 단말기 CSV).
+
+CSV 형식 (헤더 행 필수, 열 순서 무관):
+    employee_no,work_date,check_in,check_out
+    E0001,2024-05-02,08:57,18:12
+    E0002,2024-05-02,2024-05-02 21:58,2024-05-03 07:03
+
+- check_in은 필수, check_out은 비워 둘 수 있다 (출근만 기록).
+- 시각은 HH:MM[:SS](work_date 기준) 또는 날짜를 포함한 ISO 형식이며, 시간대가 없으면 현지 시각으로 본다.
+  HH:MM 형식의 퇴근 시각이 출근 시각보다 이르면 다음 날 퇴근(야간 근무)으로 본다.
+- 근무·초과근무 분은 퇴근 처리와 같은 규칙(AttendanceService.work_minutes)으로 계산한다.
+
+처리 방식
+- 파일은 csv.reader로 한 행씩 읽고, 사번 → 직원 id는 시작할 때 한 번 읽어 둔 dict로 찾는다.
+- chunk_size행마다 트랜잭션 하나에서 (employee, work_date) 기준 bulk_create(update_conflicts=True)로 upsert 하고,
+  같은 트랜잭션에서 기존 행 값과의 차이만큼 월별 근태 요약을 갱신한다 (chunk당 쿼리 4회).
+  행을 모아두지 않으므로 파일 크기와 관계없이 메모리 사용량이 일정하다.
+- 같은 (직원, 근무일)이 여러 번 나오면 뒤의 행이 앞의 행을 덮어쓴다.
+- 잘못된 행은 건너뛰고 (행 번호, 사번, 사유)를 on_error로 넘긴다. 결과에는 앞의 MAX_ERROR_ROWS건만 싣는다.
+"""
+import csv
+import datetime
+import io
+import os
+import uuid
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from apps.employees.models import Employee
+from apps.utils.db import upsert_options
+from .models import AttendanceRecord
+from .services import AttendanceService, MonthlySummaryService
+
+COLUMNS = ('employee_no', 'work_date', 'check_in', 'check_out')
+
+ENCODINGS = {
+    'utf-8': 'utf-8-sig',
+    'cp949': 'cp949',
+}
+
+CHUNK_SIZE = 1000
+
+# 결과에 싣는 오류 행 최대 건수 (전체 건수는 errors)
+MAX_ERROR_ROWS = 1000
+
+UPDATE_FIELDS = ('check_in', 'check_out', 'work_minutes', 'overtime_minutes', 'updated_at')
+
+
+class RowError(ValueError):
+    pass
+
+
+# ── 행 해석 ─────────────────────────────────────────────────────────
+def _date(value: str) -> datetime.date:
+    try:
+        return datetime.date.fromisoformat(value)
+    except ValueError:
+        raise RowError(f'근무일 형식이 올바르지 않습니다: {value}')
+
+
+def _moment(value: str, work_date: datetime.date, label: str) -> tuple:
+    """(aware datetime, 날짜 포함 여부)"""
+    try:
+        if len(value) <= 8:
+            moment, dated = datetime.datetime.combine(work_date, datetime.time.fromisoformat(value)), False
+        else:
+            moment, dated = datetime.datetime.fromisoformat(value), True
+    except ValueError:
+        raise RowError(f'{label} 형식이 올바르지 않습니다: {value}')
+    if timezone.is_naive(moment):
+        moment = timezone.make_aware(moment)
+    return moment, dated
+
+
+def parse_row(row: dict, employees: dict) -> tuple:
+    """CSV 행 dict → (employee_id, work_date, check_in, check_out, work_minutes, overtime_minutes)"""
+    employee_no = (row['employee_no'] or '').strip()
+    if not employee_no:
+        raise RowError('사번이 비어 있습니다.')
+    employee_id = employees.get(employee_no)
+    if employee_id is None:
+        raise RowError(f'존재하지 않는 사번입니다: {employee_no}')
+
+    work_date = _date((row['work_date'] or '').strip())
+    check_in_text = (row['check_in'] or '').strip()
+    if not check_in_text:
+        raise RowError('출근 시각이 비어 있습니다.')
+    check_in, _ = _moment(check_in_text, work_date, '출근 시각')
+
+    check_out_text = (row.get('check_out') or '').strip()
+    if not check_out_text:
+        return employee_id, work_date, check_in, None, 0, 0
+
+    check_out, dated = _moment(check_out_text, work_date, '퇴근 시각')
+    if check_out < check_in and not dated:
+        check_out += datetime.timedelta(days=1)
+    if check_out < check_in:
+        raise RowError('퇴근 시각이 출근 시각보다 이릅니다.')
+    work, overtime = AttendanceService.work_minutes(check_in, check_out)
+    return employee_id, work_date, check_in, check_out, work, overtime
+
+
+# ── 기록 ─────────────────────────────────────────────────────────────
+def write_chunk(rows: dict) -> int:
+    """
+    {(employee_id, work_date): (check_in, check_out, work, overtime)}를 upsert 하고
+    월별 요약에 증감분을 반영한다. 새로 만든 행 수를 반환한다.
+    """
+    by_date = defaultdict(set)
+    for emp_id, work_date in rows:
+        by_date[work_date].add(emp_id)
+    condition = Q()
+    for work_date, emp_ids in by_date.items():
+        condition |= Q(work_date=work_date, employee_id__in=emp_ids)
+
+    with transaction.atomic():
+        # 요약 증감분 계산용 기존 값 (동시 퇴근 처리와 엇갈리지 않도록 잠근다)
+        previous = {
+            (emp_id, work_date): (work, overtime)
+            for emp_id, work_date, work, overtime in (
+                AttendanceRecord.objects.select_for_update().filter(condition)
+                .values_list('employee_id', 'work_date', 'work_minutes', 'overtime_minutes')
+            )
+        }
+        AttendanceRecord.objects.bulk_create(
+            [
+                AttendanceRecord(
+                    employee_id      = emp_id,
+                    work_date        = work_date,
+                    check_in         = check_in,
+                    check_out        = check_out,
+                    work_minutes     = work,
+                    overtime_minutes = overtime,
+                )
+                for (emp_id, work_date), (check_in, check_out, work, overtime) in rows.items()
+            ],
+            **upsert_options(('employee', 'work_date'), UPDATE_FIELDS),
+        )
+
+        deltas = defaultdict(lambda: [0, 0, 0])
+        for (emp_id, work_date), (_, _, work, overtime) in rows.items():
+            old_work, old_overtime = previous.get((emp_id, work_date), (0, 0))
+            delta = deltas[emp_id, work_date.year, work_date.month]
+            delta[0] += work - old_work
+            delta[1] += overtime - old_overtime
+            delta[2] += (emp_id, work_date) not in previous
+        MonthlySummaryService.apply_deltas({key: tuple(value) for key, value in deltas.items()})
+    return len(rows) - len(previous)
+
+
+def import_rows(reader, chunk_size: int = CHUNK_SIZE, on_error=None, on_chunk=None) -> dict:
+    """
+    csv.DictReader의 행을 적재하고 결과 요약을 반환한다.
+    on_error(dict)는 잘못된 행마다, on_chunk(처리 행 수)는 chunk를 기록할 때마다 호출된다.
+    """
+    missing = [c for c in COLUMNS if c != 'check_out' and c not in (reader.fieldnames or ())]
+    if missing:
+        raise ValidationError(f'필수 열이 없습니다: {", ".join(missing)}')
+
+    employees = dict(Employee.objects.values_list('employee_no', 'id'))
+    result = {'rows': 0, 'created': 0, 'updated': 0, 'errors': 0, 'error_rows': []}
+    pending = {}
+
+    def flush():
+        created = write_chunk(pending)
+        result['created'] += created
+        result['updated'] += len(pending) - created
+        pending.clear()
+        if on_chunk is not None:
+            on_chunk(result['rows'])
+
+    try:
+        for row in reader:
+            result['rows'] += 1
+            try:
+                if None in row:
+                    raise RowError('열 개수가 헤더보다 많습니다.')
+                emp_id, work_date, *values = parse_row(row, employees)
+            except RowError as e:
+                error = {'line': reader.line_num, 'employee_no': (row.get('employee_no') or '').strip(),
+                         'error': str(e)}
+                result['errors'] += 1
+                if len(result['error_rows']) < MAX_ERROR_ROWS:
+                    result['error_rows'].append(error)
+                if on_error is not None:
+                    on_error(error)
+                continue
+            # 같은 chunk 안의 중복 키는 upsert 한 번에 두 번 나올 수 없으므로 뒤의 값으로 덮는다
+            pending[emp_id, work_date] = tuple(values)
+            if len(pending) >= chunk_size:
+                flush()
+    except UnicodeDecodeError:
+        raise ValidationError(f'파일 인코딩을 읽을 수 없습니다 ({reader.line_num + 1}행 부근).')
+    if pending:
+        flush()
+    return result
+
+
+def import_file(fileobj, encoding: str = 'utf-8', **options) -> dict:
+    """바이너리 파일 객체(업로드 파일 등)를 스트림으로 읽어 적재한다. 파일은 닫지 않는다."""
+    if encoding not in ENCODINGS:
+        raise ValidationError(f'encoding은 {", ".join(ENCODINGS)} 중 하나여야 합니다.')
+    text = io.TextIOWrapper(fileobj, encoding=ENCODINGS[encoding], newline='')
+    try:
+        return import_rows(csv.DictReader(text), **options)
+    finally:
+        text.detach()
+
+
+# ── 백그라운드 작업용 업로드 보관 ───────────────────────────────────────
+def upload_dir() -> str:
+    return os.path.join(settings.JOB_RESULT_DIR, 'uploads')
+
+
+def save_upload(upload) -> str:
+    """업로드 파일을 작업자가 읽을 수 있는 위치에 chunk 단위로 복사하고 경로를 반환한다."""
+    directory = upload_dir()
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f'attendance_{uuid.uuid4().hex}.csv')
+    with open(path, 'wb') as out:
+        for chunk in upload.chunks():
+            out.write(chunk)
+    return path
+
+
+def is_upload_path(path: str) -> bool:
+    directory = os.path.realpath(upload_dir())
+    return os.path.dirname(os.path.realpath(path)) == directory and os.path.isfile(path)
@@ -0,0 +1,45 @@
+"""
+근태 백그라운드 작업 (apps.jobs 등록부에 등록, AttendanceConfig.ready에서 import)
+
+- attendance_import: {path, encoding}  AttendanceImportView(background=true)가 보관한 CSV를 적재
+  path는 importer.upload_dir() 안의 파일만 허용한다. 파일은 작업이 성공하거나 실패(FAILED, 종료 상태)했을 때만 지운다.
+  작업자가 중단(Ctrl+C·서비스 종료)되면 파일을 남겨 두어 requeue_stale로 다시 대기열에 들어간 작업이 읽을 수 있다.
+"""
+import os
+
+from rest_framework.exceptions import ValidationError
+
+from apps.jobs.registry import register
+from . import importer
+
+
+def validate_import(params: dict) -> dict:
+    path = str(params.get('path') or '')
+    if not path or not importer.is_upload_path(path):
+        raise ValidationError('적재할 업로드 파일이 없습니다.')
+    encoding = params.get('encoding') or 'utf-8'
+    if encoding not in importer.ENCODINGS:
+        raise ValidationError(f'encoding은 {", ".join(importer.ENCODINGS)} 중 하나여야 합니다.')
+    return {'path': path, 'encoding': encoding}
+
+
+@register('attendance_import', validate=validate_import, label='출퇴근 기록 적재')
+def import_attendance(job, progress):
+    """읽은 바이트 비율로 진행률을 보고한다."""
+    path = job.params['path']
+    if not os.path.isfile(path):
+        raise ValidationError('업로드 파일이 없습니다. 파일을 다시 올려주세요.')
+    size = os.path.getsize(path)
+    try:
+        with open(path, 'rb') as f:
+            def on_chunk(rows):
+                if size:
+                    progress(min(f.tell() * 100 // size, 99), f'{rows:,}행 처리')
+
+            result = importer.import_file(f, job.params['encoding'], on_chunk=on_chunk)
+    except Exception:
+        # 실패한 작업은 다시 실행되지 않는다. KeyboardInterrupt·SystemExit(작업자 중단)은 여기서 잡지 않으므로 파일이 남는다
+        os.remove(path)
+        raise
+    os.remove(path)
+    return result
@@ -0,0 +1,125 @@
+"""
+출퇴근 API 부하 측정 (출근 시간대 재현).
+
+    python manage.py bench_check_in                       # 직원 2,000명 출근 → 퇴근
+    python manage.py bench_check_in --employees 5000 --threads 16
+    python manage.py bench_check_in --db-user-tokens      # 클레임 없는 토큰(사용자 DB 조회 경로)
+
+임시 부서·직원·계정을 만들어 실제 URL·인증·권한 경로로 POST 하고, 요청별 지연 시간의
+p50/p99와 요청당 쿼리 수를 출력한다. 측정이 끝나면 만든 데이터와 출퇴근 기록을 모두 지운다.
+--threads > 1은 스레드마다 별도 DB 연결을 쓰므로 MariaDB(또는 파일 SQLite)에서 실행한다.
+"""
+import datetime
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, reset_queries
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.accounts.authentication import issue_tokens
+from apps.attendance.models import AttendanceRecord, MonthlyAttendanceSummary
+from apps.employees.models import Department, Employee, Position
+
+User = get_user_model()
+
+PREFIX = 'BENCHCI'
+
+URLS = {
+    '출근': '/api/v1/attendance/check-in/',
+    '퇴근': '/api/v1/attendance/check-out/',
+}
+
+
+def percentile(values: list, pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+class Command(BaseCommand):
+    help = '출근·퇴근 API의 요청별 지연 시간(p50/p99)과 쿼리 수를 측정합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--employees', type=int, default=2000, help='동시에 출근하는 직원 수 (기본 2000)')
+        parser.add_argument('--threads', type=int, default=1, help='동시 요청 스레드 수 (기본 1)')
+        parser.add_argument('--db-user-tokens', action='store_true',
+                            help='role/employee_id 클레임 없는 토큰으로 요청 (사용자 DB 조회 경로)')
+
+    def handle(self, *args, **options):
+        count, threads = options['employees'], options['threads']
+        if count < 1 or threads < 1:
+            raise CommandError('--employees, --threads는 1 이상이어야 합니다.')
+        if Employee.objects.filter(employee_no__startswith=PREFIX).exists():
+            raise CommandError(f'이전 측정 데이터({PREFIX}*)가 남아 있습니다. 먼저 지워주세요.')
+
+        tokens = self._setup(count, options['db_user_tokens'])
+        try:
+            self.stdout.write(f'직원 {count:,}명, 스레드 {threads}개, '
+                              f'{"DB 사용자" if options["db_user_tokens"] else "토큰 클레임"} 인증, {connection.vendor}')
+            self.stdout.write(f'{"요청":>4}{"p50(ms)":>10}{"p99(ms)":>10}{"최대(ms)":>10}{"쿼리/요청":>10}{"실패":>6}')
+            for label, url in URLS.items():
+                self._run(label, url, tokens, threads)
+        finally:
+            self._cleanup()
+
+    def _setup(self, count: int, db_user_tokens: bool) -> list:
+        dept = Department.objects.create(name=f'{PREFIX} 부서', code=PREFIX)
+        pos  = Position.objects.create(name=f'{PREFIX} 직급', level=99)
+        Employee.objects.bulk_create([
+            Employee(
+                employee_no=f'{PREFIX}{i:06d}', name=f'측정{i}', resident_no='-',
+                department=dept, position=pos, hire_date=datetime.date(2024, 1, 1), base_salary=0,
+            )
+            for i in range(count)
+        ])
+        employees = Employee.objects.filter(employee_no__startswith=PREFIX).order_by('id')
+        User.objects.bulk_create([
+            User(username=f'{PREFIX.lower()}{i:06d}', role='EMPLOYEE', employee=emp, password='!')
+            for i, emp in enumerate(employees)
+        ])
+        users = User.objects.filter(username__startswith=PREFIX.lower()).order_by('id')
+        if db_user_tokens:
+            return [str(RefreshToken.for_user(u).access_token) for u in users]
+        return [str(issue_tokens(u).access_token) for u in users]
+
+    def _run(self, label: str, url: str, tokens: list, threads: int):
+        local = threading.local()
+        # 실제 요청과 같이 ALLOWED_HOSTS 검사를 통과하는 Host로 보낸다
+        host  = next((h.lstrip('.') for h in settings.ALLOWED_HOSTS if h != '*'), 'localhost')
+
+        def request(token):
+            if not hasattr(local, 'client'):
+                local.client = APIClient(HTTP_HOST=host)
+            reset_queries()  # 쿼리 로그는 최대 9,000건이라 요청마다 비운다
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                res = local.client.post(url, HTTP_AUTHORIZATION=f'Bearer {token}')
+                elapsed = (time.perf_counter() - started) * 1000
+            return elapsed, len(queries), res.status_code < 300
+
+        if threads == 1:
+            results = [request(t) for t in tokens]
+        else:
+            with ThreadPoolExecutor(max_workers=threads) as pool:
+                results = list(pool.map(request, tokens))
+        latencies = [r[0] for r in results]
+        self.stdout.write(
+            f'{label:>4}{statistics.median(latencies):>10.2f}{percentile(latencies, 99):>10.2f}'
+            f'{max(latencies):>10.2f}{statistics.mean(r[1] for r in results):>10.1f}'
+            f'{sum(1 for r in results if not r[2]):>6}'
+        )
+
+    def _cleanup(self):
+        employees = Employee.objects.filter(employee_no__startswith=PREFIX)
+        AttendanceRecord.objects.filter(employee__in=employees).delete()
+        MonthlyAttendanceSummary.objects.filter(employee__in=employees).delete()
+        User.objects.filter(username__startswith=PREFIX.lower()).delete()
+        employees.delete()
+        Position.objects.filter(name=f'{PREFIX} 직급').delete()
+        Department.objects.filter(code=PREFIX).delete()
@@ -0,0 +1,65 @@
+"""
+출퇴근 이벤트(PunchEvent)를 출퇴근 기록에 반영.
+
+    python manage.py fold_punches                                # 새 이벤트를 모두 반영하고 종료
+    python manage.py fold_punches --loop --sleep 5               # 계속 반영 (Ctrl+C로 종료)
+    python manage.py fold_punches --from 2024-05-01 --to 2024-05-31   # 기간 재계산 (watermark 유지)
+
+반영 규칙과 watermark는 apps.attendance.punches 참고. 몇 번을 다시 실행해도 결과가 같다.
+"""
+import datetime
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections, connection
+
+from apps.attendance import punches
+
+
+def _date(value: str) -> datetime.date:
+    try:
+        return datetime.date.fromisoformat(value)
+    except ValueError:
+        raise CommandError(f'날짜 형식(YYYY-MM-DD)이 올바르지 않습니다: {value}')
+
+
+class Command(BaseCommand):
+    help = '새 출퇴근 이벤트를 출퇴근 기록과 월별 근태 요약에 반영합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=punches.BATCH_SIZE,
+                            help=f'트랜잭션당 이벤트 수 (기본 {punches.BATCH_SIZE})')
+        parser.add_argument('--loop', action='store_true', help='새 이벤트를 계속 기다리며 반영')
+        parser.add_argument('--sleep', type=float, default=5.0, help='--loop polling 간격(초, 기본 5)')
+        parser.add_argument('--from', dest='start', help='재계산 시작 근무일 (YYYY-MM-DD)')
+        parser.add_argument('--to', dest='end', help='재계산 종료 근무일 (YYYY-MM-DD, 기본 시작일)')
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        if batch_size < 1:
+            raise CommandError('--batch-size는 1 이상이어야 합니다.')
+
+        if options['start']:
+            start = _date(options['start'])
+            end   = _date(options['end']) if options['end'] else start
+            if end < start:
+                raise CommandError('--to는 --from보다 이전일 수 없습니다.')
+            days = punches.refold(start, end, batch_size=batch_size)
+            self.stdout.write(self.style.SUCCESS(f'{start} ~ {end} 재계산 완료: {days:,}일 갱신'))
+            return
+
+        try:
+            while True:
+                if not connection.in_atomic_block:
+                    close_old_connections()
+                result = punches.fold_new(batch_size=batch_size)
+                if result['events'] or not options['loop']:
+                    self.stdout.write(self.style.SUCCESS(
+                        f'이벤트 {result["events"]:,}건 반영: {result["days"]:,}일 갱신 '
+                        f'(watermark {result["watermark"]})'
+                    ))
+                if not options['loop']:
+                    break
+                time.sleep(options['sleep'])
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,60 @@
+"""
+근태 단말기 CSV 일괄 적재.
+
+    python manage.py import_attendance punches.csv
+    python manage.py import_attendance punches.csv --encoding cp949 --errors errors.csv
+
+형식과 처리 방식은 apps.attendance.importer 참고. --errors를 지정하면 오류 행 전체를 CSV로 기록한다.
+"""
+import csv
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.exceptions import ValidationError
+
+from apps.attendance import importer
+
+
+class Command(BaseCommand):
+    help = '근태 단말기 CSV(employee_no, work_date, check_in, check_out)를 출퇴근 기록에 적재합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='CSV 파일 경로')
+        parser.add_argument('--encoding', default='utf-8', choices=sorted(importer.ENCODINGS),
+                            help='파일 인코딩 (기본 utf-8)')
+        parser.add_argument('--chunk-size', type=int, default=importer.CHUNK_SIZE,
+                            help=f'bulk upsert 단위 (기본 {importer.CHUNK_SIZE})')
+        parser.add_argument('--errors', help='오류 행 보고서 CSV 경로 (미지정 시 앞의 10건만 출력)')
+
+    def handle(self, *args, **options):
+        report = open(options['errors'], 'w', encoding='utf-8-sig', newline='') if options['errors'] else None
+        try:
+            writer = csv.DictWriter(report, fieldnames=('line', 'employee_no', 'error')) if report else None
+            if writer:
+                writer.writeheader()
+
+            def on_chunk(rows):
+                if options['verbosity'] >= 2:
+                    self.stdout.write(f'{rows:,}행 처리')
+
+            with open(options['path'], 'rb') as f:
+                result = importer.import_file(
+                    f, options['encoding'],
+                    chunk_size=options['chunk_size'],
+                    on_error=writer.writerow if writer else None,
+                    on_chunk=on_chunk,
+                )
+        except FileNotFoundError:
+            raise CommandError(f'파일이 없습니다: {options["path"]}')
+        except ValidationError as e:
+            raise CommandError(e.detail[0] if isinstance(e.detail, list) else e.detail)
+        finally:
+            if report:
+                report.close()
+
+        self.stdout.write(self.style.SUCCESS(
+            f'출퇴근 기록 적재 완료: {result["rows"]:,}행 '
+            f'(생성 {result["created"]:,}, 갱신 {result["updated"]:,}, 오류 {result["errors"]:,})'
+        ))
+        if result['errors'] and not report:
+            for error in result['error_rows'][:10]:
+                self.stderr.write(f'{error["line"]}행 {error["employee_no"]}: {error["error"]}')
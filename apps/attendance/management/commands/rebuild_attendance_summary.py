@@ -0,0 +1,30 @@
+"""
+월별 근태 요약(MonthlyAttendanceSummary) 재구성.
+
+    python manage.py rebuild_attendance_summary              # 전체
+    python manage.py rebuild_attendance_summary --year 2024 --month 5
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.attendance.services import MonthlySummaryService
+
+
+class Command(BaseCommand):
+    help = '출퇴근 기록을 집계하여 월별 근태 요약을 다시 만듭니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--year',  type=int, help='연도 (미지정 시 전체)')
+        parser.add_argument('--month', type=int, help='월 (--year와 함께 지정)')
+        parser.add_argument('--chunk-size', type=int, default=1000, help='bulk_create 단위 (기본 1000)')
+
+    def handle(self, *args, **options):
+        year, month = options['year'], options['month']
+        if month is not None:
+            if year is None:
+                raise CommandError('--month는 --year와 함께 지정해야 합니다.')
+            if not (1 <= month <= 12):
+                raise CommandError('month는 1~12 사이여야 합니다.')
+
+        count = MonthlySummaryService.rebuild(year, month, chunk_size=options['chunk_size'])
+        scope = '전체' if year is None else (f'{year}년' if month is None else f'{year}년 {month}월')
+        self.stdout.write(self.style.SUCCESS(f'월별 근태 요약 재구성 완료 ({scope}): {count}건'))
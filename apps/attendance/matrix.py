@@ -0,0 +1,97 @@
+"""
+월간 근태 현황표 (직원 × 일, HR 조회용).
+
+응답은 열 단위(columnar)로 싣는다.
+- employees: {'id': [...], 'employee_no': [...], 'name': [...], 'department': [...]}  사번 순
+- days: 해당 월의 날짜 목록 ('YYYY-MM-DD')
+- work_minutes / overtime_minutes: 직원 순 → 일 순으로 펼친 배열 (길이 = 직원 수 × 일수, 기록 없는 날은 null)
+  i번째 직원의 d번째 날 값은 배열[i * len(days) + d]
+- leave: 직원별 문자열 (길이 = 일수), 한 글자가 하루의 휴가 코드 (LEAVE_CODES, 없으면 '.')
+  승인된 휴가는 대문자, 신청 중인 휴가는 소문자
+조회는 직원 1회 + 출퇴근 기록 날짜 범위 1회 + 휴가 기간 겹침 1회로 끝난다.
+"""
+import datetime
+
+from django.db.models import F, Q
+
+from apps.employees.models import Employee
+from apps.utils.db import month_range, overlaps
+from .models import AttendanceLeave, AttendanceRecord
+
+LEAVE_CODES = {
+    AttendanceLeave.LeaveType.ANNUAL:  'A',
+    AttendanceLeave.LeaveType.HALF:    'H',
+    AttendanceLeave.LeaveType.SICK:    'S',
+    AttendanceLeave.LeaveType.SPECIAL: 'P',
+}
+
+NO_LEAVE = '.'
+
+
+def build_matrix(year: int, month: int, department_id: int = None) -> dict:
+    first, last = month_range(year, month)
+    days  = [first + datetime.timedelta(days=offset) for offset in range(last.day)]
+    width = len(days)
+
+    # 해당 월에 재직한 직원 (월 중 입사·퇴사 포함)
+    employees = Employee.objects.filter(hire_date__lte=last).filter(
+        Q(resign_date__isnull=True) | Q(resign_date__gte=first),
+    )
+    records = AttendanceRecord.objects.filter(work_date__range=(first, last))
+    leaves  = AttendanceLeave.objects.filter(
+        overlaps('start_date', 'end_date', first, last),
+        status__in=(AttendanceLeave.Status.APPROVED, AttendanceLeave.Status.PENDING),
+    )
+    if department_id is not None:
+        employees = employees.filter(department_id=department_id)
+        records   = records.filter(employee__department_id=department_id)
+        leaves    = leaves.filter(employee__department_id=department_id)
+
+    columns = {'id': [], 'employee_no': [], 'name': [], 'department': []}
+    for emp_id, employee_no, name, department in (
+        employees.order_by('employee_no')
+        .values_list('id', 'employee_no', 'name', F('department__name'))
+    ):
+        columns['id'].append(emp_id)
+        columns['employee_no'].append(employee_no)
+        columns['name'].append(name)
+        columns['department'].append(department)
+
+    row_of = {emp_id: index for index, emp_id in enumerate(columns['id'])}
+    work     = [None] * (len(row_of) * width)
+    overtime = [None] * (len(row_of) * width)
+    for emp_id, work_date, work_minutes, overtime_minutes in (
+        records.order_by().values_list('employee_id', 'work_date', 'work_minutes', 'overtime_minutes')
+    ):
+        row = row_of.get(emp_id)
+        if row is None:
+            continue
+        cell = row * width + work_date.day - 1
+        work[cell], overtime[cell] = work_minutes, overtime_minutes
+
+    leave = [[NO_LEAVE] * width for _ in row_of]
+    # 승인 휴가가 신청 중 휴가를 덮도록 신청 중 → 승인 순으로 칠한다
+    for emp_id, start, end, leave_type, status in sorted(
+        leaves.order_by().values_list('employee_id', 'start_date', 'end_date', 'leave_type', 'status'),
+        key=lambda r: r[4] == AttendanceLeave.Status.APPROVED,
+    ):
+        row = row_of.get(emp_id)
+        if row is None:
+            continue
+        code = LEAVE_CODES.get(leave_type, NO_LEAVE)
+        if status != AttendanceLeave.Status.APPROVED:
+            code = code.lower()
+        for day in range(max(start, first).day, min(end, last).day + 1):
+            leave[row][day - 1] = code
+
+    return {
+        'year':             year,
+        'month':            month,
+        'department':       department_id,
+        'days':             [day.isoformat() for day in days],
+        'employees':        columns,
+        'work_minutes':     work,
+        'overtime_minutes': overtime,
+        'leave':            [''.join(codes) for codes in leave],
+        'leave_codes':      {code: leave_type.label for leave_type, code in LEAVE_CODES.items()},
+    }
@@ -0,0 +1,63 @@
+# Generated by Django 4.2.7 on 2026-10-17 21:26
+
+from django.db import migrations, models
+from django.db.models import Count, Sum
+from django.db.models.functions import ExtractMonth, ExtractYear
+import django.db.models.deletion
+
+
+def backfill_summaries(apps, schema_editor):
+    """기존 출퇴근 기록을 (직원, 연, 월) 단위로 집계하여 요약 테이블을 채운다."""
+    AttendanceRecord         = apps.get_model('attendance', 'AttendanceRecord')
+    MonthlyAttendanceSummary = apps.get_model('attendance', 'MonthlyAttendanceSummary')
+    rows = (
+        AttendanceRecord.objects
+        .annotate(year=ExtractYear('work_date'), month=ExtractMonth('work_date'))
+        .values('employee_id', 'year', 'month')
+        .annotate(work=Sum('work_minutes'), overtime=Sum('overtime_minutes'), days=Count('id'))
+        .order_by()
+    )
+    MonthlyAttendanceSummary.objects.bulk_create(
+        [
+            MonthlyAttendanceSummary(
+                employee_id=r['employee_id'], year=r['year'], month=r['month'],
+                work_minutes=r['work'] or 0, overtime_minutes=r['overtime'] or 0,
+                days_worked=r['days'],
+            )
+            for r in rows
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('employees', '0002_employee_dependents'),
+        ('attendance', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MonthlyAttendanceSummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('year', models.PositiveSmallIntegerField(verbose_name='연도')),
+                ('month', models.PositiveSmallIntegerField(verbose_name='월')),
+                ('work_minutes', models.PositiveIntegerField(default=0, verbose_name='실근무분 합계')),
+                ('overtime_minutes', models.PositiveIntegerField(default=0, verbose_name='초과근무분 합계')),
+                ('days_worked', models.PositiveSmallIntegerField(default=0, verbose_name='근무일수')),
+                ('last_updated', models.DateTimeField(auto_now=True, verbose_name='최종 갱신')),
+                ('employee', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='attendance_summaries', to='employees.employee', verbose_name='직원')),
+            ],
+            options={
+                'verbose_name': '월별 근태 요약',
+                'verbose_name_plural': '월별 근태 요약 목록',
+                'db_table': 'attendance_monthly_summary',
+                'ordering': ['-year', '-month'],
+                'indexes': [models.Index(fields=['year', 'month'], name='att_summary_year_month')],
+                'unique_together': {('employee', 'year', 'month')},
+            },
+        ),
+        migrations.RunPython(backfill_summaries, migrations.RunPython.noop),
+    ]
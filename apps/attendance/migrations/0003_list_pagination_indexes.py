@@ -0,0 +1,21 @@
+# Generated by Django 4.2.7 on 2026-10-17 21:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('attendance', '0002_monthly_summary'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='attendanceleave',
+            index=models.Index(fields=['created_at', 'id'], name='leave_created_id'),
+        ),
+        migrations.AddIndex(
+            model_name='attendanceleave',
+            index=models.Index(fields=['employee', 'created_at', 'id'], name='leave_employee_created_id'),
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 4.2.7 on 2026-10-17 22:44
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('employees', '0003_employee_bank_account'),
+        ('attendance', '0003_list_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PunchFoldWatermark',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50, unique=True, verbose_name='이름')),
+                ('last_event_id', models.BigIntegerField(default=0, verbose_name='마지막 반영 이벤트 id')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': '출퇴근 이벤트 반영 위치',
+                'verbose_name_plural': '출퇴근 이벤트 반영 위치',
+                'db_table': 'attendance_punch_watermark',
+            },
+        ),
+        migrations.CreateModel(
+            name='PunchEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('work_date', models.DateField(verbose_name='근무일')),
+                ('timestamp', models.DateTimeField(verbose_name='타각시각')),
+                ('kind', models.CharField(choices=[('IN', '출근'), ('OUT', '퇴근')], max_length=3, verbose_name='구분')),
+                ('source', models.CharField(choices=[('TERMINAL', '근태 단말기'), ('OFFLINE', '오프라인 업로드'), ('CORRECTION', '정정')], default='TERMINAL', max_length=10, verbose_name='출처')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('employee', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='punch_events', to='employees.employee', verbose_name='직원')),
+            ],
+            options={
+                'verbose_name': '출퇴근 이벤트',
+                'verbose_name_plural': '출퇴근 이벤트 목록',
+                'db_table': 'attendance_punch_event',
+                'indexes': [models.Index(fields=['employee', 'work_date'], name='punch_employee_date'), models.Index(fields=['work_date'], name='punch_work_date')],
+            },
+        ),
+    ]
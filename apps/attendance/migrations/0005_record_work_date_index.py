@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-17 22:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('attendance', '0004_punch_events'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='attendancerecord',
+            index=models.Index(fields=['work_date'], name='att_record_work_date'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.7 on 2026-10-17 22:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('attendance', '0005_record_work_date_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='attendanceleave',
+            index=models.Index(fields=['employee', 'status'], name='leave_employee_status'),
+        ),
+        migrations.AddIndex(
+            model_name='attendanceleave',
+            index=models.Index(fields=['start_date', 'end_date'], name='leave_start_end'),
+        ),
+    ]
@@ -1,3 +1,5 @@
+import datetime
+
 from django.conf import settings
 from django.db import models
 
@@ -22,6 +24,8 @@ class AttendanceRecord(models.Model):
     class Meta:
         db_table = 'attendance_record'
         unique_together = ('employee', 'work_date')
+        # 월간 현황표처럼 전 직원의 기간을 읽는 조회용 (unique 인덱스는 직원이 앞이라 쓸 수 없다)
+        indexes = [models.Index(fields=['work_date'], name='att_record_work_date')]
         verbose_name = '출퇴근 기록'
         verbose_name_plural = '출퇴근 기록 목록'
         ordering = ['-work_date']
@@ -29,6 +33,57 @@ class AttendanceRecord(models.Model):
     def __str__(self):
         return f'{self.employee.name} {self.work_date}'
 
+    # 월별 요약(MonthlyAttendanceSummary) 증분 갱신용: DB에서 읽은 시점의 값을 기억해 둔다
+    SUMMARY_FIELDS = ('employee_id', 'work_date', 'work_minutes', 'overtime_minutes')
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._summary_state = instance.summary_state()
+        return instance
+
+    def summary_state(self):
+        """월별 요약에 반영된 값 (employee_id, work_date, work_minutes, overtime_minutes). 지연 로딩 필드가 있으면 None."""
+        loaded = self.__dict__
+        if any(f not in loaded for f in self.SUMMARY_FIELDS):
+            return None
+        work_date = loaded['work_date']
+        if isinstance(work_date, str):
+            work_date = datetime.date.fromisoformat(work_date)
+        return (loaded['employee_id'], work_date, loaded['work_minutes'] or 0, loaded['overtime_minutes'] or 0)
+
+
+class MonthlyAttendanceSummary(models.Model):
+    """
+    직원별 월 근태 합계 (AttendanceRecord 집계의 실체화).
+    AttendanceRecord 저장·삭제 시 signals에서 증분 갱신하고,
+    bulk_create / QuerySet.update 등 시그널을 거치지 않는 변경 뒤에는 rebuild_attendance_summary로 재구성한다.
+    """
+
+    employee         = models.ForeignKey(
+        'employees.Employee',
+        on_delete=models.PROTECT,
+        related_name='attendance_summaries',
+        verbose_name='직원',
+    )
+    year             = models.PositiveSmallIntegerField('연도')
+    month            = models.PositiveSmallIntegerField('월')
+    work_minutes     = models.PositiveIntegerField('실근무분 합계', default=0)
+    overtime_minutes = models.PositiveIntegerField('초과근무분 합계', default=0)
+    days_worked      = models.PositiveSmallIntegerField('근무일수', default=0)
+    last_updated     = models.DateTimeField('최종 갱신', auto_now=True)
+
+    class Meta:
+        db_table = 'attendance_monthly_summary'
+        unique_together = ('employee', 'year', 'month')
+        indexes = [models.Index(fields=['year', 'month'], name='att_summary_year_month')]
+        verbose_name = '월별 근태 요약'
+        verbose_name_plural = '월별 근태 요약 목록'
+        ordering = ['-year', '-month']
+
+    def __str__(self):
+        return f'{self.employee.name} {self.year}-{self.month:02d}'
+
 
 class AttendanceLeave(models.Model):
     """휴가 신청"""
@@ -76,6 +131,75 @@ class AttendanceLeave(models.Model):
         verbose_name = '휴가 신청'
         verbose_name_plural = '휴가 신청 목록'
         ordering = ['-created_at']
+        indexes = [
+            # 휴가 목록 키셋 페이지네이션 (-created_at, -id)
+            models.Index(fields=['created_at', 'id'], name='leave_created_id'),
+            models.Index(fields=['employee', 'created_at', 'id'], name='leave_employee_created_id'),
+            # 직원별 상태 조회 (부서 단위 현황표의 직원 → 휴가 조인)
+            models.Index(fields=['employee', 'status'], name='leave_employee_status'),
+            # 기간 겹침 조회 (start_date <= 말일 AND end_date >= 1일)
+            models.Index(fields=['start_date', 'end_date'], name='leave_start_end'),
+        ]
 
     def __str__(self):
         return f'{self.employee.name} {self.get_leave_type_display()} {self.start_date}~{self.end_date}'
+
+
+class PunchEvent(models.Model):
+    """
+    출퇴근 원시 이벤트 (추가 전용).
+    단말기 타각·오프라인 단말기 업로드·정정을 모두 행 추가로만 기록하며 수정·삭제하지 않는다.
+    정정은 source=CORRECTION 이벤트로 남기고, apps.attendance.punches가 AttendanceRecord로 접어 넣는다.
+    대량 INSERT가 싸도록 unique 제약 없이 (employee, work_date)·work_date 인덱스만 둔다.
+    """
+
+    class Kind(models.TextChoices):
+        IN  = 'IN',  '출근'
+        OUT = 'OUT', '퇴근'
+
+    class Source(models.TextChoices):
+        TERMINAL   = 'TERMINAL',   '근태 단말기'
+        OFFLINE    = 'OFFLINE',    '오프라인 업로드'
+        CORRECTION = 'CORRECTION', '정정'
+
+    employee   = models.ForeignKey(
+        'employees.Employee',
+        on_delete=models.PROTECT,
+        related_name='punch_events',
+        verbose_name='직원',
+    )
+    work_date  = models.DateField('근무일')
+    timestamp  = models.DateTimeField('타각시각')
+    kind       = models.CharField('구분', max_length=3, choices=Kind.choices)
+    source     = models.CharField('출처', max_length=10, choices=Source.choices, default=Source.TERMINAL)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'attendance_punch_event'
+        verbose_name = '출퇴근 이벤트'
+        verbose_name_plural = '출퇴근 이벤트 목록'
+        indexes = [
+            # 근무일 단위 재계산
+            models.Index(fields=['employee', 'work_date'], name='punch_employee_date'),
+            # 기간 재계산
+            models.Index(fields=['work_date'], name='punch_work_date'),
+        ]
+
+    def __str__(self):
+        return f'{self.employee_id} {self.timestamp} {self.kind}'
+
+
+class PunchFoldWatermark(models.Model):
+    """출퇴근 이벤트 반영 위치. last_event_id 이하의 이벤트는 AttendanceRecord에 반영되었다."""
+
+    name          = models.CharField('이름', max_length=50, unique=True)
+    last_event_id = models.BigIntegerField('마지막 반영 이벤트 id', default=0)
+    updated_at    = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'attendance_punch_watermark'
+        verbose_name = '출퇴근 이벤트 반영 위치'
+        verbose_name_plural = '출퇴근 이벤트 반영 위치'
+
+    def __str__(self):
+        return f'{self.name}: {self.last_event_id}'
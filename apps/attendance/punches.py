@@ -0,0 +1,217 @@
+"""
+출퇴근 원시 이벤트(PunchEvent) 기록과 AttendanceRecord 반영(fold).
+
+기록
+- record_events: 단말기·오프라인 업로드 이벤트를 검증해 bulk_create로 추가만 한다 (요청당 직원 조회 1회).
+
+반영 규칙 (직원·근무일 단위, 같은 입력이면 몇 번을 실행해도 결과가 같다)
+- 출근: 정정(CORRECTION) 출근 이벤트가 있으면 가장 최근 정정 값,
+        없으면 기존 기록의 출근 시각과 출근 이벤트 중 가장 이른 시각
+- 퇴근: 정정 퇴근 이벤트가 있으면 가장 최근 정정 값,
+        없으면 기존 기록의 퇴근 시각과 퇴근 이벤트 중 가장 늦은 시각 (출근보다 이르면 퇴근 없음)
+- 근무·초과근무 분은 AttendanceService.work_minutes와 같은 규칙
+  기존 기록(출퇴근 API·일괄 적재로 만든 값)과 합치므로 이벤트가 일부 시각만 가져도 기존 값을 지우지 않는다.
+
+반영 단계
+- fold_new: PunchFoldWatermark.last_event_id 이후 이벤트를 id 순으로 batch_size건씩 읽어, 건드린 (직원, 근무일)을
+  해당 일의 이벤트 전체로 다시 계산해 upsert 하고(importer.write_chunk, 월별 요약 포함) 같은 트랜잭션에서
+  watermark를 옮긴다. 중간에 중단되어도 반영과 watermark가 함께 롤백되므로 다시 실행하면 된다.
+  watermark 행을 잠그므로 여러 프로세스가 동시에 실행해도 한 번씩만 반영된다.
+  커밋이 늦은 INSERT를 건너뛰지 않도록 기록 후 FOLD_LAG가 지난 이벤트만 읽는다.
+- refold: 기간 안의 (직원, 근무일)을 batch_size개씩 다시 계산한다. watermark는 바꾸지 않는다.
+id 순으로 읽으므로 늦게 올라온 과거 시각 이벤트(오프라인 단말기)도 빠짐없이 반영된다.
+"""
+import datetime
+from collections import defaultdict
+from itertools import islice
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from apps.employees.models import Employee
+from .importer import write_chunk
+from .models import AttendanceRecord, PunchEvent, PunchFoldWatermark
+from .services import AttendanceService
+
+BATCH_SIZE = 1000
+
+# 요청 1회에 받는 최대 이벤트 수
+MAX_EVENTS = 5000
+
+# 결과에 싣는 오류 이벤트 최대 건수
+MAX_ERROR_ROWS = 100
+
+WATERMARK = 'default'
+
+# 기록 후 이 시간이 지난 이벤트만 fold_new가 반영한다 (fold_new 참고)
+FOLD_LAG = datetime.timedelta(seconds=10)
+
+
+# ── 기록 ─────────────────────────────────────────────────────────────
+def _event(item: dict, employees: dict, source: str) -> PunchEvent:
+    if not isinstance(item, dict):
+        raise ValueError('이벤트는 객체여야 합니다.')
+    employee_id = employees.get(str(item.get('employee_no') or '').strip())
+    if employee_id is None:
+        raise ValueError(f'존재하지 않는 사번입니다: {item.get("employee_no")}')
+    kind = str(item.get('kind') or '').upper()
+    if kind not in PunchEvent.Kind.values:
+        raise ValueError(f'kind는 {", ".join(PunchEvent.Kind.values)} 중 하나여야 합니다.')
+    try:
+        timestamp = datetime.datetime.fromisoformat(str(item.get('timestamp') or ''))
+    except ValueError:
+        raise ValueError(f'timestamp 형식이 올바르지 않습니다: {item.get("timestamp")}')
+    if timezone.is_naive(timestamp):
+        timestamp = timezone.make_aware(timestamp)
+    work_date = item.get('work_date')
+    if work_date:
+        try:
+            work_date = datetime.date.fromisoformat(str(work_date))
+        except ValueError:
+            raise ValueError(f'work_date 형식이 올바르지 않습니다: {work_date}')
+    else:
+        # 야간 근무 퇴근처럼 타각일과 근무일이 다르면 단말기가 work_date를 보낸다
+        work_date = timezone.localdate(timestamp)
+    return PunchEvent(employee_id=employee_id, work_date=work_date, timestamp=timestamp, kind=kind, source=source)
+
+
+def record_events(items: list, source: str = PunchEvent.Source.TERMINAL) -> dict:
+    """
+    [{employee_no, timestamp, kind, work_date?}, ...]를 추가한다.
+    잘못된 이벤트는 건너뛰고 (순번, 사번, 사유)를 보고한다. 반영(fold)은 하지 않는다.
+    """
+    if source not in PunchEvent.Source.values:
+        raise ValidationError(f'source는 {", ".join(PunchEvent.Source.values)} 중 하나여야 합니다.')
+    if len(items) > MAX_EVENTS:
+        raise ValidationError(f'이벤트는 한 번에 {MAX_EVENTS:,}건까지 보낼 수 있습니다.')
+
+    numbers = {str(item.get('employee_no') or '').strip() for item in items if isinstance(item, dict)}
+    employees = dict(Employee.objects.filter(employee_no__in=numbers).values_list('employee_no', 'id'))
+    events, errors = [], []
+    for index, item in enumerate(items):
+        try:
+            events.append(_event(item, employees, source))
+        except ValueError as e:
+            errors.append({
+                'index':       index,
+                'employee_no': item.get('employee_no') if isinstance(item, dict) else None,
+                'error':       str(e),
+            })
+    PunchEvent.objects.bulk_create(events, batch_size=BATCH_SIZE)
+    return {'created': len(events), 'errors': len(errors), 'error_rows': errors[:MAX_ERROR_ROWS]}
+
+
+# ── 반영 ─────────────────────────────────────────────────────────────
+def derive_day(events, check_in=None, check_out=None) -> tuple:
+    """
+    하루치 이벤트 [(id, timestamp, kind, source), ...]와 기존 기록 시각으로
+    (check_in, check_out, work_minutes, overtime_minutes)를 계산한다. 정정은 나중에 기록된(id가 큰) 것이 우선한다.
+    """
+    corrected = {}
+    for _, timestamp, kind, source in sorted(events):
+        if source == PunchEvent.Source.CORRECTION:
+            corrected[kind] = timestamp
+            continue
+        if kind == PunchEvent.Kind.IN:
+            check_in = timestamp if check_in is None else min(check_in, timestamp)
+        else:
+            check_out = timestamp if check_out is None else max(check_out, timestamp)
+    check_in  = corrected.get(PunchEvent.Kind.IN, check_in)
+    check_out = corrected.get(PunchEvent.Kind.OUT, check_out)
+
+    if check_in is None or check_out is None:
+        return check_in, check_out, 0, 0
+    if check_out < check_in:
+        return check_in, None, 0, 0
+    return (check_in, check_out, *AttendanceService.work_minutes(check_in, check_out))
+
+
+def _day_condition(keys) -> Q:
+    by_date = defaultdict(set)
+    for emp_id, work_date in keys:
+        by_date[work_date].add(emp_id)
+    condition = Q()
+    for work_date, emp_ids in by_date.items():
+        condition |= Q(work_date=work_date, employee_id__in=emp_ids)
+    return condition
+
+
+def fold_days(keys) -> int:
+    """(employee_id, work_date)들을 이벤트 전체와 기존 기록으로 다시 계산해 upsert 한다. 반영한 일수를 반환한다."""
+    keys = set(keys)
+    if not keys:
+        return 0
+    condition = _day_condition(keys)
+    events = defaultdict(list)
+    for event_id, emp_id, work_date, timestamp, kind, source in (
+        PunchEvent.objects.filter(condition)
+        .values_list('id', 'employee_id', 'work_date', 'timestamp', 'kind', 'source')
+    ):
+        events[emp_id, work_date].append((event_id, timestamp, kind, source))
+
+    with transaction.atomic():
+        existing = {
+            (emp_id, work_date): (check_in, check_out)
+            for emp_id, work_date, check_in, check_out in (
+                AttendanceRecord.objects.select_for_update().filter(condition)
+                .values_list('employee_id', 'work_date', 'check_in', 'check_out')
+            )
+        }
+        rows = {}
+        for key in keys:
+            derived = derive_day(events.get(key, ()), *existing.get(key, (None, None)))
+            if key in existing and derived[:2] == existing[key]:
+                continue  # 이미 반영된 날은 다시 쓰지 않는다
+            rows[key] = derived
+        if rows:
+            write_chunk(rows)
+    return len(rows)
+
+
+def _watermark() -> PunchFoldWatermark:
+    PunchFoldWatermark.objects.get_or_create(name=WATERMARK)
+    return PunchFoldWatermark.objects.select_for_update().get(name=WATERMARK)
+
+
+def fold_new(batch_size: int = BATCH_SIZE, max_batches: int = None, lag: datetime.timedelta = FOLD_LAG) -> dict:
+    """
+    watermark 이후 이벤트를 batch_size건씩 반영한다. {'events', 'days', 'watermark'}
+    기록된 지 lag가 지나지 않은 이벤트는 다음 실행으로 미룬다: 동시에 INSERT 한 트랜잭션은 id 순서와 다르게
+    커밋될 수 있어, 아직 보이지 않는 작은 id를 watermark가 건너뛰지 않게 하기 위함이다.
+    """
+    result = {'events': 0, 'days': 0, 'watermark': 0}
+    batches = 0
+    while max_batches is None or batches < max_batches:
+        with transaction.atomic():
+            watermark = _watermark()
+            batch = list(
+                PunchEvent.objects.filter(id__gt=watermark.last_event_id, created_at__lte=timezone.now() - lag)
+                .order_by('id').values_list('id', 'employee_id', 'work_date')[:batch_size]
+            )
+            result['watermark'] = watermark.last_event_id
+            if not batch:
+                break
+            result['days'] += fold_days((emp_id, work_date) for _, emp_id, work_date in batch)
+            watermark.last_event_id = batch[-1][0]
+            watermark.save(update_fields=['last_event_id', 'updated_at'])
+        result['events']   += len(batch)
+        result['watermark'] = watermark.last_event_id
+        batches += 1
+    return result
+
+
+def refold(start: datetime.date, end: datetime.date, batch_size: int = BATCH_SIZE) -> int:
+    """start~end 근무일의 이벤트가 있는 날을 모두 다시 계산한다. 반영한 일수를 반환한다."""
+    keys = (
+        PunchEvent.objects.filter(work_date__gte=start, work_date__lte=end)
+        .values_list('employee_id', 'work_date').distinct().order_by('work_date', 'employee_id')
+        .iterator(chunk_size=batch_size)
+    )
+    days = 0
+    while True:
+        chunk = list(islice(keys, batch_size))
+        if not chunk:
+            return days
+        days += fold_days(chunk)
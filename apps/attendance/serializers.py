@@ -1,6 +1,6 @@
 from rest_framework import serializers
 
-from .models import AttendanceRecord, AttendanceLeave
+from .models import AttendanceRecord, AttendanceLeave, MonthlyAttendanceSummary
 
 
 class AttendanceRecordSerializer(serializers.ModelSerializer):
@@ -17,6 +17,38 @@ class AttendanceRecordSerializer(serializers.ModelSerializer):
         read_only_fields = ['work_minutes', 'overtime_minutes']
 
 
+class AttendancePunchSerializer(serializers.ModelSerializer):
+    """출근 처리 응답. 직원 이름 등 관계 필드를 읽지 않는다."""
+
+    class Meta:
+        model  = AttendanceRecord
+        fields = [
+            'id', 'employee', 'work_date', 'check_in', 'check_out',
+            'work_minutes', 'overtime_minutes',
+        ]
+        read_only_fields = fields
+
+
+class CheckOutResultSerializer(serializers.Serializer):
+    """퇴근 처리 응답 (AttendanceService.check_out 결과 dict)."""
+    employee  = serializers.IntegerField()
+    work_date = serializers.DateField()
+    check_out = serializers.DateTimeField()
+
+
+class MonthlyAttendanceSummarySerializer(serializers.ModelSerializer):
+    employee_name = serializers.CharField(source='employee.name', read_only=True)
+    employee_no   = serializers.CharField(source='employee.employee_no', read_only=True)
+
+    class Meta:
+        model  = MonthlyAttendanceSummary
+        fields = [
+            'employee', 'employee_name', 'employee_no', 'year', 'month',
+            'days_worked', 'work_minutes', 'overtime_minutes', 'last_updated',
+        ]
+        read_only_fields = fields
+
+
 class AttendanceLeaveSerializer(serializers.ModelSerializer):
     employee_name   = serializers.CharField(source='employee.name', read_only=True)
     leave_type_display = serializers.CharField(source='get_leave_type_display', read_only=True)
@@ -1,60 +1,221 @@
 import datetime
+from collections import defaultdict
 
+from django.db import IntegrityError, transaction
+from django.db.models import Count, DateTimeField, F, Q, Subquery, Sum, Value
+from django.db.models.functions import ExtractMonth, ExtractYear, Greatest
 from django.utils import timezone
 from rest_framework.exceptions import ValidationError
 
-from .models import AttendanceRecord, AttendanceLeave
+from apps.utils.db import MinutesBetween, create_unique, month_range, upsert_options, year_range
+from .models import AttendanceRecord, AttendanceLeave, MonthlyAttendanceSummary
+
+# 기본 근무시간: 8시간(480분), 초과분은 초과근무
+STANDARD_WORK_MINUTES = 480
 
 
 # ── 출퇴근 서비스 ──────────────────────────────────────────────────
 class AttendanceService:
 
     @staticmethod
-    def check_in(employee):
-        """출근 처리. 당일 중복 출근 시 오류."""
-        today = timezone.localdate()
-        if AttendanceRecord.objects.filter(employee=employee, work_date=today).exists():
-            raise ValidationError('이미 오늘 출근 기록이 있습니다.')
-        return AttendanceRecord.objects.create(
-            employee=employee,
-            work_date=today,
+    def check_in(employee_id):
+        """
+        출근 처리. 조회 없이 INSERT 한 번으로 처리하며,
+        당일 중복 출근(동시 요청 포함)은 (employee, work_date) unique 제약으로 막는다.
+        """
+        return create_unique(
+            AttendanceRecord,
+            {'employee_id': employee_id, 'work_date': timezone.localdate()},
+            '이미 오늘 출근 기록이 있습니다.',
             check_in=timezone.now(),
         )
 
     @staticmethod
-    def check_out(employee):
-        """퇴근 처리. 출근 기록이 없거나 이미 퇴근한 경우 오류."""
+    def check_out(employee_id) -> dict:
+        """
+        퇴근 처리. 기록을 읽지 않고 'check_out IS NULL' 조건부 UPDATE 한 번으로 퇴근 시각과
+        근무·초과근무 분(work_minutes와 같은 규칙)을 SQL에서 계산해 기록한다.
+        월별 요약은 같은 트랜잭션에서 방금 기록한 분을 서브쿼리로 더한다 (UPDATE는 시그널을 거치지 않는다).
+        출근 기록이 없거나 이미 퇴근한 경우 오류 (실패한 경우에만 원인을 조회한다).
+        """
         today = timezone.localdate()
-        try:
-            record = AttendanceRecord.objects.get(employee=employee, work_date=today)
-        except AttendanceRecord.DoesNotExist:
-            raise ValidationError('오늘 출근 기록이 없습니다.')
-
-        if record.check_out:
-            raise ValidationError('이미 퇴근 처리되었습니다.')
-
-        now = timezone.now()
-        record.check_out = now
+        now   = timezone.now()
+        today_record = AttendanceRecord.objects.filter(employee_id=employee_id, work_date=today)
+        minutes = MinutesBetween('check_in', Value(now, output_field=DateTimeField()))
+
+        with transaction.atomic():
+            updated = today_record.filter(check_out__isnull=True, check_in__isnull=False).update(
+                check_out        = now,
+                work_minutes     = minutes,
+                overtime_minutes = Greatest(minutes - STANDARD_WORK_MINUTES, Value(0)),
+                updated_at       = now,
+            )
+            if not updated:
+                if today_record.filter(check_out__isnull=False).exists():
+                    raise ValidationError('이미 퇴근 처리되었습니다.')
+                raise ValidationError('오늘 출근 기록이 없습니다.')
+
+            # 출근 시 근무일수는 이미 반영되었으므로 분만 더한다
+            recorded = today_record.order_by()
+            summary = MonthlyAttendanceSummary.objects.filter(
+                employee_id=employee_id, year=today.year, month=today.month,
+            )
+            if not summary.update(
+                work_minutes     = F('work_minutes') + Subquery(recorded.values('work_minutes')[:1]),
+                overtime_minutes = F('overtime_minutes') + Subquery(recorded.values('overtime_minutes')[:1]),
+                last_updated     = now,
+            ):
+                # 요약 행이 없으면(재구성 중 등) 기록 전체를 새로 더한다
+                work, overtime = today_record.values_list('work_minutes', 'overtime_minutes').get()
+                MonthlySummaryService.apply_delta(employee_id, today.year, today.month, work, overtime, 1)
+        return {'employee': employee_id, 'work_date': today, 'check_out': now}
 
-        # 실근무시간 계산 (분 단위)
-        delta = now - record.check_in
-        total_minutes = int(delta.total_seconds() // 60)
-
-        # 기본 근무시간: 8시간(480분), 초과분 산출
-        standard = 480
-        record.work_minutes     = total_minutes
-        record.overtime_minutes = max(0, total_minutes - standard)
-        record.save(update_fields=['check_out', 'work_minutes', 'overtime_minutes', 'updated_at'])
-        return record
+    @staticmethod
+    def work_minutes(check_in, check_out) -> tuple:
+        """(실근무 분, 초과근무 분). 퇴근·일괄 적재가 같은 규칙을 쓴다."""
+        total_minutes = int((check_out - check_in).total_seconds() // 60)
+        return total_minutes, max(0, total_minutes - STANDARD_WORK_MINUTES)
 
     @staticmethod
     def get_monthly_records(employee, year: int, month: int):
         return AttendanceRecord.objects.filter(
             employee=employee,
-            work_date__year=year,
-            work_date__month=month,
+            work_date__range=month_range(year, month),
         ).order_by('work_date')
 
+    @staticmethod
+    def get_monthly_summary(employee, year: int, month: int):
+        """월별 근태 요약 1건. 기록이 없는 달은 None."""
+        return MonthlyAttendanceSummary.objects.filter(
+            employee=employee, year=year, month=month,
+        ).first()
+
+
+# ── 월별 근태 요약 서비스 ──────────────────────────────────────────
+class MonthlySummaryService:
+
+    @staticmethod
+    def apply_delta(employee_id, year: int, month: int,
+                    work_minutes: int = 0, overtime_minutes: int = 0, days: int = 0):
+        """월별 요약 행에 증감분을 더한다. 행이 없으면 생성한다."""
+        if not (work_minutes or overtime_minutes or days):
+            return
+        rows = MonthlyAttendanceSummary.objects.filter(employee_id=employee_id, year=year, month=month)
+        changes = {
+            'work_minutes':     F('work_minutes') + work_minutes,
+            'overtime_minutes': F('overtime_minutes') + overtime_minutes,
+            'days_worked':      F('days_worked') + days,
+            'last_updated':     timezone.now(),
+        }
+        if rows.update(**changes):
+            return
+        try:
+            with transaction.atomic():
+                MonthlyAttendanceSummary.objects.create(
+                    employee_id      = employee_id,
+                    year             = year,
+                    month            = month,
+                    work_minutes     = max(work_minutes, 0),
+                    overtime_minutes = max(overtime_minutes, 0),
+                    days_worked      = max(days, 0),
+                )
+        except IntegrityError:
+            # 동시에 다른 요청이 같은 행을 만든 경우
+            rows.update(**changes)
+
+    @staticmethod
+    def apply_deltas(deltas: dict):
+        """
+        {(employee_id, year, month): (work_minutes, overtime_minutes, days)} 증감분을 한 번에 반영한다.
+        대상 요약 행을 잠그고 읽어 새 값을 계산한 뒤 bulk upsert 한다 (일괄 적재용, 쿼리 2회).
+        호출 측 트랜잭션 안에서 실행해야 한다.
+        """
+        deltas = {key: delta for key, delta in deltas.items() if any(delta)}
+        if not deltas:
+            return
+        by_month = defaultdict(set)
+        for emp_id, year, month in deltas:
+            by_month[year, month].add(emp_id)
+        condition = Q()
+        for (year, month), emp_ids in by_month.items():
+            condition |= Q(year=year, month=month, employee_id__in=emp_ids)
+        current = {
+            (emp_id, year, month): (work, overtime, days)
+            for emp_id, year, month, work, overtime, days in (
+                MonthlyAttendanceSummary.objects.select_for_update().filter(condition)
+                .values_list('employee_id', 'year', 'month', 'work_minutes', 'overtime_minutes', 'days_worked')
+            )
+        }
+        objs = []
+        for key, (work, overtime, days) in deltas.items():
+            base = current.get(key, (0, 0, 0))
+            objs.append(MonthlyAttendanceSummary(
+                employee_id      = key[0],
+                year             = key[1],
+                month            = key[2],
+                work_minutes     = max(base[0] + work, 0),
+                overtime_minutes = max(base[1] + overtime, 0),
+                days_worked      = max(base[2] + days, 0),
+            ))
+        MonthlyAttendanceSummary.objects.bulk_create(objs, **upsert_options(
+            ('employee', 'year', 'month'),
+            ('work_minutes', 'overtime_minutes', 'days_worked', 'last_updated'),
+        ))
+
+    @staticmethod
+    def record_changed(old_state, new_state):
+        """
+        AttendanceRecord의 이전/이후 상태(AttendanceRecord.summary_state)를 월별 요약에 반영한다.
+        생성은 old_state=None, 삭제는 new_state=None.
+        """
+        if old_state == new_state:
+            return
+        if old_state is not None:
+            emp_id, day, work, overtime = old_state
+            MonthlySummaryService.apply_delta(emp_id, day.year, day.month, -work, -overtime, -1)
+        if new_state is not None:
+            emp_id, day, work, overtime = new_state
+            MonthlySummaryService.apply_delta(emp_id, day.year, day.month, work, overtime, 1)
+
+    @staticmethod
+    def rebuild(year: int = None, month: int = None, chunk_size: int = 1000) -> int:
+        """
+        AttendanceRecord를 (직원, 연, 월) 단위로 집계하여 요약 테이블을 다시 만든다.
+        year(와 month)를 지정하면 해당 범위만 재구성한다. 생성한 행 수를 반환한다.
+        """
+        records   = AttendanceRecord.objects.all()
+        summaries = MonthlyAttendanceSummary.objects.all()
+        if month is not None:
+            if year is None:
+                raise ValueError('month는 year와 함께 지정해야 합니다.')
+            records   = records.filter(work_date__range=month_range(year, month))
+            summaries = summaries.filter(year=year, month=month)
+        elif year is not None:
+            records   = records.filter(work_date__range=year_range(year))
+            summaries = summaries.filter(year=year)
+
+        rows = (
+            records.annotate(year=ExtractYear('work_date'), month=ExtractMonth('work_date'))
+            .values('employee_id', 'year', 'month')
+            .annotate(work=Sum('work_minutes'), overtime=Sum('overtime_minutes'), days=Count('id'))
+            .order_by()
+        )
+        objs = [
+            MonthlyAttendanceSummary(
+                employee_id      = r['employee_id'],
+                year             = r['year'],
+                month            = r['month'],
+                work_minutes     = r['work'] or 0,
+                overtime_minutes = r['overtime'] or 0,
+                days_worked      = r['days'],
+            )
+            for r in rows
+        ]
+        with transaction.atomic():
+            summaries.delete()
+            MonthlyAttendanceSummary.objects.bulk_create(objs, batch_size=chunk_size)
+        return len(objs)
+
 
 # ── 휴가 서비스 ────────────────────────────────────────────────────
 class LeaveService:
@@ -0,0 +1,34 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .models import AttendanceRecord
+from .services import MonthlySummaryService
+
+
+@receiver(pre_save, sender=AttendanceRecord)
+def remember_summary_state(sender, instance, raw=False, **kwargs):
+    """저장 전 DB 값을 확보한다. from_db 시점 값이 없을 때만 조회한다."""
+    if raw or instance._state.adding:
+        instance._summary_state = None
+        return
+    if getattr(instance, '_summary_state', None) is None:
+        instance._summary_state = (
+            AttendanceRecord.objects.filter(pk=instance.pk)
+            .values_list(*AttendanceRecord.SUMMARY_FIELDS).first()
+        )
+
+
+@receiver(post_save, sender=AttendanceRecord)
+def update_monthly_summary(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    new_state = instance.summary_state()
+    MonthlySummaryService.record_changed(getattr(instance, '_summary_state', None), new_state)
+    instance._summary_state = new_state
+
+
+@receiver(post_delete, sender=AttendanceRecord)
+def remove_from_monthly_summary(sender, instance, **kwargs):
+    state = getattr(instance, '_summary_state', None) or instance.summary_state()
+    MonthlySummaryService.record_changed(state, None)
+    instance._summary_state = None
@@ -1,21 +1,33 @@
+import csv
 import datetime
+import io
+import re
 from unittest.mock import patch
 
+from django.test import TransactionTestCase
 from django.utils import timezone
+from rest_framework.exceptions import ValidationError
 from rest_framework.test import APITestCase
 from rest_framework import status
 from django.contrib.auth import get_user_model
 
 from apps.employees.models import Department, Position, Employee
 from apps.utils.encryption import encrypt
-from .models import AttendanceRecord, AttendanceLeave
+from apps.utils.testing import (
+    concurrency_skip_reason, explain_queries, explain_skip_reason, query_plan, run_concurrently,
+)
+from .models import AttendanceRecord, AttendanceLeave, MonthlyAttendanceSummary, PunchEvent
 
 User = get_user_model()
 
 CHECK_IN_URL  = '/api/v1/attendance/check-in/'
 CHECK_OUT_URL = '/api/v1/attendance/check-out/'
 MONTHLY_URL   = '/api/v1/attendance/monthly/'
+SUMMARY_URL   = '/api/v1/attendance/monthly/summary/'
 LEAVES_URL    = '/api/v1/attendance/leaves/'
+IMPORT_URL    = '/api/v1/attendance/import/'
+PUNCHES_URL   = '/api/v1/attendance/punches/'
+MATRIX_URL    = '/api/v1/attendance/matrix/'
 
 
 # ── 공통 헬퍼 ────────────────────────────────────────────────────
@@ -86,7 +98,9 @@ class CheckInOutTest(APITestCase):
         self.assertEqual(res.status_code, status.HTTP_200_OK)
         self.assertTrue(res.data['success'])
         self.assertIsNotNone(res.data['data']['check_out'])
-        self.assertGreaterEqual(res.data['data']['work_minutes'], 0)
+        rec = AttendanceRecord.objects.get(employee=self.emp_obj, work_date=timezone.localdate())
+        self.assertIsNotNone(rec.check_out)
+        self.assertGreaterEqual(rec.work_minutes, 0)
 
     def test_check_out_without_check_in_fails(self):
         res = self.client.post(CHECK_OUT_URL)
@@ -110,15 +124,78 @@ class CheckInOutTest(APITestCase):
         )
         res = self.client.post(CHECK_OUT_URL)
         self.assertTrue(res.data['success'])
-        self.assertGreaterEqual(res.data['data']['overtime_minutes'], 55)  # 약 60분 초과
+        rec = AttendanceRecord.objects.get(employee=self.emp_obj, work_date=timezone.localdate())
+        self.assertGreaterEqual(rec.overtime_minutes, 55)  # 약 60분 초과
 
     def test_unauthenticated_fails(self):
         self.client.credentials()
         res = self.client.post(CHECK_IN_URL)
         self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
 
+    def test_check_out_minutes_computed_in_sql(self):
+        """SQL 계산이 AttendanceService.work_minutes(초 이하 버림)와 같은 값이어야 한다."""
+        from .services import AttendanceService
+        check_in = timezone.now() - datetime.timedelta(hours=9, minutes=30, seconds=59)
+        AttendanceRecord.objects.create(employee=self.emp_obj, work_date=timezone.localdate(), check_in=check_in)
+        res = self.client.post(CHECK_OUT_URL)
+        rec = AttendanceRecord.objects.get(employee=self.emp_obj, work_date=timezone.localdate())
+        self.assertEqual((rec.work_minutes, rec.overtime_minutes),
+                         AttendanceService.work_minutes(check_in, rec.check_out))
+        self.assertEqual((rec.work_minutes, rec.overtime_minutes), (570, 90))
+        self.assertEqual(res.data['data']['work_date'], str(rec.work_date))
+
+    def test_check_in_out_without_user_lookup(self):
+        """토큰 클레임으로 인증하므로 사용자·직원 조회 없이 INSERT/UPDATE와 요약 갱신만 실행한다."""
+        today = timezone.localdate()
+        MonthlyAttendanceSummary.objects.create(employee=self.emp_obj, year=today.year, month=today.month)
+        # savepoint + 기록 INSERT + 요약 UPDATE + release
+        with self.assertNumQueries(4):
+            res = self.client.post(CHECK_IN_URL)
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(res.data['data']['employee'], self.emp_obj.pk)
+        # savepoint + 조건부 UPDATE + 요약 UPDATE(서브쿼리) + release
+        with self.assertNumQueries(4):
+            res = self.client.post(CHECK_OUT_URL)
+        self.assertTrue(res.data['success'])
+        summary = MonthlyAttendanceSummary.objects.get(employee=self.emp_obj, year=today.year, month=today.month)
+        self.assertEqual(summary.days_worked, 1)
+
+    def test_token_without_claims_falls_back_to_db_user(self):
+        from rest_framework_simplejwt.tokens import RefreshToken
+        auth(self.client, str(RefreshToken.for_user(self.user).access_token))
+        res = self.client.post(CHECK_IN_URL)
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(res.data['data']['employee'], self.emp_obj.pk)
+
 
 # ── 월별 조회 테스트 ─────────────────────────────────────────────
+class CheckInConcurrencyTest(TransactionTestCase):
+    """동시 출근 요청: 사전 조회 없이 unique 제약으로 1건만 생성되어야 한다."""
+
+    def setUp(self):
+        reason = concurrency_skip_reason()
+        if reason:
+            self.skipTest(reason)
+
+    def test_concurrent_check_in_creates_one_record(self):
+        from .services import AttendanceService
+        emp = make_employee(make_dept(), make_pos())
+
+        results = run_concurrently(lambda: AttendanceService.check_in(emp.pk), threads=8)
+
+        ok     = [value for kind, value in results if kind == 'ok']
+        errors = [value for kind, value in results if kind == 'error']
+        self.assertEqual(len(ok), 1)
+        self.assertEqual(len(errors), 7)
+        for e in errors:
+            self.assertIsInstance(e, ValidationError)
+            self.assertEqual(str(e.detail[0]), '이미 오늘 출근 기록이 있습니다.')
+        self.assertEqual(AttendanceRecord.objects.filter(employee=emp).count(), 1)
+        today = timezone.localdate()
+        summary = MonthlyAttendanceSummary.objects.get(employee=emp, year=today.year, month=today.month)
+        self.assertEqual(summary.days_worked, 1)
+
+
 class MonthlyAttendanceTest(APITestCase):
 
     def setUp(self):
@@ -146,6 +223,559 @@ class MonthlyAttendanceTest(APITestCase):
         self.assertFalse(res.data['success'])
 
 
+# ── 월별 근태 요약 테스트 ────────────────────────────────────────
+class MonthlySummaryTest(APITestCase):
+
+    def setUp(self):
+        dept = make_dept()
+        pos  = make_pos()
+        self.emp_obj = make_employee(dept, pos)
+        self.other   = make_employee(dept, pos, 'EMP002', '이영희')
+        make_user('emp_sum', role='EMPLOYEE', employee=self.emp_obj)
+        make_user('hr_sum',  role='HR_MANAGER')
+        auth(self.client, get_token(self.client, 'emp_sum'))
+
+    def _summary(self, year=2024, month=1, employee=None):
+        return MonthlyAttendanceSummary.objects.get(
+            employee=employee or self.emp_obj, year=year, month=month,
+        )
+
+    def _record(self, day, work=500, overtime=20, employee=None):
+        return AttendanceRecord.objects.create(
+            employee=employee or self.emp_obj, work_date=day,
+            work_minutes=work, overtime_minutes=overtime,
+        )
+
+    def test_create_edit_delete_update_summary(self):
+        self._record(datetime.date(2024, 1, 2))
+        rec = self._record(datetime.date(2024, 1, 3), 540, 60)
+        s = self._summary()
+        self.assertEqual((s.days_worked, s.work_minutes, s.overtime_minutes), (2, 1040, 80))
+
+        # 다시 조회한 인스턴스 수정 → 차이만 반영
+        rec = AttendanceRecord.objects.get(pk=rec.pk)
+        rec.overtime_minutes = 90
+        rec.work_minutes = 570
+        rec.save()
+        s = self._summary()
+        self.assertEqual((s.days_worked, s.work_minutes, s.overtime_minutes), (2, 1070, 110))
+
+        # 근무일을 다른 달로 옮기면 두 달 모두 갱신
+        rec.work_date = datetime.date(2024, 2, 1)
+        rec.save()
+        self.assertEqual(self._summary().overtime_minutes, 20)
+        self.assertEqual(self._summary(month=2).overtime_minutes, 90)
+
+        AttendanceRecord.objects.filter(pk=rec.pk).delete()
+        s = self._summary(month=2)
+        self.assertEqual((s.days_worked, s.work_minutes, s.overtime_minutes), (0, 0, 0))
+
+    def test_check_out_updates_summary(self):
+        AttendanceRecord.objects.create(
+            employee=self.emp_obj, work_date=timezone.localdate(),
+            check_in=timezone.now() - datetime.timedelta(hours=9),
+        )
+        res = self.client.post(CHECK_OUT_URL)
+        self.assertTrue(res.data['success'])
+        today = timezone.localdate()
+        s = self._summary(today.year, today.month)
+        rec = AttendanceRecord.objects.get(employee=self.emp_obj, work_date=today)
+        self.assertEqual(s.days_worked, 1)
+        self.assertEqual(s.work_minutes, rec.work_minutes)
+        self.assertEqual(s.overtime_minutes, rec.overtime_minutes)
+
+        # 요약 행이 없어진 상태에서 퇴근해도 기록 전체가 반영된다
+        AttendanceRecord.objects.filter(pk=rec.pk).update(check_out=None)
+        MonthlyAttendanceSummary.objects.all().delete()
+        self.client.post(CHECK_OUT_URL)
+        s = self._summary(today.year, today.month)
+        rec = AttendanceRecord.objects.get(pk=rec.pk)
+        self.assertEqual((s.days_worked, s.work_minutes), (1, rec.work_minutes))
+
+    def test_rebuild_command_matches_incremental(self):
+        from io import StringIO
+        from django.core.management import call_command
+        for day in (2, 3, 4):
+            self._record(datetime.date(2024, 1, day), 480 + day, day)
+        self._record(datetime.date(2024, 1, 2), 600, 120, employee=self.other)
+        self._record(datetime.date(2024, 3, 2), 500, 20)
+        before = {
+            (s.employee_id, s.year, s.month): (s.days_worked, s.work_minutes, s.overtime_minutes)
+            for s in MonthlyAttendanceSummary.objects.all()
+        }
+        # 시그널을 거치지 않는 변경으로 어긋난 요약을 재구성
+        MonthlyAttendanceSummary.objects.update(overtime_minutes=0, days_worked=0)
+        out = StringIO()
+        call_command('rebuild_attendance_summary', stdout=out)
+        self.assertIn('3건', out.getvalue())
+        after = {
+            (s.employee_id, s.year, s.month): (s.days_worked, s.work_minutes, s.overtime_minutes)
+            for s in MonthlyAttendanceSummary.objects.all()
+        }
+        self.assertEqual(before, after)
+        self.assertEqual(after[(self.emp_obj.id, 2024, 1)], (3, 1449, 9))
+
+        call_command('rebuild_attendance_summary', year=2024, month=3, stdout=StringIO())
+        self.assertEqual(MonthlyAttendanceSummary.objects.count(), 3)
+
+    def test_summary_view_scope(self):
+        self._record(datetime.date(2024, 1, 2))
+        self._record(datetime.date(2024, 1, 2), employee=self.other)
+        res = self.client.get(SUMMARY_URL, {'year': 2024, 'month': 1})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual([r['employee_no'] for r in res.data['data']], ['EMP001'])
+
+        auth(self.client, get_token(self.client, 'hr_sum'))
+        res = self.client.get(SUMMARY_URL, {'year': 2024, 'month': 1})
+        self.assertEqual(len(res.data['data']), 2)
+        self.assertEqual(res.data['data'][0]['overtime_minutes'], 20)
+
+        res = self.client.get(SUMMARY_URL, {'year': 2024, 'month': 'x'})
+        self.assertFalse(res.data['success'])
+
+
+# ── 월간 근태 현황표 테스트 ──────────────────────────────────────────
+class AttendanceMatrixTest(APITestCase):
+
+    def setUp(self):
+        dept  = make_dept()
+        other = make_dept('인사팀', 'HR')
+        pos   = make_pos()
+        self.kim  = make_employee(dept, pos, 'EMP001', '김철수')
+        self.lee  = make_employee(other, pos, 'EMP002', '이영희')
+        # 2월 퇴사자는 3월 현황에서 빠진다
+        self.gone = make_employee(dept, pos, 'EMP003', '박퇴사')
+        Employee.objects.filter(pk=self.gone.pk).update(resign_date=datetime.date(2024, 2, 29), is_active=False)
+        make_user('emp_mx', role='EMPLOYEE', employee=self.kim)
+        make_user('hr_mx',  role='HR_MANAGER')
+        auth(self.client, get_token(self.client, 'hr_mx'))
+
+        for emp, day, work, overtime in (
+            (self.kim, 1, 480, 0), (self.kim, 31, 540, 60), (self.lee, 4, 500, 20), (self.gone, 1, 480, 0),
+        ):
+            AttendanceRecord.objects.create(
+                employee=emp, work_date=datetime.date(2024, 3, day), work_minutes=work, overtime_minutes=overtime,
+            )
+        AttendanceRecord.objects.create(employee=self.kim, work_date=datetime.date(2024, 4, 1), work_minutes=480)
+        for emp, leave_type, start, end, leave_status in (
+            (self.kim, 'ANNUAL',  (2024, 2, 28), (2024, 3, 2), 'APPROVED'),
+            (self.kim, 'SICK',    (2024, 3, 5),  (2024, 3, 6), 'PENDING'),
+            (self.kim, 'SPECIAL', (2024, 3, 6),  (2024, 3, 6), 'APPROVED'),  # 신청 중 휴가보다 우선
+            (self.kim, 'HALF',    (2024, 3, 8),  (2024, 3, 8), 'REJECTED'),
+            (self.lee, 'HALF',    (2024, 3, 29), (2024, 4, 2), 'APPROVED'),
+        ):
+            AttendanceLeave.objects.create(
+                employee=emp, leave_type=leave_type, reason='-', status=leave_status,
+                start_date=datetime.date(*start), end_date=datetime.date(*end),
+            )
+
+    def test_matrix_payload(self):
+        res = self.client.get(MATRIX_URL, {'year': 2024, 'month': 3})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        data = res.data['data']
+        self.assertEqual(len(data['days']), 31)
+        self.assertEqual(data['days'][0], '2024-03-01')
+        self.assertEqual(data['employees']['employee_no'], ['EMP001', 'EMP002'])
+        self.assertEqual(data['employees']['department'], ['개발팀', '인사팀'])
+        self.assertEqual(len(data['work_minutes']), 2 * 31)
+        # 직원 i, 날짜 d → i * 31 + d
+        self.assertEqual(data['work_minutes'][0], 480)
+        self.assertEqual(data['work_minutes'][30], 540)
+        self.assertEqual(data['overtime_minutes'][30], 60)
+        self.assertEqual(data['work_minutes'][31 + 3], 500)
+        self.assertIsNone(data['work_minutes'][1])
+        self.assertEqual(sum(1 for v in data['work_minutes'] if v is not None), 3)
+        self.assertEqual(data['leave'][0], 'AA..sP' + '.' * 25)
+        self.assertEqual(data['leave'][1], '.' * 28 + 'HHH')
+        self.assertEqual(data['leave_codes']['A'], '연차')
+
+    def test_department_filter_and_queries(self):
+        from .matrix import build_matrix
+        with self.assertNumQueries(3):
+            data = build_matrix(2024, 3, self.lee.department_id)
+        self.assertEqual(data['employees']['id'], [self.lee.id])
+        self.assertEqual(len(data['work_minutes']), 31)
+        self.assertEqual(data['leave'], ['.' * 28 + 'HHH'])
+
+        # 2월은 29일
+        self.assertEqual(len(build_matrix(2024, 2)['days']), 29)
+
+    def test_permission_and_params(self):
+        for params in ({'year': 2024}, {'year': 2024, 'month': 13}, {'year': 2024, 'month': 3, 'department': 'x'}):
+            res = self.client.get(MATRIX_URL, params)
+            self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+        auth(self.client, get_token(self.client, 'emp_mx'))
+        res = self.client.get(MATRIX_URL, {'year': 2024, 'month': 3})
+        self.assertEqual(res.status_code, status.HTTP_403_FORBIDDEN)
+
+
+# ── 월 조회 실행 계획 테스트 ─────────────────────────────────────────
+class MonthQueryPlanTest(APITestCase):
+    """월 단위 조회가 날짜 범위로 인덱스를 타는지 (EXTRACT·전체 스캔으로 돌아가면 실패)."""
+
+    def setUp(self):
+        reason = explain_skip_reason()
+        if reason:
+            self.skipTest(reason)
+        dept = make_dept()
+        pos  = make_pos()
+        self.emp_obj = make_employee(dept, pos)
+        other = make_employee(dept, pos, 'EMP002', '이영희')
+        for emp in (self.emp_obj, other):
+            for month, day in ((2, 28), (3, 1), (3, 15), (4, 1)):
+                AttendanceRecord.objects.create(
+                    employee=emp, work_date=datetime.date(2024, month, day), work_minutes=480,
+                )
+            AttendanceLeave.objects.create(
+                employee=emp, leave_type='ANNUAL', reason='-', status='APPROVED',
+                start_date=datetime.date(2024, 3, 4), end_date=datetime.date(2024, 3, 5),
+            )
+
+    def _steps(self, steps, table):
+        steps = [s for s in steps if s['table'] == table]
+        self.assertTrue(steps, f'{table} 접근 단계가 없습니다.')
+        return steps
+
+    def assertIndexRange(self, steps, table):
+        for step in self._steps(steps, table):
+            self.assertFalse(step['full_scan'], f'{table} 전체 스캔: {step}')
+            self.assertTrue(step['range'], f'{table} 범위 탐색 아님: {step}')
+            # work_date__year는 BETWEEN이 되어 범위 탐색은 유지되지만 __month는 조건절의 EXTRACT로 남는다
+            where = re.split(r' GROUP BY | ORDER BY ', step['sql'].upper().split(' WHERE ', 1)[-1])[0]
+            self.assertNotIn('EXTRACT', where, f'{table} 월 조건이 날짜 범위가 아닙니다: {step["sql"]}')
+
+    def test_monthly_records(self):
+        from .services import AttendanceService
+        qs = AttendanceService.get_monthly_records(self.emp_obj, 2024, 3)
+        self.assertEqual(len(qs), 2)
+        self.assertIndexRange(query_plan(*qs.query.sql_with_params()), 'attendance_record')
+
+    def test_summary_rebuild(self):
+        from .services import MonthlySummaryService
+        self.assertIndexRange(
+            explain_queries(lambda: MonthlySummaryService.rebuild(2024, 3)), 'attendance_record',
+        )
+        self.assertIndexRange(
+            explain_queries(lambda: MonthlySummaryService.rebuild(2024)), 'attendance_record',
+        )
+
+    def test_matrix(self):
+        from .matrix import build_matrix
+        steps = explain_queries(lambda: build_matrix(2024, 3))
+        self.assertIndexRange(steps, 'attendance_record')
+        self.assertIndexRange(steps, 'attendance_leave')
+
+        steps = explain_queries(lambda: build_matrix(2024, 3, self.emp_obj.department_id))
+        for table in ('attendance_record', 'attendance_leave'):
+            for step in self._steps(steps, table):
+                self.assertFalse(step['full_scan'], f'{table} 전체 스캔: {step}')
+
+
+# ── 출퇴근 기록 일괄 적재 테스트 ────────────────────────────────────
+class AttendanceImportTest(APITestCase):
+
+    def setUp(self):
+        dept = make_dept()
+        pos  = make_pos()
+        self.emp_obj = make_employee(dept, pos)
+        self.other   = make_employee(dept, pos, 'EMP002', '이영희')
+        make_user('emp_imp', role='EMPLOYEE', employee=self.emp_obj)
+        make_user('hr_imp',  role='HR_MANAGER')
+        auth(self.client, get_token(self.client, 'hr_imp'))
+
+    def _upload(self, text, encoding='utf-8', **data):
+        from django.core.files.uploadedfile import SimpleUploadedFile
+        upload = SimpleUploadedFile('punches.csv', text.encode(encoding), content_type='text/csv')
+        return self.client.post(IMPORT_URL, {'file': upload, 'encoding': encoding, **data}, format='multipart')
+
+    def _summary(self, employee=None, month=5):
+        s = MonthlyAttendanceSummary.objects.get(employee=employee or self.emp_obj, year=2024, month=month)
+        return s.days_worked, s.work_minutes, s.overtime_minutes
+
+    def test_import_creates_records_with_check_out_rules(self):
+        res = self._upload(
+            'employee_no,work_date,check_in,check_out\n'
+            'EMP001,2024-05-02,09:00,19:30\n'
+            'EMP001,2024-05-03,22:00,07:00\n'                       # 야간 근무 → 다음 날 퇴근
+            'EMP002,2024-05-02,2024-05-02 08:30,2024-05-02 17:29:59\n'
+            'EMP002,2024-05-03,09:00,\n'                             # 출근만
+        )
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data['data']['created'], 4)
+        self.assertEqual(res.data['data']['errors'], 0)
+
+        rec = AttendanceRecord.objects.get(employee=self.emp_obj, work_date=datetime.date(2024, 5, 2))
+        self.assertEqual((rec.work_minutes, rec.overtime_minutes), (630, 150))
+        self.assertEqual(timezone.localtime(rec.check_in).hour, 9)
+        night = AttendanceRecord.objects.get(employee=self.emp_obj, work_date=datetime.date(2024, 5, 3))
+        self.assertEqual(timezone.localtime(night.check_out).date(), datetime.date(2024, 5, 4))
+        self.assertEqual((night.work_minutes, night.overtime_minutes), (540, 60))
+        self.assertEqual(
+            AttendanceRecord.objects.get(employee=self.other, work_date=datetime.date(2024, 5, 2)).work_minutes,
+            539,
+        )
+        open_rec = AttendanceRecord.objects.get(employee=self.other, work_date=datetime.date(2024, 5, 3))
+        self.assertIsNone(open_rec.check_out)
+
+        self.assertEqual(self._summary(), (2, 1170, 210))
+        self.assertEqual(self._summary(self.other), (2, 539, 59))
+
+    def test_reimport_updates_and_keeps_summary_consistent(self):
+        AttendanceRecord.objects.create(
+            employee=self.emp_obj, work_date=datetime.date(2024, 5, 2), work_minutes=100, overtime_minutes=0,
+        )
+        res = self._upload(
+            'work_date,employee_no,check_in,check_out\n'
+            '2024-05-02,EMP001,09:00,18:00\n'
+            '2024-05-02,EMP001,09:00,20:00\n'                        # 같은 날 중복 → 뒤의 행
+            '2024-05-31,EMP001,09:00,18:00\n'
+            '2024-06-01,EMP001,09:00,18:00\n'
+        )
+        self.assertEqual((res.data['data']['created'], res.data['data']['updated']), (2, 1))
+        self.assertEqual(AttendanceRecord.objects.get(work_date=datetime.date(2024, 5, 2)).work_minutes, 660)
+        self.assertEqual(self._summary(), (2, 1200, 240))
+        self.assertEqual(self._summary(month=6), (1, 540, 60))
+
+        # 증분 반영 결과가 재구성 결과와 같아야 한다
+        before = set(MonthlyAttendanceSummary.objects.values_list(
+            'employee_id', 'year', 'month', 'days_worked', 'work_minutes', 'overtime_minutes'))
+        from apps.attendance.services import MonthlySummaryService
+        MonthlySummaryService.rebuild()
+        after = set(MonthlyAttendanceSummary.objects.values_list(
+            'employee_id', 'year', 'month', 'days_worked', 'work_minutes', 'overtime_minutes'))
+        self.assertEqual(before, after)
+
+    def test_row_errors_are_reported_and_skipped(self):
+        res = self._upload(
+            'employee_no,work_date,check_in,check_out\n'
+            'EMP001,2024-05-02,09:00,18:00\n'
+            'NOPE,2024-05-02,09:00,18:00\n'
+            'EMP002,2024-13-02,09:00,18:00\n'
+            'EMP002,2024-05-02,,18:00\n'
+            'EMP002,2024-05-03,9시,18:00\n'
+            'EMP002,2024-05-04,2024-05-04 09:00,2024-05-03 18:00\n'
+            'EMP002,2024-05-05,09:00,18:00,extra\n'
+        )
+        data = res.data['data']
+        self.assertEqual((data['rows'], data['created'], data['errors']), (7, 1, 6))
+        self.assertEqual([e['line'] for e in data['error_rows']], [3, 4, 5, 6, 7, 8])
+        self.assertEqual(data['error_rows'][0]['employee_no'], 'NOPE')
+        self.assertIn('존재하지 않는 사번', data['error_rows'][0]['error'])
+        self.assertIn('오류 6행', res.data['message'])
+
+    def test_missing_column_and_permission(self):
+        res = self._upload('employee_no,check_in\nEMP001,09:00\n')
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('work_date', res.data['message'])
+        self.assertEqual(self.client.post(IMPORT_URL, {}, format='multipart').status_code,
+                         status.HTTP_400_BAD_REQUEST)
+
+        auth(self.client, get_token(self.client, 'emp_imp'))
+        res = self._upload('employee_no,work_date,check_in,check_out\n')
+        self.assertEqual(res.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_cp949_file(self):
+        res = self._upload('employee_no,work_date,check_in,check_out,비고\nEMP001,2024-05-02,09:00,18:00,정상\n',
+                           encoding='cp949')
+        self.assertEqual(res.data['data']['created'], 1)
+
+    def test_chunked_import_query_count(self):
+        from apps.attendance import importer
+        lines = ['employee_no,work_date,check_in,check_out']
+        for day in range(1, 31):
+            for emp in ('EMP001', 'EMP002'):
+                lines.append(f'{emp},2024-05-{day:02d},09:00,18:30')
+        stream = io.StringIO('\n'.join(lines) + '\n')
+        chunks = []
+        # 직원 dict 1회 + chunk(20행)마다 기존 행·upsert·요약 조회·요약 upsert 4회 + savepoint 2회
+        with self.assertNumQueries(1 + 3 * 6):
+            result = importer.import_rows(csv.DictReader(stream), chunk_size=20, on_chunk=chunks.append)
+        self.assertEqual(result['created'], 60)
+        self.assertEqual(chunks, [20, 40, 60])
+        self.assertEqual(self._summary(), (30, 30 * 570, 30 * 90))
+
+    def test_import_command_writes_error_report(self):
+        import tempfile
+        from io import StringIO
+        from django.core.management import call_command
+
+        with tempfile.TemporaryDirectory() as directory:
+            path, report = f'{directory}/punches.csv', f'{directory}/errors.csv'
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write('employee_no,work_date,check_in,check_out\nEMP001,2024-05-02,09:00,18:00\nX,2024-05-02,09:00,\n')
+            out = StringIO()
+            call_command('import_attendance', path, errors=report, stdout=out)
+            self.assertIn('생성 1, 갱신 0, 오류 1', out.getvalue())
+            with open(report, encoding='utf-8-sig') as f:
+                self.assertEqual(list(csv.reader(f))[1], ['3', 'X', '존재하지 않는 사번입니다: X'])
+
+    def test_background_import_job(self):
+        import os
+        import tempfile
+        from apps.jobs.services import JobService
+
+        with tempfile.TemporaryDirectory() as directory, self.settings(JOB_RESULT_DIR=directory):
+            res = self._upload('employee_no,work_date,check_in,check_out\nEMP001,2024-05-02,09:00,18:00\n',
+                               background='true')
+            self.assertEqual(res.status_code, status.HTTP_202_ACCEPTED)
+            path = res.data['data']['params']['path']
+            self.assertTrue(os.path.isfile(path))
+
+            job = JobService.run_next('test')
+            self.assertEqual(job.state, 'SUCCEEDED', job.error)
+            self.assertEqual(job.result['created'], 1)
+            self.assertFalse(os.path.exists(path))
+
+        # 업로드 디렉터리 밖의 경로는 작업 파라미터로 받지 않는다
+        res = self.client.post('/api/v1/jobs/', {'kind': 'attendance_import', 'params': {'path': '/etc/passwd'}},
+                               format='json')
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+    def test_background_import_keeps_file_until_terminal_state(self):
+        import os
+        import tempfile
+        from unittest.mock import patch
+        from apps.jobs.models import Job
+        from apps.jobs.services import JobService
+        from . import importer
+
+        with tempfile.TemporaryDirectory() as directory, self.settings(JOB_RESULT_DIR=directory):
+            body = 'employee_no,work_date,check_in,check_out\nEMP001,2024-05-02,09:00,18:00\n'
+            path = self._upload(body, background='true').data['data']['params']['path']
+
+            # 작업자 중단: 작업은 RUNNING으로 남아 다시 대기열에 들어가므로 파일을 지우지 않는다
+            with patch.object(importer, 'import_file', side_effect=KeyboardInterrupt):
+                with self.assertRaises(KeyboardInterrupt):
+                    JobService.run_next('w1')
+            self.assertTrue(os.path.isfile(path))
+            Job.objects.update(state=Job.State.QUEUED)
+            self.assertEqual(JobService.run_next('w2').state, 'SUCCEEDED')
+            self.assertFalse(os.path.exists(path))
+
+            # 실패(종료 상태)면 지운다
+            path = self._upload(body, background='true').data['data']['params']['path']
+            with patch.object(importer, 'import_file', side_effect=RuntimeError('적재 실패')), \
+                    self.assertLogs('apps.jobs.services', 'ERROR'):
+                job = JobService.run_next('w1')
+            self.assertEqual(job.state, 'FAILED')
+            self.assertFalse(os.path.exists(path))
+
+# ── 출퇴근 이벤트 반영 테스트 ──────────────────────────────────────
+class PunchEventFoldTest(APITestCase):
+
+    def setUp(self):
+        dept = make_dept()
+        pos  = make_pos()
+        self.emp_obj = make_employee(dept, pos)
+        self.other   = make_employee(dept, pos, 'EMP002', '이영희')
+        make_user('emp_punch', role='EMPLOYEE', employee=self.emp_obj)
+        make_user('hr_punch',  role='HR_MANAGER')
+        auth(self.client, get_token(self.client, 'hr_punch'))
+
+    def _post(self, *events, source='TERMINAL'):
+        items = [
+            {'employee_no': no, 'timestamp': ts, 'kind': kind, **({'work_date': day} if day else {})}
+            for no, ts, kind, day in ((*e, None) if len(e) == 3 else e for e in events)
+        ]
+        return self.client.post(PUNCHES_URL, {'source': source, 'events': items}, format='json')
+
+    def _fold(self, **options):
+        from .punches import fold_new
+        return fold_new(lag=datetime.timedelta(0), **options)
+
+    def _record(self, employee=None, day=datetime.date(2024, 5, 2)):
+        rec = AttendanceRecord.objects.get(employee=employee or self.emp_obj, work_date=day)
+        local = lambda value: value and timezone.localtime(value).strftime('%m-%d %H:%M')
+        return local(rec.check_in), local(rec.check_out), rec.work_minutes, rec.overtime_minutes
+
+    def test_record_events_validates_and_appends(self):
+        res = self._post(
+            ('EMP001', '2024-05-02T08:58:00', 'IN'),
+            ('NOPE',   '2024-05-02T09:00:00', 'IN'),
+            ('EMP001', '2024-05-02 18:00', 'out'),
+            ('EMP001', 'yesterday', 'IN'),
+        )
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual((res.data['data']['created'], res.data['data']['errors']), (2, 2))
+        self.assertEqual([e['index'] for e in res.data['data']['error_rows']], [1, 3])
+        self.assertEqual(list(PunchEvent.objects.values_list('kind', flat=True).order_by('id')), ['IN', 'OUT'])
+        # 이벤트만 쌓이고 출퇴근 기록은 fold 전까지 생기지 않는다
+        self.assertFalse(AttendanceRecord.objects.exists())
+
+        self.assertEqual(self._post(('EMP001', '2024-05-02T08:58', 'IN'), source='X').status_code,
+                         status.HTTP_400_BAD_REQUEST)
+        auth(self.client, get_token(self.client, 'emp_punch'))
+        self.assertEqual(self._post(('EMP001', '2024-05-02T08:58', 'IN')).status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_fold_multiple_punches_and_watermark(self):
+        self._post(
+            ('EMP001', '2024-05-02T09:02', 'IN'),
+            ('EMP001', '2024-05-02T08:58', 'IN'),
+            ('EMP001', '2024-05-02T18:00', 'OUT'),
+            ('EMP001', '2024-05-02T18:30', 'OUT'),
+            ('EMP002', '2024-05-02T22:00', 'IN'),
+            ('EMP002', '2024-05-03T07:00', 'OUT', '2024-05-02'),   # 야간 근무: 근무일 지정
+        )
+        result = self._fold(batch_size=4)
+        self.assertEqual(result['events'], 6)
+        self.assertEqual(result['watermark'], PunchEvent.objects.order_by('-id').first().id)
+        self.assertEqual(self._record(), ('05-02 08:58', '05-02 18:30', 572, 92))
+        self.assertEqual(self._record(self.other), ('05-02 22:00', '05-03 07:00', 540, 60))
+        summary = MonthlyAttendanceSummary.objects.get(employee=self.emp_obj, year=2024, month=5)
+        self.assertEqual((summary.days_worked, summary.work_minutes), (1, 572))
+
+        # 다시 실행해도 새 이벤트가 없으면 아무것도 바꾸지 않는다
+        self.assertEqual(self._fold()['events'], 0)
+        # 늦게 올라온 오프라인 단말기 이벤트(과거 시각)도 id 순으로 반영된다
+        self._post(('EMP001', '2024-05-02T08:40', 'IN'), source='OFFLINE')
+        self.assertEqual(self._fold(), {'events': 1, 'days': 1, 'watermark': result['watermark'] + 1})
+        self.assertEqual(self._record()[:2], ('05-02 08:40', '05-02 18:30'))
+
+    def test_correction_and_refold_are_idempotent(self):
+        from io import StringIO
+        from django.core.management import call_command
+        from .punches import refold
+
+        self._post(('EMP001', '2024-05-02T07:10', 'IN'), ('EMP001', '2024-05-02T18:00', 'OUT'))
+        self._post(('EMP001', '2024-05-02T09:00', 'IN'), source='CORRECTION')
+        self._fold()
+        self.assertEqual(self._record(), ('05-02 09:00', '05-02 18:00', 540, 60))
+
+        snapshot = lambda: (
+            list(AttendanceRecord.objects.values_list('employee_id', 'work_date', 'check_in', 'check_out',
+                                                      'work_minutes', 'overtime_minutes')),
+            list(MonthlyAttendanceSummary.objects.values_list('employee_id', 'days_worked', 'work_minutes')),
+        )
+        before = snapshot()
+        self.assertEqual(refold(datetime.date(2024, 5, 1), datetime.date(2024, 5, 31)), 0)
+        out = StringIO()
+        call_command('fold_punches', '--from', '2024-05-01', '--to', '2024-05-31', stdout=out)
+        self.assertIn('0일 갱신', out.getvalue())
+        self.assertEqual(snapshot(), before)
+
+        # 나중 정정이 앞의 정정보다 우선한다
+        self._post(('EMP001', '2024-05-02T08:30', 'IN'), source='CORRECTION')
+        self._fold()
+        self.assertEqual(self._record()[0], '05-02 08:30')
+
+    def test_fold_merges_with_existing_record(self):
+        check_in = timezone.make_aware(datetime.datetime(2024, 5, 2, 9, 0))
+        AttendanceRecord.objects.create(employee=self.emp_obj, work_date=datetime.date(2024, 5, 2), check_in=check_in)
+        self._post(('EMP001', '2024-05-02T19:00', 'OUT'))
+        self._fold()
+        self.assertEqual(self._record(), ('05-02 09:00', '05-02 19:00', 600, 120))
+        summary = MonthlyAttendanceSummary.objects.get(employee=self.emp_obj, year=2024, month=5)
+        self.assertEqual((summary.days_worked, summary.work_minutes, summary.overtime_minutes), (1, 600, 120))
+
+    def test_recent_events_wait_for_lag(self):
+        from .punches import fold_new
+        self._post(('EMP001', '2024-05-02T09:00', 'IN'))
+        self.assertEqual(fold_new()['events'], 0)
+        self.assertEqual(self._fold()['events'], 1)
+
+
 # ── 휴가 신청 테스트 ─────────────────────────────────────────────
 class LeaveTest(APITestCase):
 
@@ -198,6 +828,37 @@ class LeaveTest(APITestCase):
         self.assertEqual(res.status_code, status.HTTP_200_OK)
         self.assertEqual(len(res.data['data']), 1)
 
+    def test_hr_list_filtered_by_status(self):
+        for leave_status in ('PENDING', 'APPROVED', 'PENDING'):
+            AttendanceLeave.objects.create(
+                employee=self.emp_obj, leave_type='ANNUAL', status=leave_status,
+                start_date=datetime.date(2024, 6, 1), end_date=datetime.date(2024, 6, 1),
+            )
+        auth(self.client, get_token(self.client, 'hr1'))
+        res = self.client.get(LEAVES_URL, {'status': 'PENDING'})
+        self.assertEqual([r['status'] for r in res.data['data']], ['PENDING', 'PENDING'])
+        res = self.client.get(LEAVES_URL, {'status': 'UNKNOWN'})
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_hr_list_cursor_with_equal_created_at(self):
+        for i in range(7):
+            AttendanceLeave.objects.create(
+                employee=self.emp_obj, leave_type='ANNUAL',
+                start_date=datetime.date(2024, 6, 1), end_date=datetime.date(2024, 6, 1),
+            )
+        # 같은 created_at이어도 id로 순서가 고정되어야 함
+        AttendanceLeave.objects.update(created_at=timezone.now())
+        auth(self.client, get_token(self.client, 'hr1'))
+        ids, cursor = [], None
+        while True:
+            res = self.client.get(LEAVES_URL, {'page_size': 3, **({'cursor': cursor} if cursor else {})})
+            ids += [r['id'] for r in res.data['data']]
+            cursor = res.data['next']
+            if not cursor:
+                break
+        expected = list(AttendanceLeave.objects.order_by('-id').values_list('id', flat=True))
+        self.assertEqual(ids, expected)
+
     def test_unauthenticated_cannot_request(self):
         self.client.credentials()
         res = self.client.post(LEAVES_URL, self.leave_data)
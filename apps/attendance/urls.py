@@ -4,6 +4,10 @@ from .views import (
     CheckInView,
     CheckOutView,
     MonthlyAttendanceView,
+    MonthlySummaryView,
+    AttendanceMatrixView,
+    AttendanceImportView,
+    PunchEventView,
     LeaveListCreateView,
     LeaveApprovalView,
 )
@@ -12,6 +16,10 @@ urlpatterns = [
     path('check-in/',      CheckInView.as_view(),          name='attendance-check-in'),
     path('check-out/',     CheckOutView.as_view(),          name='attendance-check-out'),
     path('monthly/',       MonthlyAttendanceView.as_view(), name='attendance-monthly'),
+    path('monthly/summary/', MonthlySummaryView.as_view(),  name='attendance-monthly-summary'),
+    path('matrix/',        AttendanceMatrixView.as_view(),  name='attendance-matrix'),
+    path('import/',        AttendanceImportView.as_view(),  name='attendance-import'),
+    path('punches/',       PunchEventView.as_view(),        name='attendance-punches'),
     path('leaves/',        LeaveListCreateView.as_view(),   name='leave-list-create'),
     path('leaves/<int:pk>/approve/', LeaveApprovalView.as_view(), name='leave-approval'),
 ]
@@ -1,12 +1,23 @@
+import datetime
+import os
+
 from django.shortcuts import get_object_or_404
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 
+from apps.accounts.authentication import TokenClaimsAuthentication
 from apps.accounts.permissions import IsEmployee, IsHRManager
-from .models import AttendanceRecord, AttendanceLeave
+from apps.jobs.serializers import JobSerializer
+from apps.jobs.services import JobService
+from apps.utils.pagination import InvalidCursor, paginate, paginated_response
+from . import importer, matrix, punches
+from .models import AttendanceRecord, AttendanceLeave, MonthlyAttendanceSummary, PunchEvent
 from .serializers import (
+    AttendancePunchSerializer,
     AttendanceRecordSerializer,
+    CheckOutResultSerializer,
+    MonthlyAttendanceSummarySerializer,
     AttendanceLeaveSerializer,
     LeaveApprovalSerializer,
 )
@@ -37,34 +48,44 @@ def _extract_error(exc) -> str:
 
 # ── 출근 ────────────────────────────────────────────────────────────
 class CheckInView(APIView):
-    """POST /api/v1/attendance/check-in/"""
+    """
+    POST /api/v1/attendance/check-in/
+    출근 시간대에 요청이 몰리므로 사용자·직원 행을 읽지 않는다
+    (토큰 클레임의 employee_id로 INSERT 한 번 + 월별 요약 갱신).
+    """
+    authentication_classes = [TokenClaimsAuthentication]
     permission_classes = [IsEmployee]
 
     def post(self, request):
-        user = request.user
-        if not user.employee_id:
+        employee_id = request.user.employee_id
+        if not employee_id:
             return err('연결된 직원 정보가 없습니다.', status.HTTP_400_BAD_REQUEST)
         try:
-            record = AttendanceService.check_in(user.employee)
+            record = AttendanceService.check_in(employee_id)
         except Exception as e:
             return err(_extract_error(e))
-        return ok(AttendanceRecordSerializer(record).data, '출근 처리되었습니다.', status.HTTP_201_CREATED)
+        return ok(AttendancePunchSerializer(record).data, '출근 처리되었습니다.', status.HTTP_201_CREATED)
 
 
 # ── 퇴근 ────────────────────────────────────────────────────────────
 class CheckOutView(APIView):
-    """POST /api/v1/attendance/check-out/"""
+    """
+    POST /api/v1/attendance/check-out/
+    조건부 UPDATE로 처리하며 기록을 읽지 않으므로 응답에는 퇴근 시각만 싣는다
+    (근무·초과근무 분은 월별 조회에서 확인).
+    """
+    authentication_classes = [TokenClaimsAuthentication]
     permission_classes = [IsEmployee]
 
     def post(self, request):
-        user = request.user
-        if not user.employee_id:
+        employee_id = request.user.employee_id
+        if not employee_id:
             return err('연결된 직원 정보가 없습니다.')
         try:
-            record = AttendanceService.check_out(user.employee)
+            result = AttendanceService.check_out(employee_id)
         except Exception as e:
             return err(_extract_error(e))
-        return ok(AttendanceRecordSerializer(record).data, '퇴근 처리되었습니다.')
+        return ok(CheckOutResultSerializer(result).data, '퇴근 처리되었습니다.')
 
 
 # ── 월별 근태 조회 ──────────────────────────────────────────────────
@@ -82,15 +103,137 @@ class MonthlyAttendanceView(APIView):
             month = int(request.query_params.get('month', ''))
         except (ValueError, TypeError):
             return err('year, month 파라미터를 정수로 입력해주세요.')
+        if not (1 <= month <= 12):
+            return err('month는 1~12 사이여야 합니다.')
+        if not (datetime.MINYEAR <= year <= datetime.MAXYEAR):
+            return err('year 파라미터가 올바르지 않습니다.')
 
         records = AttendanceService.get_monthly_records(user.employee, year, month)
         return ok(AttendanceRecordSerializer(records, many=True).data)
 
 
+# ── 월별 근태 요약 ──────────────────────────────────────────────────
+class MonthlySummaryView(APIView):
+    """
+    GET /api/v1/attendance/monthly/summary/?year=2024&month=1[&department=<id>]
+    직원별 월 합계 1행씩 (MonthlyAttendanceSummary). 일반 직원은 본인 행만, HR은 전체.
+    """
+    permission_classes = [IsEmployee]
+
+    def get(self, request):
+        user = request.user
+        try:
+            year  = int(request.query_params.get('year',  ''))
+            month = int(request.query_params.get('month', ''))
+        except (ValueError, TypeError):
+            return err('year, month 파라미터를 정수로 입력해주세요.')
+
+        qs = MonthlyAttendanceSummary.objects.filter(year=year, month=month).select_related('employee')
+        if user.role in ('ADMIN', 'HR_MANAGER'):
+            department = request.query_params.get('department')
+            if department:
+                if not department.isdigit():
+                    return err('department 파라미터는 부서 id(정수)여야 합니다.')
+                qs = qs.filter(employee__department_id=int(department))
+        else:
+            if not user.employee_id:
+                return err('연결된 직원 정보가 없습니다.')
+            qs = qs.filter(employee=user.employee)
+        return ok(MonthlyAttendanceSummarySerializer(qs.order_by('employee__employee_no'), many=True).data)
+
+
+# ── 월간 근태 현황표 ────────────────────────────────────────────────
+class AttendanceMatrixView(APIView):
+    """
+    GET /api/v1/attendance/matrix/?year=2024&month=1[&department=<id>]
+    직원 × 일 근무·초과근무 분과 휴가 코드를 열 단위 배열로 반환 (HR 전용, 형식은 apps.attendance.matrix 참고).
+    """
+    permission_classes = [IsHRManager]
+
+    def get(self, request):
+        try:
+            year  = int(request.query_params.get('year',  ''))
+            month = int(request.query_params.get('month', ''))
+        except (ValueError, TypeError):
+            return err('year, month 파라미터를 정수로 입력해주세요.')
+        if not (1 <= month <= 12):
+            return err('month는 1~12 사이여야 합니다.')
+        if not (datetime.MINYEAR <= year <= datetime.MAXYEAR):
+            return err('year 파라미터가 올바르지 않습니다.')
+
+        department = request.query_params.get('department')
+        if department and not department.isdigit():
+            return err('department 파라미터는 부서 id(정수)여야 합니다.')
+        return ok(matrix.build_matrix(year, month, int(department) if department else None))
+
+
+# ── 출퇴근 기록 일괄 적재 ────────────────────────────────────────────
+class AttendanceImportView(APIView):
+    """
+    POST /api/v1/attendance/import/  (multipart)
+      file:       근태 단말기 CSV (employee_no, work_date, check_in, check_out)
+      encoding:   utf-8(기본) | cp949
+      background: true이면 파일을 보관하고 attendance_import 작업으로 등록한다 (202, 대용량 파일용)
+    결과: 처리 행 수, 생성/갱신 건수, 오류 건수와 오류 행 (앞의 MAX_ERROR_ROWS건)
+    """
+    permission_classes = [IsHRManager]
+
+    def post(self, request):
+        upload = request.FILES.get('file')
+        if upload is None:
+            return err('file을 첨부해주세요.')
+        encoding = request.data.get('encoding') or 'utf-8'
+        if encoding not in importer.ENCODINGS:
+            return err(f'encoding은 {", ".join(importer.ENCODINGS)} 중 하나여야 합니다.')
+
+        if str(request.data.get('background')).lower() in ('true', '1', 'yes', 'on'):
+            path = importer.save_upload(upload)
+            try:
+                job = JobService.enqueue('attendance_import', {'path': path, 'encoding': encoding},
+                                         user=request.user)
+            except Exception as e:
+                os.remove(path)
+                return err(_extract_error(e))
+            return ok(JobSerializer(job).data, '출퇴근 기록 적재 작업이 등록되었습니다.', status.HTTP_202_ACCEPTED)
+
+        try:
+            result = importer.import_file(upload, encoding)
+        except Exception as e:
+            return err(_extract_error(e))
+        message = f'{result["created"] + result["updated"]:,}건 적재되었습니다.'
+        if result['errors']:
+            message += f' (오류 {result["errors"]:,}행 제외)'
+        return ok(result, message)
+
+
+# ── 출퇴근 이벤트 수신 ──────────────────────────────────────────────
+class PunchEventView(APIView):
+    """
+    POST /api/v1/attendance/punches/
+      {"source": "TERMINAL"|"OFFLINE"|"CORRECTION",
+       "events": [{"employee_no", "timestamp", "kind": "IN"|"OUT", "work_date"?}, ...]}
+    단말기 연동 계정(HR 권한)이 이벤트를 추가만 한다. 출퇴근 기록 반영은 fold_punches가 한다.
+    """
+    permission_classes = [IsHRManager]
+
+    def post(self, request):
+        events = request.data.get('events')
+        if not isinstance(events, list) or not events:
+            return err('events 목록이 필요합니다.')
+        try:
+            result = punches.record_events(events, request.data.get('source') or PunchEvent.Source.TERMINAL)
+        except Exception as e:
+            return err(_extract_error(e))
+        message = f'이벤트 {result["created"]:,}건이 기록되었습니다.'
+        if result['errors']:
+            message += f' (오류 {result["errors"]:,}건 제외)'
+        return ok(result, message, status.HTTP_201_CREATED)
+
+
 # ── 휴가 목록 / 신청 ────────────────────────────────────────────────
 class LeaveListCreateView(APIView):
     """
-    GET  /api/v1/attendance/leaves/   — 본인 휴가 목록 (HR은 전체)
+    GET  /api/v1/attendance/leaves/   — 본인 휴가 목록 (HR은 전체), 최신 신청순 cursor 페이지 (?status=)
     POST /api/v1/attendance/leaves/   — 휴가 신청
     """
     permission_classes = [IsEmployee]
@@ -101,9 +244,18 @@ class LeaveListCreateView(APIView):
             qs = AttendanceLeave.objects.select_related('employee', 'approver').all()
         else:
             if not user.employee_id:
-                return ok([])
-            qs = AttendanceLeave.objects.filter(employee=user.employee).select_related('approver')
-        return ok(AttendanceLeaveSerializer(qs, many=True).data)
+                return paginated_response([], None)
+            qs = AttendanceLeave.objects.filter(employee=user.employee).select_related('employee', 'approver')
+        leave_status = request.query_params.get('status')
+        if leave_status:
+            if leave_status not in AttendanceLeave.Status.values:
+                return err('status 값이 올바르지 않습니다.')
+            qs = qs.filter(status=leave_status)
+        try:
+            page, next_cursor = paginate(request, qs, ('-created_at', '-id'))
+        except InvalidCursor as e:
+            return err(str(e))
+        return paginated_response(AttendanceLeaveSerializer(page, many=True).data, next_cursor)
 
     def post(self, request):
         user = request.user
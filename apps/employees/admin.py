@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from apps.utils.encryption import decrypt, mask_resident_no
+from apps.utils.encryption import decrypt, mask_account_no, mask_resident_no
 from .models import Department, Position, Employee
 
 
@@ -26,10 +26,14 @@ class EmployeeAdmin(admin.ModelAdmin):
     list_filter     = ('is_active', 'department', 'position')
     search_fields   = ('employee_no', 'name')
     ordering        = ('employee_no',)
-    readonly_fields = ('masked_rn', 'created_at', 'updated_at')
+    readonly_fields = ('masked_rn', 'masked_account', 'created_at', 'updated_at')
     # 암호화 컬럼은 Admin에서 직접 수정 불가
-    exclude = ('resident_no',)
+    exclude = ('resident_no', 'bank_account_no')
 
     @admin.display(description='주민번호(마스킹)')
     def masked_rn(self, obj):
         return mask_resident_no(decrypt(obj.resident_no)) if obj.resident_no else '-'
+
+    @admin.display(description='계좌번호(마스킹)')
+    def masked_account(self, obj):
+        return mask_account_no(decrypt(obj.bank_account_no)) if obj.bank_account_no else '-'
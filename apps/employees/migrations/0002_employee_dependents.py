@@ -0,0 +1,19 @@
+# Generated by Django 4.2.7 on 2026-10-17 21:22
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('employees', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='employee',
+            name='dependents',
+            field=models.PositiveSmallIntegerField(default=1, help_text='본인 포함. 근로소득 간이세액표 조회에 사용', validators=[django.core.validators.MinValueValidator(1)], verbose_name='공제대상 가족 수'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 4.2.7 on 2026-10-17 22:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('employees', '0002_employee_dependents'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='employee',
+            name='account_holder',
+            field=models.CharField(blank=True, help_text='비우면 직원 이름', max_length=50, verbose_name='예금주'),
+        ),
+        migrations.AddField(
+            model_name='employee',
+            name='bank_account_no',
+            field=models.CharField(blank=True, max_length=255, verbose_name='계좌번호'),
+        ),
+        migrations.AddField(
+            model_name='employee',
+            name='bank_code',
+            field=models.CharField(blank=True, help_text='금융결제원 3자리 은행코드', max_length=3, verbose_name='은행코드'),
+        ),
+    ]
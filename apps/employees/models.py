@@ -52,6 +52,15 @@ class Employee(models.Model):
     hire_date   = models.DateField('입사일')
     resign_date = models.DateField('퇴사일', null=True, blank=True)
     base_salary = models.DecimalField('기본급', max_digits=15, decimal_places=2)
+    dependents  = models.PositiveSmallIntegerField(
+        '공제대상 가족 수', default=1,
+        validators=[MinValueValidator(1)],
+        help_text='본인 포함. 근로소득 간이세액표 조회에 사용',
+    )
+    # 급여 이체 계좌. 계좌번호는 resident_no와 같이 Fernet 암호화하여 저장
+    bank_code       = models.CharField('은행코드', max_length=3, blank=True, help_text='금융결제원 3자리 은행코드')
+    bank_account_no = models.CharField('계좌번호', max_length=255, blank=True)
+    account_holder  = models.CharField('예금주', max_length=50, blank=True, help_text='비우면 직원 이름')
     is_active   = models.BooleanField('재직여부', default=True)
     created_at  = models.DateTimeField(auto_now_add=True)
     updated_at  = models.DateTimeField(auto_now=True)
@@ -1,7 +1,7 @@
 import re
 from rest_framework import serializers
 
-from apps.utils.encryption import decrypt, mask_resident_no
+from apps.utils.encryption import decrypt, mask_account_no, mask_resident_no
 from .models import Department, Position, Employee
 
 
@@ -36,20 +36,27 @@ class EmployeeDetailSerializer(serializers.ModelSerializer):
 
     - 입력: department·position = FK ID (정수)
             resident_no = 평문 (990101-1234567)
+            bank_account_no = 평문 (숫자, '-' 허용)
     - 출력: department·position = nested object
             resident_no = 마스킹 (990101-*******)
+            bank_account_no = 마스킹 (********6789)
     """
     resident_no = serializers.CharField(
         required=False, allow_blank=True, label='주민등록번호',
         help_text='입력: 평문 13자리 (YYMMDD-NNNNNNN). 조회 시 마스킹 반환.',
     )
+    bank_account_no = serializers.CharField(
+        required=False, allow_blank=True, label='계좌번호',
+        help_text='입력: 평문 (숫자 10~16자리, - 허용). 조회 시 마스킹 반환.',
+    )
 
     class Meta:
         model  = Employee
         fields = [
             'id', 'employee_no', 'name', 'resident_no',
             'department', 'position',
-            'hire_date', 'resign_date', 'base_salary',
+            'hire_date', 'resign_date', 'base_salary', 'dependents',
+            'bank_code', 'bank_account_no', 'account_holder',
             'is_active', 'created_at', 'updated_at',
         ]
         read_only_fields = ['id', 'is_active', 'resign_date', 'created_at', 'updated_at']
@@ -67,6 +74,10 @@ class EmployeeDetailSerializer(serializers.ModelSerializer):
             mask_resident_no(decrypt(instance.resident_no))
             if instance.resident_no else ''
         )
+        data['bank_account_no'] = (
+            mask_account_no(decrypt(instance.bank_account_no))
+            if instance.bank_account_no else ''
+        )
         return data
 
     # ── 유효성 검사 ────────────────────────────────────────
@@ -80,6 +91,21 @@ class EmployeeDetailSerializer(serializers.ModelSerializer):
             )
         return value
 
+    def validate_bank_code(self, value):
+        if value and not re.fullmatch(r'[0-9]{3}', value):
+            raise serializers.ValidationError('은행코드는 숫자 3자리여야 합니다. (예: 004)')
+        return value
+
+    def validate_bank_account_no(self, value):
+        if not value:
+            return value
+        if not re.fullmatch(r'[0-9-]+', value):
+            raise serializers.ValidationError('계좌번호는 숫자와 -만 입력할 수 있습니다.')
+        clean = value.replace('-', '')
+        if not (10 <= len(clean) <= 16):
+            raise serializers.ValidationError('계좌번호는 숫자 10~16자리여야 합니다.')
+        return clean
+
     def validate_base_salary(self, value):
         if value <= 0:
             raise serializers.ValidationError('기본급은 0보다 커야 합니다.')
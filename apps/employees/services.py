@@ -1,7 +1,7 @@
 """
 EmployeeService: 직원 생성·수정·퇴직 처리 비즈니스 로직.
 
-- 주민번호 암호화/복호화는 이 레이어에서만 수행
+- 주민번호·계좌번호 암호화/복호화는 이 레이어에서만 수행
 - Serializer의 validated_data를 받아서 모델에 저장
 """
 import datetime
@@ -9,27 +9,32 @@ import datetime
 from apps.utils.encryption import encrypt
 from .models import Employee
 
+# 평문으로 받아 암호화해 저장하는 필드
+ENCRYPTED_FIELDS = ('resident_no', 'bank_account_no')
+
 
 class EmployeeService:
 
     @staticmethod
     def create(validated_data: dict) -> Employee:
-        """직원 신규 등록. resident_no는 평문으로 받아 암호화 후 저장."""
-        resident_no_plain = validated_data.pop('resident_no', '')
+        """직원 신규 등록. resident_no·bank_account_no는 평문으로 받아 암호화 후 저장."""
+        plains = {field: validated_data.pop(field, '') for field in ENCRYPTED_FIELDS}
         employee = Employee(**validated_data)
-        if resident_no_plain:
-            employee.resident_no = encrypt(resident_no_plain)
+        for field, plain in plains.items():
+            if plain:
+                setattr(employee, field, encrypt(plain))
         employee.save()
         return employee
 
     @staticmethod
     def update(instance: Employee, validated_data: dict) -> Employee:
-        """직원 정보 수정. resident_no가 전달된 경우에만 재암호화."""
-        resident_no_plain = validated_data.pop('resident_no', None)
+        """직원 정보 수정. resident_no·bank_account_no는 전달된 경우에만 재암호화."""
+        plains = {field: validated_data.pop(field, None) for field in ENCRYPTED_FIELDS}
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
-        if resident_no_plain is not None:
-            instance.resident_no = encrypt(resident_no_plain) if resident_no_plain else ''
+        for field, plain in plains.items():
+            if plain is not None:
+                setattr(instance, field, encrypt(plain) if plain else '')
         instance.save()
         return instance
 
@@ -139,6 +139,28 @@ class EmployeeAPITest(APITestCase):
         self.assertNotEqual(emp.resident_no, '990101-1234567')
         self.assertEqual(decrypt(emp.resident_no), '990101-1234567')
 
+    def test_bank_account_encrypted_and_masked(self):
+        data = {**self.emp_data, 'bank_code': '004', 'bank_account_no': '110-123-456789'}
+        res = self.client.post(EMP_URL, data)
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(res.data['data']['bank_account_no'], '********6789')
+        emp = Employee.objects.get(employee_no='EMP001')
+        self.assertNotIn('123456789', emp.bank_account_no)
+        self.assertEqual(decrypt(emp.bank_account_no), '110123456789')
+
+        # 생략하면 유지, 빈 값이면 삭제
+        self.client.put(f'{EMP_URL}{emp.id}/', {'account_holder': '홍길동'}, format='json')
+        emp.refresh_from_db()
+        self.assertEqual(decrypt(emp.bank_account_no), '110123456789')
+        self.client.put(f'{EMP_URL}{emp.id}/', {'bank_account_no': ''}, format='json')
+        emp.refresh_from_db()
+        self.assertEqual(emp.bank_account_no, '')
+
+    def test_invalid_bank_account_fails(self):
+        for field, value in [('bank_code', '4'), ('bank_account_no', '12-34'), ('bank_account_no', '110-abc-4567')]:
+            res = self.client.post(EMP_URL, {**self.emp_data, field: value})
+            self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST, (field, value))
+
     def test_duplicate_employee_no_fails(self):
         make_employee(self.dept, self.pos)
         res = self.client.post(EMP_URL, self.emp_data)
@@ -204,6 +226,43 @@ class EmployeeAPITest(APITestCase):
         self.assertEqual(len(res.data['data']), 1)
         self.assertEqual(res.data['data'][0]['name'], '재직자')
 
+    def test_list_cursor_pagination(self):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        Employee.objects.bulk_create([
+            Employee(
+                employee_no=f'EMP{i:03d}', name=f'직원{i}', resident_no='', department=self.dept,
+                position=self.pos, hire_date=datetime.date(2024, 1, 1), base_salary='3000000',
+            )
+            for i in range(45)
+        ])
+        seen, cursor, pages = [], None, 0
+        with CaptureQueriesContext(connection) as ctx:
+            while True:
+                params = {'page_size': 20, **({'cursor': cursor} if cursor else {})}
+                res = self.client.get(EMP_URL, params)
+                self.assertTrue(res.data['success'])
+                seen += [r['employee_no'] for r in res.data['data']]
+                pages += 1
+                cursor = res.data['next']
+                if not cursor:
+                    break
+        self.assertEqual(pages, 3)
+        self.assertEqual(seen, [f'EMP{i:03d}' for i in range(45)])
+        sql = ' '.join(q['sql'] for q in ctx.captured_queries).upper()
+        self.assertNotIn('COUNT(', sql)
+        self.assertNotIn('OFFSET', sql)
+
+    def test_list_default_page_size_and_invalid_cursor(self):
+        for i in range(25):
+            make_employee(self.dept, self.pos, f'EMP{i:03d}', f'직원{i}')
+        res = self.client.get(EMP_URL)
+        self.assertEqual(len(res.data['data']), 20)
+        self.assertIsNotNone(res.data['next'])
+        res = self.client.get(EMP_URL, {'cursor': 'not-a-cursor'})
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(res.data['success'])
+
     # ── 상세 조회 ────────────────────────────────────────────────
     def test_get_employee_detail_includes_salary(self):
         emp = make_employee(self.dept, self.pos)
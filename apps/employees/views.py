@@ -6,6 +6,7 @@ from rest_framework.response import Response
 from rest_framework import status
 
 from apps.accounts.permissions import IsAdmin, IsHRManager
+from apps.utils.pagination import InvalidCursor, paginate, paginated_response
 from .models import Department, Position, Employee
 from .serializers import (
     DepartmentSerializer, PositionSerializer,
@@ -59,7 +60,7 @@ class EmployeeListView(APIView):
     permission_classes = [IsHRManager]
 
     def get(self, request):
-        qs = Employee.objects.select_related('department', 'position').order_by('employee_no')
+        qs = Employee.objects.select_related('department', 'position')
 
         search    = request.query_params.get('search', '').strip()
         dept_id   = request.query_params.get('department', '').strip()
@@ -74,7 +75,11 @@ class EmployeeListView(APIView):
         if is_active:
             qs = qs.filter(is_active=(is_active.lower() == 'true'))
 
-        return ok(data=EmployeeListSerializer(qs, many=True).data)
+        try:
+            page, next_cursor = paginate(request, qs, ('employee_no',))
+        except InvalidCursor as e:
+            return err(str(e))
+        return paginated_response(EmployeeListSerializer(page, many=True).data, next_cursor)
 
     def post(self, request):
         s = EmployeeDetailSerializer(data=request.data)
@@ -0,0 +1,16 @@
+from django.contrib import admin
+
+from .models import Job
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display  = ['id', 'kind', 'state', 'progress', 'created_by', 'worker', 'created_at', 'finished_at']
+    list_filter   = ['state', 'kind']
+    search_fields = ['kind', 'created_by__username']
+    readonly_fields = [
+        'kind', 'params', 'progress', 'progress_message', 'result', 'result_filename',
+        'result_content_type', 'error', 'created_by', 'worker',
+        'created_at', 'started_at', 'finished_at', 'heartbeat',
+    ]
+    exclude = ['result_file']
@@ -0,0 +1,72 @@
+"""
+백그라운드 작업 실행기.
+
+    python manage.py run_jobs                 # 계속 polling 하며 실행 (Ctrl+C로 종료)
+    python manage.py run_jobs --once          # 대기 중인 작업을 모두 실행하고 종료
+    python manage.py run_jobs --max-jobs 100  # 100건 실행 후 종료 (프로세스 재시작 주기 관리용)
+
+여러 프로세스·서버에서 동시에 실행해도 된다. 작업은 SELECT ... FOR UPDATE SKIP LOCKED로
+한 작업자만 가져간다. --stale-minutes 동안 진행 보고가 없는 RUNNING 작업은 다시 대기열에 넣는다
+(시작할 때와 실행 중 REQUEUE_INTERVAL초마다 확인하므로, 다른 작업자가 죽어도 살아 있는 작업자가 이어받는다).
+"""
+import os
+import socket
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections, connection
+
+from apps.jobs.services import JobService
+
+# 중단된 작업 확인 주기(초)
+REQUEUE_INTERVAL = 60
+
+
+class Command(BaseCommand):
+    help = '대기 중인 백그라운드 작업(급여 일괄 계산·내보내기 등)을 실행합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='대기 작업이 없으면 종료')
+        parser.add_argument('--sleep', type=float, default=2.0, help='대기 작업이 없을 때 polling 간격(초, 기본 2)')
+        parser.add_argument('--max-jobs', type=int, default=0, help='실행할 최대 작업 수 (0: 제한 없음)')
+        parser.add_argument('--stale-minutes', type=int, default=30,
+                            help='진행 보고가 끊긴 RUNNING 작업을 다시 대기열에 넣는 기준(분, 기본 30)')
+
+    def handle(self, *args, **options):
+        worker   = f'{socket.gethostname()}:{os.getpid()}'
+        max_jobs = options['max_jobs']
+        stale    = timedelta(minutes=options['stale_minutes'])
+        done     = 0
+        checked  = None
+
+        try:
+            while not max_jobs or done < max_jobs:
+                if not connection.in_atomic_block:
+                    # 오래된·끊긴 연결 정리 (호출 측 트랜잭션 안에서 실행된 경우는 제외)
+                    close_old_connections()
+                if checked is None or time.monotonic() - checked >= REQUEUE_INTERVAL:
+                    self._requeue(stale)
+                    checked = time.monotonic()
+                job = JobService.run_next(worker)
+                if job is None:
+                    if options['once']:
+                        break
+                    time.sleep(options['sleep'])
+                    continue
+
+                done += 1
+                style = self.style.SUCCESS if job.state == job.State.SUCCEEDED else self.style.ERROR
+                line  = f'#{job.pk} {job.kind}: {job.get_state_display()}'
+                if job.error:
+                    line += f' - {job.error}'
+                self.stdout.write(style(line))
+        except KeyboardInterrupt:
+            pass
+
+        self.stdout.write(f'작업 {done}건 실행 ({worker})')
+
+    def _requeue(self, stale):
+        requeued = JobService.requeue_stale(stale)
+        if requeued:
+            self.stdout.write(self.style.WARNING(f'중단된 작업 {requeued}건을 다시 대기열에 넣었습니다.'))
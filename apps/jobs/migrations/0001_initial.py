@@ -0,0 +1,46 @@
+# Generated by Django 4.2.7 on 2026-10-17 22:06
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Job',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(max_length=50, verbose_name='작업 종류')),
+                ('params', models.JSONField(blank=True, default=dict, verbose_name='작업 파라미터')),
+                ('state', models.CharField(choices=[('QUEUED', '대기'), ('RUNNING', '실행 중'), ('SUCCEEDED', '완료'), ('FAILED', '실패')], default='QUEUED', max_length=10, verbose_name='상태')),
+                ('progress', models.PositiveSmallIntegerField(default=0, verbose_name='진행률(%)')),
+                ('progress_message', models.CharField(blank=True, default='', max_length=200, verbose_name='진행 메시지')),
+                ('result', models.JSONField(blank=True, null=True, verbose_name='결과')),
+                ('result_file', models.BinaryField(blank=True, null=True, verbose_name='결과 파일')),
+                ('result_filename', models.CharField(blank=True, default='', max_length=200, verbose_name='결과 파일명')),
+                ('result_content_type', models.CharField(blank=True, default='', max_length=100, verbose_name='결과 파일 형식')),
+                ('error', models.TextField(blank=True, default='', verbose_name='오류')),
+                ('worker', models.CharField(blank=True, default='', max_length=100, verbose_name='작업자')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='등록일시')),
+                ('started_at', models.DateTimeField(blank=True, null=True, verbose_name='시작일시')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='종료일시')),
+                ('heartbeat', models.DateTimeField(blank=True, null=True, verbose_name='최근 진행 보고')),
+                ('created_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='jobs', to=settings.AUTH_USER_MODEL, verbose_name='요청자')),
+            ],
+            options={
+                'verbose_name': '백그라운드 작업',
+                'verbose_name_plural': '백그라운드 작업 목록',
+                'db_table': 'job',
+                'ordering': ['-created_at', '-id'],
+                'indexes': [models.Index(fields=['state', 'created_at', 'id'], name='job_state_created_id'), models.Index(fields=['created_by', 'created_at', 'id'], name='job_owner_created_id')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-17 22:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='result_path',
+            field=models.CharField(blank=True, default='', max_length=500, verbose_name='결과 파일 경로'),
+        ),
+    ]
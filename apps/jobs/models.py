@@ -0,0 +1,63 @@
+from django.conf import settings
+from django.db import models
+
+
+class Job(models.Model):
+    """
+    백그라운드 작업 (DB 큐).
+    API가 QUEUED 상태로 등록하고, run_jobs 작업자가 SELECT ... FOR UPDATE SKIP LOCKED로 하나씩 가져가 실행한다.
+    결과는 JSON(result)과 선택적인 파일로 저장한다. 파일은 작은 내보내기는 result_file(DB)에,
+    명세서 ZIP처럼 큰 파일은 JOB_RESULT_DIR 아래(result_path)에 둔다.
+    """
+
+    class State(models.TextChoices):
+        QUEUED    = 'QUEUED',    '대기'
+        RUNNING   = 'RUNNING',   '실행 중'
+        SUCCEEDED = 'SUCCEEDED', '완료'
+        FAILED    = 'FAILED',    '실패'
+
+    kind   = models.CharField('작업 종류', max_length=50)
+    params = models.JSONField('작업 파라미터', default=dict, blank=True)
+    state  = models.CharField('상태', max_length=10, choices=State.choices, default=State.QUEUED)
+
+    progress         = models.PositiveSmallIntegerField('진행률(%)', default=0)
+    progress_message = models.CharField('진행 메시지', max_length=200, blank=True, default='')
+
+    result              = models.JSONField('결과', null=True, blank=True)
+    result_file         = models.BinaryField('결과 파일', null=True, blank=True)
+    result_path         = models.CharField('결과 파일 경로', max_length=500, blank=True, default='')
+    result_filename     = models.CharField('결과 파일명', max_length=200, blank=True, default='')
+    result_content_type = models.CharField('결과 파일 형식', max_length=100, blank=True, default='')
+    error               = models.TextField('오류', blank=True, default='')
+
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True, blank=True,
+        verbose_name='요청자',
+        related_name='jobs',
+    )
+    worker      = models.CharField('작업자', max_length=100, blank=True, default='')
+    created_at  = models.DateTimeField('등록일시', auto_now_add=True)
+    started_at  = models.DateTimeField('시작일시', null=True, blank=True)
+    finished_at = models.DateTimeField('종료일시', null=True, blank=True)
+    heartbeat   = models.DateTimeField('최근 진행 보고', null=True, blank=True)
+
+    class Meta:
+        db_table = 'job'
+        ordering = ['-created_at', '-id']
+        indexes  = [
+            # 작업자 claim: WHERE state='QUEUED' ORDER BY created_at, id
+            models.Index(fields=['state', 'created_at', 'id'], name='job_state_created_id'),
+            # 내 작업 목록 키셋 페이지네이션
+            models.Index(fields=['created_by', 'created_at', 'id'], name='job_owner_created_id'),
+        ]
+        verbose_name = '백그라운드 작업'
+        verbose_name_plural = '백그라운드 작업 목록'
+
+    def __str__(self):
+        return f'#{self.pk} {self.kind} ({self.get_state_display()})'
+
+    @property
+    def is_finished(self) -> bool:
+        return self.state in (self.State.SUCCEEDED, self.State.FAILED)
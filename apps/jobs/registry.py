@@ -0,0 +1,56 @@
+"""
+작업 종류 등록부.
+
+각 앱의 jobs.py에서 @register('종류')로 실행 함수를 등록하고 AppConfig.ready()에서 import 한다.
+
+    @register('payroll_run', validate=validate_run_params)
+    def run_payroll(job, progress):
+        progress(50, '개발팀 완료')
+        return {'created': 10}                      # Job.result (JSON)
+
+- validate(params) → 정규화된 params. 올바르지 않으면 ValidationError (등록 시점에 검사)
+- roles: 작업을 등록할 수 있는 역할
+- 실행 함수는 결과 dict를 반환하고, 파일 결과는 JobFile(filename, content_type, data)을 반환한다
+  (큰 파일은 JobService.result_file_path(job, filename)에 직접 기록하고 data 대신 path를 넘긴다.
+   크기를 미리 알 수 없으면 JobService.file_result로 작은 파일만 data로 바꾼다)
+"""
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+HR_ROLES = ('ADMIN', 'HR_MANAGER')
+
+
+@dataclass(frozen=True)
+class JobType:
+    kind:     str
+    handler:  Callable
+    validate: Optional[Callable] = None
+    roles:    tuple = HR_ROLES
+    label:    str = ''
+
+
+@dataclass
+class JobFile:
+    filename:     str
+    content_type: str
+    data:         Optional[bytes] = None
+    result:       dict = field(default_factory=dict)
+    path:         str = ''
+
+
+_types = {}
+
+
+def register(kind: str, validate=None, roles=HR_ROLES, label=''):
+    def decorator(handler):
+        _types[kind] = JobType(kind, handler, validate, tuple(roles), label)
+        return handler
+    return decorator
+
+
+def get(kind: str) -> Optional[JobType]:
+    return _types.get(kind)
+
+
+def kinds() -> list:
+    return sorted(_types)
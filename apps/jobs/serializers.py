@@ -0,0 +1,27 @@
+from rest_framework import serializers
+
+from .models import Job
+
+
+class JobSerializer(serializers.ModelSerializer):
+    state_display   = serializers.CharField(source='get_state_display', read_only=True)
+    created_by_name = serializers.SerializerMethodField()
+    has_file        = serializers.SerializerMethodField()
+
+    class Meta:
+        model  = Job
+        fields = [
+            'id', 'kind', 'params', 'state', 'state_display',
+            'progress', 'progress_message', 'result', 'error',
+            'has_file', 'result_filename',
+            'created_by', 'created_by_name', 'worker',
+            'created_at', 'started_at', 'finished_at',
+        ]
+        read_only_fields = fields
+
+    def get_created_by_name(self, obj):
+        return obj.created_by.username if obj.created_by_id else None
+
+    def get_has_file(self, obj):
+        # 목록 조회에서는 result_file을 defer 하므로 파일명으로 판단한다
+        return obj.state == Job.State.SUCCEEDED and bool(obj.result_filename)
@@ -0,0 +1,164 @@
+"""
+DB 기반 작업 큐 서비스
+
+- enqueue: 작업 종류·권한·파라미터를 검증하고 QUEUED 행을 만든다
+- claim:   가장 오래된 QUEUED 작업 1건을 SELECT ... FOR UPDATE SKIP LOCKED로 잠가 RUNNING으로 바꾼다
+           (여러 작업자가 동시에 polling 해도 같은 작업을 두 번 가져가지 않는다.
+            SKIP LOCKED를 지원하지 않는 SQLite에서는 state 조건부 UPDATE로 한 번 더 막는다)
+- execute: 등록된 실행 함수를 호출하고 결과/파일/오류를 기록한다.
+           진행률은 작업 행에 QuerySet.update로 바로 기록하므로 API polling에서 보인다.
+- requeue_stale: heartbeat가 끊긴 RUNNING 작업(작업자 비정상 종료)을 다시 대기열에 넣는다
+- file_result: result_file_path에 기록한 파일을 결과로 만든다. 작은 파일만 DB(result_file)에 넣는다
+"""
+import logging
+import os
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+from rest_framework.exceptions import PermissionDenied, ValidationError
+
+from . import registry
+from .models import Job
+
+logger = logging.getLogger(__name__)
+
+
+class JobService:
+
+    @staticmethod
+    def enqueue(kind: str, params: dict = None, user=None) -> Job:
+        """
+        작업을 등록한다. 알 수 없는 종류·잘못된 파라미터는 ValidationError,
+        등록 권한이 없는 역할은 PermissionDenied.
+        """
+        job_type = registry.get(kind)
+        if job_type is None:
+            raise ValidationError(f'알 수 없는 작업 종류입니다: {kind}')
+        if user is not None and getattr(user, 'role', None) not in job_type.roles:
+            raise PermissionDenied('이 작업을 등록할 권한이 없습니다.')
+
+        params = dict(params or {})
+        if job_type.validate is not None:
+            params = job_type.validate(params)
+        return Job.objects.create(kind=kind, params=params, created_by=user)
+
+    @staticmethod
+    def claim(worker: str):
+        """대기 중인 가장 오래된 작업을 RUNNING으로 가져온다. 없으면 None."""
+        now = timezone.now()
+        with transaction.atomic():
+            queued = Job.objects.filter(state=Job.State.QUEUED).order_by('created_at', 'id')
+            if connection.features.has_select_for_update_skip_locked:
+                queued = queued.select_for_update(skip_locked=True)
+            job = queued.only('id').first()
+            if job is None:
+                return None
+            # 잠금이 없는 DB(SQLite)에서도 먼저 바꾼 작업자만 1행을 갱신한다
+            claimed = Job.objects.filter(pk=job.pk, state=Job.State.QUEUED).update(
+                state=Job.State.RUNNING, worker=worker, started_at=now, heartbeat=now,
+                progress=0, progress_message='', error='',
+            )
+        if not claimed:
+            return None
+        return Job.objects.get(pk=job.pk)
+
+    @staticmethod
+    def progress_reporter(job: Job):
+        """실행 함수에 넘기는 progress(percent, message='') 콜백."""
+        def progress(percent, message=''):
+            percent = max(0, min(int(percent), 100))
+            Job.objects.filter(pk=job.pk).update(
+                progress=percent, progress_message=str(message)[:200], heartbeat=timezone.now(),
+            )
+            job.progress, job.progress_message = percent, message
+        return progress
+
+    @staticmethod
+    def execute(job: Job) -> Job:
+        """claim한 작업을 실행하고 SUCCEEDED/FAILED로 마무리한다. 예외는 밖으로 내보내지 않는다."""
+        job_type = registry.get(job.kind)
+        fields = {}
+        try:
+            if job_type is None:
+                raise ValidationError(f'알 수 없는 작업 종류입니다: {job.kind}')
+            output = job_type.handler(job, JobService.progress_reporter(job))
+        except Exception as e:
+            logger.exception('작업 #%s (%s) 실패', job.pk, job.kind)
+            fields.update(state=Job.State.FAILED, error=_error_text(e))
+        else:
+            fields.update(state=Job.State.SUCCEEDED, progress=100)
+            if isinstance(output, registry.JobFile):
+                fields.update(
+                    result=output.result,
+                    result_file=None if output.path else output.data,
+                    result_path=output.path,
+                    result_filename=output.filename,
+                    result_content_type=output.content_type,
+                )
+            else:
+                fields['result'] = output
+
+        fields['finished_at'] = fields['heartbeat'] = timezone.now()
+        Job.objects.filter(pk=job.pk).update(**fields)
+        for name, value in fields.items():
+            setattr(job, name, value)
+        return job
+
+    @staticmethod
+    def result_file_path(job: Job, filename: str) -> str:
+        """큰 결과 파일을 기록할 경로 (JOB_RESULT_DIR/<작업 id>/<파일명>). 디렉터리는 만들어 둔다."""
+        directory = os.path.join(settings.JOB_RESULT_DIR, str(job.pk))
+        os.makedirs(directory, exist_ok=True)
+        return os.path.join(directory, filename)
+
+    @staticmethod
+    def file_result(path: str, filename: str, content_type: str, result: dict = None) -> registry.JobFile:
+        """
+        result_file_path에 기록을 마친 파일을 작업 결과로 만든다.
+        settings.JOB_RESULT_INLINE_BYTES 이하인 파일은 result_file(DB)로 옮기고 파일을 지운다.
+        그보다 큰 파일은 경로만 저장한다 (큰 BinaryField는 MariaDB max_allowed_packet을 넘는다).
+        """
+        result = result or {}
+        if os.path.getsize(path) > settings.JOB_RESULT_INLINE_BYTES:
+            return registry.JobFile(filename=filename, content_type=content_type, result=result, path=path)
+        with open(path, 'rb') as f:
+            data = f.read()
+        os.remove(path)
+        try:
+            os.rmdir(os.path.dirname(path))
+        except OSError:
+            pass
+        return registry.JobFile(filename=filename, content_type=content_type, data=data, result=result)
+
+    @staticmethod
+    def run_next(worker: str):
+        """작업 1건을 가져와 실행한다. 대기 작업이 없으면 None."""
+        job = JobService.claim(worker)
+        if job is None:
+            return None
+        return JobService.execute(job)
+
+    @staticmethod
+    def requeue_stale(timeout: timedelta) -> int:
+        """heartbeat가 timeout 이상 갱신되지 않은 RUNNING 작업을 QUEUED로 되돌린다."""
+        cutoff = timezone.now() - timeout
+        return Job.objects.filter(state=Job.State.RUNNING, heartbeat__lt=cutoff).update(
+            state=Job.State.QUEUED, worker='', started_at=None, heartbeat=None,
+            progress=0, progress_message='',
+        )
+
+
+def _error_text(exc) -> str:
+    """사용자에게 보여줄 오류 메시지 (검증 오류는 메시지만, 그 외에는 마지막 traceback 줄 포함)."""
+    if isinstance(exc, ValidationError):
+        detail = exc.detail
+        if isinstance(detail, list) and detail:
+            return str(detail[0])
+        if isinstance(detail, dict):
+            first = next(iter(detail.values()), '')
+            return str(first[0] if isinstance(first, list) and first else first)
+        return str(detail)
+    return ''.join(traceback.format_exception_only(type(exc), exc)).strip()
@@ -0,0 +1,295 @@
+import datetime
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TransactionTestCase
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.employees.models import Department, Position, Employee
+from apps.payroll.models import PayrollRecord
+from apps.utils.encryption import encrypt
+from apps.utils.testing import concurrency_skip_reason, run_concurrently
+from . import registry
+from .models import Job
+from .services import JobService
+
+User = get_user_model()
+
+JOBS_URL = '/api/v1/jobs/'
+
+
+def job_url(pk):
+    return f'{JOBS_URL}{pk}/'
+
+
+def result_url(pk):
+    return f'{JOBS_URL}{pk}/result/'
+
+
+def make_user(username, password='pass1234', role='EMPLOYEE'):
+    return User.objects.create_user(username=username, password=password, role=role)
+
+
+def get_token(client, username, password='pass1234'):
+    res = client.post('/api/v1/auth/login/', {'username': username, 'password': password})
+    return res.data['data']['access']
+
+
+def auth(client, token):
+    client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+
+
+def run_worker():
+    out = StringIO()
+    call_command('run_jobs', '--once', stdout=out)
+    return out.getvalue()
+
+
+class JobApiTest(APITestCase):
+
+    def setUp(self):
+        self.hr       = make_user('hr', role='HR_MANAGER')
+        self.admin    = make_user('admin', role='ADMIN')
+        self.employee = make_user('emp')
+        self.dev   = Department.objects.create(name='개발팀', code='DEV')
+        self.sales = Department.objects.create(name='영업팀', code='SAL')
+        pos = Position.objects.create(name='사원', level=1)
+        for i, dept in enumerate([self.dev, self.dev, self.sales]):
+            Employee.objects.create(
+                employee_no=f'EMP{i:03d}', name=f'직원{i}', resident_no=encrypt('990101-1234567'),
+                department=dept, position=pos, hire_date=datetime.date(2024, 1, 1),
+                base_salary='3000000',
+            )
+        auth(self.client, get_token(self.client, 'hr'))
+
+    def enqueue(self, kind, **params):
+        return self.client.post(JOBS_URL, {'kind': kind, 'params': params}, format='json')
+
+    def test_payroll_run_job(self):
+        """급여 일괄 계산 작업 등록 → 작업자 실행 → polling 결과"""
+        res = self.enqueue('payroll_run', year=2024, month=3)
+        self.assertEqual(res.status_code, status.HTTP_202_ACCEPTED)
+        job_id = res.data['data']['id']
+        self.assertEqual(res.data['data']['state'], 'QUEUED')
+        self.assertEqual(res.data['data']['params'],
+                         {'year': 2024, 'month': 3, 'department': None, 'recalculate': False})
+        self.assertFalse(PayrollRecord.objects.exists())
+
+        self.assertIn('1건', run_worker())
+
+        res = self.client.get(job_url(job_id))
+        data = res.data['data']
+        self.assertEqual(data['state'], 'SUCCEEDED')
+        self.assertEqual(data['progress'], 100)
+        self.assertEqual(data['result']['created'], 3)
+        self.assertEqual(data['result']['departments'], 2)
+        self.assertEqual(PayrollRecord.objects.filter(year=2024, month=3).count(), 3)
+
+        # 같은 달 재실행은 모두 건너뜀
+        self.enqueue('payroll_run', year=2024, month=3, department=self.dev.pk)
+        run_worker()
+        job = Job.objects.latest('id')
+        self.assertEqual(job.result['skipped'], 2)
+        self.assertEqual(job.progress_message, '개발팀 완료 (1/1)')
+
+    def _use_result_dir(self):
+        import tempfile
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        settings = self.settings(JOB_RESULT_DIR=directory.name)
+        settings.enable()
+        self.addCleanup(settings.disable)
+        return directory.name
+
+    def test_ledger_export_job(self):
+        """급여대장 내보내기 작업 결과 파일 다운로드"""
+        import os
+        directory = self._use_result_dir()
+        self.enqueue('payroll_run', year=2024, month=3)
+        job_id = self.enqueue('ledger_export', year=2024, month=3).data['data']['id']
+
+        res = self.client.get(result_url(job_id))
+        self.assertEqual(res.status_code, status.HTTP_409_CONFLICT)
+
+        run_worker()
+        job = self.client.get(job_url(job_id)).data['data']
+        self.assertTrue(job['has_file'])
+        self.assertEqual(job['result_filename'], 'payroll_ledger_202403.csv')
+        self.assertEqual(job['result']['rows'], 3)
+
+        res = self.client.get(result_url(job_id))
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertIn('attachment; filename="payroll_ledger_202403.csv"', res['Content-Disposition'])
+        body = b''.join(res.streaming_content).decode('utf-8-sig')
+        self.assertIn('직원0', body)
+        self.assertIn('합계', body)
+        # 작은 파일은 DB에 넣고 결과 디렉터리에는 남기지 않는다
+        job = Job.objects.get(pk=job_id)
+        self.assertEqual(job.result_path, '')
+        self.assertEqual(os.listdir(directory), [])
+
+    def test_large_export_job_kept_as_file(self):
+        import os
+        self._use_result_dir()
+        self.enqueue('payroll_run', year=2024, month=3)
+        with self.settings(JOB_RESULT_INLINE_BYTES=0):
+            job_id = self.enqueue('ledger_export', year=2024, month=3).data['data']['id']
+            run_worker()
+            annual_id = self.enqueue('annual_export', year=2024).data['data']['id']
+            run_worker()
+        job = Job.objects.get(pk=job_id)
+        self.assertIsNone(job.result_file)
+        self.assertTrue(os.path.isfile(job.result_path))
+        body = b''.join(self.client.get(result_url(job_id)).streaming_content).decode('utf-8-sig')
+        self.assertIn('직원0', body)
+        self.assertTrue(os.path.isfile(Job.objects.get(pk=annual_id).result_path))
+
+    def test_xlsx_export_job(self):
+        self._use_result_dir()
+        self.enqueue('payroll_run', year=2024, month=3)
+        job_id = self.enqueue('ledger_export', year=2024, month=3, format='XLSX').data['data']['id']
+        run_worker()
+        res = self.client.get(result_url(job_id))
+        self.assertEqual(res['Content-Type'], 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
+        self.assertTrue(b''.join(res.streaming_content).startswith(b'PK'))
+
+    def test_invalid_requests(self):
+        self.assertEqual(self.client.post(JOBS_URL, {}, format='json').status_code, status.HTTP_400_BAD_REQUEST)
+
+        res = self.enqueue('unknown_kind')
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('unknown_kind', res.data['message'])
+
+        res = self.enqueue('payroll_run', year=2024, month=13)
+        self.assertEqual(res.data['message'], 'month는 1~12 사이여야 합니다.')
+        res = self.enqueue('ledger_export', year=2024, month=1, format='pdf')
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        res = self.enqueue('annual_export', year=2024, department=99999)
+        self.assertEqual(res.data['message'], '존재하지 않는 부서입니다.')
+        self.assertFalse(Job.objects.exists())
+
+    def test_employee_cannot_enqueue_payroll_jobs(self):
+        auth(self.client, get_token(self.client, 'emp'))
+        res = self.enqueue('payroll_run', year=2024, month=3)
+        self.assertEqual(res.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(Job.objects.exists())
+
+    def test_list_visibility(self):
+        """본인 작업만 조회, 관리자는 전체"""
+        mine  = JobService.enqueue('annual_export', {'year': 2024}, user=self.hr)
+        other = JobService.enqueue('annual_export', {'year': 2023}, user=self.admin)
+
+        res = self.client.get(JOBS_URL)
+        self.assertEqual([j['id'] for j in res.data['data']], [mine.pk])
+        self.assertEqual(self.client.get(job_url(other.pk)).status_code, status.HTTP_404_NOT_FOUND)
+
+        auth(self.client, get_token(self.client, 'admin'))
+        res = self.client.get(JOBS_URL, {'page_size': 1})
+        self.assertEqual([j['id'] for j in res.data['data']], [other.pk])
+        res = self.client.get(JOBS_URL, {'page_size': 1, 'cursor': res.data['next']})
+        self.assertEqual([j['id'] for j in res.data['data']], [mine.pk])
+        self.assertIsNone(res.data['next'])
+
+        res = self.client.get(JOBS_URL, {'state': 'succeeded'})
+        self.assertEqual(res.data['data'], [])
+
+
+class JobServiceTest(APITestCase):
+
+    def setUp(self):
+        self.hr = make_user('hr', role='HR_MANAGER')
+        registry.register('test_fail')(self._fail)
+        registry.register('test_progress')(self._progress)
+
+    def tearDown(self):
+        registry._types.pop('test_fail', None)
+        registry._types.pop('test_progress', None)
+
+    @staticmethod
+    def _fail(job, progress):
+        progress(40, '절반 전')
+        raise RuntimeError('계산 실패')
+
+    @staticmethod
+    def _progress(job, progress):
+        progress(150, '범위 밖')
+        saved = Job.objects.get(pk=job.pk)
+        return {'progress': saved.progress, 'state': saved.state}
+
+    def test_claim_order_and_single_claim(self):
+        first  = JobService.enqueue('test_progress', user=self.hr)
+        second = JobService.enqueue('test_progress', user=self.hr)
+
+        claimed = JobService.claim('w1')
+        self.assertEqual(claimed.pk, first.pk)
+        self.assertEqual(claimed.state, Job.State.RUNNING)
+        self.assertEqual(claimed.worker, 'w1')
+        self.assertEqual(JobService.claim('w2').pk, second.pk)
+        self.assertIsNone(JobService.claim('w3'))
+
+    def test_failed_job_records_error(self):
+        job = JobService.run_next('w1')
+        self.assertIsNone(job)
+
+        JobService.enqueue('test_fail', user=self.hr)
+        with self.assertLogs('apps.jobs.services', 'ERROR'):
+            job = JobService.run_next('w1')
+        job.refresh_from_db()
+        self.assertEqual(job.state, Job.State.FAILED)
+        self.assertEqual(job.progress, 40)
+        self.assertIn('RuntimeError: 계산 실패', job.error)
+        self.assertIsNotNone(job.finished_at)
+
+    def test_progress_is_written_while_running(self):
+        JobService.enqueue('test_progress', user=self.hr)
+        job = JobService.run_next('w1')
+        self.assertEqual(job.result, {'progress': 100, 'state': 'RUNNING'})
+        self.assertEqual(job.state, Job.State.SUCCEEDED)
+
+    def test_requeue_stale(self):
+        job = JobService.enqueue('test_progress', user=self.hr)
+        JobService.claim('w1')
+        self.assertEqual(JobService.requeue_stale(timedelta(minutes=30)), 0)
+
+        Job.objects.filter(pk=job.pk).update(heartbeat=timezone.now() - timedelta(hours=1))
+        self.assertEqual(JobService.requeue_stale(timedelta(minutes=30)), 1)
+        job.refresh_from_db()
+        self.assertEqual(job.state, Job.State.QUEUED)
+        self.assertEqual(JobService.claim('w2').pk, job.pk)
+
+    def test_worker_requeues_stale_jobs_while_polling(self):
+        from unittest.mock import patch
+        from apps.jobs.management.commands import run_jobs
+        for _ in range(2):
+            JobService.enqueue('test_progress', user=self.hr)
+        with patch.object(JobService, 'requeue_stale', wraps=JobService.requeue_stale) as requeue:
+            run_worker()
+        self.assertEqual(requeue.call_count, 1)   # 주기 안에서는 시작할 때 한 번
+
+        for _ in range(2):
+            JobService.enqueue('test_progress', user=self.hr)
+        with patch.object(run_jobs, 'REQUEUE_INTERVAL', 0), \
+                patch.object(JobService, 'requeue_stale', wraps=JobService.requeue_stale) as requeue:
+            run_worker()
+        self.assertEqual(requeue.call_count, 3)   # 작업 2건 + 마지막 빈 polling 전마다
+
+
+class JobClaimConcurrencyTest(TransactionTestCase):
+    """여러 작업자가 동시에 claim 해도 작업마다 정확히 한 작업자만 가져간다."""
+
+    def setUp(self):
+        reason = concurrency_skip_reason()
+        if reason:
+            self.skipTest(reason)
+
+    def test_concurrent_claims(self):
+        jobs = [Job.objects.create(kind='annual_export', params={'year': 2024}) for _ in range(3)]
+
+        results = run_concurrently(lambda: JobService.claim('worker'))
+        claimed = [value.pk for kind, value in results if kind == 'ok' and value is not None]
+        self.assertEqual(sorted(claimed), [job.pk for job in jobs])
+        self.assertFalse(Job.objects.filter(state=Job.State.QUEUED).exists())
@@ -0,0 +1,9 @@
+from django.urls import path
+
+from .views import JobDetailView, JobListCreateView, JobResultFileView
+
+urlpatterns = [
+    path('',                   JobListCreateView.as_view(), name='job-list-create'),
+    path('<int:pk>/',          JobDetailView.as_view(),     name='job-detail'),
+    path('<int:pk>/result/',   JobResultFileView.as_view(), name='job-result'),
+]
@@ -0,0 +1,108 @@
+from io import BytesIO
+
+from django.http import FileResponse
+from django.shortcuts import get_object_or_404
+from rest_framework import status
+from rest_framework.exceptions import PermissionDenied, ValidationError
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.accounts.permissions import IsEmployee
+from apps.utils.pagination import InvalidCursor, paginate, paginated_response
+from .models import Job
+from .serializers import JobSerializer
+from .services import JobService, _error_text
+
+JOB_LIST_ORDERING = ('-created_at', '-id')
+
+
+def ok(data, message='', status_code=status.HTTP_200_OK):
+    return Response({'success': True, 'data': data, 'message': message}, status=status_code)
+
+
+def err(message, status_code=status.HTTP_400_BAD_REQUEST):
+    return Response({'success': False, 'data': None, 'message': message}, status=status_code)
+
+
+def _visible_jobs(user):
+    """관리자는 전체, 그 외에는 본인이 등록한 작업만. 결과 파일은 읽지 않는다."""
+    qs = Job.objects.select_related('created_by').defer('result_file')
+    if user.role == 'ADMIN':
+        return qs
+    return qs.filter(created_by=user)
+
+
+class JobListCreateView(APIView):
+    """
+    GET  /api/v1/jobs/[?state=&kind=&cursor=&page_size=]  내 작업 목록 (관리자는 전체)
+    POST /api/v1/jobs/  {kind, params}                     작업 등록 → 202 Accepted
+
+    등록된 작업은 run_jobs 작업자가 실행하며, 클라이언트는 GET /jobs/<id>/로 진행률을 polling 한다.
+    """
+    permission_classes = [IsEmployee]
+
+    def get(self, request):
+        qs = _visible_jobs(request.user)
+        state = request.query_params.get('state')
+        kind  = request.query_params.get('kind')
+        if state:
+            qs = qs.filter(state=state.upper())
+        if kind:
+            qs = qs.filter(kind=kind)
+
+        try:
+            page, next_cursor = paginate(request, qs, JOB_LIST_ORDERING)
+        except InvalidCursor as e:
+            return err(str(e))
+        return paginated_response(JobSerializer(page, many=True).data, next_cursor)
+
+    def post(self, request):
+        kind   = request.data.get('kind')
+        params = request.data.get('params') or {}
+        if not kind:
+            return err('kind 값이 필요합니다.')
+        if not isinstance(params, dict):
+            return err('params는 객체여야 합니다.')
+
+        try:
+            job = JobService.enqueue(kind, params, user=request.user)
+        except PermissionDenied as e:
+            return err(str(e.detail), status.HTTP_403_FORBIDDEN)
+        except ValidationError as e:
+            return err(_error_text(e))
+        return ok(JobSerializer(job).data, '작업이 등록되었습니다.', status.HTTP_202_ACCEPTED)
+
+
+class JobDetailView(APIView):
+    """GET /api/v1/jobs/<id>/  상태·진행률·결과 (polling 용)"""
+    permission_classes = [IsEmployee]
+
+    def get(self, request, pk):
+        job = get_object_or_404(_visible_jobs(request.user), pk=pk)
+        return ok(JobSerializer(job).data)
+
+
+class JobResultFileView(APIView):
+    """GET /api/v1/jobs/<id>/result/  완료된 작업의 결과 파일 다운로드"""
+    permission_classes = [IsEmployee]
+
+    def get(self, request, pk):
+        job = get_object_or_404(_visible_jobs(request.user).defer(None), pk=pk)
+        if job.state != Job.State.SUCCEEDED:
+            return err('아직 완료되지 않은 작업입니다.', status.HTTP_409_CONFLICT)
+        if job.result_path:
+            try:
+                content = open(job.result_path, 'rb')
+            except FileNotFoundError:
+                return err('결과 파일이 삭제되었습니다.', status.HTTP_404_NOT_FOUND)
+        elif job.result_file is not None:
+            content = BytesIO(bytes(job.result_file))
+        else:
+            return err('결과 파일이 없는 작업입니다.', status.HTTP_404_NOT_FOUND)
+
+        return FileResponse(
+            content,
+            as_attachment=True,
+            filename=job.result_filename,
+            content_type=job.result_content_type or 'application/octet-stream',
+        )
@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from .models import PayrollRecord
+from .models import PayrollRecord, PayrollRateSet, PayrollYearToDate
 
 
 @admin.register(PayrollRecord)
@@ -18,3 +18,22 @@ class PayrollRecordAdmin(admin.ModelAdmin):
         'employment_insurance', 'income_tax', 'local_income_tax',
         'confirmed_at', 'confirmed_by', 'created_at', 'updated_at',
     ]
+
+
+@admin.register(PayrollRateSet)
+class PayrollRateSetAdmin(admin.ModelAdmin):
+    list_display = [
+        'effective_from',
+        'national_pension_rate', 'health_insurance_rate', 'long_term_care_rate',
+        'employment_insurance_rate', 'income_tax_rate', 'local_income_tax_rate',
+        'pension_base_floor', 'pension_base_ceiling',
+        'meal_allowance', 'transport_allowance', 'withholding_table',
+    ]
+    date_hierarchy = 'effective_from'
+
+
+@admin.register(PayrollYearToDate)
+class PayrollYearToDateAdmin(admin.ModelAdmin):
+    list_display  = ['employee', 'year', 'months', 'gross_pay', 'total_deduction', 'net_pay', 'last_updated']
+    list_filter   = ['year', 'employee__department']
+    search_fields = ['employee__name', 'employee__employee_no']
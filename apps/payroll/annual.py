@@ -0,0 +1,108 @@
+"""
+연간 급여 리포트 (연말정산·원천징수영수증용).
+
+직원별 12개월 누계는 확정 급여 시점에 갱신되는 PayrollYearToDate에서 읽는다.
+급여 레코드를 월별로 다시 읽지 않으므로 인원수(N)만큼의 행만 조회한다.
+- 부서 소계: (부서) 단위 GROUP BY + Sum 1회. 전체 합계는 부서 소계를 더해 구한다.
+- 명세 행: values()로 필요한 열만 읽고, 급여대장과 같은 (부서명, 부서 id, 사번) 키셋 조건으로
+  DETAIL_CHUNK_SIZE 행씩 나눠 조회해 흘려보낸다 (apps.utils.db.keyset_rows).
+"""
+from itertools import groupby
+
+from django.db.models import Count, F, Sum
+from django.utils import timezone
+
+from apps.utils.db import keyset_rows
+from .ledger import DETAIL_CHUNK_SIZE, DETAIL_KEYS, _money
+from .models import PayrollYearToDate
+from .services import YearToDateService
+
+# 누계 열 (금액 + 초과근무분)
+TOTAL_FIELDS = YearToDateService.FIELDS
+
+
+def annual_queryset(year: int, department_id: int = None):
+    qs = PayrollYearToDate.objects.filter(year=year)
+    if department_id is not None:
+        qs = qs.filter(employee__department_id=department_id)
+    return qs
+
+
+def department_rollup(year: int, department_id: int = None) -> list:
+    """부서별 인원수·누계 합계. 부서명, 부서 id 순."""
+    rows = (
+        annual_queryset(year, department_id)
+        .values(department_id=F('employee__department_id'), name=F('employee__department__name'))
+        .annotate(count=Count('id'), **{f: Sum(f) for f in TOTAL_FIELDS})
+        .order_by('name', 'department_id')
+    )
+    return list(rows)
+
+
+def detail_rows(year: int, department_id: int = None, chunk_size: int = DETAIL_CHUNK_SIZE):
+    """
+    직원별 누계 dict를 부서명, 부서 id, 사번 순으로 흘려보낸다. 금액은 Decimal.
+    chunk_size 행씩 별도 쿼리로 읽으므로 한 번에 chunk_size 행만 메모리에 있다.
+    """
+    rows = (
+        annual_queryset(year, department_id)
+        .values(
+            'employee_id', 'months',
+            *TOTAL_FIELDS,
+            department_id   = F('employee__department_id'),
+            department_name = F('employee__department__name'),
+            employee_no     = F('employee__employee_no'),
+            employee_name   = F('employee__name'),
+            position_name   = F('employee__position__name'),
+        )
+    )
+    return keyset_rows(rows, DETAIL_KEYS, chunk_size)
+
+
+def _totals(row: dict) -> dict:
+    data = {f: _money(row[f] or 0) for f in TOTAL_FIELDS if f != 'overtime_minutes'}
+    data['overtime_minutes'] = row['overtime_minutes'] or 0
+    return data
+
+
+def _employee_data(row: dict) -> dict:
+    return {
+        'employee_id':   row['employee_id'],
+        'employee_no':   row['employee_no'],
+        'employee_name': row['employee_name'],
+        'position_name': row['position_name'],
+        'months':        row['months'],
+        **_totals(row),
+    }
+
+
+def build_report(year: int, department_id: int = None, detail: bool = True) -> dict:
+    """연간 리포트 응답 데이터. detail=False이면 부서별 employees를 포함하지 않는다."""
+    rollup      = department_rollup(year, department_id)
+    departments = []
+    by_id       = {}
+    for row in rollup:
+        dept = {
+            'department_id': row['department_id'],
+            'name':          row['name'],
+            'count':         row['count'],
+            'totals':        _totals(row),
+        }
+        if detail:
+            dept['employees'] = []
+            by_id[row['department_id']] = dept
+        departments.append(dept)
+
+    if detail:
+        rows = detail_rows(year, department_id)
+        for dept_id, group in groupby(rows, key=lambda r: r['department_id']):
+            by_id[dept_id]['employees'].extend(_employee_data(r) for r in group)
+
+    grand = {f: sum(row[f] or 0 for row in rollup) for f in TOTAL_FIELDS}
+    return {
+        'year':         year,
+        'generated_at': timezone.now().isoformat(),
+        'total_count':  sum(row['count'] for row in rollup),
+        'totals':       _totals(grand),
+        'departments':  departments,
+    }
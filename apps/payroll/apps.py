@@ -5,4 +5,7 @@ class PayrollConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.payroll'
     label = 'payroll'
-    verbose_name = '급여관리'
\ No newline at end of file
+    verbose_name = '급여관리'
+
+    def ready(self):
+        from . import jobs, signals  # noqa: F401
@@ -0,0 +1,200 @@
+"""
+급여 대량이체 파일 (확정 급여 기준).
+
+해당 월 CONFIRMED PayrollRecord의 실수령액을 직원 급여 계좌로 보내는 이체 파일을 만든다.
+- 명세 행은 사번 키셋 조건으로 chunk 단위 쿼리를 나눠 읽고(apps.utils.db.keyset_chunks), chunk마다
+  계좌번호를 캐시된 Fernet 하나로 일괄 복호화한 뒤 바로 내보낸다.
+  DB 결과도 쿼리마다 chunk 크기만큼만 받으므로 인원수와 관계없이 메모리 사용량이 일정하다.
+- 형식
+  fixed: 고정길이 레코드 (CP949 바이트 기준 RECORD_LENGTH, CRLF) — H(헤더) / D(명세) / T(트레일러)
+  csv:   UTF-8 BOM CSV — 헤더 행 / 명세 행 / TRAILER 행
+- 트레일러: 건수, 총 이체금액, 체크섬
+  체크섬은 명세 행마다 '은행코드|계좌번호|금액\\n'을 이어 붙인 SHA-256 (앞 CHECKSUM_LENGTH자리, 16진수)으로
+  두 형식에서 같은 값이다. 수신 측은 명세 행으로 다시 계산해 파일 잘림·변조를 확인한다.
+계좌 정보가 없거나(missing_accounts) 계좌번호를 복호화할 수 없는(invalid_accounts) 직원이 있으면
+스트리밍을 시작하기 전에 거절한다. 확인 뒤 계좌가 바뀌어 스트리밍 중 복호화에 실패하면 ValueError로 중단한다.
+"""
+import csv
+import hashlib
+from django.db.models import F, Q
+from django.utils import timezone
+
+from apps.utils.db import keyset_chunks
+from apps.utils.encryption import decrypt_many
+from .export import _Echo
+from .ledger import DETAIL_CHUNK_SIZE
+from .models import PayrollRecord
+
+FORMATS = ('fixed', 'csv')
+
+CONTENT_TYPES = {
+    'fixed': 'text/plain; charset=cp949',
+    'csv':   'text/csv; charset=utf-8',
+}
+
+ENCODING        = 'cp949'
+RECORD_LENGTH   = 120
+CHECKSUM_LENGTH = 32
+
+CSV_HEADERS = ('순번', '은행코드', '계좌번호', '예금주', '이체금액', '사번', '적요')
+
+# 계좌 누락·복호화 실패 오류 응답에 싣는 최대 사번 수
+MISSING_LIMIT = 20
+
+
+def filename(year: int, month: int, file_format: str) -> str:
+    ext = 'txt' if file_format == 'fixed' else 'csv'
+    return f'bank_transfer_{year}{month:02d}.{ext}'
+
+
+def transfer_queryset(year: int, month: int):
+    """이체 대상: 해당 월 확정 급여 중 실수령액이 0보다 큰 행."""
+    return PayrollRecord.objects.filter(
+        year=year, month=month, status=PayrollRecord.Status.CONFIRMED, net_pay__gt=0,
+    )
+
+
+def missing_accounts(year: int, month: int) -> list:
+    """은행코드 또는 계좌번호가 없는 이체 대상 직원의 사번 (최대 MISSING_LIMIT+1건)."""
+    return list(
+        transfer_queryset(year, month)
+        .filter(Q(employee__bank_code='') | Q(employee__bank_account_no=''))
+        .order_by('employee__employee_no')
+        .values_list('employee__employee_no', flat=True)[:MISSING_LIMIT + 1]
+    )
+
+
+def invalid_accounts(year: int, month: int, chunk_size: int = DETAIL_CHUNK_SIZE) -> list:
+    """
+    계좌번호를 복호화할 수 없는 이체 대상 직원의 사번 (최대 MISSING_LIMIT+1건).
+    스트리밍 전에 chunk 단위로 모두 복호화해 본다 (SECRET_KEY 변경·암호문 손상).
+    """
+    rows = (
+        transfer_queryset(year, month)
+        .exclude(employee__bank_account_no='')
+        .values(employee_no=F('employee__employee_no'), account_cipher=F('employee__bank_account_no'))
+    )
+    invalid = []
+    for chunk in keyset_chunks(rows, ('employee_no',), chunk_size):
+        accounts = decrypt_many(r['account_cipher'] for r in chunk)
+        invalid += [r['employee_no'] for r, account_no in zip(chunk, accounts) if account_no is None]
+        if len(invalid) > MISSING_LIMIT:
+            break
+    return invalid[:MISSING_LIMIT + 1]
+
+
+def transfer_rows(year: int, month: int, chunk_size: int = DETAIL_CHUNK_SIZE):
+    """
+    사번 순 이체 명세 dict를 생성한다.
+    {'employee_no', 'holder', 'bank_code', 'account_no'(복호화), 'amount'(원 단위 int)}
+    복호화할 수 없는 계좌번호를 만나면 ValueError (invalid_accounts로 먼저 확인한다).
+    """
+    rows = (
+        transfer_queryset(year, month)
+        .values(
+            'net_pay',
+            employee_no    = F('employee__employee_no'),
+            name           = F('employee__name'),
+            bank_code      = F('employee__bank_code'),
+            account_cipher = F('employee__bank_account_no'),
+            account_holder = F('employee__account_holder'),
+        )
+    )
+    for chunk in keyset_chunks(rows, ('employee_no',), chunk_size):
+        accounts = decrypt_many(r['account_cipher'] for r in chunk)
+        for r, account_no in zip(chunk, accounts):
+            if account_no is None:
+                raise ValueError(f'계좌번호를 복호화할 수 없습니다: {r["employee_no"]}')
+            yield {
+                'employee_no': r['employee_no'],
+                'holder':      r['account_holder'] or r['name'],
+                'bank_code':   r['bank_code'],
+                'account_no':  account_no,
+                'amount':      int(r['net_pay']),
+            }
+
+
+class Trailer:
+    """명세 행을 받으며 건수·총액·체크섬을 누적한다."""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self._hash = hashlib.sha256()
+
+    def add(self, row: dict):
+        self.count += 1
+        self.total += row['amount']
+        self._hash.update(f'{row["bank_code"]}|{row["account_no"]}|{row["amount"]}\n'.encode())
+
+    @property
+    def checksum(self) -> str:
+        return self._hash.hexdigest()[:CHECKSUM_LENGTH].upper()
+
+
+def memo(year: int, month: int) -> str:
+    return f'{year}년{month:02d}월급여'
+
+
+# ── 고정길이 ────────────────────────────────────────────────────────
+def _text(value: str, width: int) -> bytes:
+    """CP949 바이트 기준 왼쪽 정렬·공백 채움. 넘치면 한글이 깨지지 않게 글자 단위로 자른다."""
+    data = str(value).encode(ENCODING, errors='replace')
+    if len(data) > width:
+        data = data[:width].decode(ENCODING, errors='ignore').encode(ENCODING)
+    return data.ljust(width)
+
+
+def _number(value: int, width: int) -> bytes:
+    return str(value).rjust(width, '0').encode()
+
+
+def _record(*fields: bytes) -> bytes:
+    return b''.join(fields).ljust(RECORD_LENGTH) + b'\r\n'
+
+
+def iter_fixed(year: int, month: int, rows):
+    """
+    H: 'H' + 급여연월(6) + 작성일(8)
+    D: 'D' + 순번(6) + 은행코드(3) + 계좌번호(16) + 예금주(20) + 금액(13) + 사번(20) + 적요(20)
+    T: 'T' + 건수(6) + 총액(15) + 체크섬(32)
+    """
+    yield _record(b'H', f'{year}{month:02d}'.encode(), timezone.localdate().strftime('%Y%m%d').encode())
+    trailer = Trailer()
+    text    = memo(year, month)
+    for row in rows:
+        trailer.add(row)
+        yield _record(
+            b'D',
+            _number(trailer.count, 6),
+            _text(row['bank_code'], 3),
+            _text(row['account_no'], 16),
+            _text(row['holder'], 20),
+            _number(row['amount'], 13),
+            _text(row['employee_no'], 20),
+            _text(text, 20),
+        )
+    yield _record(b'T', _number(trailer.count, 6), _number(trailer.total, 15), trailer.checksum.encode())
+
+
+# ── CSV ─────────────────────────────────────────────────────────────
+def iter_csv(year: int, month: int, rows):
+    yield '\ufeff'
+    writer  = csv.writer(_Echo())
+    trailer = Trailer()
+    text    = memo(year, month)
+    yield writer.writerow(CSV_HEADERS)
+    for row in rows:
+        trailer.add(row)
+        yield writer.writerow([
+            trailer.count, row['bank_code'], row['account_no'], row['holder'],
+            row['amount'], row['employee_no'], text,
+        ])
+    yield writer.writerow(['TRAILER', trailer.count, trailer.total, trailer.checksum])
+
+
+def stream(year: int, month: int, file_format: str, chunk_size: int = DETAIL_CHUNK_SIZE):
+    rows = transfer_rows(year, month, chunk_size=chunk_size)
+    if file_format == 'fixed':
+        return iter_fixed(year, month, rows)
+    return iter_csv(year, month, rows)
@@ -0,0 +1,221 @@
+"""
+급여 계산 코어 (ORM 비의존).
+
+PayrollInput(기본급·월 초과근무분·수당) + RateSet(공제율) → PayrollResult
+- DB 접근 없이 순수 계산만 수행하므로 미리보기·시뮬레이션·일괄 계산에서 재사용
+- 금액은 모두 Decimal, 공제는 원 단위 절사
+- 계산 엔진은 Decimal(기본)과 정수 원 단위 고정소수점(fixedpoint) 중 선택
+"""
+from dataclasses import dataclass, field
+from decimal import Decimal, ROUND_FLOOR
+from typing import Iterable, Iterator, Optional
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+
+# ── 공제율 상수 (2024 기준) ────────────────────────────────────────────
+NATIONAL_PENSION_RATE     = Decimal('0.045')    # 4.5%
+HEALTH_INSURANCE_RATE     = Decimal('0.03545')  # 3.545%
+LONG_TERM_CARE_RATE       = Decimal('0.1281')   # 건강보험 × 12.81%
+EMPLOYMENT_INSURANCE_RATE = Decimal('0.009')    # 0.9%
+INCOME_TAX_RATE           = Decimal('0.02')     # 2.0% (간이세액 근사값)
+LOCAL_INCOME_TAX_RATE     = Decimal('0.10')     # 소득세 × 10%
+
+# ── 고정수당 ──────────────────────────────────────────────────────────
+MEAL_ALLOWANCE      = Decimal('200000')
+TRANSPORT_ALLOWANCE = Decimal('100000')
+
+# ── 표준 월 근로시간 (초과근무수당 계산 기준) ───────────────────────────
+STANDARD_MONTHLY_HOURS = Decimal('209')
+OVERTIME_MULTIPLIER    = Decimal('1.5')
+
+_ONE   = Decimal('1')
+_SIXTY = Decimal('60')
+
+
+def _floor(amount: Decimal) -> Decimal:
+    """원 단위 절사."""
+    return amount.quantize(_ONE, rounding=ROUND_FLOOR)
+
+
+@dataclass(frozen=True, slots=True)
+class RateSet:
+    """공제율·고정수당·초과근무 기준 묶음."""
+    national_pension:       Decimal = NATIONAL_PENSION_RATE
+    health_insurance:       Decimal = HEALTH_INSURANCE_RATE
+    long_term_care:         Decimal = LONG_TERM_CARE_RATE
+    employment_insurance:   Decimal = EMPLOYMENT_INSURANCE_RATE
+    income_tax:             Decimal = INCOME_TAX_RATE
+    local_income_tax:       Decimal = LOCAL_INCOME_TAX_RATE
+    meal_allowance:         Decimal = MEAL_ALLOWANCE
+    transport_allowance:    Decimal = TRANSPORT_ALLOWANCE
+    standard_monthly_hours: Decimal = STANDARD_MONTHLY_HOURS
+    overtime_multiplier:    Decimal = OVERTIME_MULTIPLIER
+    # 국민연금 기준소득월액 하한/상한 (None이면 제한 없음)
+    pension_base_floor:     Optional[Decimal] = None
+    pension_base_ceiling:   Optional[Decimal] = None
+    # 근로소득 간이세액표 (withholding.WithholdingTable). 있으면 income_tax 요율 대신 사용
+    withholding:            Optional[object] = field(default=None, compare=False)
+
+    def pension_base(self, gross_pay):
+        """국민연금 부과 기준액: 총지급액을 하한/상한으로 제한한다."""
+        if self.pension_base_floor is not None and gross_pay < self.pension_base_floor:
+            return self.pension_base_floor
+        if self.pension_base_ceiling is not None and gross_pay > self.pension_base_ceiling:
+            return self.pension_base_ceiling
+        return gross_pay
+
+
+DEFAULT_RATES = RateSet()
+
+
+@dataclass(frozen=True, slots=True)
+class PayrollInput:
+    """
+    직원 1명분 계산 입력.
+    수당(meal/transport)이 None이면 RateSet의 고정수당을 사용한다.
+    dependents는 간이세액표 조회용 공제대상 가족 수(본인 포함).
+    key는 호출 측 식별자(employee_id 등)로 결과에 그대로 전달된다.
+    """
+    base_salary:         Decimal
+    overtime_minutes:    int = 0
+    meal_allowance:      Optional[Decimal] = None
+    transport_allowance: Optional[Decimal] = None
+    dependents:          int = 1
+    key:                 object = None
+
+
+@dataclass(slots=True)
+class PayrollResult:
+    """
+    계산 결과. 필드명은 PayrollRecord 금액 필드와 동일하다.
+    금액 타입은 Decimal 엔진이면 Decimal, fixed 엔진이면 int(원)이다.
+    """
+    key:                  object
+    base_salary:          Decimal
+    meal_allowance:       Decimal
+    transport_allowance:  Decimal
+    overtime_pay:         Decimal
+    gross_pay:            Decimal
+    national_pension:     Decimal
+    health_insurance:     Decimal
+    long_term_care:       Decimal
+    employment_insurance: Decimal
+    income_tax:           Decimal
+    local_income_tax:     Decimal
+    total_deduction:      Decimal
+    net_pay:              Decimal
+    overtime_minutes:     int
+
+    def as_fields(self) -> dict:
+        """PayrollRecord(**fields) 생성용 dict (key 제외)."""
+        return {name: getattr(self, name) for name in RECORD_FIELDS}
+
+
+RECORD_FIELDS = tuple(f for f in PayrollResult.__slots__ if f != 'key')
+
+
+ENGINES = ('decimal', 'fixed')
+
+
+def decimal_overtime_pay(base_salary: Decimal, overtime_minutes: int,
+                         standard_hours: Decimal, overtime_factor: Decimal) -> Decimal:
+    """초과근무수당 = 기본급 / 월 기준시간 × 배율 × 초과시간 (원 단위 절사)."""
+    hourly_rate    = base_salary / standard_hours
+    overtime_hours = Decimal(str(overtime_minutes)) / _SIXTY
+    return _floor(hourly_rate * overtime_factor * overtime_hours)
+
+
+def taxable_pay(gross_pay, meal_allowance):
+    """간이세액표 조회 기준 월 과세급여 = 총지급액 - 식대(비과세)."""
+    return gross_pay - meal_allowance
+
+
+def calculate(inp: PayrollInput, rates: RateSet = DEFAULT_RATES,
+              engine: Optional[str] = None) -> PayrollResult:
+    """직원 1명분 급여 계산."""
+    return next(calculate_many((inp,), rates, engine))
+
+
+def calculate_many(inputs: Iterable[PayrollInput],
+                   rates: RateSet = DEFAULT_RATES,
+                   engine: Optional[str] = None) -> Iterator[PayrollResult]:
+    """
+    입력을 한 번 순회하며 결과를 차례로 생성한다.
+    engine 미지정 시 settings.PAYROLL_ENGINE('decimal' | 'fixed')을 따른다.
+    """
+    if engine is None:
+        engine = getattr(settings, 'PAYROLL_ENGINE', 'decimal')
+    if engine == 'fixed':
+        from .fixedpoint import calculate_many_fixed
+        return calculate_many_fixed(inputs, rates)
+    if engine != 'decimal':
+        raise ImproperlyConfigured(f'PAYROLL_ENGINE은 {ENGINES} 중 하나여야 합니다: {engine!r}')
+    return calculate_many_decimal(inputs, rates)
+
+
+def calculate_many_decimal(inputs: Iterable[PayrollInput],
+                           rates: RateSet = DEFAULT_RATES) -> Iterator[PayrollResult]:
+    """Decimal 엔진. 요율은 루프 밖에서 한 번만 읽는다."""
+    pension_rate    = rates.national_pension
+    health_rate     = rates.health_insurance
+    care_rate       = rates.long_term_care
+    employment_rate = rates.employment_insurance
+    income_rate     = rates.income_tax
+    local_rate      = rates.local_income_tax
+    default_meal      = rates.meal_allowance
+    default_transport = rates.transport_allowance
+    overtime_factor   = rates.overtime_multiplier
+    standard_hours    = rates.standard_monthly_hours
+    pension_base      = rates.pension_base
+    withholding       = rates.withholding
+
+    for inp in inputs:
+        base_salary = Decimal(str(inp.base_salary))
+        meal        = default_meal if inp.meal_allowance is None else inp.meal_allowance
+        transport   = default_transport if inp.transport_allowance is None else inp.transport_allowance
+
+        # 초과근무수당
+        overtime_pay = decimal_overtime_pay(
+            base_salary, inp.overtime_minutes, standard_hours, overtime_factor,
+        )
+
+        # 총지급액
+        gross_pay = base_salary + meal + transport + overtime_pay
+
+        # 공제 (원 단위 절사)
+        national_pension     = _floor(pension_base(gross_pay) * pension_rate)
+        health_insurance     = _floor(gross_pay * health_rate)
+        long_term_care       = _floor(health_insurance * care_rate)
+        employment_insurance = _floor(gross_pay * employment_rate)
+        if withholding is None:
+            income_tax = _floor(gross_pay * income_rate)
+        else:
+            income_tax = Decimal(withholding.lookup(
+                int(_floor(taxable_pay(gross_pay, meal))), inp.dependents,
+            ))
+        local_income_tax     = _floor(income_tax * local_rate)
+
+        total_deduction = (
+            national_pension + health_insurance + long_term_care
+            + employment_insurance + income_tax + local_income_tax
+        )
+
+        yield PayrollResult(
+            key                  = inp.key,
+            base_salary          = base_salary,
+            meal_allowance       = meal,
+            transport_allowance  = transport,
+            overtime_pay         = overtime_pay,
+            gross_pay            = gross_pay,
+            national_pension     = national_pension,
+            health_insurance     = health_insurance,
+            long_term_care       = long_term_care,
+            employment_insurance = employment_insurance,
+            income_tax           = income_tax,
+            local_income_tax     = local_income_tax,
+            total_deduction      = total_deduction,
+            net_pay              = gross_pay - total_deduction,
+            overtime_minutes     = inp.overtime_minutes,
+        )
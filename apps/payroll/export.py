@@ -0,0 +1,145 @@
+"""
+급여대장·연간 리포트 파일 내보내기 (CSV / XLSX).
+
+명세 행은 ledger.detail_rows()로 chunk 단위 키셋 쿼리를 나눠 읽고,
+부서가 바뀌는 시점에 소계 행을, 마지막에 합계 행을 끼워 넣는다.
+DB 결과도 쿼리마다 chunk 크기만큼만 받고 행을 모아두지 않으므로 인원수와 관계없이 메모리 사용량이 일정하다.
+
+- CSV : StreamingHttpResponse로 행 단위 전송 (Excel 한글 인식을 위해 UTF-8 BOM)
+- XLSX: openpyxl write-only 워크북 → 임시 파일 → FileResponse로 chunk 전송
+연간 리포트(annual_rows)는 PayrollYearToDate 누계 행을 같은 방식으로 CSV 스트리밍한다.
+"""
+import csv
+import tempfile
+from decimal import Decimal
+from itertools import groupby
+
+from . import annual, ledger
+
+FORMATS = ('csv', 'xlsx')
+
+HEADERS = (
+    '부서', '사번', '이름', '직급',
+    '기본급', '식대', '교통비', '초과근무수당', '총지급액',
+    '국민연금', '건강보험', '장기요양보험', '고용보험', '소득세', '지방소득세',
+    '총공제액', '실수령액', '초과근무(분)', '상태',
+)
+
+ANNUAL_HEADERS = (
+    '부서', '사번', '이름', '직급', '확정월수',
+    '기본급', '식대', '교통비', '초과근무수당', '총지급액',
+    '국민연금', '건강보험', '장기요양보험', '고용보험', '소득세', '지방소득세',
+    '총공제액', '실수령액', '초과근무(분)',
+)
+
+CONTENT_TYPES = {
+    'csv':  'text/csv; charset=utf-8',
+    'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+}
+
+
+def filename(year: int, month: int, file_format: str) -> str:
+    return f'payroll_ledger_{year}{month:02d}.{file_format}'
+
+
+def annual_filename(year: int) -> str:
+    return f'payroll_annual_{year}.csv'
+
+
+def _total_row(label: str, name: str, count: int, sums: list, minutes: int) -> list:
+    return [label, name, f'{count}명', '', *sums, minutes, '']
+
+
+def ledger_rows(year: int, month: int, chunk_size: int = ledger.DETAIL_CHUNK_SIZE):
+    """헤더 → (부서별 명세 행 … 소계 행) → 합계 행 순으로 list를 생성한다. 금액은 Decimal."""
+    yield list(HEADERS)
+
+    n = len(ledger.AMOUNT_FIELDS)
+    grand, grand_count, grand_minutes = [Decimal(0)] * n, 0, 0
+    rows = ledger.detail_rows(year, month, chunk_size=chunk_size)
+    for _, group in groupby(rows, key=lambda r: r['department_id']):
+        sums, count, minutes, dept_name = [Decimal(0)] * n, 0, 0, ''
+        for r in group:
+            amounts = [r[f] for f in ledger.AMOUNT_FIELDS]
+            dept_name = r['department_name']
+            yield [
+                dept_name, r['employee_no'], r['employee_name'], r['position_name'] or '',
+                *amounts,
+                r['overtime_minutes'], ledger.STATUS_LABELS.get(r['status'], r['status']),
+            ]
+            sums = [a + b for a, b in zip(sums, amounts)]
+            count   += 1
+            minutes += r['overtime_minutes']
+        yield _total_row(dept_name, '소계', count, sums, minutes)
+        grand = [a + b for a, b in zip(grand, sums)]
+        grand_count   += count
+        grand_minutes += minutes
+
+    yield _total_row('합계', '', grand_count, grand, grand_minutes)
+
+
+def annual_rows(year: int, department_id: int = None, chunk_size: int = ledger.DETAIL_CHUNK_SIZE):
+    """헤더 → (부서별 직원 누계 행 … 소계 행) → 합계 행 순으로 list를 생성한다."""
+    yield list(ANNUAL_HEADERS)
+
+    n = len(ledger.AMOUNT_FIELDS)
+    grand, grand_count, grand_minutes = [Decimal(0)] * n, 0, 0
+    rows = annual.detail_rows(year, department_id, chunk_size=chunk_size)
+    for _, group in groupby(rows, key=lambda r: r['department_id']):
+        sums, count, minutes, dept_name = [Decimal(0)] * n, 0, 0, ''
+        for r in group:
+            amounts = [r[f] for f in ledger.AMOUNT_FIELDS]
+            dept_name = r['department_name']
+            yield [
+                dept_name, r['employee_no'], r['employee_name'], r['position_name'] or '',
+                r['months'], *amounts, r['overtime_minutes'],
+            ]
+            sums = [a + b for a, b in zip(sums, amounts)]
+            count   += 1
+            minutes += r['overtime_minutes']
+        yield [dept_name, '소계', f'{count}명', '', '', *sums, minutes]
+        grand = [a + b for a, b in zip(grand, sums)]
+        grand_count   += count
+        grand_minutes += minutes
+
+    yield ['합계', '', f'{grand_count}명', '', '', *grand, grand_minutes]
+
+
+class _Echo:
+    """csv.writer가 쓴 한 행을 그대로 돌려주는 의사 버퍼."""
+
+    def write(self, value):
+        return value
+
+
+def iter_csv(rows):
+    yield '\ufeff'
+    writer = csv.writer(_Echo())
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def write_xlsx(rows, year: int, month: int, out=None):
+    """
+    write-only 워크북을 out(바이너리 파일)에 기록한다.
+    out을 생략하면 임시 파일에 기록하고 처음 위치로 되감은 파일 객체를 반환한다.
+    """
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(f'{year}년 {month}월')
+    for row in rows:
+        ws.append(row)
+    if out is not None:
+        wb.save(out)
+        return out
+    out = tempfile.TemporaryFile()
+    wb.save(out)
+    out.seek(0)
+    return out
+
+
+def write_csv(rows, out):
+    """iter_csv의 행을 out(바이너리 파일)에 UTF-8로 바로 기록한다."""
+    for line in iter_csv(rows):
+        out.write(line.encode('utf-8'))
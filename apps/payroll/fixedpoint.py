@@ -0,0 +1,162 @@
+"""
+정수 원 단위 고정소수점 급여 계산 엔진 (settings.PAYROLL_ENGINE = 'fixed').
+
+금액은 int(원), 요율은 Decimal.as_integer_ratio()로 얻은 정수 분자/분모로 보관한다.
+원 단위 절사는 floor(금액 × 요율) = 금액 × 분자 // 분모 로 정확히 같아서
+Decimal 엔진과 결과가 원 단위까지 일치한다.
+
+예외적으로 Decimal 엔진과 계산 경로를 맞춰야 하는 경우는 Decimal로 위임한다.
+- 기본급·수당에 원 미만 단위가 있는 입력
+- 초과근무수당의 정확한 값이 정수인 경우: Decimal 엔진은 기본급/209, 분/60을
+  28자리로 반올림한 뒤 곱하므로 1원 작게 절사될 수 있다.
+"""
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Iterable, Iterator, Optional
+
+from .calculator import (
+    DEFAULT_RATES, PayrollInput, PayrollResult, RateSet,
+    calculate_many_decimal, decimal_overtime_pay, taxable_pay,
+)
+
+
+def to_int_won(amount):
+    """원 단위 정수로 표현 가능하면 int, 아니면 None."""
+    if type(amount) is int:
+        return amount
+    num, den = Decimal(amount).as_integer_ratio()
+    return num if den == 1 else None
+
+
+def _optional_won(amount, label: str):
+    if amount is None:
+        return None
+    won = to_int_won(amount)
+    if won is None:
+        raise ValueError(f'{label}은 원 단위 정수여야 합니다.')
+    return won
+
+
+@dataclass(frozen=True, slots=True)
+class IntRates:
+    """RateSet을 정수 분자/분모로 변환한 값."""
+    pension_num:    int
+    pension_den:    int
+    health_num:     int
+    health_den:     int
+    care_num:       int
+    care_den:       int
+    employment_num: int
+    employment_den: int
+    income_num:     int
+    income_den:     int
+    local_num:      int
+    local_den:      int
+    meal:           int
+    transport:      int
+    # 초과근무수당 = 기본급 × 분 × overtime_num // overtime_den
+    overtime_num:   int
+    overtime_den:   int
+    # 국민연금 기준소득월액 하한/상한 (None이면 제한 없음)
+    pension_floor:   Optional[int] = None
+    pension_ceiling: Optional[int] = None
+
+    @classmethod
+    def from_rate_set(cls, rates: RateSet) -> 'IntRates':
+        meal      = to_int_won(rates.meal_allowance)
+        transport = to_int_won(rates.transport_allowance)
+        if meal is None or transport is None:
+            raise ValueError('고정수당은 원 단위 정수여야 합니다.')
+        pension_floor   = _optional_won(rates.pension_base_floor,   '국민연금 기준소득월액 하한')
+        pension_ceiling = _optional_won(rates.pension_base_ceiling, '국민연금 기준소득월액 상한')
+        factor_num, factor_den = rates.overtime_multiplier.as_integer_ratio()
+        hours_num,  hours_den  = rates.standard_monthly_hours.as_integer_ratio()
+        ratios = [
+            r.as_integer_ratio() for r in (
+                rates.national_pension, rates.health_insurance, rates.long_term_care,
+                rates.employment_insurance, rates.income_tax, rates.local_income_tax,
+            )
+        ]
+        return cls(
+            *(v for pair in ratios for v in pair),
+            meal=meal,
+            transport=transport,
+            overtime_num=factor_num * hours_den,
+            overtime_den=factor_den * hours_num * 60,
+            pension_floor=pension_floor,
+            pension_ceiling=pension_ceiling,
+        )
+
+
+def calculate_many_fixed(inputs: Iterable[PayrollInput],
+                         rates: RateSet = DEFAULT_RATES) -> Iterator[PayrollResult]:
+    """
+    정수 엔진. 결과 금액 필드는 int(원)로 반환한다.
+    PayrollRecord의 DecimalField는 저장 시 int를 그대로 받는다.
+    """
+    r = IntRates.from_rate_set(rates)
+    pension_num, pension_den       = r.pension_num, r.pension_den
+    health_num, health_den         = r.health_num, r.health_den
+    care_num, care_den             = r.care_num, r.care_den
+    employment_num, employment_den = r.employment_num, r.employment_den
+    income_num, income_den         = r.income_num, r.income_den
+    local_num, local_den           = r.local_num, r.local_den
+    overtime_num, overtime_den     = r.overtime_num, r.overtime_den
+    pension_floor, pension_ceiling = r.pension_floor, r.pension_ceiling
+    withholding = rates.withholding
+    standard_hours  = rates.standard_monthly_hours
+    overtime_factor = rates.overtime_multiplier
+
+    for inp in inputs:
+        base      = to_int_won(inp.base_salary)
+        meal      = r.meal if inp.meal_allowance is None else to_int_won(inp.meal_allowance)
+        transport = r.transport if inp.transport_allowance is None else to_int_won(inp.transport_allowance)
+        if base is None or meal is None or transport is None:
+            yield from calculate_many_decimal((inp,), rates)
+            continue
+
+        minutes = inp.overtime_minutes
+        overtime_pay, remainder = divmod(base * minutes * overtime_num, overtime_den)
+        if remainder == 0 and overtime_pay:
+            overtime_pay = int(decimal_overtime_pay(Decimal(base), minutes, standard_hours, overtime_factor))
+
+        gross = base + meal + transport + overtime_pay
+
+        pension_base = gross
+        if pension_floor is not None and pension_base < pension_floor:
+            pension_base = pension_floor
+        if pension_ceiling is not None and pension_base > pension_ceiling:
+            pension_base = pension_ceiling
+
+        national_pension     = pension_base * pension_num // pension_den
+        health_insurance     = gross * health_num // health_den
+        long_term_care       = health_insurance * care_num // care_den
+        employment_insurance = gross * employment_num // employment_den
+        if withholding is None:
+            income_tax = gross * income_num // income_den
+        else:
+            income_tax = withholding.lookup(taxable_pay(gross, meal), inp.dependents)
+        local_income_tax     = income_tax * local_num // local_den
+
+        total_deduction = (
+            national_pension + health_insurance + long_term_care
+            + employment_insurance + income_tax + local_income_tax
+        )
+
+        yield PayrollResult(
+            key                  = inp.key,
+            base_salary          = base,
+            meal_allowance       = meal,
+            transport_allowance  = transport,
+            overtime_pay         = overtime_pay,
+            gross_pay            = gross,
+            national_pension     = national_pension,
+            health_insurance     = health_insurance,
+            long_term_care       = long_term_care,
+            employment_insurance = employment_insurance,
+            income_tax           = income_tax,
+            local_income_tax     = local_income_tax,
+            total_deduction      = total_deduction,
+            net_pay              = gross - total_deduction,
+            overtime_minutes     = minutes,
+        )
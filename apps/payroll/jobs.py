@@ -0,0 +1,180 @@
+"""
+급여 백그라운드 작업 (apps.jobs 등록부에 등록, PayrollConfig.ready에서 import)
+
+- payroll_run:   {year, month, department?, recalculate?}  부서 단위로 run_month를 실행하며 진행률 보고
+- ledger_export: {year, month, format}                      급여대장 CSV/XLSX 파일 (JOB_RESULT_DIR에 기록)
+- annual_export: {year, department?}                        연간 급여 리포트 CSV 파일 (JOB_RESULT_DIR에 기록)
+- payslip_batch: {year, month, department?}                 확정 급여명세서 PDF ZIP (JOB_RESULT_DIR에 기록)
+
+요청 스레드에서 실행하던 일괄 계산·대용량 내보내기를 run_jobs 작업자에게 넘기기 위한 것으로,
+계산·내보내기 로직은 동기 API와 같은 함수를 그대로 쓴다.
+"""
+from rest_framework.exceptions import ValidationError
+
+from apps.employees.models import Department
+from apps.jobs.registry import JobFile, register
+from apps.jobs.services import JobService
+from . import export, ledger, payslip
+from .models import PayrollRecord
+from .services import PayrollService
+
+# 결과 JSON에 남기는 직원별 오류 최대 건수
+MAX_ERROR_ROWS = 100
+
+
+def _int(params: dict, name: str, required: bool = True):
+    value = params.get(name)
+    if value in (None, ''):
+        if required:
+            raise ValidationError(f'{name} 값이 필요합니다.')
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise ValidationError(f'{name}는 정수여야 합니다.')
+
+
+def _year_month(params: dict) -> dict:
+    year, month = _int(params, 'year'), _int(params, 'month')
+    if not (1 <= month <= 12):
+        raise ValidationError('month는 1~12 사이여야 합니다.')
+    return {'year': year, 'month': month}
+
+
+def _department(params: dict):
+    department = _int(params, 'department', required=False)
+    if department is not None and not Department.objects.filter(pk=department).exists():
+        raise ValidationError('존재하지 않는 부서입니다.')
+    return department
+
+
+# ── 급여 일괄 계산 ────────────────────────────────────────────────────
+def validate_run(params: dict) -> dict:
+    return {
+        **_year_month(params),
+        'department':  _department(params),
+        'recalculate': str(params.get('recalculate')).lower() in ('true', '1', 'yes', 'on'),
+    }
+
+
+@register('payroll_run', validate=validate_run, label='급여 일괄 계산')
+def run_payroll(job, progress):
+    """재직자가 있는 부서를 부서코드 순으로 하나씩 run_month 하고, 부서가 끝날 때마다 진행률을 보고한다."""
+    params = job.params
+    year, month = params['year'], params['month']
+
+    departments = Department.objects.filter(employees__is_active=True)
+    if params.get('department') is not None:
+        departments = departments.filter(pk=params['department'])
+    departments = list(departments.distinct().order_by('code').values_list('id', 'name'))
+
+    totals = dict.fromkeys(('created', 'updated', 'unchanged', 'skipped', 'errors'), 0)
+    errors = []
+    for index, (dept_id, name) in enumerate(departments, start=1):
+        summary = PayrollService.run_month(year, month, department=dept_id,
+                                           recalculate=params.get('recalculate', False))
+        for key in totals:
+            totals[key] += summary[key]
+        errors.extend(r for r in summary['results'] if r['status'] == 'error')
+        progress(index * 100 // len(departments), f'{name} 완료 ({index}/{len(departments)})')
+
+    return {
+        'year':        year,
+        'month':       month,
+        'recalculate': params.get('recalculate', False),
+        'departments': len(departments),
+        **totals,
+        'error_rows':  errors[:MAX_ERROR_ROWS],
+    }
+
+
+# ── 파일 내보내기 ─────────────────────────────────────────────────────
+def _tracked(rows, total: int, progress, every: int = ledger.DETAIL_CHUNK_SIZE):
+    """rows를 그대로 흘려보내며 every행마다 진행률(최대 99%)을 보고한다."""
+    for count, row in enumerate(rows, start=1):
+        if count % every == 0 and total:
+            progress(min(count * 100 // total, 99), f'{count:,}행 기록')
+        yield row
+
+
+def validate_ledger_export(params: dict) -> dict:
+    file_format = str(params.get('format') or 'csv').lower()
+    if file_format not in export.FORMATS:
+        raise ValidationError(f'format은 {", ".join(export.FORMATS)} 중 하나여야 합니다.')
+    return {**_year_month(params), 'format': file_format}
+
+
+@register('ledger_export', validate=validate_ledger_export, label='급여대장 내보내기')
+def export_ledger(job, progress):
+    """파일을 결과 디렉터리에 행 단위로 기록한다 (작은 파일만 DB로 옮긴다, JobService.file_result)."""
+    year, month, file_format = job.params['year'], job.params['month'], job.params['format']
+    total = PayrollRecord.objects.filter(year=year, month=month).count()
+    rows  = _tracked(export.ledger_rows(year, month), total, progress)
+    name  = export.filename(year, month, file_format)
+    path  = JobService.result_file_path(job, name)
+
+    with open(path, 'wb') as out:
+        if file_format == 'csv':
+            export.write_csv(rows, out)
+        else:
+            export.write_xlsx(rows, year, month, out=out)
+    return JobService.file_result(
+        path, name, export.CONTENT_TYPES[file_format],
+        result={'year': year, 'month': month, 'format': file_format, 'rows': total},
+    )
+
+
+def validate_annual_export(params: dict) -> dict:
+    return {'year': _int(params, 'year'), 'department': _department(params)}
+
+
+@register('annual_export', validate=validate_annual_export, label='연간 급여 리포트 내보내기')
+def export_annual(job, progress):
+    from .annual import annual_queryset
+
+    year, department = job.params['year'], job.params.get('department')
+    total = annual_queryset(year, department).count()
+    name  = export.annual_filename(year)
+    path  = JobService.result_file_path(job, name)
+
+    with open(path, 'wb') as out:
+        export.write_csv(_tracked(export.annual_rows(year, department), total, progress), out)
+    return JobService.file_result(
+        path, name, export.CONTENT_TYPES['csv'],
+        result={'year': year, 'department': department, 'rows': total},
+    )
+
+
+def validate_payslip_batch(params: dict) -> dict:
+    return {**_year_month(params), 'department': _department(params)}
+
+
+@register('payslip_batch', validate=validate_payslip_batch, label='급여명세서 일괄 생성')
+def build_payslips(job, progress):
+    """명세서 ZIP을 결과 디렉터리에 바로 기록한다 (DB에는 경로만 저장)."""
+    from django.conf import settings
+
+    year, month, department = job.params['year'], job.params['month'], job.params.get('department')
+    total = payslip.payslip_queryset(year, month, department).count()
+    name  = payslip.filename(year, month)
+    path  = JobService.result_file_path(job, name)
+
+    def on_chunk(done):
+        # 작업자 수 × chunk마다 한 번 정도만 기록
+        if total and done % (payslip.CHUNK_SIZE * 4) == 0:
+            progress(min(done * 100 // total, 99), f'{done:,}/{total:,}건 생성')
+
+    pdfs = payslip.iter_pdfs(
+        payslip.payslip_rows(year, month, department),
+        workers=payslip.default_workers(),
+        on_chunk=on_chunk,
+        font_path=settings.PAYSLIP_FONT_PATH,
+    )
+    with open(path, 'wb') as out:
+        count = payslip.write_zip(out, pdfs)
+    return JobFile(
+        filename=name,
+        content_type='application/zip',
+        path=path,
+        result={'year': year, 'month': month, 'department': department, 'count': count},
+    )
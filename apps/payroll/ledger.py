@@ -0,0 +1,134 @@
+"""
+급여대장 조회 (DB 집계).
+
+- 부서 소계: (부서) 단위 GROUP BY + Sum 1회. 전체 합계는 부서 소계를 더해 구한다.
+- 명세 행: 모델 인스턴스 대신 values()로 필요한 열만 읽고, (부서명, 부서 id, 사번) 키셋 조건으로
+  DETAIL_CHUNK_SIZE 행씩 나눠 조회해 흘려보낸다 (apps.utils.db.keyset_rows).
+detail=False이면 명세 행 쿼리를 생략하고 소계만 반환한다 (대시보드용).
+"""
+from itertools import groupby
+
+from django.db.models import Count, F, Sum
+from django.utils import timezone
+
+from apps.utils.db import keyset_rows
+from .models import PayrollRecord
+
+
+# 급여대장 금액 열 (LedgerRecordSerializer와 같은 순서)
+AMOUNT_FIELDS = (
+    'base_salary', 'meal_allowance', 'transport_allowance',
+    'overtime_pay', 'gross_pay',
+    'national_pension', 'health_insurance', 'long_term_care',
+    'employment_insurance', 'income_tax', 'local_income_tax',
+    'total_deduction', 'net_pay',
+)
+
+# 부서 소계 항목 → 원본 필드
+SUBTOTAL_FIELDS = {
+    'subtotal_gross_pay': 'gross_pay',
+    'subtotal_deduction': 'total_deduction',
+    'subtotal_net_pay':   'net_pay',
+}
+
+STATUS_LABELS = dict(PayrollRecord.Status.choices)
+
+DETAIL_CHUNK_SIZE = 2000
+
+# 명세 행 정렬·키셋 키 (부서명이 같은 부서는 id로 구분, 사번은 유일)
+DETAIL_KEYS = ('department_name', 'department_id', 'employee_no')
+
+
+def ledger_queryset(year: int, month: int):
+    return PayrollRecord.objects.filter(year=year, month=month)
+
+
+def department_subtotals(year: int, month: int) -> list:
+    """부서별 인원수·소계. 부서명, 부서 id 순."""
+    rows = (
+        ledger_queryset(year, month)
+        .values(department_id=F('employee__department_id'), name=F('employee__department__name'))
+        .annotate(
+            count=Count('id'),
+            **{key: Sum(field) for key, field in SUBTOTAL_FIELDS.items()},
+        )
+        .order_by('name', 'department_id')
+    )
+    return list(rows)
+
+
+def detail_rows(year: int, month: int, chunk_size: int = DETAIL_CHUNK_SIZE):
+    """
+    명세 행 dict를 부서명, 부서 id, 사번 순으로 흘려보낸다. 금액은 Decimal.
+    chunk_size 행씩 별도 쿼리로 읽으므로 한 번에 chunk_size 행만 메모리에 있다.
+    """
+    rows = (
+        ledger_queryset(year, month)
+        .values(
+            'id',
+            *AMOUNT_FIELDS,
+            'overtime_minutes', 'status',
+            department_id   = F('employee__department_id'),
+            department_name = F('employee__department__name'),
+            employee_no     = F('employee__employee_no'),
+            employee_name   = F('employee__name'),
+            position_name   = F('employee__position__name'),
+        )
+    )
+    return keyset_rows(rows, DETAIL_KEYS, chunk_size)
+
+
+def _money(value) -> str:
+    # LedgerRecordSerializer(DecimalField, 소수 2자리)와 같은 문자열
+    return f'{value:.2f}'
+
+
+def _record_data(row: dict) -> dict:
+    data = {
+        'id':            row['id'],
+        'employee_no':   row['employee_no'],
+        'employee_name': row['employee_name'],
+        'position_name': row['position_name'],
+    }
+    for field in AMOUNT_FIELDS:
+        data[field] = _money(row[field])
+    data['overtime_minutes'] = row['overtime_minutes']
+    data['status']           = row['status']
+    data['status_display']   = STATUS_LABELS.get(row['status'], row['status'])
+    return data
+
+
+def build_ledger(year: int, month: int, detail: bool = True) -> dict:
+    """급여대장 응답 데이터. detail=False이면 부서별 records를 포함하지 않는다."""
+    subtotals   = department_subtotals(year, month)
+    departments = []
+    by_id       = {}
+    for row in subtotals:
+        dept = {
+            'department_id': row['department_id'],
+            'name':          row['name'],
+            'count':         row['count'],
+            **{key: str(row[key]) for key in SUBTOTAL_FIELDS},
+        }
+        if detail:
+            dept['records'] = []
+            by_id[row['department_id']] = dept
+        departments.append(dept)
+
+    if detail:
+        for dept_id, rows in groupby(detail_rows(year, month), key=lambda r: r['department_id']):
+            by_id[dept_id]['records'].extend(_record_data(r) for r in rows)
+
+    def total(key):
+        return str(sum(row[key] for row in subtotals))
+
+    return {
+        'year':            year,
+        'month':           month,
+        'generated_at':    timezone.now().isoformat(),
+        'total_count':     sum(row['count'] for row in subtotals),
+        'total_gross_pay': total('subtotal_gross_pay'),
+        'total_deduction': total('subtotal_deduction'),
+        'total_net_pay':   total('subtotal_net_pay'),
+        'departments':     departments,
+    }
@@ -0,0 +1,110 @@
+"""
+급여대장 캐시 (Django cache framework).
+
+- 급여월별 변경 카운터(PayrollLedgerVersion)를 DB에 두고, 대장 데이터는 (연, 월, 조회 옵션, 버전) 키로 캐시에 저장한다.
+  급여 생성·수정·확정·삭제 시 해당 월 카운터만 올리면 이전 키는 더 이상 조회되지 않는다.
+- 직원·부서·직급이 바뀌면(이름 등) 세대 행(0, 0)을 올려 모든 월을 무효화한다.
+- 버전은 ETag / Last-Modified 계산에도 쓰이므로 대장을 다시 만들지 않고 304 판단이 가능하다 (조회 1회).
+- 적중/실패 횟수는 캐시 카운터로 기록한다 (stats()).
+
+카운터가 DB에 있으므로 작업 워커(run_jobs)·관리 명령(run_payroll 등)처럼 다른 프로세스에서 급여를 바꿔도
+웹 프로세스가 바로 새 버전을 본다. 캐시 백엔드가 프로세스별(locmem)이면 대장 데이터만 프로세스마다 따로 쌓인다.
+카운터 갱신은 급여 변경과 같은 트랜잭션에서 이루어져 커밋 전에는 다른 프로세스에 보이지 않는다.
+
+PayrollRecord 시그널은 save/delete에서 호출되며, bulk_create / QuerySet.update를 쓰는
+서비스 함수(write_records, confirm_bulk)는 invalidate()를 직접 호출한다.
+"""
+import hashlib
+import math
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F, Q
+from django.utils import timezone
+
+from . import ledger
+from .models import PayrollLedgerVersion
+
+_PREFIX      = 'payroll:ledger'
+_GENERATION  = (0, 0)
+_STAT_KEYS   = {'hits': f'{_PREFIX}:hits', 'misses': f'{_PREFIX}:misses'}
+
+
+def version(year: int, month: int) -> tuple:
+    """(세대, 해당 월 버전, 마지막 변경 시각 timestamp). 하나라도 바뀌면 캐시·ETag가 달라진다."""
+    rows = {
+        (y, m): (ver, updated_at)
+        for y, m, ver, updated_at in PayrollLedgerVersion.objects.filter(
+            Q(year=_GENERATION[0], month=_GENERATION[1]) | Q(year=year, month=month),
+        ).values_list('year', 'month', 'version', 'updated_at')
+    }
+    generation, generation_at = rows.get(_GENERATION, (0, None))
+    current, current_at       = rows.get((year, month), (0, None))
+    modified = max((t.timestamp() for t in (generation_at, current_at) if t), default=0.0)
+    return generation, current, modified
+
+
+def _bump(year: int, month: int):
+    counters = PayrollLedgerVersion.objects.filter(year=year, month=month)
+    if counters.update(version=F('version') + 1, updated_at=timezone.now()):
+        return
+    _, created = PayrollLedgerVersion.objects.get_or_create(year=year, month=month, defaults={'version': 1})
+    if not created:  # 다른 트랜잭션이 먼저 만든 경우
+        counters.update(version=F('version') + 1, updated_at=timezone.now())
+
+
+def invalidate(year: int, month: int):
+    """해당 급여월 무효화."""
+    _bump(year, month)
+
+
+def invalidate_all():
+    _bump(*_GENERATION)
+
+
+def etag(year: int, month: int, detail: bool, ver: tuple) -> str:
+    raw = f'{year}:{month}:{int(detail)}:{ver[0]}:{ver[1]}:{ver[2]:.6f}'
+    return '"' + hashlib.md5(raw.encode(), usedforsecurity=False).hexdigest() + '"'
+
+
+def last_modified(ver: tuple) -> float:
+    return math.ceil(ver[2])
+
+
+def _count(name: str):
+    key = _STAT_KEYS[name]
+    try:
+        cache.incr(key)
+    except ValueError:
+        if not cache.add(key, 1, None):
+            cache.incr(key)
+
+
+def get_ledger(year: int, month: int, detail: bool = True, ver: tuple = None):
+    """(대장 데이터, 캐시 적중 여부). 캐시에 없으면 ledger.build_ledger로 만들어 저장한다."""
+    ver = ver or version(year, month)
+    key = f'{_PREFIX}:data:{year}:{month}:{int(detail)}:{ver[0]}:{ver[1]}:{ver[2]:.6f}'
+    data = cache.get(key)
+    if data is not None:
+        _count('hits')
+        return data, True
+    _count('misses')
+    data = ledger.build_ledger(year, month, detail=detail)
+    cache.set(key, data, settings.PAYROLL_LEDGER_CACHE_TIMEOUT)
+    return data, False
+
+
+def stats() -> dict:
+    hits   = cache.get(_STAT_KEYS['hits'])   or 0
+    misses = cache.get(_STAT_KEYS['misses']) or 0
+    total  = hits + misses
+    return {
+        'hits':     hits,
+        'misses':   misses,
+        'hit_rate': round(hits / total, 4) if total else None,
+        'backend':  settings.CACHES['default']['BACKEND'].rsplit('.', 1)[-1],
+    }
+
+
+def reset_stats():
+    cache.delete_many(list(_STAT_KEYS.values()))
@@ -0,0 +1,74 @@
+"""
+급여명세서 PDF 일괄 생성 벤치마크 (DB 없이 가상 명세서로 측정).
+
+    python manage.py bench_payslips                          # 10,000건, 작업자 1/2/4/CPU 수
+    python manage.py bench_payslips --count 10000 --workers 1 8
+    python manage.py bench_payslips --output /tmp/payslips.zip
+
+렌더링 → ZIP 스트리밍 전체 경로를 측정하며 ZIP 조각은 버린다 (--output 지정 시 파일에 기록).
+최대 RSS는 이 프로세스 기준이며 (작업자 프로세스 제외), 건수와 관계없이 일정해야 한다.
+"""
+import os
+import resource
+import time
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.payroll import payslip
+
+
+def fake_rows(count: int, year: int = 2024, month: int = 5):
+    for i in range(count):
+        base = Decimal(2_500_000 + (i % 400) * 10_000)
+        yield {
+            'year': year, 'month': month, 'overtime_minutes': (i * 7) % 1200,
+            'employee_no': f'EMP{i:06d}', 'employee_name': f'직원{i}',
+            'department_name': f'부서{i % 50:02d}', 'position_name': '사원',
+            **{field: base for field in payslip.AMOUNT_FIELDS},
+        }
+
+
+def _max_rss_mb() -> float:
+    # Linux: KB 단위
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+class Command(BaseCommand):
+    help = '급여명세서 PDF 일괄 생성(프로세스 풀 + ZIP 스트리밍) 처리량을 측정합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--count', type=int, default=10000, help='명세서 수 (기본 10000)')
+        parser.add_argument('--workers', type=int, nargs='+', help='작업자 수 목록 (기본 1 2 4 CPU 수)')
+        parser.add_argument('--chunk-size', type=int, default=payslip.CHUNK_SIZE, help='작업자당 chunk 크기')
+        parser.add_argument('--output', help='마지막 실행의 ZIP을 기록할 경로')
+
+    def handle(self, *args, **options):
+        count = options['count']
+        if count < 1:
+            raise CommandError('--count는 1 이상이어야 합니다.')
+        workers_list = options['workers'] or sorted({1, 2, 4, os.cpu_count() or 1})
+
+        self.stdout.write(f'명세서 {count:,}건, chunk {options["chunk_size"]}, CPU {os.cpu_count()}개')
+        self.stdout.write(f'{"작업자":>6}{"소요(s)":>10}{"건/초":>10}{"ZIP(MB)":>10}{"최대RSS(MB)":>13}')
+        for index, workers in enumerate(workers_list):
+            last = index == len(workers_list) - 1
+            out  = open(options['output'], 'wb') if options['output'] and last else None
+            size = 0
+            started = time.perf_counter()
+            pdfs = payslip.iter_pdfs(
+                fake_rows(count), workers=workers, chunk_size=options['chunk_size'],
+                font_path=settings.PAYSLIP_FONT_PATH,
+            )
+            for part in payslip.stream_zip(pdfs):
+                size += len(part)
+                if out:
+                    out.write(part)
+            elapsed = time.perf_counter() - started
+            if out:
+                out.close()
+            self.stdout.write(
+                f'{workers:>6}{elapsed:>10.2f}{count / elapsed:>10.0f}'
+                f'{size / 1024 / 1024:>10.1f}{_max_rss_mb():>13.1f}'
+            )
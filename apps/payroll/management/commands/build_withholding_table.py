@@ -0,0 +1,64 @@
+"""
+근로소득 간이세액표 CSV → mmap용 바이너리 변환.
+
+    python manage.py build_withholding_table 간이세액표_2024.csv --output data/withholding_2024.bin
+    python manage.py build_withholding_table 간이세액표_2024.csv --benchmark 1000000
+
+--output 생략 시 settings.WITHHOLDING_TAX_TABLE 경로에 저장한다.
+연도별 세액표는 다른 경로에 저장한 뒤 해당 공제율(PayrollRateSet)의 간이세액표 파일로 지정한다.
+CSV 형식은 apps/payroll/withholding.py 참고.
+"""
+import random
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.payroll.rates import bump_version
+from apps.payroll.withholding import WithholdingTable
+
+
+class Command(BaseCommand):
+    help = '간이세액표 CSV를 바이너리 조회 파일로 변환합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('csv_path')
+        parser.add_argument('--output', help='저장 경로 (기본: settings.WITHHOLDING_TAX_TABLE)')
+        parser.add_argument('--benchmark', type=int, default=0, metavar='N',
+                            help='저장한 파일을 mmap으로 열어 N건 조회 속도를 측정')
+
+    def handle(self, *args, **options):
+        output = options['output'] or getattr(settings, 'WITHHOLDING_TAX_TABLE', '')
+        if not output:
+            raise CommandError('--output 또는 WITHHOLDING_TAX_TABLE 설정이 필요합니다.')
+
+        try:
+            table = WithholdingTable.from_csv(options['csv_path'])
+        except (OSError, ValueError) as e:
+            raise CommandError(str(e))
+
+        Path(output).parent.mkdir(parents=True, exist_ok=True)
+        table.save(output)
+        # 각 프로세스의 요율 캐시가 새 세액표로 다시 컴파일되도록 버전을 올린다
+        bump_version()
+        self.stdout.write(self.style.SUCCESS(
+            f'간이세액표 저장 완료: {output} (구간 {len(table)}개, 가족 수 1~{table.dependents}명)'
+        ))
+
+        if options['benchmark']:
+            self._benchmark(WithholdingTable.open(output), options['benchmark'])
+
+    def _benchmark(self, table, n):
+        rng   = random.Random(0)
+        upper = table.uppers[len(table) - 1]
+        if table.statutory:
+            upper += upper // 10   # 1천만원 초과 산식 포함
+        pays  = [rng.randrange(0, upper) for _ in range(n)]
+        deps  = [rng.randrange(1, table.dependents + 1) for _ in range(n)]
+        lookup = table.lookup
+        started = time.perf_counter()
+        for pay, dep in zip(pays, deps):
+            lookup(pay, dep)
+        elapsed = time.perf_counter() - started
+        self.stdout.write(f'조회 {n:,}건: {elapsed:.3f}s ({n / elapsed:,.0f}건/초)')
@@ -0,0 +1,23 @@
+"""
+연간 급여 누계(PayrollYearToDate) 재구성.
+
+    python manage.py rebuild_payroll_ytd              # 전체 연도
+    python manage.py rebuild_payroll_ytd --year 2024
+"""
+from django.core.management.base import BaseCommand
+
+from apps.payroll.services import YearToDateService
+
+
+class Command(BaseCommand):
+    help = '확정 급여를 집계하여 직원별 연간 누계를 다시 만듭니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--year', type=int, help='연도 (미지정 시 전체)')
+        parser.add_argument('--chunk-size', type=int, default=1000, help='bulk_create 단위 (기본 1000)')
+
+    def handle(self, *args, **options):
+        year  = options['year']
+        count = YearToDateService.rebuild(year, chunk_size=options['chunk_size'])
+        scope = '전체' if year is None else f'{year}년'
+        self.stdout.write(self.style.SUCCESS(f'연간 급여 누계 재구성 완료 ({scope}): {count}건'))
@@ -0,0 +1,91 @@
+"""
+월말 급여 일괄 계산.
+
+    python manage.py run_payroll 2024 5
+    python manage.py run_payroll 2024 5 --department 3   # 부서 id (API·작업의 department와 같은 값)
+    python manage.py run_payroll 2024 5 --workers 8     # 부서 단위 병렬 + 부서별 소요시간 출력
+    python manage.py run_payroll 2024 5 --recalculate   # 기존 DRAFT 재계산 (값이 바뀐 행만 갱신)
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.employees.models import Department
+from apps.payroll.services import PayrollService, RunConflict
+
+
+class Command(BaseCommand):
+    help = '재직 중인 전 직원의 해당 월 급여를 일괄 계산합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('year',  type=int)
+        parser.add_argument('month', type=int)
+        parser.add_argument('--department', type=int, help='부서 id (미지정 시 전 부서)')
+        parser.add_argument('--chunk-size', type=int, default=500, help='bulk_create 단위 (기본 500)')
+        parser.add_argument(
+            '--workers', type=int, default=None,
+            help='부서 단위 병렬 작업자 수. 지정하면 부서별 조회/계산 시간을 출력합니다.',
+        )
+        parser.add_argument(
+            '--recalculate', action='store_true',
+            help='이미 계산된 DRAFT 급여를 다시 계산합니다 (CONFIRMED는 건너뜀).',
+        )
+
+    def handle(self, *args, **options):
+        year, month = options['year'], options['month']
+        if not (1 <= month <= 12):
+            raise CommandError('month는 1~12 사이여야 합니다.')
+
+        department = None
+        if options['department'] is not None:
+            try:
+                department = Department.objects.get(pk=options['department'])
+            except Department.DoesNotExist:
+                raise CommandError(f'부서 id {options["department"]}를 찾을 수 없습니다.')
+
+        try:
+            summary = self._run(year, month, department, options)
+        except RunConflict as e:
+            raise CommandError(e.detail[0])
+
+        for r in summary['results']:
+            if r['status'] == 'error':
+                self.stderr.write(f'[{r["employee_no"]}] {r["name"]}: {r["message"]}')
+
+        changes = (
+            f'변경 {summary["updated"]}건, 변경 없음 {summary["unchanged"]}건, '
+            if options['recalculate'] else ''
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f'{year}년 {month}월 급여 일괄 계산 완료: '
+            f'생성 {summary["created"]}건, {changes}건너뜀 {summary["skipped"]}건, 오류 {summary["errors"]}건'
+        ))
+
+    def _run(self, year: int, month: int, department, options) -> dict:
+        workers = options['workers']
+        if workers is None:
+            return PayrollService.run_month(
+                year, month, department=department, chunk_size=options['chunk_size'],
+                recalculate=options['recalculate'],
+            )
+        if workers < 1:
+            raise CommandError('--workers는 1 이상이어야 합니다.')
+        summary = PayrollService.run_month_parallel(
+            year, month, workers=workers, department=department,
+            chunk_size=options['chunk_size'], recalculate=options['recalculate'],
+        )
+        self._write_timings(summary)
+        return summary
+
+    def _write_timings(self, summary):
+        self.stdout.write(f'작업자 {summary["workers"]}개, 부서 {len(summary["partitions"])}개')
+        self.stdout.write(f'{"부서코드":<12}{"인원":>8}{"조회(s)":>10}{"계산(s)":>10}{"합계(s)":>10}{"PID":>8}')
+        for p in summary['partitions']:
+            self.stdout.write(
+                f'{p["department_code"]:<12}{p["employees"]:>8}'
+                f'{p["load_seconds"]:>10.3f}{p["compute_seconds"]:>10.3f}'
+                f'{p["total_seconds"]:>10.3f}{p["pid"]:>8}'
+            )
+        load    = sum(p['load_seconds']    for p in summary['partitions'])
+        compute = sum(p['compute_seconds'] for p in summary['partitions'])
+        self.stdout.write(
+            f'조회 합계 {load:.3f}s, 계산 합계 {compute:.3f}s, 기록 {summary["write_seconds"]:.3f}s'
+        )
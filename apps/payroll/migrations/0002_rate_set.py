@@ -0,0 +1,77 @@
+# Generated by Django 4.2.7 on 2026-10-17 21:18
+
+import datetime
+from decimal import Decimal
+
+from django.db import migrations, models
+
+
+def seed_2024_rates(apps, schema_editor):
+    """기존 모듈 상수(2024 기준)를 첫 요율 행으로 등록한다. 기준소득월액 제한은 두지 않는다."""
+    PayrollRateSet     = apps.get_model('payroll', 'PayrollRateSet')
+    PayrollRateVersion = apps.get_model('payroll', 'PayrollRateVersion')
+    PayrollRateSet.objects.get_or_create(
+        effective_from=datetime.date(2024, 1, 1),
+        defaults=dict(
+            national_pension_rate     = Decimal('0.045'),
+            health_insurance_rate     = Decimal('0.03545'),
+            long_term_care_rate       = Decimal('0.1281'),
+            employment_insurance_rate = Decimal('0.009'),
+            income_tax_rate           = Decimal('0.02'),
+            local_income_tax_rate     = Decimal('0.10'),
+            meal_allowance            = Decimal('200000'),
+            transport_allowance       = Decimal('100000'),
+            standard_monthly_hours    = Decimal('209'),
+            overtime_multiplier       = Decimal('1.5'),
+        ),
+    )
+    PayrollRateVersion.objects.get_or_create(pk=1, defaults={'version': 1})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payroll', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PayrollRateSet',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('effective_from', models.DateField(unique=True, verbose_name='적용시작일')),
+                ('national_pension_rate', models.DecimalField(decimal_places=6, max_digits=8, verbose_name='국민연금 요율')),
+                ('health_insurance_rate', models.DecimalField(decimal_places=6, max_digits=8, verbose_name='건강보험 요율')),
+                ('long_term_care_rate', models.DecimalField(decimal_places=6, help_text='건강보험료 대비 비율', max_digits=8, verbose_name='장기요양보험 요율')),
+                ('employment_insurance_rate', models.DecimalField(decimal_places=6, max_digits=8, verbose_name='고용보험 요율')),
+                ('income_tax_rate', models.DecimalField(decimal_places=6, max_digits=8, verbose_name='소득세 요율')),
+                ('local_income_tax_rate', models.DecimalField(decimal_places=6, help_text='소득세 대비 비율', max_digits=8, verbose_name='지방소득세 요율')),
+                ('pension_base_floor', models.DecimalField(blank=True, decimal_places=0, max_digits=15, null=True, verbose_name='국민연금 기준소득 하한')),
+                ('pension_base_ceiling', models.DecimalField(blank=True, decimal_places=0, max_digits=15, null=True, verbose_name='국민연금 기준소득 상한')),
+                ('meal_allowance', models.DecimalField(decimal_places=0, max_digits=15, verbose_name='식대')),
+                ('transport_allowance', models.DecimalField(decimal_places=0, max_digits=15, verbose_name='교통비')),
+                ('standard_monthly_hours', models.DecimalField(decimal_places=2, max_digits=6, verbose_name='월 기준근로시간')),
+                ('overtime_multiplier', models.DecimalField(decimal_places=2, max_digits=4, verbose_name='초과근무 가산배율')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': '공제율',
+                'verbose_name_plural': '공제율 목록',
+                'db_table': 'payroll_rate_set',
+                'ordering': ['-effective_from'],
+            },
+        ),
+        migrations.CreateModel(
+            name='PayrollRateVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.PositiveBigIntegerField(default=0, verbose_name='버전')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'payroll_rate_version',
+            },
+        ),
+        migrations.RunPython(seed_2024_rates, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-17 21:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payroll', '0002_rate_set'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='payrollrecord',
+            index=models.Index(fields=['year', 'month', 'employee'], name='payroll_period_employee'),
+        ),
+    ]
@@ -0,0 +1,71 @@
+# Generated by Django 4.2.7 on 2026-10-17 21:50
+
+from django.db import migrations, models
+from django.db.models import Count, Sum
+import django.db.models.deletion
+
+YTD_FIELDS = (
+    'base_salary', 'meal_allowance', 'transport_allowance', 'overtime_pay', 'gross_pay',
+    'national_pension', 'health_insurance', 'long_term_care', 'employment_insurance',
+    'income_tax', 'local_income_tax', 'total_deduction', 'net_pay', 'overtime_minutes',
+)
+
+
+def backfill_year_to_date(apps, schema_editor):
+    """기존 확정 급여를 (직원, 연도) 단위로 집계하여 누계 테이블을 채운다."""
+    PayrollRecord     = apps.get_model('payroll', 'PayrollRecord')
+    PayrollYearToDate = apps.get_model('payroll', 'PayrollYearToDate')
+    rows = (
+        PayrollRecord.objects.filter(status='CONFIRMED')
+        .values('employee_id', 'year')
+        .annotate(months=Count('id'), **{f: Sum(f) for f in YTD_FIELDS})
+        .order_by()
+    )
+    PayrollYearToDate.objects.bulk_create(
+        [PayrollYearToDate(**r) for r in rows],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('employees', '0002_employee_dependents'),
+        ('payroll', '0003_list_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PayrollYearToDate',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('year', models.PositiveSmallIntegerField(verbose_name='급여연도')),
+                ('months', models.PositiveSmallIntegerField(default=0, verbose_name='확정 개월수')),
+                ('base_salary', models.DecimalField(decimal_places=2, default=0, max_digits=15, verbose_name='기본급')),
+                ('meal_allowance', models.DecimalField(decimal_places=2, default=0, max_digits=15, verbose_name='식대')),
+                ('transport_allowance', models.DecimalField(decimal_places=2, default=0, max_digits=15, verbose_name='교통비')),
+                ('overtime_pay', models.DecimalField(decimal_places=2, default=0, max_digits=15, verbose_name='초과근무수당')),
+                ('gross_pay', models.DecimalField(decimal_places=2, default=0, max_digits=15, verbose_name='총지급액')),
+                ('national_pension', models.DecimalField(decimal_places=2, default=0, max_digits=15, verbose_name='국민연금')),
+                ('health_insurance', models.DecimalField(decimal_places=2, default=0, max_digits=15, verbose_name='건강보험')),
+                ('long_term_care', models.DecimalField(decimal_places=2, default=0, max_digits=15, verbose_name='장기요양보험')),
+                ('employment_insurance', models.DecimalField(decimal_places=2, default=0, max_digits=15, verbose_name='고용보험')),
+                ('income_tax', models.DecimalField(decimal_places=2, default=0, max_digits=15, verbose_name='소득세')),
+                ('local_income_tax', models.DecimalField(decimal_places=2, default=0, max_digits=15, verbose_name='지방소득세')),
+                ('total_deduction', models.DecimalField(decimal_places=2, default=0, max_digits=15, verbose_name='총공제액')),
+                ('net_pay', models.DecimalField(decimal_places=2, default=0, max_digits=15, verbose_name='실수령액')),
+                ('overtime_minutes', models.PositiveIntegerField(default=0, verbose_name='초과근무(분) 누계')),
+                ('last_updated', models.DateTimeField(auto_now=True, verbose_name='최종 갱신')),
+                ('employee', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='payroll_year_to_date', to='employees.employee', verbose_name='직원')),
+            ],
+            options={
+                'verbose_name': '연간 급여 누계',
+                'verbose_name_plural': '연간 급여 누계 목록',
+                'db_table': 'payroll_year_to_date',
+                'ordering': ['-year', 'employee'],
+                'indexes': [models.Index(fields=['year'], name='payroll_ytd_year')],
+                'unique_together': {('employee', 'year')},
+            },
+        ),
+        migrations.RunPython(backfill_year_to_date, migrations.RunPython.noop),
+    ]
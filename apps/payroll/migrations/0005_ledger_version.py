@@ -0,0 +1,27 @@
+# Generated by Django 4.2.7 on 2026-10-17 23:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payroll', '0004_year_to_date'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PayrollLedgerVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('year', models.PositiveSmallIntegerField(verbose_name='연도')),
+                ('month', models.PositiveSmallIntegerField(verbose_name='월')),
+                ('version', models.PositiveBigIntegerField(default=0, verbose_name='버전')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'payroll_ledger_version',
+                'unique_together': {('year', 'month')},
+            },
+        ),
+    ]
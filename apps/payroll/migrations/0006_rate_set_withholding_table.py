@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-17 23:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payroll', '0005_ledger_version'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='payrollrateset',
+            name='withholding_table',
+            field=models.CharField(blank=True, help_text='비워두면 settings.WITHHOLDING_TAX_TABLE을 사용', max_length=255, verbose_name='간이세액표 파일'),
+        ),
+    ]
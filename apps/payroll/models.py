@@ -1,4 +1,7 @@
+import os
+
 from django.conf import settings
+from django.core.exceptions import ValidationError
 from django.db import models
 
 from apps.employees.models import Employee
@@ -56,6 +59,153 @@ class PayrollRecord(models.Model):
         db_table        = 'payroll_record'
         unique_together = ('employee', 'year', 'month')
         ordering        = ['-year', '-month', 'employee']
+        indexes         = [
+            # 급여월 조회·목록 키셋 페이지네이션 (-year, -month, employee_id)
+            models.Index(fields=['year', 'month', 'employee'], name='payroll_period_employee'),
+        ]
 
     def __str__(self):
         return f'[{self.employee}] {self.year}-{self.month:02d} ({self.get_status_display()})'
+
+
+
+class PayrollYearToDate(models.Model):
+    """
+    직원별 연간 누계 (확정 급여 집계의 실체화). 연말정산·원천징수영수증·연간 리포트용.
+    CONFIRMED 급여의 저장·삭제는 signals에서, confirm_bulk 같은 QuerySet.update 경로는
+    서비스에서 직접 해당 (직원, 연도) 행을 다시 집계하고, rebuild_payroll_ytd로 전체를 재구성한다.
+    """
+
+    employee = models.ForeignKey(
+        Employee,
+        on_delete=models.PROTECT,
+        verbose_name='직원',
+        related_name='payroll_year_to_date',
+    )
+    year   = models.PositiveSmallIntegerField('급여연도')
+    months = models.PositiveSmallIntegerField('확정 개월수', default=0)
+
+    # 지급항목 누계
+    base_salary         = models.DecimalField('기본급',     max_digits=15, decimal_places=2, default=0)
+    meal_allowance      = models.DecimalField('식대',       max_digits=15, decimal_places=2, default=0)
+    transport_allowance = models.DecimalField('교통비',     max_digits=15, decimal_places=2, default=0)
+    overtime_pay        = models.DecimalField('초과근무수당', max_digits=15, decimal_places=2, default=0)
+    gross_pay           = models.DecimalField('총지급액',   max_digits=15, decimal_places=2, default=0)
+
+    # 공제항목 누계
+    national_pension      = models.DecimalField('국민연금',     max_digits=15, decimal_places=2, default=0)
+    health_insurance      = models.DecimalField('건강보험',     max_digits=15, decimal_places=2, default=0)
+    long_term_care        = models.DecimalField('장기요양보험',  max_digits=15, decimal_places=2, default=0)
+    employment_insurance  = models.DecimalField('고용보험',     max_digits=15, decimal_places=2, default=0)
+    income_tax            = models.DecimalField('소득세',       max_digits=15, decimal_places=2, default=0)
+    local_income_tax      = models.DecimalField('지방소득세',   max_digits=15, decimal_places=2, default=0)
+    total_deduction       = models.DecimalField('총공제액',     max_digits=15, decimal_places=2, default=0)
+
+    net_pay = models.DecimalField('실수령액', max_digits=15, decimal_places=2, default=0)
+
+    overtime_minutes = models.PositiveIntegerField('초과근무(분) 누계', default=0)
+
+    last_updated = models.DateTimeField('최종 갱신', auto_now=True)
+
+    class Meta:
+        db_table        = 'payroll_year_to_date'
+        unique_together = ('employee', 'year')
+        indexes         = [models.Index(fields=['year'], name='payroll_ytd_year')]
+        ordering        = ['-year', 'employee']
+        verbose_name        = '연간 급여 누계'
+        verbose_name_plural = '연간 급여 누계 목록'
+
+    def __str__(self):
+        return f'[{self.employee}] {self.year} 누계 ({self.months}개월)'
+
+
+class PayrollRateSet(models.Model):
+    """적용 시작일별 공제율·고정수당. 급여월 1일 기준으로 가장 최근 시작일의 요율을 적용한다."""
+
+    effective_from = models.DateField('적용시작일', unique=True)
+
+    national_pension_rate     = models.DecimalField('국민연금 요율',     max_digits=8, decimal_places=6)
+    health_insurance_rate     = models.DecimalField('건강보험 요율',     max_digits=8, decimal_places=6)
+    long_term_care_rate       = models.DecimalField('장기요양보험 요율', max_digits=8, decimal_places=6,
+                                                    help_text='건강보험료 대비 비율')
+    employment_insurance_rate = models.DecimalField('고용보험 요율',     max_digits=8, decimal_places=6)
+    income_tax_rate           = models.DecimalField('소득세 요율',       max_digits=8, decimal_places=6)
+    local_income_tax_rate     = models.DecimalField('지방소득세 요율',   max_digits=8, decimal_places=6,
+                                                    help_text='소득세 대비 비율')
+
+    # 국민연금 기준소득월액 하한/상한 (비워두면 제한 없음)
+    pension_base_floor   = models.DecimalField('국민연금 기준소득 하한', max_digits=15, decimal_places=0,
+                                               null=True, blank=True)
+    pension_base_ceiling = models.DecimalField('국민연금 기준소득 상한', max_digits=15, decimal_places=0,
+                                               null=True, blank=True)
+
+    meal_allowance      = models.DecimalField('식대',   max_digits=15, decimal_places=0)
+    transport_allowance = models.DecimalField('교통비', max_digits=15, decimal_places=0)
+
+    standard_monthly_hours = models.DecimalField('월 기준근로시간',   max_digits=6, decimal_places=2)
+    overtime_multiplier    = models.DecimalField('초과근무 가산배율', max_digits=4, decimal_places=2)
+
+    # 적용 연도의 간이세액표 (manage.py build_withholding_table로 만든 파일)
+    withholding_table = models.CharField(
+        '간이세액표 파일', max_length=255, blank=True,
+        help_text='비워두면 settings.WITHHOLDING_TAX_TABLE을 사용',
+    )
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'payroll_rate_set'
+        ordering = ['-effective_from']
+        verbose_name = '공제율'
+        verbose_name_plural = '공제율 목록'
+
+    def __str__(self):
+        return f'{self.effective_from} 적용 요율'
+
+    def clean(self):
+        if self.withholding_table and not os.path.isfile(self.withholding_table):
+            raise ValidationError({'withholding_table': '간이세액표 파일을 찾을 수 없습니다.'})
+
+    def to_rate_set(self):
+        from .calculator import RateSet
+        return RateSet(
+            national_pension       = self.national_pension_rate,
+            health_insurance       = self.health_insurance_rate,
+            long_term_care         = self.long_term_care_rate,
+            employment_insurance   = self.employment_insurance_rate,
+            income_tax             = self.income_tax_rate,
+            local_income_tax       = self.local_income_tax_rate,
+            meal_allowance         = self.meal_allowance,
+            transport_allowance    = self.transport_allowance,
+            standard_monthly_hours = self.standard_monthly_hours,
+            overtime_multiplier    = self.overtime_multiplier,
+            pension_base_floor     = self.pension_base_floor,
+            pension_base_ceiling   = self.pension_base_ceiling,
+        )
+
+
+class PayrollRateVersion(models.Model):
+    """공제율 변경 카운터 (단일 행). 프로세스별 요율 캐시의 무효화 기준."""
+
+    version    = models.PositiveBigIntegerField('버전', default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'payroll_rate_version'
+
+
+class PayrollLedgerVersion(models.Model):
+    """
+    급여대장 변경 카운터. (연, 월)별 1행, (0, 0) 행은 직원·부서·직급 변경 세대.
+    캐시 백엔드와 무관하게 모든 프로세스(웹·작업 워커·관리 명령)가 같은 값을 보도록 DB에 둔다.
+    """
+
+    year       = models.PositiveSmallIntegerField('연도')
+    month      = models.PositiveSmallIntegerField('월')
+    version    = models.PositiveBigIntegerField('버전', default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table        = 'payroll_ledger_version'
+        unique_together = ('year', 'month')
@@ -0,0 +1,56 @@
+"""
+부서 단위 병렬 급여 계산용 작업자 함수.
+
+spawn 방식 작업자 프로세스에서도 import 할 수 있도록 이 모듈은 최상위에서
+모델을 import 하지 않는다. 작업자는 init_worker()에서 Django를 초기화한 뒤
+각자의 DB 연결로 부서 하나를 조회·계산하고, 저장하지 않은 PayrollRecord 목록
+(새 레코드, 재계산으로 값이 바뀐 기존 레코드)을 돌려준다.
+"""
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+
+def init_worker(settings_module: str):
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', settings_module)
+    import django
+    django.setup()
+
+
+def compute_partition(task) -> dict:
+    """task = (year, month, department_id, department_code, recalculate)"""
+    from .services import prepare_month
+
+    year, month, department_id, code, recalculate = task
+    started  = time.perf_counter()
+    prepared = prepare_month(year, month, department=department_id, recalculate=recalculate)
+    return {
+        'department_id':   department_id,
+        'department_code': code,
+        'pid':             os.getpid(),
+        'employees':       prepared['employees'],
+        'load_seconds':    prepared['load_seconds'],
+        'compute_seconds': prepared['compute_seconds'],
+        'total_seconds':   time.perf_counter() - started,
+        'results':         prepared['results'],
+        'records':         prepared['records'],
+        'updates':         prepared['updates'],
+    }
+
+
+def run_partitions(tasks, workers: int) -> list:
+    """작업을 프로세스 풀에서 실행하고 결과를 tasks 순서대로 반환한다."""
+    from django.conf import settings
+    from django.db import connections
+
+    # 부모 프로세스의 연결을 작업자와 공유하지 않도록 먼저 닫는다
+    connections.close_all()
+    settings_module = os.environ.get('DJANGO_SETTINGS_MODULE') or settings.SETTINGS_MODULE
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=init_worker,
+        initargs=(settings_module,),
+    ) as pool:
+        return list(pool.map(compute_partition, tasks))
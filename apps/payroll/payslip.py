@@ -0,0 +1,297 @@
+"""
+급여명세서 PDF 일괄 생성 (확정 급여 기준).
+
+- 명세서 레이아웃은 TEMPLATE(제목·인적사항·지급/공제 항목·실수령액)로 정의하고 render_payslip이 A4 1장으로 그린다.
+  한글은 기본적으로 PDF 뷰어 내장 CJK 글꼴(HYSMyeongJo/HYGothic, UnicodeCIDFont)을 써서 글꼴 파일을 포함하지 않는다.
+  한글 글꼴이 없는 뷰어까지 고려하면 settings.PAYSLIP_FONT_PATH에 TTF(예: 맑은 고딕)를 지정해 포함시킨다.
+- 명세 행은 사번 키셋 조건으로 2000행씩 나눠 조회하고(apps.utils.db.keyset_rows) chunk 단위로 ProcessPoolExecutor 작업자에게 넘긴다
+  (백그라운드 작업 payslip_batch. 다운로드 API는 workers=1로 요청 스레드에서 그린다).
+  작업자는 DB에 접근하지 않고 받은 dict만 그리므로 Django를 초기화하지 않는다
+  (spawn 방식 작업자에서도 import 할 수 있도록 이 모듈은 최상위에서 Django·모델을 import 하지 않는다).
+- 결과는 chunk 순서대로 받아 ZIP에 바로 쓴다. 동시에 처리 중인 chunk는 작업자 수 × 2개로 제한하므로
+  메모리에는 그만큼의 PDF만 존재한다.
+- stream_zip: StreamingHttpResponse용 bytes 생성기, write_zip: 파일 객체에 기록 (백그라운드 작업 결과)
+"""
+import io
+import multiprocessing
+import os
+import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+# 작업자에게 한 번에 넘기는 명세서 수
+CHUNK_SIZE = 50
+
+AMOUNT_FIELDS = (
+    'base_salary', 'meal_allowance', 'transport_allowance', 'overtime_pay', 'gross_pay',
+    'national_pension', 'health_insurance', 'long_term_care', 'employment_insurance',
+    'income_tax', 'local_income_tax', 'total_deduction', 'net_pay',
+)
+
+TEMPLATE = {
+    'title':   '{year}년 {month}월 급여명세서',
+    'profile': (
+        ('사번', 'employee_no'), ('이름', 'employee_name'),
+        ('부서', 'department_name'), ('직급', 'position_name'),
+    ),
+    'sections': (
+        ('지급 항목', (
+            ('기본급',       'base_salary'),
+            ('식대',         'meal_allowance'),
+            ('교통비',       'transport_allowance'),
+            ('초과근무수당', 'overtime_pay'),
+        ), ('총 지급액', 'gross_pay')),
+        ('공제 항목', (
+            ('국민연금',     'national_pension'),
+            ('건강보험',     'health_insurance'),
+            ('장기요양보험', 'long_term_care'),
+            ('고용보험',     'employment_insurance'),
+            ('소득세',       'income_tax'),
+            ('지방소득세',   'local_income_tax'),
+        ), ('총 공제액', 'total_deduction')),
+    ),
+    'net':    ('실 수령액', 'net_pay'),
+    'footer': '이 명세서는 {year}년 {month}월 확정 급여 기준으로 발행되었습니다.',
+}
+
+BODY_FONT  = 'HYSMyeongJo-Medium'
+TITLE_FONT = 'HYGothic-Medium'
+EMBED_FONT = 'PayslipFont'
+
+
+# ── 렌더링 (작업자 프로세스) ───────────────────────────────────────────
+_fonts = {}
+
+
+def _register_fonts(font_path: str = '') -> tuple:
+    """(본문 글꼴, 제목 글꼴) 이름. 프로세스당 한 번만 등록한다."""
+    if font_path not in _fonts:
+        from reportlab.pdfbase import pdfmetrics
+
+        if font_path:
+            from reportlab.pdfbase.ttfonts import TTFont
+
+            pdfmetrics.registerFont(TTFont(EMBED_FONT, font_path))
+            _fonts[font_path] = (EMBED_FONT, EMBED_FONT)
+        else:
+            from reportlab.pdfbase.cidfonts import UnicodeCIDFont
+
+            pdfmetrics.registerFont(UnicodeCIDFont(BODY_FONT))
+            pdfmetrics.registerFont(UnicodeCIDFont(TITLE_FONT))
+            _fonts[font_path] = (BODY_FONT, TITLE_FONT)
+    return _fonts[font_path]
+
+
+def _won(value) -> str:
+    return f'{int(value or 0):,}원'
+
+
+def _overtime(minutes) -> str:
+    hours, rest = divmod(int(minutes or 0), 60)
+    return f'{hours}시간 {rest}분' if rest else f'{hours}시간'
+
+
+def entry_name(row: dict) -> str:
+    """ZIP 안의 파일명: 사번_이름_연월.pdf"""
+    name = str(row['employee_name']).replace('/', '_')
+    return f'{row["employee_no"]}_{name}_{row["year"]}{row["month"]:02d}.pdf'
+
+
+def render_payslip(row: dict, font_path: str = '') -> bytes:
+    """명세 dict 1건 → PDF bytes (A4 1장)."""
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.units import mm
+    from reportlab.pdfgen import canvas
+
+    body_font, title_font = _register_fonts(font_path)
+    buffer = io.BytesIO()
+    width, height = A4
+    pdf = canvas.Canvas(buffer, pagesize=A4, pageCompression=1)
+    pdf.setTitle(f'{row["employee_no"]} {row["year"]}-{row["month"]:02d} 급여명세서')
+
+    left, right = 20 * mm, width - 20 * mm
+    y = height - 25 * mm
+    pdf.setFont(title_font, 18)
+    pdf.drawCentredString(width / 2, y, TEMPLATE['title'].format(**row))
+
+    # 인적사항 (2열)
+    y -= 15 * mm
+    pdf.setFont(body_font, 10)
+    for i, (label, field) in enumerate(TEMPLATE['profile']):
+        x = left if i % 2 == 0 else width / 2
+        pdf.drawString(x, y, f'{label}: {row.get(field) or "-"}')
+        if i % 2 == 1:
+            y -= 6 * mm
+    pdf.drawString(left, y, f'초과근무: {_overtime(row.get("overtime_minutes"))}')
+
+    # 지급·공제 항목
+    for title, items, (total_label, total_field) in TEMPLATE['sections']:
+        y -= 12 * mm
+        pdf.setFont(title_font, 12)
+        pdf.drawString(left, y, title)
+        y -= 2 * mm
+        pdf.line(left, y, right, y)
+        pdf.setFont(body_font, 10)
+        for label, field in items:
+            y -= 6 * mm
+            pdf.drawString(left + 2 * mm, y, label)
+            pdf.drawRightString(right - 2 * mm, y, _won(row.get(field)))
+        y -= 3 * mm
+        pdf.line(left, y, right, y)
+        y -= 6 * mm
+        pdf.setFont(title_font, 10)
+        pdf.drawString(left + 2 * mm, y, total_label)
+        pdf.drawRightString(right - 2 * mm, y, _won(row.get(total_field)))
+
+    # 실수령액
+    label, field = TEMPLATE['net']
+    y -= 14 * mm
+    pdf.rect(left, y - 4 * mm, right - left, 12 * mm)
+    pdf.setFont(title_font, 14)
+    pdf.drawString(left + 4 * mm, y, label)
+    pdf.drawRightString(right - 4 * mm, y, _won(row.get(field)))
+
+    pdf.setFont(body_font, 8)
+    pdf.drawCentredString(width / 2, 15 * mm, TEMPLATE['footer'].format(**row))
+    pdf.showPage()
+    pdf.save()
+    return buffer.getvalue()
+
+
+def render_chunk(rows: list, font_path: str = '') -> list:
+    """[(ZIP 파일명, PDF bytes), ...] — 프로세스 풀 작업 단위."""
+    return [(entry_name(row), render_payslip(row, font_path)) for row in rows]
+
+
+def _chunks(rows, size: int):
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_pdfs(rows, workers: int = 1, chunk_size: int = CHUNK_SIZE, on_chunk=None, font_path: str = ''):
+    """
+    명세 dict를 받아 (파일명, PDF bytes)를 입력 순서대로 생성한다.
+    workers > 1이면 프로세스 풀에서 그리며, 처리 중인 chunk는 workers × 2개를 넘지 않는다.
+    on_chunk(완료 건수)는 chunk가 끝날 때마다 호출된다 (진행률 보고용).
+    """
+    done = 0
+
+    def finished(outputs):
+        nonlocal done
+        done += len(outputs)
+        if on_chunk is not None:
+            on_chunk(done)
+        return outputs
+
+    chunks = _chunks(rows, chunk_size)
+    if workers <= 1:
+        for chunk in chunks:
+            yield from finished(render_chunk(chunk, font_path))
+        return
+
+    pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+    pending = deque()
+    try:
+        for chunk in chunks:
+            pending.append(pool.submit(render_chunk, chunk, font_path))
+            if len(pending) >= workers * 2:
+                yield from finished(pending.popleft().result())
+        while pending:
+            yield from finished(pending.popleft().result())
+    finally:
+        # 응답이 중간에 끊기면 남은 작업은 버린다
+        for future in pending:
+            future.cancel()
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+# ── ZIP ─────────────────────────────────────────────────────────────
+class _ZipSink:
+    """zipfile이 쓴 bytes를 모아두었다가 꺼내 가는 쓰기 전용 버퍼 (seek 불가 → 데이터 디스크립터 방식)."""
+
+    def __init__(self):
+        self._parts = []
+        self._offset = 0
+
+    def write(self, data):
+        self._parts.append(bytes(data))
+        self._offset += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._offset
+
+    def flush(self):
+        pass
+
+    def drain(self) -> bytes:
+        data = b''.join(self._parts)
+        self._parts.clear()
+        return data
+
+
+def stream_zip(pdfs):
+    """(파일명, PDF bytes) 생성기 → ZIP bytes 조각 생성기. PDF는 이미 압축되어 있으므로 저장 방식."""
+    sink = _ZipSink()
+    with zipfile.ZipFile(sink, 'w', compression=zipfile.ZIP_STORED, allowZip64=True) as archive:
+        for name, data in pdfs:
+            archive.writestr(name, data)
+            yield sink.drain()
+    yield sink.drain()
+
+
+def write_zip(fileobj, pdfs) -> int:
+    """ZIP을 파일 객체에 기록하고 명세서 수를 반환한다."""
+    count = 0
+    with zipfile.ZipFile(fileobj, 'w', compression=zipfile.ZIP_STORED, allowZip64=True) as archive:
+        for name, data in pdfs:
+            archive.writestr(name, data)
+            count += 1
+    return count
+
+
+# ── 조회 (요청·작업 프로세스) ───────────────────────────────────────────
+def default_workers() -> int:
+    from django.conf import settings
+
+    return settings.PAYSLIP_RENDER_WORKERS or os.cpu_count() or 1
+
+
+def payslip_queryset(year: int, month: int, department_id: int = None):
+    from .models import PayrollRecord
+
+    qs = PayrollRecord.objects.filter(year=year, month=month, status=PayrollRecord.Status.CONFIRMED)
+    if department_id is not None:
+        qs = qs.filter(employee__department_id=department_id)
+    return qs
+
+
+def payslip_rows(year: int, month: int, department_id: int = None, chunk_size: int = 2000):
+    """
+    명세서 dict를 사번 순으로 흘려보낸다.
+    chunk_size 행씩 별도 쿼리로 읽으므로 한 번에 chunk_size 행만 메모리에 있다.
+    """
+    from django.db.models import F
+
+    from apps.utils.db import keyset_rows
+
+    rows = (
+        payslip_queryset(year, month, department_id)
+        .values(
+            'year', 'month', 'overtime_minutes', *AMOUNT_FIELDS,
+            employee_no     = F('employee__employee_no'),
+            employee_name   = F('employee__name'),
+            department_name = F('employee__department__name'),
+            position_name   = F('employee__position__name'),
+        )
+    )
+    return keyset_rows(rows, ('employee_no',), chunk_size)
+
+
+def filename(year: int, month: int) -> str:
+    return f'payslips_{year}{month:02d}.zip'
@@ -0,0 +1,100 @@
+"""
+적용일별 공제율 조회 (프로세스 단위 컴파일 캐시).
+
+PayrollRateSet 전체를 적용시작일 오름차순 배열로 컴파일해 두고 bisect로 O(log n) 조회한다.
+요율이 저장·삭제되면 signals에서 PayrollRateVersion.version을 올린다.
+각 프로세스(waitress 스레드, 병렬 급여 작업자)는 get_rate_table() 호출 시
+버전 1건만 조회하여 바뀐 경우에만 다시 컴파일한다.
+
+등록된 요율이 없거나 첫 적용시작일 이전 월은 calculator의 기본 상수(DEFAULT_RATES)를 사용한다.
+각 요율에는 PayrollRateSet.withholding_table의 간이세액표를, 비어 있으면 settings.WITHHOLDING_TAX_TABLE을 붙인다
+(기본 요율은 settings 값만 사용). 같은 파일은 컴파일마다 한 번만 연다.
+"""
+import datetime
+import threading
+from bisect import bisect_right
+from dataclasses import replace
+
+from django.db.models import F
+
+from . import withholding
+from .calculator import DEFAULT_RATES, RateSet
+from .models import PayrollRateSet, PayrollRateVersion
+
+
+class RateTable:
+    """적용시작일 정렬 배열 + 요율 배열."""
+    __slots__ = ('version', 'dates', 'rate_sets', 'default')
+
+    def __init__(self, version: int, dates: list, rate_sets: list, default: RateSet = DEFAULT_RATES):
+        self.version   = version
+        self.dates     = dates
+        self.rate_sets = rate_sets
+        self.default   = default
+
+    def for_date(self, day: datetime.date) -> RateSet:
+        i = bisect_right(self.dates, day) - 1
+        return self.rate_sets[i] if i >= 0 else self.default
+
+    def for_month(self, year: int, month: int) -> RateSet:
+        return self.for_date(datetime.date(year, month, 1))
+
+
+_lock  = threading.Lock()
+_table = None
+
+
+def current_version() -> int:
+    return (
+        PayrollRateVersion.objects.filter(pk=1).values_list('version', flat=True).first() or 0
+    )
+
+
+def bump_version():
+    """요율 변경 시 호출. 다른 프로세스의 캐시가 다음 조회 때 다시 컴파일되도록 한다."""
+    updated = PayrollRateVersion.objects.filter(pk=1).update(version=F('version') + 1)
+    if not updated:
+        PayrollRateVersion.objects.get_or_create(pk=1, defaults={'version': 1})
+    clear_cache()
+
+
+def _compile(version: int) -> RateTable:
+    rows   = list(PayrollRateSet.objects.order_by('effective_from'))
+    tables = {}
+
+    def attach(rate_set: RateSet, path: str) -> RateSet:
+        path = path or withholding.default_path()
+        if not path:
+            return rate_set
+        if path not in tables:
+            tables[path] = withholding.get_table(path)
+        return replace(rate_set, withholding=tables[path])
+
+    return RateTable(
+        version,
+        [r.effective_from for r in rows],
+        [attach(r.to_rate_set(), r.withholding_table) for r in rows],
+        attach(DEFAULT_RATES, ''),
+    )
+
+
+def get_rate_table() -> RateTable:
+    """버전이 바뀐 경우에만 다시 컴파일한 요율표를 반환한다."""
+    global _table
+    version = current_version()
+    table = _table
+    if table is not None and table.version == version:
+        return table
+    with _lock:
+        if _table is None or _table.version != version:
+            _table = _compile(version)
+        return _table
+
+
+def rates_for_month(year: int, month: int) -> RateSet:
+    return get_rate_table().for_month(year, month)
+
+
+def clear_cache():
+    global _table
+    _table = None
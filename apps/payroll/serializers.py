@@ -62,3 +62,19 @@ class PayrollRecordSerializer(serializers.ModelSerializer):
             'confirmed_at', 'confirmed_by', 'confirmed_by_name',
             'created_at', 'updated_at',
         ]
+
+
+class RateSetSerializer(serializers.Serializer):
+    """급여 시뮬레이션용 요율 입력. 생략한 항목은 현행 요율을 사용한다."""
+    national_pension       = serializers.DecimalField(max_digits=9,  decimal_places=6, min_value=0, max_value=1, required=False)
+    health_insurance       = serializers.DecimalField(max_digits=9,  decimal_places=6, min_value=0, max_value=1, required=False)
+    long_term_care         = serializers.DecimalField(max_digits=9,  decimal_places=6, min_value=0, max_value=1, required=False)
+    employment_insurance   = serializers.DecimalField(max_digits=9,  decimal_places=6, min_value=0, max_value=1, required=False)
+    income_tax             = serializers.DecimalField(max_digits=9,  decimal_places=6, min_value=0, max_value=1, required=False)
+    local_income_tax       = serializers.DecimalField(max_digits=9,  decimal_places=6, min_value=0, max_value=1, required=False)
+    meal_allowance         = serializers.DecimalField(max_digits=15, decimal_places=0, min_value=0, required=False)
+    transport_allowance    = serializers.DecimalField(max_digits=15, decimal_places=0, min_value=0, required=False)
+    standard_monthly_hours = serializers.DecimalField(max_digits=6,  decimal_places=2, min_value=1, required=False)
+    overtime_multiplier    = serializers.DecimalField(max_digits=4,  decimal_places=2, min_value=0, required=False)
+    pension_base_floor     = serializers.DecimalField(max_digits=15, decimal_places=0, min_value=0, required=False, allow_null=True)
+    pension_base_ceiling   = serializers.DecimalField(max_digits=15, decimal_places=0, min_value=0, required=False, allow_null=True)
@@ -1,93 +1,292 @@
-from decimal import Decimal, ROUND_FLOOR
+import time
 
+from django.db import IntegrityError, transaction
+from django.db.models import Count, Sum
 from django.utils import timezone
 from rest_framework.exceptions import ValidationError
 
+from apps.attendance.models import MonthlyAttendanceSummary
 from apps.attendance.services import AttendanceService
-from .models import PayrollRecord
+from apps.employees.models import Department, Employee
+from apps.utils.db import create_unique, upsert_options
+from . import calculator, ledger_cache
+from .calculator import PayrollInput, calculate_many
+from .ledger import AMOUNT_FIELDS
+from .models import PayrollRecord, PayrollYearToDate
+from .rates import rates_for_month
 
+# 공제율·수당 상수는 calculator 모듈에 정의 (기존 import 경로 호환용 재노출)
+from .calculator import (  # noqa: F401
+    NATIONAL_PENSION_RATE, HEALTH_INSURANCE_RATE, LONG_TERM_CARE_RATE,
+    EMPLOYMENT_INSURANCE_RATE, INCOME_TAX_RATE, LOCAL_INCOME_TAX_RATE,
+    MEAL_ALLOWANCE, TRANSPORT_ALLOWANCE,
+    STANDARD_MONTHLY_HOURS, OVERTIME_MULTIPLIER,
+)
 
-# ── 공제율 상수 (2024 기준) ────────────────────────────────────────────
-NATIONAL_PENSION_RATE     = Decimal('0.045')    # 4.5%
-HEALTH_INSURANCE_RATE     = Decimal('0.03545')  # 3.545%
-LONG_TERM_CARE_RATE       = Decimal('0.1281')   # 건강보험 × 12.81%
-EMPLOYMENT_INSURANCE_RATE = Decimal('0.009')    # 0.9%
-INCOME_TAX_RATE           = Decimal('0.02')     # 2.0% (간이세액 근사값)
-LOCAL_INCOME_TAX_RATE     = Decimal('0.10')     # 소득세 × 10%
 
-# ── 고정수당 ──────────────────────────────────────────────────────────
-MEAL_ALLOWANCE      = Decimal('200000')
-TRANSPORT_ALLOWANCE = Decimal('100000')
+def prepare_month(year: int, month: int, department=None, recalculate: bool = False) -> dict:
+    """
+    run_month의 조회·계산 단계. DB에는 쓰지 않는다.
+    {'results': 직원별 결과, 'records': 새로 저장할 PayrollRecord 목록,
+     'updates': 값이 바뀐 기존 DRAFT PayrollRecord 목록 (recalculate일 때만),
+     'employees': 대상 인원, 'load_seconds', 'compute_seconds'}
 
-# ── 표준 월 근로시간 (초과근무수당 계산 기준) ───────────────────────────
-STANDARD_MONTHLY_HOURS = Decimal('209')
-OVERTIME_MULTIPLIER    = Decimal('1.5')
+    recalculate=False이면 이미 레코드가 있는 직원은 건너뛴다.
+    recalculate=True이면 기존 DRAFT 레코드를 다시 계산해 저장된 값과 비교하고,
+    CONFIRMED 레코드는 건너뛴다.
+    """
+    started = time.perf_counter()
 
+    employees = Employee.objects.filter(is_active=True)
+    summaries = MonthlyAttendanceSummary.objects.filter(
+        employee__is_active=True, year=year, month=month,
+    )
+    existing = PayrollRecord.objects.filter(year=year, month=month)
+    if department is not None:
+        employees = employees.filter(department=department)
+        summaries = summaries.filter(employee__department=department)
+        existing  = existing.filter(employee__department=department)
+    employees = list(
+        employees.only('id', 'employee_no', 'name', 'base_salary', 'dependents')
+        .order_by('employee_no')
+    )
+    if recalculate:
+        existing = {
+            r.employee_id: r
+            for r in existing.only('id', 'employee_id', 'year', 'month', 'status', *calculator.RECORD_FIELDS)
+        }
+    else:
+        existing = dict.fromkeys(existing.values_list('employee_id', flat=True))
+    overtime_totals = dict(summaries.values_list('employee_id', 'overtime_minutes'))
+    loaded = time.perf_counter()
 
-def _floor(amount: Decimal) -> Decimal:
-    """원 단위 절사."""
-    return amount.quantize(Decimal('1'), rounding=ROUND_FLOOR)
+    results = []
+    inputs  = []
+    pending = {}
+    for emp in employees:
+        result = {'employee_id': emp.id, 'employee_no': emp.employee_no, 'name': emp.name}
+        if emp.id in existing:
+            if not recalculate:
+                results.append({**result, 'status': 'skipped',
+                                'message': f'{year}년 {month}월 급여가 이미 계산되었습니다.'})
+                continue
+            if existing[emp.id].status == PayrollRecord.Status.CONFIRMED:
+                results.append({**result, 'status': 'skipped',
+                                'message': '확정된 급여는 재계산하지 않습니다.'})
+                continue
+        if emp.base_salary is None or emp.base_salary < 0:
+            results.append({**result, 'status': 'error', 'message': '기본급이 올바르지 않습니다.'})
+            continue
+        inputs.append(PayrollInput(
+            emp.base_salary, overtime_totals.get(emp.id) or 0,
+            dependents=emp.dependents, key=emp.id,
+        ))
+        result = {**result, 'status': 'created', 'message': ''}
+        pending[emp.id] = result
+        results.append(result)
+
+    records = []
+    updates = []
+    for r in calculate_many(inputs, rates_for_month(year, month)):
+        record = existing.get(r.key)
+        if record is None:
+            records.append(PayrollRecord(
+                employee_id = r.key,
+                year        = year,
+                month       = month,
+                status      = PayrollRecord.Status.DRAFT,
+                **r.as_fields(),
+            ))
+        elif _apply_changes(record, r.as_fields()):
+            updates.append(record)
+            pending[r.key]['status'] = 'updated'
+        else:
+            pending[r.key]['status'] = 'unchanged'
+
+    return {
+        'results':         results,
+        'records':         records,
+        'updates':         updates,
+        'employees':       len(employees),
+        'load_seconds':    loaded - started,
+        'compute_seconds': time.perf_counter() - loaded,
+    }
+
+
+def _apply_changes(record: PayrollRecord, fields: dict) -> list:
+    """계산값 중 저장된 값과 다른 필드만 record에 반영하고 그 필드명 목록을 반환한다."""
+    changed = [name for name, value in fields.items() if getattr(record, name) != value]
+    for name in changed:
+        setattr(record, name, fields[name])
+    return changed
+
+
+# 재계산 시 갱신하는 열 (bulk_update는 auto_now를 채우지 않으므로 updated_at을 직접 넣는다)
+UPDATE_FIELDS = (*calculator.RECORD_FIELDS, 'updated_at')
+
+
+class RunConflict(ValidationError):
+    """같은 달 일괄 계산이 겹쳐 실행되어 이미 생성된 급여와 (직원, 연, 월) unique 제약이 충돌함."""
+
+
+def write_records(records, chunk_size: int = 500, updates=()) -> int:
+    """
+    PayrollRecord 목록을 하나의 트랜잭션 안에서 chunk 단위로 bulk_create 하고,
+    updates(값이 바뀐 기존 레코드)는 DRAFT 상태인 행만 chunk 단위 bulk_update 한다.
+    실제로 갱신된 행 수를 반환한다 (그 사이 확정된 레코드는 갱신되지 않는다).
+    조회 후 다른 실행이 같은 직원의 급여를 먼저 만들었으면 전체를 롤백하고 RunConflict를 발생시킨다.
+    """
+    now = timezone.now()
+    for record in updates:
+        record.updated_at = now
+    updated = 0
+    try:
+        with transaction.atomic():
+            for i in range(0, len(records), chunk_size):
+                PayrollRecord.objects.bulk_create(records[i:i + chunk_size])
+            drafts = PayrollRecord.objects.filter(status=PayrollRecord.Status.DRAFT)
+            for i in range(0, len(updates), chunk_size):
+                updated += drafts.bulk_update(updates[i:i + chunk_size], UPDATE_FIELDS)
+    except IntegrityError:
+        raise RunConflict('같은 달 급여 일괄 계산이 동시에 실행되었습니다. 완료된 후 다시 실행해주세요.')
+    # bulk_create / bulk_update는 post_save 시그널이 없으므로 급여대장 캐시를 직접 무효화
+    for year, month in {(r.year, r.month) for r in (*records, *updates)}:
+        ledger_cache.invalidate(year, month)
+    return updated
+
+
+def _summary(year: int, month: int, results: list, updated: int = None) -> dict:
+    counts = {
+        name: sum(1 for r in results if r['status'] == name)
+        for name in ('created', 'updated', 'unchanged', 'skipped', 'error')
+    }
+    return {
+        'year':      year,
+        'month':     month,
+        'created':   counts['created'],
+        'updated':   counts['updated'] if updated is None else updated,
+        'unchanged': counts['unchanged'],
+        'skipped':   counts['skipped'],
+        'errors':    counts['error'],
+        'results':   results,
+    }
 
 
 class PayrollService:
 
+    @staticmethod
+    def _compute(employee, year: int, month: int) -> dict:
+        """직원 1명의 year/month 계산값 (PayrollRecord 필드 dict)."""
+        # 초과근무 합계 (월별 근태 요약 1행)
+        summary = AttendanceService.get_monthly_summary(employee, year, month)
+        total_overtime_minutes = summary.overtime_minutes if summary else 0
+        return calculator.calculate(
+            PayrollInput(
+                employee.base_salary, total_overtime_minutes, dependents=employee.dependents,
+            ),
+            rates_for_month(year, month),
+        ).as_fields()
+
     @staticmethod
     def calculate(employee, year: int, month: int) -> PayrollRecord:
         """
         해당 직원의 year/month 급여를 계산하여 PayrollRecord(DRAFT)를 생성한다.
-        이미 해당 월의 레코드가 존재하면 ValidationError.
+        이미 해당 월의 레코드가 존재하면(동시 요청 포함) ValidationError.
+        중복 여부는 사전 조회 없이 (employee, year, month) unique 제약으로 판단한다.
         """
-        if PayrollRecord.objects.filter(employee=employee, year=year, month=month).exists():
-            raise ValidationError(f'{year}년 {month}월 급여가 이미 계산되었습니다.')
+        return create_unique(
+            PayrollRecord,
+            {'employee': employee, 'year': year, 'month': month},
+            f'{year}년 {month}월 급여가 이미 계산되었습니다.',
+            status=PayrollRecord.Status.DRAFT,
+            **PayrollService._compute(employee, year, month),
+        )
 
-        # 기본급 스냅샷
-        base_salary = Decimal(str(employee.base_salary))
+    @staticmethod
+    def recalculate(employee, year: int, month: int):
+        """
+        해당 직원의 year/month 급여를 다시 계산한다. (레코드, 변경된 필드 목록)을 반환한다.
 
-        # 초과근무수당 계산
-        records = AttendanceService.get_monthly_records(employee, year, month)
-        total_overtime_minutes = sum(r.overtime_minutes for r in records)
+        - 레코드가 없으면 calculate와 같이 새로 생성한다 (변경 필드 = 전체)
+        - DRAFT이면 저장된 값과 비교해 바뀐 필드만 UPDATE ... WHERE status='DRAFT'
+        - CONFIRMED이면 ValidationError (재계산 중 확정된 경우도 포함)
+        """
+        record = PayrollRecord.objects.filter(employee=employee, year=year, month=month).first()
+        if record is None:
+            record = PayrollService.calculate(employee, year, month)
+            return record, list(calculator.RECORD_FIELDS)
+        if record.status == PayrollRecord.Status.CONFIRMED:
+            raise ValidationError('확정된 급여는 재계산할 수 없습니다.')
+
+        changed = _apply_changes(record, PayrollService._compute(employee, year, month))
+        if changed:
+            record.updated_at = timezone.now()
+            updated = PayrollRecord.objects.filter(
+                pk=record.pk, status=PayrollRecord.Status.DRAFT,
+            ).update(**{name: getattr(record, name) for name in (*changed, 'updated_at')})
+            if not updated:
+                raise ValidationError('확정된 급여는 재계산할 수 없습니다.')
+            # QuerySet.update는 post_save 시그널이 없으므로 급여대장 캐시를 직접 무효화
+            ledger_cache.invalidate(year, month)
+        return record, changed
 
-        hourly_rate    = base_salary / STANDARD_MONTHLY_HOURS
-        overtime_hours = Decimal(str(total_overtime_minutes)) / Decimal('60')
-        overtime_pay   = _floor(hourly_rate * OVERTIME_MULTIPLIER * overtime_hours)
+    @staticmethod
+    def run_month(year: int, month: int, department=None, chunk_size: int = 500,
+                  recalculate: bool = False) -> dict:
+        """
+        재직 중인 전 직원(또는 특정 부서)의 year/month 급여를 일괄 계산한다.
 
-        # 총지급액
-        gross_pay = base_salary + MEAL_ALLOWANCE + TRANSPORT_ALLOWANCE + overtime_pay
+        - 초과근무 합계는 월별 근태 요약(MonthlyAttendanceSummary) 조회 1회
+        - 이미 레코드가 있는 직원은 건너뜀
+          (recalculate=True이면 DRAFT 레코드를 다시 계산해 값이 바뀐 행만 bulk_update, CONFIRMED는 건너뜀)
+        - 계산은 메모리에서 수행하고 하나의 트랜잭션 안에서 chunk 단위 bulk_create / bulk_update
+        직원별 처리 결과(created/updated/unchanged/skipped/error)와 건수 요약을 반환한다.
+        """
+        prepared = prepare_month(year, month, department=department, recalculate=recalculate)
+        updated  = write_records(prepared['records'], chunk_size, updates=prepared['updates'])
+        return _summary(year, month, prepared['results'], updated)
 
-        # 공제 계산 (원 단위 절사)
-        national_pension     = _floor(gross_pay * NATIONAL_PENSION_RATE)
-        health_insurance     = _floor(gross_pay * HEALTH_INSURANCE_RATE)
-        long_term_care       = _floor(health_insurance * LONG_TERM_CARE_RATE)
-        employment_insurance = _floor(gross_pay * EMPLOYMENT_INSURANCE_RATE)
-        income_tax           = _floor(gross_pay * INCOME_TAX_RATE)
-        local_income_tax     = _floor(income_tax * LOCAL_INCOME_TAX_RATE)
+    @staticmethod
+    def run_month_parallel(year: int, month: int, workers: int = 1,
+                           department=None, chunk_size: int = 500, recalculate: bool = False) -> dict:
+        """
+        run_month의 부서 단위 병렬 버전.
 
-        total_deduction = (
-            national_pension + health_insurance + long_term_care
-            + employment_insurance + income_tax + local_income_tax
-        )
-        net_pay = gross_pay - total_deduction
-
-        return PayrollRecord.objects.create(
-            employee             = employee,
-            year                 = year,
-            month                = month,
-            base_salary          = base_salary,
-            meal_allowance       = MEAL_ALLOWANCE,
-            transport_allowance  = TRANSPORT_ALLOWANCE,
-            overtime_pay         = overtime_pay,
-            gross_pay            = gross_pay,
-            national_pension     = national_pension,
-            health_insurance     = health_insurance,
-            long_term_care       = long_term_care,
-            employment_insurance = employment_insurance,
-            income_tax           = income_tax,
-            local_income_tax     = local_income_tax,
-            total_deduction      = total_deduction,
-            net_pay              = net_pay,
-            overtime_minutes     = total_overtime_minutes,
-            status               = PayrollRecord.Status.DRAFT,
-        )
+        재직자가 있는 부서를 부서코드 순으로 나눈다. 부서별 조회·계산은
+        ProcessPoolExecutor 작업자가 각자의 DB 연결로 수행한다.
+        INSERT는 호출 프로세스 하나가 부서 순서대로 모아서 기록한다.
+        workers <= 1이면 같은 경로를 현재 프로세스에서 순차 실행한다.
+        반환값에는 run_month 요약 외에 부서별 소요시간(partitions)과 기록 시간(write_seconds)이 포함된다.
+        """
+        from .parallel import compute_partition, run_partitions
+
+        departments = Department.objects.filter(employees__is_active=True)
+        if department is not None:
+            departments = departments.filter(pk=getattr(department, 'pk', department))
+        partitions = list(departments.distinct().order_by('code').values_list('id', 'code'))
+
+        tasks = [(year, month, dept_id, code, recalculate) for dept_id, code in partitions]
+        if workers > 1:
+            outputs = run_partitions(tasks, workers)
+        else:
+            outputs = [compute_partition(task) for task in tasks]
+
+        results, records, updates = [], [], []
+        for out in outputs:
+            results.extend(out.pop('results'))
+            records.extend(out.pop('records'))
+            updates.extend(out.pop('updates'))
+
+        started = time.perf_counter()
+        updated = write_records(records, chunk_size, updates=updates)
+        write_seconds = time.perf_counter() - started
+
+        return {
+            **_summary(year, month, results, updated),
+            'workers':       max(workers, 1),
+            'partitions':    outputs,
+            'write_seconds': write_seconds,
+        }
 
     @staticmethod
     def confirm(record: PayrollRecord, confirmed_by) -> PayrollRecord:
@@ -103,3 +302,109 @@ class PayrollService:
         record.confirmed_at = timezone.now()
         record.save(update_fields=['status', 'confirmed_by', 'confirmed_at', 'updated_at'])
         return record
+
+    @staticmethod
+    def confirm_bulk(year: int, month: int, confirmed_by, department=None, ids=None) -> dict:
+        """
+        year/month(선택: 부서, 급여 id 목록)에 해당하는 DRAFT 급여를 한 번에 확정한다.
+
+        조건부 UPDATE ... WHERE status='DRAFT' 1회로 처리하므로
+        동시에 확정된 레코드를 다시 덮어쓰지 않는다. 같은 요청으로 확정된 레코드는
+        confirmed_by / confirmed_at이 모두 같다. 이번에 확정된 직원의 연간 누계도 함께 갱신한다.
+        {'confirmed': 이번에 확정, 'already_confirmed': 이미 확정, 'not_found': 없는 id 수}
+        """
+        records = PayrollRecord.objects.filter(year=year, month=month)
+        if department is not None:
+            records = records.filter(employee__department=department)
+        if ids is not None:
+            records = records.filter(pk__in=ids)
+
+        now = timezone.now()
+        with transaction.atomic():
+            confirmed = records.filter(status=PayrollRecord.Status.DRAFT).update(
+                status       = PayrollRecord.Status.CONFIRMED,
+                confirmed_by = confirmed_by,
+                confirmed_at = now,
+                updated_at   = now,
+            )
+            total_confirmed = records.filter(status=PayrollRecord.Status.CONFIRMED).count()
+            if confirmed:
+                # QuerySet.update는 post_save 시그널이 없으므로 연간 누계를 같은 트랜잭션에서 직접 갱신
+                YearToDateService.refresh(
+                    year, records.filter(confirmed_at=now).values('employee_id'),
+                )
+        if confirmed:
+            ledger_cache.invalidate(year, month)
+
+        already = total_confirmed - confirmed
+        return {
+            'year':              year,
+            'month':             month,
+            'confirmed':         confirmed,
+            'already_confirmed': already,
+            'not_found':         len(ids) - confirmed - already if ids is not None else 0,
+            'confirmed_at':      now.isoformat() if confirmed else None,
+        }
+
+
+class YearToDateService:
+    """확정(CONFIRMED) 급여의 직원별 연간 누계(PayrollYearToDate) 관리."""
+
+    # 누계 대상 열 (금액 + 초과근무분)
+    FIELDS = AMOUNT_FIELDS + ('overtime_minutes',)
+
+    @staticmethod
+    def _aggregate(records):
+        """(직원, 연도)별 확정 급여 합계 values() 쿼리셋."""
+        return (
+            records.filter(status=PayrollRecord.Status.CONFIRMED)
+            .values('employee_id', 'year')
+            .annotate(months=Count('id'), **{f: Sum(f) for f in YearToDateService.FIELDS})
+            .order_by()
+        )
+
+    @staticmethod
+    def refresh(year: int, employee_ids, chunk_size: int = 1000) -> int:
+        """
+        employee_ids(id 목록 또는 values('employee_id') 서브쿼리) 직원의 year 누계를
+        확정 급여로 다시 집계하여 upsert 한다. 확정 급여가 남지 않은 직원의 행은 삭제한다.
+        대상 직원의 행만 다시 계산하므로 같은 급여를 여러 번 반영해도 결과가 같다.
+        갱신한 행 수를 반환한다.
+        """
+        confirmed = PayrollRecord.objects.filter(year=year, status=PayrollRecord.Status.CONFIRMED)
+        objs = [
+            PayrollYearToDate(**row)
+            for row in YearToDateService._aggregate(confirmed.filter(employee_id__in=employee_ids))
+        ]
+        with transaction.atomic():
+            PayrollYearToDate.objects.bulk_create(
+                objs, batch_size=chunk_size,
+                **upsert_options(
+                    ('employee', 'year'),
+                    ('months', *YearToDateService.FIELDS, 'last_updated'),
+                ),
+            )
+            (
+                PayrollYearToDate.objects.filter(year=year, employee_id__in=employee_ids)
+                .exclude(employee_id__in=confirmed.values('employee_id'))
+                .delete()
+            )
+        return len(objs)
+
+    @staticmethod
+    def rebuild(year: int = None, chunk_size: int = 1000) -> int:
+        """
+        확정 급여 전체(또는 year)를 집계하여 누계 테이블을 다시 만든다.
+        생성한 행 수를 반환한다.
+        """
+        records = PayrollRecord.objects.all()
+        rows    = PayrollYearToDate.objects.all()
+        if year is not None:
+            records = records.filter(year=year)
+            rows    = rows.filter(year=year)
+
+        objs = [PayrollYearToDate(**row) for row in YearToDateService._aggregate(records)]
+        with transaction.atomic():
+            rows.delete()
+            PayrollYearToDate.objects.bulk_create(objs, batch_size=chunk_size)
+        return len(objs)
@@ -0,0 +1,37 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.employees.models import Department, Employee, Position
+from . import ledger_cache
+from .models import PayrollRateSet, PayrollRecord
+from .rates import bump_version
+from .services import YearToDateService
+
+
+@receiver(post_save,   sender=PayrollRateSet)
+@receiver(post_delete, sender=PayrollRateSet)
+def invalidate_rate_cache(sender, **kwargs):
+    bump_version()
+
+
+@receiver(post_save,   sender=PayrollRecord)
+@receiver(post_delete, sender=PayrollRecord)
+def invalidate_ledger_month(sender, instance, **kwargs):
+    ledger_cache.invalidate(instance.year, instance.month)
+
+
+@receiver(post_save,   sender=PayrollRecord)
+@receiver(post_delete, sender=PayrollRecord)
+def refresh_year_to_date(sender, instance, raw=False, **kwargs):
+    # 확정 급여의 저장(확정 포함)·삭제만 연간 누계에 영향을 준다
+    if not raw and instance.status == PayrollRecord.Status.CONFIRMED:
+        YearToDateService.refresh(instance.year, [instance.employee_id])
+
+
+@receiver(post_save,   sender=Employee)
+@receiver(post_save,   sender=Department)
+@receiver(post_save,   sender=Position)
+def invalidate_ledger_all(sender, raw=False, **kwargs):
+    # 급여대장에 표시되는 사번·이름·부서명·직급명 변경
+    if not raw:
+        ledger_cache.invalidate_all()
@@ -0,0 +1,214 @@
+"""
+급여 요율 변경 시뮬레이션 (NumPy 벡터 연산, DB 저장 없음).
+
+전 직원의 기본급·월 초과근무분을 int64 배열로 적재한 뒤
+공제 파이프라인을 배열 연산으로 적용한다. 절사 규칙은 fixed 엔진과 같다
+(금액 × 분자 // 분모). 따라서 결과는 calculator의 Decimal 엔진과 원 단위까지 일치한다.
+"""
+from dataclasses import dataclass
+from decimal import Decimal
+
+import numpy as np
+
+from apps.attendance.models import MonthlyAttendanceSummary
+from apps.employees.models import Employee
+from . import withholding
+from .calculator import (
+    DEFAULT_RATES, PayrollInput, RateSet, calculate_many_decimal, decimal_overtime_pay,
+)
+from .fixedpoint import IntRates, to_int_won
+
+
+# 합계·차액을 보고하는 항목 (PayrollRecord 필드명)
+SUMMARY_FIELDS = (
+    'overtime_pay', 'gross_pay',
+    'national_pension', 'health_insurance', 'long_term_care',
+    'employment_insurance', 'income_tax', 'local_income_tax',
+    'total_deduction', 'net_pay',
+)
+
+
+@dataclass
+class Workforce:
+    """시뮬레이션 입력 배열. 모든 배열은 같은 길이(직원 수)."""
+    employee_ids:     np.ndarray   # int64
+    department_ids:   np.ndarray   # int64
+    base_salary:      np.ndarray   # int64, 원
+    overtime_minutes: np.ndarray   # int64
+    dependents:       np.ndarray   # int64, 간이세액표 공제대상 가족 수
+    # 원 미만 단위가 있는 기본급 (인덱스 → Decimal). Decimal 엔진으로 개별 계산한다.
+    fractional:       dict
+
+    def __len__(self):
+        return len(self.employee_ids)
+
+
+def load_workforce(year: int, month: int, department=None) -> Workforce:
+    """재직 중인 직원의 기본급과 월별 근태 요약의 초과근무 합계를 쿼리 2회로 적재한다."""
+    employees = Employee.objects.filter(is_active=True)
+    summaries = MonthlyAttendanceSummary.objects.filter(
+        employee__is_active=True, year=year, month=month,
+    )
+    if department is not None:
+        employees = employees.filter(department=department)
+        summaries = summaries.filter(employee__department=department)
+
+    rows = list(
+        employees.order_by('id').values_list('id', 'department_id', 'base_salary', 'dependents')
+    )
+    overtime_totals = dict(summaries.values_list('employee_id', 'overtime_minutes'))
+
+    n = len(rows)
+    employee_ids     = np.empty(n, dtype=np.int64)
+    department_ids   = np.empty(n, dtype=np.int64)
+    base_salary      = np.empty(n, dtype=np.int64)
+    overtime_minutes = np.empty(n, dtype=np.int64)
+    dependents       = np.empty(n, dtype=np.int64)
+    fractional = {}
+    for i, (emp_id, dept_id, salary, deps) in enumerate(rows):
+        won = to_int_won(salary)
+        if won is None:
+            fractional[i] = salary
+            won = int(salary)
+        employee_ids[i]     = emp_id
+        department_ids[i]   = dept_id
+        base_salary[i]      = won
+        overtime_minutes[i] = overtime_totals.get(emp_id) or 0
+        dependents[i]       = deps
+
+    return Workforce(
+        employee_ids, department_ids, base_salary, overtime_minutes, dependents, fractional,
+    )
+
+
+_EXCESS_THRESHOLDS = np.array([b[0] for b in withholding.EXCESS_BRACKETS], dtype=np.int64)
+_EXCESS_BASES      = np.array([b[1] for b in withholding.EXCESS_BRACKETS], dtype=np.int64)
+_EXCESS_RATES      = np.array([b[2] for b in withholding.EXCESS_BRACKETS], dtype=np.int64)
+
+
+def _withholding_tax(table, taxable, dependents):
+    """간이세액표를 배열 단위로 조회한다 (WithholdingTable.lookup과 같은 규칙)."""
+    lowers = np.asarray(table.lowers, dtype=np.int64)
+    uppers = np.asarray(table.uppers, dtype=np.int64)
+    taxes  = np.asarray(table.taxes,  dtype=np.int64).reshape(len(lowers), table.dependents)
+    row = np.searchsorted(lowers, taxable, side='right') - 1
+    col = np.clip(dependents, 1, table.dependents) - 1
+    safe = np.maximum(row, 0)
+    tax  = np.where(row >= 0, taxes[safe, col], 0)
+
+    excess = (taxable > withholding.EXCESS_FROM) if table.statutory else np.zeros(len(tax), dtype=bool)
+    if excess.any():
+        pay = taxable[excess]
+        k = np.searchsorted(_EXCESS_THRESHOLDS, pay, side='left') - 1
+        tax[excess] += _EXCESS_BASES[k] + (pay - _EXCESS_THRESHOLDS[k]) * _EXCESS_RATES[k] // 10000
+
+    missing = (row >= 0) & ~excess & (taxable >= uppers[safe])
+    if missing.any():
+        pay = int(taxable[np.flatnonzero(missing)[0]])
+        raise ValueError(f'과세급여 {pay:,}원에 해당하는 간이세액표 구간이 없습니다.')
+    return tax
+
+
+def simulate(workforce: Workforce, rates: RateSet = DEFAULT_RATES) -> dict:
+    """공제 파이프라인을 배열 단위로 적용하여 항목별 int64 배열을 반환한다."""
+    r       = IntRates.from_rate_set(rates)
+    base    = workforce.base_salary
+    minutes = workforce.overtime_minutes
+
+    overtime_pay, remainder = np.divmod(base * minutes * r.overtime_num, r.overtime_den)
+    # 정확한 값이 정수인 경우는 Decimal 엔진의 절사 결과를 따른다 (fixedpoint 모듈 참고)
+    for i in np.flatnonzero((remainder == 0) & (overtime_pay > 0)):
+        overtime_pay[i] = int(decimal_overtime_pay(
+            Decimal(int(base[i])), int(minutes[i]),
+            rates.standard_monthly_hours, rates.overtime_multiplier,
+        ))
+
+    gross = base + r.meal + r.transport + overtime_pay
+
+    pension_base = gross
+    if r.pension_floor is not None or r.pension_ceiling is not None:
+        pension_base = np.clip(gross, r.pension_floor, r.pension_ceiling)
+
+    health = gross * r.health_num // r.health_den
+    if rates.withholding is None:
+        income_tax = gross * r.income_num // r.income_den
+    else:
+        income_tax = _withholding_tax(rates.withholding, gross - r.meal, workforce.dependents)
+    result = {
+        'overtime_pay':         overtime_pay,
+        'gross_pay':            gross,
+        'national_pension':     pension_base * r.pension_num // r.pension_den,
+        'health_insurance':     health,
+        'long_term_care':       health * r.care_num // r.care_den,
+        'employment_insurance': gross * r.employment_num // r.employment_den,
+        'income_tax':           income_tax,
+        'local_income_tax':     income_tax * r.local_num // r.local_den,
+    }
+    result['total_deduction'] = (
+        result['national_pension'] + result['health_insurance'] + result['long_term_care']
+        + result['employment_insurance'] + result['income_tax'] + result['local_income_tax']
+    )
+    result['net_pay'] = gross - result['total_deduction']
+
+    # 원 미만 기본급은 Decimal 엔진 결과로 덮어쓰고 원 단위로 절사하여 합산한다
+    if workforce.fractional:
+        inputs = [
+            PayrollInput(salary, int(minutes[i]), dependents=int(workforce.dependents[i]), key=i)
+            for i, salary in workforce.fractional.items()
+        ]
+        for res in calculate_many_decimal(inputs, rates):
+            for field in SUMMARY_FIELDS:
+                result[field][res.key] = int(getattr(res, field))
+    return result
+
+
+def _department_sums(workforce: Workforce, values: dict):
+    """부서별 합계. (부서 id 배열, 인원수 배열, {항목: 합계 배열})"""
+    dept_ids, inverse, counts = np.unique(
+        workforce.department_ids, return_inverse=True, return_counts=True,
+    )
+    sums = {}
+    for field in SUMMARY_FIELDS:
+        out = np.zeros(len(dept_ids), dtype=np.int64)
+        np.add.at(out, inverse, values[field])
+        sums[field] = out
+    return dept_ids, counts, sums
+
+
+def compare(workforce: Workforce, baseline: RateSet, alternative: RateSet) -> dict:
+    """
+    두 요율 세트의 결과를 비교하여 전체·부서별 합계와 차액(alternative - baseline)을 반환한다.
+    금액은 int(원).
+    """
+    base_values = simulate(workforce, baseline)
+    alt_values  = simulate(workforce, alternative)
+
+    def summary(base_sum, alt_sum):
+        return {
+            field: {
+                'baseline':    int(base_sum[field]),
+                'alternative': int(alt_sum[field]),
+                'delta':       int(alt_sum[field]) - int(base_sum[field]),
+            }
+            for field in SUMMARY_FIELDS
+        }
+
+    totals = summary(
+        {f: base_values[f].sum() for f in SUMMARY_FIELDS},
+        {f: alt_values[f].sum()  for f in SUMMARY_FIELDS},
+    )
+
+    dept_ids, counts, base_dept = _department_sums(workforce, base_values)
+    _,        _,      alt_dept  = _department_sums(workforce, alt_values)
+    departments = [
+        {
+            'department_id': int(dept_id),
+            'count':         int(counts[i]),
+            **summary(
+                {f: base_dept[f][i] for f in SUMMARY_FIELDS},
+                {f: alt_dept[f][i]  for f in SUMMARY_FIELDS},
+            ),
+        }
+        for i, dept_id in enumerate(dept_ids)
+    ]
+    return {'employee_count': len(workforce), 'total': totals, 'departments': departments}
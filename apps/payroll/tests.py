@@ -1,14 +1,27 @@
 import datetime
 from decimal import Decimal
 
+import os
+import random
+import unittest
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.test import SimpleTestCase, TransactionTestCase, override_settings
+from rest_framework.exceptions import ValidationError
 from rest_framework.test import APITestCase
 from rest_framework import status
 from django.contrib.auth import get_user_model
 
 from apps.employees.models import Department, Position, Employee
 from apps.utils.encryption import encrypt
+from apps.utils.testing import concurrency_skip_reason, explain_queries, explain_skip_reason, run_concurrently
 from apps.attendance.models import AttendanceRecord
-from .models import PayrollRecord
+from . import calculator
+from .calculator import PayrollInput, RateSet
+from .models import PayrollRecord, PayrollRateSet, PayrollYearToDate
+from .rates import rates_for_month
 
 User = get_user_model()
 
@@ -16,6 +29,15 @@ CALCULATE_URL = '/api/v1/payroll/calculate/'
 LIST_URL      = '/api/v1/payroll/'
 MY_URL        = '/api/v1/payroll/my/'
 LEDGER_URL    = '/api/v1/payroll/reports/ledger/'
+EXPORT_URL    = '/api/v1/payroll/reports/ledger/export/'
+RUNS_URL      = '/api/v1/payroll/runs/'
+SIMULATE_URL  = '/api/v1/payroll/simulate/'
+CONFIRM_BULK_URL = '/api/v1/payroll/confirm-bulk/'
+VARIANCE_URL  = '/api/v1/payroll/reports/variance/'
+ANNUAL_URL    = '/api/v1/payroll/reports/annual/'
+ANNUAL_EXPORT_URL = '/api/v1/payroll/reports/annual/export/'
+BANK_TRANSFER_URL = '/api/v1/payroll/reports/bank-transfer/'
+PAYSLIPS_URL  = '/api/v1/payroll/reports/payslips/'
 
 
 # ── 공통 헬퍼 ────────────────────────────────────────────────────────
@@ -124,6 +146,26 @@ class PayrollCalculateTest(APITestCase):
         # 시간당 기본급 = 3000000 / 209 ≈ 14354.07, × 1.5 × 1h ≈ 21531
         self.assertGreater(ot_pay, 0)
 
+    def test_calculate_reads_monthly_summary(self):
+        """초과근무 합계는 일별 기록이 아닌 월별 근태 요약 1행에서 읽는다."""
+        from apps.attendance.models import MonthlyAttendanceSummary
+        from . import ledger_cache
+        from .services import PayrollService
+        for day in range(1, 21):
+            AttendanceRecord.objects.create(
+                employee=self.emp_obj, work_date=datetime.date(2024, 1, day), overtime_minutes=10,
+            )
+        self.assertEqual(
+            MonthlyAttendanceSummary.objects.get(employee=self.emp_obj, year=2024, month=1).overtime_minutes,
+            200,
+        )
+        rates_for_month(2024, 1)  # 요율 캐시 적재
+        ledger_cache.invalidate(2024, 1)  # 급여대장 버전 행 생성 (월 최초 1회)
+        # 요율 버전 확인 + 요약 조회 + SAVEPOINT + INSERT + 대장 버전 UPDATE + RELEASE (사전 중복 확인 없음)
+        with self.assertNumQueries(6):
+            record = PayrollService.calculate(self.emp_obj, 2024, 1)
+        self.assertEqual(record.overtime_minutes, 200)
+
     def test_calculate_requires_hr_permission(self):
         auth(self.client, get_token(self.client, 'emp1'))
         res = self._post()
@@ -139,6 +181,762 @@ class PayrollCalculateTest(APITestCase):
         self.assertFalse(res.data['success'])
 
 
+# ── 계산 코어 테스트 (DB 미사용) ─────────────────────────────────────
+def legacy_calculate(base_salary, overtime_minutes):
+    """분리 이전 PayrollService.calculate의 금액 계산 로직 (비교 기준)."""
+    from decimal import ROUND_FLOOR
+
+    def floor(v):
+        return v.quantize(Decimal('1'), rounding=ROUND_FLOOR)
+
+    base_salary  = Decimal(str(base_salary))
+    overtime_pay = floor(
+        base_salary / Decimal('209') * Decimal('1.5')
+        * (Decimal(str(overtime_minutes)) / Decimal('60'))
+    )
+    gross = base_salary + Decimal('200000') + Decimal('100000') + overtime_pay
+    pension    = floor(gross * Decimal('0.045'))
+    health     = floor(gross * Decimal('0.03545'))
+    care       = floor(health * Decimal('0.1281'))
+    employment = floor(gross * Decimal('0.009'))
+    income     = floor(gross * Decimal('0.02'))
+    local      = floor(income * Decimal('0.10'))
+    total = pension + health + care + employment + income + local
+    return {
+        'overtime_pay': overtime_pay, 'gross_pay': gross,
+        'national_pension': pension, 'health_insurance': health, 'long_term_care': care,
+        'employment_insurance': employment, 'income_tax': income, 'local_income_tax': local,
+        'total_deduction': total, 'net_pay': gross - total,
+    }
+
+
+class PayrollCalculateConcurrencyTest(TransactionTestCase):
+    """동시 급여 계산 요청: 1건만 생성되고 나머지는 기존 검증 메시지로 실패해야 한다."""
+
+    def setUp(self):
+        reason = concurrency_skip_reason()
+        if reason:
+            self.skipTest(reason)
+
+    def test_concurrent_calculate_creates_one_record(self):
+        from .services import PayrollService
+        emp = make_employee(make_dept(), make_pos())
+
+        results = run_concurrently(lambda: PayrollService.calculate(emp, 2024, 1), threads=8)
+
+        ok     = [value for kind, value in results if kind == 'ok']
+        errors = [value for kind, value in results if kind == 'error']
+        self.assertEqual(len(ok), 1)
+        self.assertEqual(len(errors), 7)
+        for e in errors:
+            self.assertIsInstance(e, ValidationError)
+            self.assertEqual(str(e.detail[0]), '2024년 1월 급여가 이미 계산되었습니다.')
+        self.assertEqual(PayrollRecord.objects.filter(employee=emp).count(), 1)
+
+    def test_other_integrity_errors_are_not_translated(self):
+        from django.db import IntegrityError
+        from .services import PayrollService
+        # 존재하지 않는 직원(FK 위반)은 중복 메시지로 바뀌지 않아야 함
+        emp = Employee(pk=999999, base_salary=Decimal('3000000'), dependents=1)
+        with self.assertRaises(IntegrityError):
+            PayrollService.calculate(emp, 2024, 1)
+
+
+class PayrollCalculatorTest(SimpleTestCase):
+
+    def test_known_values(self):
+        r = calculator.calculate(PayrollInput(Decimal('3000000'), 150))
+        self.assertEqual(r.overtime_pay,         Decimal('53827'))
+        self.assertEqual(r.gross_pay,            Decimal('3353827'))
+        self.assertEqual(r.national_pension,     Decimal('150922'))
+        self.assertEqual(r.health_insurance,     Decimal('118893'))
+        self.assertEqual(r.long_term_care,       Decimal('15230'))
+        self.assertEqual(r.employment_insurance, Decimal('30184'))
+        self.assertEqual(r.income_tax,           Decimal('67076'))
+        self.assertEqual(r.local_income_tax,     Decimal('6707'))
+        self.assertEqual(r.total_deduction,      Decimal('389012'))
+        self.assertEqual(r.net_pay,              Decimal('2964815'))
+
+    def test_matches_legacy_calculation(self):
+        inputs = [
+            PayrollInput(Decimal(salary), minutes, key=(salary, minutes))
+            for salary in ('0', '1', '2060740', '2345678', '3000000.00', '4999999', '87654321')
+            for minutes in (0, 1, 59, 437, 1234, 6000)
+        ]
+        results = list(calculator.calculate_many(inputs))
+        self.assertEqual(len(results), len(inputs))
+        for inp, r in zip(inputs, results):
+            self.assertEqual(r.key, inp.key)
+            expected = legacy_calculate(inp.base_salary, inp.overtime_minutes)
+            for field, value in expected.items():
+                self.assertEqual(getattr(r, field), value, (inp.key, field))
+
+    def test_allowance_override_and_rate_set(self):
+        rates = RateSet(meal_allowance=Decimal('0'), transport_allowance=Decimal('0'))
+        r = calculator.calculate(PayrollInput(Decimal('1000000')), rates)
+        self.assertEqual(r.gross_pay, Decimal('1000000'))
+        r = calculator.calculate(PayrollInput(Decimal('1000000'), meal_allowance=Decimal('50000')), rates)
+        self.assertEqual(r.meal_allowance, Decimal('50000'))
+        self.assertEqual(r.gross_pay,      Decimal('1050000'))
+
+    def test_as_fields_matches_model_fields(self):
+        fields = calculator.calculate(PayrollInput(Decimal('3000000'))).as_fields()
+        self.assertNotIn('key', fields)
+        PayrollRecord(year=2024, month=1, **fields)  # 필드명 불일치 시 TypeError
+
+
+class FixedPointEngineTest(SimpleTestCase):
+    """
+    fixed 엔진이 Decimal 엔진과 0~1억 원 전 구간에서 원 단위까지 일치하는지 검증.
+
+    각 공제 단계 f(x) = floor(x × p/q)는 f(x + q) = f(x) + p 인 주기 선형 함수이므로
+    단계별로 한 주기 [0, q) 전체와 1억 원 부근의 같은 잉여류를 비교하면 전 구간 일치가 보장된다.
+    엔진 전체는 주기 구간 전수 + 고정 시드 무작위 표본으로 비교하고,
+    1억 건 완전 전수는 PAYROLL_EXHAUSTIVE_TEST=1 일 때만 실행한다.
+    """
+    UPPER = 100_000_000
+
+    def _assert_same(self, inputs):
+        decimal_results = calculator.calculate_many(inputs, engine='decimal')
+        fixed_results   = calculator.calculate_many(inputs, engine='fixed')
+        for inp, d, f in zip(inputs, decimal_results, fixed_results):
+            for field in calculator.RECORD_FIELDS:
+                self.assertEqual(getattr(d, field), getattr(f, field), (inp, field))
+
+    def test_each_rate_stage_over_full_period(self):
+        rates = calculator.DEFAULT_RATES
+        for rate in (rates.national_pension, rates.health_insurance, rates.long_term_care,
+                     rates.employment_insurance, rates.income_tax, rates.local_income_tax):
+            p, q = rate.as_integer_ratio()
+            top = (self.UPPER // q) * q
+            for x in range(q):
+                for amount in (x, top + x):
+                    expected = (Decimal(amount) * rate).quantize(Decimal('1'), rounding='ROUND_FLOOR')
+                    self.assertEqual(amount * p // q, expected, (rate, amount))
+
+    def test_engine_over_salary_period_without_overtime(self):
+        self._assert_same([PayrollInput(Decimal(s)) for s in range(0, 20_000)])
+        self._assert_same([PayrollInput(Decimal(s)) for s in range(self.UPPER - 20_000, self.UPPER + 1)])
+
+    def test_engine_random_salaries_with_overtime(self):
+        rng = random.Random(20240101)
+        self._assert_same([
+            PayrollInput(Decimal(rng.randrange(0, self.UPPER + 1)), rng.randrange(0, 6000))
+            for _ in range(5000)
+        ])
+
+    def test_overtime_exact_integer_boundary(self):
+        # 정확한 초과근무수당이 정수인 경우 Decimal 엔진의 28자리 반올림 결과를 따른다
+        self._assert_same([
+            PayrollInput(Decimal('99996050'), 80),
+            PayrollInput(Decimal('2090000'), 20),
+            PayrollInput(Decimal('2090000'), 60),
+        ])
+
+    def test_fractional_amounts_fall_back_to_decimal(self):
+        self._assert_same([
+            PayrollInput(Decimal('3000000.50'), 90),
+            PayrollInput(Decimal('3000000'), 90, meal_allowance=Decimal('150000.25')),
+        ])
+
+    def test_pension_base_floor_and_ceiling(self):
+        rates = RateSet(pension_base_floor=Decimal('390000'), pension_base_ceiling=Decimal('6170000'))
+        inputs = [PayrollInput(Decimal(s), m) for s in (0, 50_000, 5_870_000, 5_900_000, 9_000_000) for m in (0, 600)]
+        for d, f in zip(calculator.calculate_many(inputs, rates, engine='decimal'),
+                        calculator.calculate_many(inputs, rates, engine='fixed')):
+            self.assertEqual(d.national_pension, f.national_pension)
+        r = calculator.calculate(PayrollInput(Decimal('9000000')), rates)
+        self.assertEqual(r.national_pension, Decimal('277650'))   # 6,170,000 × 4.5%
+        r = calculator.calculate(PayrollInput(Decimal('0'), meal_allowance=Decimal('0'),
+                                              transport_allowance=Decimal('0')), rates)
+        self.assertEqual(r.national_pension, Decimal('17550'))    # 390,000 × 4.5%
+
+    @override_settings(PAYROLL_ENGINE='fixed')
+    def test_setting_selects_engine(self):
+        r = calculator.calculate(PayrollInput(Decimal('3000000'), 150))
+        self.assertIsInstance(r.gross_pay, int)
+        self.assertEqual(r.net_pay, Decimal('2964815'))
+
+    @override_settings(PAYROLL_ENGINE='float')
+    def test_unknown_engine_rejected(self):
+        with self.assertRaises(ImproperlyConfigured):
+            calculator.calculate(PayrollInput(Decimal('3000000')))
+
+    @unittest.skipUnless(os.getenv('PAYROLL_EXHAUSTIVE_TEST'), '1억 건 전수 검증은 PAYROLL_EXHAUSTIVE_TEST=1 일 때만')
+    def test_exhaustive_every_salary(self):
+        step = 100_000
+        for start in range(0, self.UPPER + 1, step):
+            self._assert_same([
+                PayrollInput(Decimal(s)) for s in range(start, min(start + step, self.UPPER + 1))
+            ])
+
+
+# ── 적용일별 요율 테스트 ────────────────────────────────────────────
+def make_rate_set(effective_from, **overrides):
+    fields = dict(
+        national_pension_rate='0.045', health_insurance_rate='0.03545',
+        long_term_care_rate='0.1281', employment_insurance_rate='0.009',
+        income_tax_rate='0.02', local_income_tax_rate='0.10',
+        meal_allowance='200000', transport_allowance='100000',
+        standard_monthly_hours='209', overtime_multiplier='1.5',
+    )
+    fields.update(overrides)
+    return PayrollRateSet.objects.create(effective_from=effective_from, **fields)
+
+
+class PayrollRateSetTest(APITestCase):
+
+    def setUp(self):
+        from .rates import clear_cache
+        clear_cache()
+        dept = make_dept()
+        pos  = make_pos()
+        self.emp = make_employee(dept, pos, 'EMP001', '홍길동', '6000000')
+
+    def test_seeded_2024_rates_match_constants(self):
+        from .rates import rates_for_month
+        rates = rates_for_month(2024, 6)
+        self.assertEqual(rates.national_pension, calculator.NATIONAL_PENSION_RATE)
+        self.assertEqual(rates.meal_allowance,   calculator.MEAL_ALLOWANCE)
+        self.assertIsNone(rates.pension_base_ceiling)
+        # 첫 적용일 이전은 기본 상수
+        self.assertIs(rates_for_month(2023, 12), calculator.DEFAULT_RATES)
+
+    def test_lookup_picks_latest_effective_rate(self):
+        from .rates import rates_for_month
+        make_rate_set(datetime.date(2025, 1, 1), income_tax_rate='0.03')
+        make_rate_set(datetime.date(2025, 7, 1), income_tax_rate='0.04')
+        self.assertEqual(rates_for_month(2024, 12).income_tax, Decimal('0.02'))
+        self.assertEqual(rates_for_month(2025, 1).income_tax,  Decimal('0.03'))
+        self.assertEqual(rates_for_month(2025, 6).income_tax,  Decimal('0.03'))
+        self.assertEqual(rates_for_month(2025, 7).income_tax,  Decimal('0.04'))
+
+    def test_cache_reused_until_rates_change(self):
+        from .rates import get_rate_table
+        table = get_rate_table()
+        self.assertIs(get_rate_table(), table)
+        rate_set = make_rate_set(datetime.date(2025, 1, 1))
+        changed = get_rate_table()
+        self.assertIsNot(changed, table)
+        self.assertGreater(changed.version, table.version)
+        rate_set.delete()
+        self.assertEqual(len(get_rate_table().dates), len(table.dates))
+
+    def test_calculate_uses_rates_effective_for_month(self):
+        from .services import PayrollService
+        make_rate_set(
+            datetime.date(2025, 1, 1),
+            pension_base_ceiling='5000000', meal_allowance='250000',
+        )
+        old = PayrollService.calculate(self.emp, 2024, 12)
+        new = PayrollService.calculate(self.emp, 2025, 1)
+        self.assertEqual(old.national_pension, Decimal('283500'))   # 6,300,000 × 4.5%
+        self.assertEqual(new.national_pension, Decimal('225000'))   # 상한 5,000,000 × 4.5%
+        self.assertEqual(new.meal_allowance,   Decimal('250000'))
+
+
+# ── 급여 일괄 계산 테스트 ────────────────────────────────────────────
+class PayrollRunTest(APITestCase):
+
+    def setUp(self):
+        self.dev = make_dept('개발팀', 'DEV')
+        self.hr  = Department.objects.create(name='인사팀', code='HR')
+        pos = make_pos()
+        self.emp1 = make_employee(self.dev, pos, 'EMP001', '홍길동', '3000000')
+        self.emp2 = make_employee(self.dev, pos, 'EMP002', '이영희', '4000000')
+        self.emp3 = make_employee(self.hr,  pos, 'EMP003', '박민수', '3500000')
+        resigned = make_employee(self.dev, pos, 'EMP004', '최퇴사', '3000000')
+        resigned.is_active = False
+        resigned.save()
+
+        for day, minutes in [(3, 60), (4, 90)]:
+            AttendanceRecord.objects.create(
+                employee=self.emp1, work_date=datetime.date(2024, 1, day), overtime_minutes=minutes,
+            )
+        # 다른 달 기록은 합산되지 않아야 함
+        AttendanceRecord.objects.create(
+            employee=self.emp1, work_date=datetime.date(2024, 2, 1), overtime_minutes=300,
+        )
+
+        make_user('hr_run', role='HR_MANAGER')
+        make_user('emp_run', role='EMPLOYEE', employee=self.emp1)
+        auth(self.client, get_token(self.client, 'hr_run'))
+
+    def test_run_creates_records_for_active_employees(self):
+        res = self.client.post(RUNS_URL, {'year': 2024, 'month': 1})
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        data = res.data['data']
+        self.assertEqual(data['created'], 3)
+        self.assertEqual(data['skipped'], 0)
+        self.assertEqual(PayrollRecord.objects.filter(year=2024, month=1).count(), 3)
+        self.assertEqual(
+            PayrollRecord.objects.get(employee=self.emp1, year=2024, month=1).overtime_minutes, 150,
+        )
+
+    def test_run_matches_single_calculate(self):
+        from .services import PayrollService
+        PayrollService.run_month(2024, 1)
+        bulk = PayrollRecord.objects.get(employee=self.emp1, year=2024, month=1)
+        bulk.delete()
+        single = PayrollService.calculate(self.emp1, 2024, 1)
+        for field in ('overtime_pay', 'gross_pay', 'total_deduction', 'net_pay', 'overtime_minutes'):
+            self.assertEqual(getattr(bulk, field), getattr(single, field), field)
+
+    def test_run_with_fixed_engine_matches_decimal(self):
+        from .services import PayrollService
+        with override_settings(PAYROLL_ENGINE='fixed'):
+            PayrollService.run_month(2024, 1)
+        fixed = {r.employee_id: r for r in PayrollRecord.objects.filter(year=2024, month=1)}
+        PayrollRecord.objects.all().delete()
+        PayrollService.run_month(2024, 1)
+        for r in PayrollRecord.objects.filter(year=2024, month=1):
+            for field in calculator.RECORD_FIELDS:
+                self.assertEqual(getattr(r, field), getattr(fixed[r.employee_id], field), field)
+
+    def test_run_skips_existing_records(self):
+        self.client.post(CALCULATE_URL, {'employee_id': self.emp2.id, 'year': 2024, 'month': 1})
+        res = self.client.post(RUNS_URL, {'year': 2024, 'month': 1})
+        data = res.data['data']
+        self.assertEqual(data['created'], 2)
+        self.assertEqual(data['skipped'], 1)
+        skipped = next(r for r in data['results'] if r['status'] == 'skipped')
+        self.assertEqual(skipped['employee_no'], 'EMP002')
+
+    def test_recalculate_updates_only_changed_drafts(self):
+        from .services import PayrollService
+        PayrollService.run_month(2024, 1)
+        records = {r.employee_id: r for r in PayrollRecord.objects.filter(year=2024, month=1)}
+        PayrollService.confirm(records[self.emp3.id], confirmed_by=None)
+
+        # 근태 정정(홍길동 초과근무 추가) + 확정된 박민수의 기본급 변경
+        AttendanceRecord.objects.create(
+            employee=self.emp1, work_date=datetime.date(2024, 1, 5), overtime_minutes=120,
+        )
+        self.emp3.base_salary = '9000000'
+        self.emp3.save()
+
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        with CaptureQueriesContext(connection) as ctx:
+            summary = PayrollService.run_month(2024, 1, recalculate=True)
+        self.assertEqual(
+            (summary['created'], summary['updated'], summary['unchanged'], summary['skipped']),
+            (0, 1, 1, 1),
+        )
+        updates = [q['sql'] for q in ctx.captured_queries if q['sql'].startswith('UPDATE "payroll_record"')]
+        self.assertEqual(len(updates), 1)
+        self.assertIn('"status" = ', updates[0])   # WHERE status='DRAFT' 조건 포함
+
+        emp1 = PayrollRecord.objects.get(employee=self.emp1, year=2024, month=1)
+        self.assertEqual(emp1.overtime_minutes, 270)
+        self.assertGreater(emp1.net_pay, records[self.emp1.id].net_pay)
+        emp2 = PayrollRecord.objects.get(employee=self.emp2, year=2024, month=1)
+        self.assertEqual(emp2.updated_at, records[self.emp2.id].updated_at)
+        emp3 = PayrollRecord.objects.get(employee=self.emp3, year=2024, month=1)
+        self.assertEqual(emp3.base_salary, Decimal('3500000'))
+
+        res = self.client.post(RUNS_URL, {'year': 2024, 'month': 1, 'recalculate': True}, format='json')
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual((res.data['data']['updated'], res.data['data']['unchanged']), (0, 2))
+
+    def test_single_recalculate(self):
+        res = self.client.post(CALCULATE_URL, {'employee_id': self.emp1.id, 'year': 2024, 'month': 1})
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        data = {'employee_id': self.emp1.id, 'year': 2024, 'month': 1, 'recalculate': 'true'}
+
+        res = self.client.post(CALCULATE_URL, data)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data['data']['changed_fields'], [])
+
+        AttendanceRecord.objects.create(
+            employee=self.emp1, work_date=datetime.date(2024, 1, 5), overtime_minutes=120,
+        )
+        res = self.client.post(CALCULATE_URL, data)
+        self.assertIn('overtime_minutes', res.data['data']['changed_fields'])
+        self.assertEqual(res.data['data']['overtime_minutes'], 270)
+        self.assertEqual(PayrollRecord.objects.get(employee=self.emp1).overtime_minutes, 270)
+
+        PayrollRecord.objects.filter(employee=self.emp1).update(status=PayrollRecord.Status.CONFIRMED)
+        res = self.client.post(CALCULATE_URL, data)
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(res.data['message'], '확정된 급여는 재계산할 수 없습니다.')
+
+    def test_run_department_filter(self):
+        res = self.client.post(RUNS_URL, {'year': 2024, 'month': 1, 'department': self.hr.id})
+        self.assertEqual(res.data['data']['created'], 1)
+        self.assertTrue(PayrollRecord.objects.filter(employee=self.emp3).exists())
+
+    def test_run_invalid_month_fails(self):
+        res = self.client.post(RUNS_URL, {'year': 2024, 'month': 13})
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_run_requires_hr_permission(self):
+        auth(self.client, get_token(self.client, 'emp_run'))
+        res = self.client.post(RUNS_URL, {'year': 2024, 'month': 1})
+        self.assertEqual(res.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_run_month_parallel_single_worker(self):
+        from .services import PayrollService
+        summary = PayrollService.run_month_parallel(2024, 1, workers=1)
+        self.assertEqual(summary['created'], 3)
+        # 부서코드 순 → 사번 순으로 결정적 정렬
+        self.assertEqual([p['department_code'] for p in summary['partitions']], ['DEV', 'HR'])
+        self.assertEqual([r['employee_no'] for r in summary['results']], ['EMP001', 'EMP002', 'EMP003'])
+        self.assertNotIn('records', summary['partitions'][0])
+        self.assertEqual(
+            PayrollRecord.objects.get(employee=self.emp1, year=2024, month=1).overtime_minutes, 150,
+        )
+
+    def test_run_payroll_command_with_workers_prints_timings(self):
+        from io import StringIO
+        from django.core.management import call_command
+        out = StringIO()
+        call_command('run_payroll', '2024', '1', '--workers', '1', stdout=out)
+        self.assertIn('DEV', out.getvalue())
+        self.assertIn('생성 3건', out.getvalue())
+
+    def test_run_payroll_command(self):
+        from io import StringIO
+        from django.core.management import call_command
+        out = StringIO()
+        call_command('run_payroll', '2024', '1', '--department', str(self.dev.pk), stdout=out)
+        self.assertIn('생성 2건', out.getvalue())
+
+    def test_run_payroll_command_unknown_department(self):
+        from django.core.management import call_command
+        from django.core.management.base import CommandError
+        with self.assertRaises(CommandError):
+            call_command('run_payroll', '2024', '1', '--department', '99999')
+
+    def test_overlapping_run_returns_conflict(self):
+        from apps.payroll import services
+        # 조회는 끝났지만 기록 전에 다른 실행이 같은 달 급여를 먼저 만든 상황
+        stale = services.prepare_month(2024, 1)
+        services.PayrollService.run_month(2024, 1)
+        with patch.object(services, 'prepare_month', return_value=stale):
+            res = self.client.post(RUNS_URL, {'year': 2024, 'month': 1})
+        self.assertEqual(res.status_code, status.HTTP_409_CONFLICT)
+        self.assertFalse(res.data['success'])
+        self.assertEqual(PayrollRecord.objects.filter(year=2024, month=1).count(), 3)
+
+
+class PayrollMonthQueryPlanTest(APITestCase):
+    """월 급여 계산의 근태 요약·급여 조회가 (year, month) 인덱스를 타는지."""
+
+    def setUp(self):
+        reason = explain_skip_reason()
+        if reason:
+            self.skipTest(reason)
+        dept = make_dept()
+        pos  = make_pos()
+        for i in range(3):
+            emp = make_employee(dept, pos, f'EMP00{i}', f'직원{i}')
+            AttendanceRecord.objects.create(
+                employee=emp, work_date=datetime.date(2024, 1, 2), overtime_minutes=60,
+            )
+
+    def test_prepare_month(self):
+        from .services import PayrollService, prepare_month
+        PayrollService.run_month(2024, 1)
+        for recalculate in (False, True):
+            steps = explain_queries(lambda: prepare_month(2024, 1, recalculate=recalculate))
+            for table in ('attendance_monthly_summary', 'payroll_record'):
+                table_steps = [s for s in steps if s['table'] == table]
+                self.assertTrue(table_steps, f'{table} 접근 단계가 없습니다.')
+                for step in table_steps:
+                    self.assertFalse(step['full_scan'], f'{table} 전체 스캔: {step}')
+
+
+# ── 요율 시뮬레이션 테스트 ──────────────────────────────────────────
+class PayrollSimulationEngineTest(SimpleTestCase):
+
+    def _workforce(self, salaries, minutes, departments=None):
+        import numpy as np
+        from .simulation import Workforce
+        n = len(salaries)
+        return Workforce(
+            employee_ids     = np.arange(n, dtype=np.int64),
+            department_ids   = np.asarray(departments or [1] * n, dtype=np.int64),
+            base_salary      = np.asarray(salaries, dtype=np.int64),
+            overtime_minutes = np.asarray(minutes, dtype=np.int64),
+            dependents       = np.ones(n, dtype=np.int64),
+            fractional       = {},
+        )
+
+    def test_matches_calculator_per_employee(self):
+        from .simulation import simulate, SUMMARY_FIELDS
+        rng = random.Random(7)
+        salaries = [rng.randrange(0, 100_000_001) for _ in range(3000)] + [99996050, 2090000]
+        minutes  = [rng.randrange(0, 6000) for _ in range(3000)] + [80, 20]
+        values = simulate(self._workforce(salaries, minutes))
+        inputs = [PayrollInput(Decimal(s), m) for s, m in zip(salaries, minutes)]
+        for i, r in enumerate(calculator.calculate_many(inputs, engine='decimal')):
+            for field in SUMMARY_FIELDS:
+                self.assertEqual(int(values[field][i]), getattr(r, field), (i, field))
+
+    def test_compare_department_deltas(self):
+        from .simulation import compare
+        wf = self._workforce([3_000_000, 4_000_000, 3_500_000], [0, 0, 0], [1, 1, 2])
+        alt = RateSet(national_pension=Decimal('0.05'))
+        result = compare(wf, calculator.DEFAULT_RATES, alt)
+        # 국민연금 0.5%p 인상: 총지급액 × 0.005
+        self.assertEqual(result['total']['national_pension']['delta'], (3_300_000 + 4_300_000 + 3_800_000) // 200)
+        self.assertEqual(result['total']['gross_pay']['delta'], 0)
+        dev = next(d for d in result['departments'] if d['department_id'] == 1)
+        self.assertEqual(dev['count'], 2)
+        self.assertEqual(dev['net_pay']['delta'], -(3_300_000 + 4_300_000) // 200)
+
+    def test_50k_employees_under_one_second(self):
+        import time
+        from .simulation import compare
+        rng = random.Random(1)
+        n = 50_000
+        wf = self._workforce(
+            [rng.randrange(2_000_000, 10_000_000) for _ in range(n)],
+            [rng.randrange(0, 3000) for _ in range(n)],
+            [rng.randrange(1, 301) for _ in range(n)],
+        )
+        started = time.perf_counter()
+        compare(wf, calculator.DEFAULT_RATES, RateSet(health_insurance=Decimal('0.03595')))
+        self.assertLess(time.perf_counter() - started, 1.0)
+
+
+class WithholdingTableTest(APITestCase):
+    """간이세액표 CSV 변환, mmap 조회, 엔진 연동."""
+
+    CSV = (
+        'lower,upper,1,2,3\n'
+        '1000000,2000000,10000,5000,0\n'
+        '2000000,3000000,40000,30000,20000\n'
+        '3000000,5000000,90000,70000,50000\n'
+    )
+
+    def setUp(self):
+        import tempfile
+        from . import rates
+        tmp = tempfile.mkdtemp()
+        self.csv_path = os.path.join(tmp, 'table.csv')
+        self.bin_path = os.path.join(tmp, 'table.bin')
+        with open(self.csv_path, 'w', encoding='utf-8') as f:
+            f.write(self.CSV)
+        self.addCleanup(rates.clear_cache)
+
+    def _table(self):
+        from .withholding import WithholdingTable
+        WithholdingTable.from_csv(self.csv_path).save(self.bin_path)
+        return WithholdingTable.open(self.bin_path)
+
+    def test_round_trip_and_lookup_rules(self):
+        table = self._table()
+        self.assertEqual(len(table), 3)
+        self.assertEqual(table.dependents, 3)
+        self.assertEqual(table.lookup(999_999), 0)             # 첫 구간 미만
+        self.assertEqual(table.lookup(1_000_000), 10000)
+        self.assertEqual(table.lookup(1_999_999, 2), 5000)
+        self.assertEqual(table.lookup(2_000_000, 3), 20000)
+        self.assertEqual(table.lookup(4_999_999, 1), 90000)
+        self.assertEqual(table.lookup(2_500_000, 7), 20000)    # 가족 수 초과 → 마지막 열
+        self.assertEqual(table.lookup(2_500_000, 0), 40000)    # 1명 미만 → 1명 열
+        with self.assertRaises(ValueError):
+            table.lookup(5_000_000, 1)                         # 1천만원 행이 없는 표의 범위 밖
+
+    def test_lookup_rejects_gap(self):
+        from array import array
+        from .withholding import WithholdingTable
+        table = WithholdingTable(
+            array('q', [1_000_000, 3_000_000]), array('q', [2_000_000, 4_000_000]),
+            array('q', [10000, 90000]), 1,
+        )
+        self.assertEqual(table.lookup(1_999_999), 10000)
+        with self.assertRaises(ValueError):
+            table.lookup(2_500_000)                            # 구간 사이
+        self.assertEqual(table.lookup(3_000_000), 90000)
+
+    def test_statutory_excess_formula(self):
+        from array import array
+        from .simulation import _withholding_tax
+        from .withholding import WithholdingTable
+        import numpy as np
+        # 마지막 행이 1천만원인 표 → 1천만원 초과분은 별표2 산식
+        table = WithholdingTable(
+            array('q', [9_980_000, 10_000_000]), array('q', [10_000_000, 10_000_001]),
+            array('q', [1_500_000, 1_400_000, 1_507_000, 1_407_000]), 2,
+        )
+        self.assertTrue(table.statutory)
+        self.assertEqual(table.lookup(10_000_000, 1), 1_507_000)
+        cases = {
+            12_000_000: 1_507_000 + 25_000 + 2_000_000 * 98 * 35 // 10000,
+            14_000_000: 1_507_000 + 1_397_000,
+            20_000_000: 1_507_000 + 1_397_000 + 6_000_000 * 98 * 38 // 10000,
+            29_000_000: 1_507_000 + 6_610_600 + 1_000_000 * 98 * 40 // 10000,
+            40_000_000: 1_507_000 + 7_394_600 + 10_000_000 * 40 // 100,
+            50_000_000: 1_507_000 + 13_394_600 + 5_000_000 * 42 // 100,
+            100_000_000: 1_507_000 + 31_034_600 + 13_000_000 * 45 // 100,
+        }
+        for pay, expected in cases.items():
+            self.assertEqual(table.lookup(pay, 1), expected, pay)
+        self.assertEqual(table.lookup(12_000_000, 2), cases[12_000_000] - 100_000)
+
+        pays = np.array([0, 9_990_000, 10_000_000, *cases], dtype=np.int64)
+        deps = np.array([1, 2, 1, *[1] * len(cases)], dtype=np.int64)
+        self.assertEqual(
+            _withholding_tax(table, pays, deps).tolist(),
+            [table.lookup(int(p), int(d)) for p, d in zip(pays, deps)],
+        )
+
+    def test_simulation_rejects_out_of_table_pay(self):
+        import numpy as np
+        from .simulation import _withholding_tax
+        table = self._table()
+        with self.assertRaises(ValueError):
+            _withholding_tax(table, np.array([2_000_000, 6_000_000], dtype=np.int64),
+                             np.array([1, 1], dtype=np.int64))
+
+    def test_invalid_csv(self):
+        from .withholding import WithholdingTable
+        with open(self.csv_path, 'w', encoding='utf-8') as f:
+            f.write('lower,upper,1\n2000000,3000000,1\n1000000,2000000,2\n')
+        with self.assertRaises(ValueError):
+            WithholdingTable.from_csv(self.csv_path)
+        with open(self.csv_path, 'w', encoding='utf-8') as f:
+            f.write('lower,upper,1\n1000000,2000000,1\n2500000,3000000,2\n')
+        with self.assertRaisesMessage(ValueError, '비어 있습니다'):
+            WithholdingTable.from_csv(self.csv_path)
+
+    def test_engines_use_table(self):
+        from dataclasses import replace
+        rates = replace(calculator.DEFAULT_RATES, withholding=self._table())
+        # 총지급 3,300,000 - 식대 200,000 = 과세급여 3,100,000 → 3번째 구간
+        inputs = [
+            PayrollInput(Decimal('3000000'), dependents=d, key=d) for d in (1, 2, 3)
+        ] + [PayrollInput(Decimal('500000'), key='low')]
+        for engine in calculator.ENGINES:
+            results = {r.key: r for r in calculator.calculate_many(inputs, rates, engine=engine)}
+            self.assertEqual(results[1].income_tax, 90000, engine)
+            self.assertEqual(results[2].income_tax, 70000, engine)
+            self.assertEqual(results[3].local_income_tax, 5000, engine)
+            self.assertEqual(results['low'].income_tax, 0, engine)
+
+    def test_calculate_uses_configured_table(self):
+        from . import rates
+        from .services import PayrollService
+        self._table()
+        emp = make_employee(make_dept(), make_pos())
+        emp.dependents = 2
+        emp.save()
+        with override_settings(WITHHOLDING_TAX_TABLE=self.bin_path):
+            rates.clear_cache()
+            record = PayrollService.calculate(emp, 2024, 1)
+        self.assertEqual(record.income_tax, Decimal('70000'))
+        self.assertEqual(record.local_income_tax, Decimal('7000'))
+
+    def test_rate_sets_use_their_own_tables(self):
+        from . import rates
+        from .withholding import WithholdingTable
+        self._table()
+        other_path = os.path.join(os.path.dirname(self.bin_path), 'table_2025.bin')
+        with open(self.csv_path, 'w', encoding='utf-8') as f:
+            f.write('lower,upper,1\n0,9000000,12345\n')
+        WithholdingTable.from_csv(self.csv_path).save(other_path)
+        make_rate_set(datetime.date(2025, 1, 1), withholding_table=other_path)
+        make_rate_set(datetime.date(2026, 1, 1))
+
+        with override_settings(WITHHOLDING_TAX_TABLE=self.bin_path):
+            rates.clear_cache()
+            rate_2024 = rates_for_month(2024, 6)
+            rate_2025 = rates_for_month(2025, 6)
+            rate_2026 = rates_for_month(2026, 6)
+            self.assertEqual(rate_2024.withholding.path, self.bin_path)   # 경로 미지정 → settings
+            self.assertEqual(rate_2025.withholding.path, other_path)
+            self.assertEqual(rate_2025.withholding.lookup(3_000_000), 12345)
+            self.assertIs(rate_2026.withholding, rate_2024.withholding)   # 같은 파일은 한 번만 연다
+            self.assertIs(rates.get_rate_table().default.withholding, rate_2024.withholding)
+
+    def test_rate_set_clean_checks_table_path(self):
+        from django.core.exceptions import ValidationError as DjangoValidationError
+        rate_set = PayrollRateSet.objects.get(effective_from=datetime.date(2024, 1, 1))
+        rate_set.withholding_table = os.path.join(os.path.dirname(self.bin_path), 'missing.bin')
+        with self.assertRaises(DjangoValidationError):
+            rate_set.clean()
+
+    def test_command_builds_table(self):
+        from io import StringIO
+        from django.core.management import call_command
+        out = StringIO()
+        call_command(
+            'build_withholding_table', self.csv_path,
+            output=self.bin_path, benchmark=1000, stdout=out,
+        )
+        self.assertIn('구간 3개', out.getvalue())
+        self.assertIn('1,000건', out.getvalue())
+        self.assertTrue(os.path.exists(self.bin_path))
+
+    def test_lookup_throughput(self):
+        import time
+        table = self._table()
+        rng = random.Random(3)
+        pays = [rng.randrange(0, 5_000_000) for _ in range(200_000)]
+        lookup = table.lookup
+        started = time.perf_counter()
+        for pay in pays:
+            lookup(pay, 2)
+        # 개발 환경 기준 100만 건/초 이상. CI 편차를 고려해 여유 있게 검사한다
+        self.assertLess(time.perf_counter() - started, 1.0)
+
+
+class PayrollSimulationViewTest(APITestCase):
+
+    def setUp(self):
+        dev = make_dept('개발팀', 'DEV')
+        hr  = Department.objects.create(name='인사팀', code='HR')
+        pos = make_pos()
+        self.emp1 = make_employee(dev, pos, 'EMP001', '홍길동', '3000000')
+        self.emp2 = make_employee(hr,  pos, 'EMP002', '이영희', '4000000')
+        AttendanceRecord.objects.create(
+            employee=self.emp1, work_date=datetime.date(2024, 1, 3), overtime_minutes=150,
+        )
+        make_user('hr_sim', role='HR_MANAGER')
+        make_user('emp_sim', role='EMPLOYEE', employee=self.emp1)
+        auth(self.client, get_token(self.client, 'hr_sim'))
+
+    def _post(self, rates, **extra):
+        return self.client.post(
+            SIMULATE_URL, {'year': 2024, 'month': 1, 'rates': rates, **extra}, format='json',
+        )
+
+    def test_simulate_returns_totals_and_persists_nothing(self):
+        res = self._post({'income_tax': '0.03'})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        data = res.data['data']
+        self.assertEqual(data['employee_count'], 2)
+        # 현행 기준선은 PayrollService.calculate 결과 합계와 같아야 함
+        self.assertEqual(data['total']['net_pay']['baseline'], 2964815 + 3801239)
+        self.assertEqual(
+            data['total']['income_tax']['delta'],
+            sum(g * 3 // 100 - g * 2 // 100 for g in (3353827, 4300000)),
+        )
+        self.assertEqual(len(data['departments']), 2)
+        self.assertFalse(PayrollRecord.objects.exists())
+
+    def test_simulate_department_filter(self):
+        dept = self.emp2.department_id
+        res = self._post({}, department=dept)
+        data = res.data['data']
+        self.assertEqual(data['employee_count'], 1)
+        self.assertEqual(data['departments'][0]['name'], '인사팀')
+        self.assertEqual(data['total']['net_pay']['delta'], 0)
+
+    def test_simulate_invalid_rate_fails(self):
+        res = self._post({'national_pension': '2'})
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(res.data['success'])
+
+    def test_simulate_requires_hr_permission(self):
+        auth(self.client, get_token(self.client, 'emp_sim'))
+        res = self._post({})
+        self.assertEqual(res.status_code, status.HTTP_403_FORBIDDEN)
+
+
 # ── 급여 목록 테스트 ─────────────────────────────────────────────────
 class PayrollListTest(APITestCase):
 
@@ -173,6 +971,28 @@ class PayrollListTest(APITestCase):
         self.assertEqual(len(res.data['data']), 1)
         self.assertEqual(res.data['data'][0]['month'], 1)
 
+    def test_list_cursor_follows_period_ordering(self):
+        pos = make_pos('대리', 2)
+        others = [
+            make_employee(self.emp_obj.department, pos, f'EMP{i:03d}', f'직원{i}')
+            for i in range(2, 5)
+        ]
+        for emp in [self.emp_obj] + others:
+            for month in (1, 2, 3):
+                PayrollRecord.objects.get_or_create(
+                    employee=emp, year=2024, month=month,
+                    defaults={'base_salary': '3000000'},
+                )
+        keys, cursor = [], None
+        while True:
+            res = self.client.get(LIST_URL, {'page_size': 5, **({'cursor': cursor} if cursor else {})})
+            keys += [(r['year'], r['month'], r['employee']) for r in res.data['data']]
+            cursor = res.data['next']
+            if not cursor:
+                break
+        self.assertEqual(len(keys), 12)
+        self.assertEqual(keys, sorted(keys, key=lambda k: (-k[0], -k[1], k[2])))
+
     def test_employee_cannot_access_list(self):
         auth(self.client, get_token(self.client, 'emp2'))
         res = self.client.get(LIST_URL)
@@ -276,10 +1096,88 @@ class PayrollConfirmTest(APITestCase):
         self.assertEqual(res.status_code, status.HTTP_403_FORBIDDEN)
 
 
+class PayrollConfirmBulkTest(APITestCase):
+
+    def setUp(self):
+        self.dev = make_dept('개발팀', 'DEV')
+        self.hr  = Department.objects.create(name='인사팀', code='HR')
+        pos = make_pos()
+        self.admin = make_user('admin_bulk', role='ADMIN')
+        make_user('hr_bulk', role='HR_MANAGER')
+        self.records = []
+        for i, dept in enumerate([self.dev, self.dev, self.dev, self.hr]):
+            emp = make_employee(dept, pos, f'EMP{i:03d}', f'직원{i}')
+            self.records.append(PayrollRecord.objects.create(
+                employee=emp, year=2024, month=5,
+                base_salary='3000000', gross_pay='3300000',
+                total_deduction='300000', net_pay='3000000',
+            ))
+        # 다른 달 레코드는 확정되지 않아야 함
+        self.other_month = PayrollRecord.objects.create(
+            employee=self.records[0].employee, year=2024, month=6,
+            base_salary='3000000', gross_pay='3300000',
+            total_deduction='300000', net_pay='3000000',
+        )
+        auth(self.client, get_token(self.client, 'admin_bulk'))
+
+    def _post(self, data):
+        return self.client.post(CONFIRM_BULK_URL, data, format='json')
+
+    def test_confirms_month_with_single_update(self):
+        from .services import PayrollService
+        PayrollService.confirm(self.records[0], confirmed_by=self.admin)
+        # SAVEPOINT + 조건부 UPDATE + 확정 건수 COUNT
+        # + 연간 누계 갱신(집계 SELECT + SAVEPOINT + upsert + 정리 DELETE + RELEASE) + 대장 버전 UPDATE + RELEASE
+        with self.assertNumQueries(10):
+            summary = PayrollService.confirm_bulk(2024, 5, confirmed_by=self.admin)
+        self.assertEqual(summary['confirmed'], 3)
+        self.assertEqual(summary['already_confirmed'], 1)
+
+        stamps = set(
+            PayrollRecord.objects.filter(pk__in=[r.pk for r in self.records[1:]])
+            .values_list('confirmed_by_id', 'confirmed_at')
+        )
+        self.assertEqual(len(stamps), 1)
+        self.assertEqual(next(iter(stamps))[0], self.admin.id)
+        self.other_month.refresh_from_db()
+        self.assertEqual(self.other_month.status, PayrollRecord.Status.DRAFT)
+
+    def test_department_and_ids_filters(self):
+        res = self._post({'year': 2024, 'month': 5, 'department': self.hr.id})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data['data']['confirmed'], 1)
+
+        ids = [self.records[0].id, self.records[3].id, self.other_month.id, 999999]
+        res = self._post({'year': 2024, 'month': 5, 'ids': ids})
+        data = res.data['data']
+        self.assertEqual((data['confirmed'], data['already_confirmed'], data['not_found']), (1, 1, 2))
+        self.assertEqual(
+            PayrollRecord.objects.filter(status=PayrollRecord.Status.CONFIRMED).count(), 2,
+        )
+
+    def test_repeat_confirms_nothing(self):
+        self._post({'year': 2024, 'month': 5})
+        res = self._post({'year': 2024, 'month': 5})
+        self.assertEqual(res.data['data']['confirmed'], 0)
+        self.assertEqual(res.data['data']['already_confirmed'], 4)
+        self.assertIsNone(res.data['data']['confirmed_at'])
+
+    def test_validation_and_permission(self):
+        self.assertFalse(self._post({'year': 2024}).data['success'])
+        self.assertFalse(self._post({'year': 2024, 'month': 13}).data['success'])
+        self.assertFalse(self._post({'year': 2024, 'month': 5, 'ids': 'abc'}).data['success'])
+        auth(self.client, get_token(self.client, 'hr_bulk'))
+        res = self._post({'year': 2024, 'month': 5})
+        self.assertEqual(res.status_code, status.HTTP_403_FORBIDDEN)
+
+
 # ── 급여대장 테스트 ──────────────────────────────────────────────────
-class PayrollLedgerTest(APITestCase):
+class LedgerFixtureMixin:
+    """급여대장 테스트 공통 데이터: 2024년 5월 개발팀 2명, 인사팀 1명."""
 
     def setUp(self):
+        # 테스트 간 롤백은 캐시 stamp를 되돌리지 않으므로 비워두고 시작
+        cache.clear()
         dept1 = make_dept('개발팀', 'DEV')
         dept2 = Department.objects.create(name='인사팀', code='HR')
         pos   = make_pos()
@@ -307,6 +1205,9 @@ class PayrollLedgerTest(APITestCase):
 
         auth(self.client, get_token(self.client, 'hr5'))
 
+
+class PayrollLedgerTest(LedgerFixtureMixin, APITestCase):
+
     def test_ledger_success(self):
         res = self.client.get(LEDGER_URL, {'year': 2024, 'month': 5})
         self.assertEqual(res.status_code, status.HTTP_200_OK)
@@ -334,6 +1235,34 @@ class PayrollLedgerTest(APITestCase):
         self.assertIn('employee_no',   dev['records'][0])
         self.assertIn('position_name', dev['records'][0])
 
+    def test_ledger_records_match_serializer(self):
+        from .serializers import LedgerRecordSerializer
+        res  = self.client.get(LEDGER_URL, {'year': 2024, 'month': 5})
+        rows = [r for d in res.data['data']['departments'] for r in d['records']]
+        expected = LedgerRecordSerializer(
+            PayrollRecord.objects.filter(year=2024, month=5)
+            .order_by('employee__department__name', 'employee__employee_no'),
+            many=True,
+        ).data
+        self.assertEqual(rows, [dict(r) for r in expected])
+
+    def test_ledger_query_count(self):
+        from .ledger import build_ledger
+        with self.assertNumQueries(2):  # 부서 소계 GROUP BY + 명세 values()
+            data = build_ledger(2024, 5)
+        self.assertEqual(data['total_count'], 3)
+        with self.assertNumQueries(1):
+            summary = build_ledger(2024, 5, detail=False)
+        self.assertEqual(summary['total_net_pay'], data['total_net_pay'])
+
+    def test_ledger_subtotals_only(self):
+        res  = self.client.get(LEDGER_URL, {'year': 2024, 'month': 5, 'detail': 'false'})
+        data = res.data['data']
+        self.assertEqual(Decimal(data['total_gross_pay']), Decimal('11400000'))
+        dev = next(d for d in data['departments'] if d['name'] == '개발팀')
+        self.assertEqual(Decimal(dev['subtotal_net_pay']), Decimal('6840000'))
+        self.assertNotIn('records', dev)
+
     def test_ledger_empty_month(self):
         res  = self.client.get(LEDGER_URL, {'year': 2024, 'month': 6})
         data = res.data['data']
@@ -357,3 +1286,563 @@ class PayrollLedgerTest(APITestCase):
         self.client.credentials()
         res = self.client.get(LEDGER_URL, {'year': 2024, 'month': 5})
         self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class PayrollLedgerExportTest(LedgerFixtureMixin, APITestCase):
+    """급여대장 CSV/XLSX 내보내기."""
+
+    def _get(self, **params):
+        return self.client.get(EXPORT_URL, {'year': 2024, 'month': 5, **params})
+
+    def _csv_rows(self, res):
+        import csv
+        import io
+        body = b''.join(res.streaming_content).decode('utf-8')
+        self.assertTrue(body.startswith('\ufeff'))
+        return list(csv.reader(io.StringIO(body[1:])))
+
+    def test_csv_with_inline_subtotals(self):
+        res = self._get(format='csv')
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertTrue(res.streaming)
+        self.assertIn('attachment; filename="payroll_ledger_202405.csv"', res['Content-Disposition'])
+        rows = self._csv_rows(res)
+        self.assertEqual(rows[0][:3], ['부서', '사번', '이름'])
+        self.assertEqual(
+            [(r[0], r[1]) for r in rows[1:]],
+            [('개발팀', 'EMP001'), ('개발팀', 'EMP002'), ('개발팀', '소계'),
+             ('인사팀', 'EMP003'), ('인사팀', '소계'), ('합계', '')],
+        )
+        gross = rows[0].index('총지급액')
+        self.assertEqual(Decimal(rows[3][gross]), Decimal('7600000'))
+        self.assertEqual(rows[3][2], '2명')
+        self.assertEqual(Decimal(rows[-1][gross]), Decimal('11400000'))
+        self.assertEqual(Decimal(rows[-1][rows[0].index('실수령액')]), Decimal('10260000'))
+
+    def test_xlsx_matches_csv(self):
+        import io
+        from openpyxl import load_workbook
+        csv_rows = self._csv_rows(self._get(format='csv'))
+        res = self._get(format='xlsx')
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertIn('spreadsheetml', res['Content-Type'])
+        ws = load_workbook(io.BytesIO(b''.join(res.streaming_content)), read_only=True).active
+        xlsx_rows = [['' if v is None else v for v in row] for row in ws.iter_rows(values_only=True)]
+        self.assertEqual(len(xlsx_rows), len(csv_rows))
+        gross = csv_rows[0].index('총지급액')
+        for x, c in zip(xlsx_rows[1:], csv_rows[1:]):
+            self.assertEqual(x[1], c[1])
+            self.assertEqual(Decimal(str(x[gross])), Decimal(c[gross]))
+
+    def test_rows_read_in_keyset_chunks(self):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        from . import export
+        expected = list(export.ledger_rows(2024, 5))
+        with CaptureQueriesContext(connection) as ctx:
+            rows = list(export.ledger_rows(2024, 5, chunk_size=1))
+        self.assertEqual(rows, expected)
+        # 명세 3행 → LIMIT 1 쿼리 3회 + 끝 확인 1회, 같은 부서 안은 사번 키로 이어 읽는다
+        self.assertEqual(len(ctx.captured_queries), 4)
+        for query in ctx.captured_queries:
+            self.assertIn('LIMIT 1', query['sql'])
+
+    def test_empty_month_has_total_row_only(self):
+        rows = self._csv_rows(self._get(month=6))
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[1][:3], ['합계', '', '0명'])
+
+    def test_invalid_format_and_permission(self):
+        res = self._get(format='pdf')
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(res.data['success'])
+        auth(self.client, get_token(self.client, 'emp6'))
+        self.assertEqual(self._get(format='csv').status_code, status.HTTP_403_FORBIDDEN)
+
+
+class PayrollLedgerCacheTest(LedgerFixtureMixin, APITestCase):
+
+    def setUp(self):
+        super().setUp()
+        from . import ledger_cache
+        ledger_cache.reset_stats()
+        self.admin = make_user('admin_cache', role='ADMIN')
+
+    def _get(self, **headers):
+        return self.client.get(LEDGER_URL, {'year': 2024, 'month': 5}, **headers)
+
+    def test_hit_after_miss_and_stats(self):
+        first = self._get()
+        self.assertEqual(first['X-Cache'], 'MISS')
+        with self.assertNumQueries(2):  # 인증 사용자 + 대장 버전, 대장 쿼리 없음
+            second = self._get()
+        self.assertEqual(second['X-Cache'], 'HIT')
+        self.assertEqual(second.data, first.data)
+        self.assertEqual(first['ETag'], second['ETag'])
+
+        auth(self.client, get_token(self.client, 'admin_cache'))
+        res = self.client.get('/api/v1/payroll/reports/ledger/cache-stats/')
+        self.assertEqual((res.data['data']['hits'], res.data['data']['misses']), (1, 1))
+        self.assertEqual(res.data['data']['hit_rate'], 0.5)
+
+    def test_conditional_requests_return_304(self):
+        res = self._get()
+        not_modified = self._get(HTTP_IF_NONE_MATCH=res['ETag'])
+        self.assertEqual(not_modified.status_code, status.HTTP_304_NOT_MODIFIED)
+        not_modified = self._get(HTTP_IF_MODIFIED_SINCE=res['Last-Modified'])
+        self.assertEqual(not_modified.status_code, status.HTTP_304_NOT_MODIFIED)
+        # detail 옵션은 별도 ETag
+        summary = self.client.get(LEDGER_URL, {'year': 2024, 'month': 5, 'detail': 'false'})
+        self.assertNotEqual(summary['ETag'], res['ETag'])
+
+    def test_invalidated_by_record_changes(self):
+        from .services import PayrollService
+        etag = self._get()['ETag']
+
+        # 단건 확정(save) → 같은 월 무효화
+        record = PayrollRecord.objects.get(employee=self.emp1, year=2024, month=5)
+        PayrollService.confirm(record, confirmed_by=None)
+        res = self._get(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res['X-Cache'], 'MISS')
+        statuses = {r['employee_no']: r['status'] for d in res.data['data']['departments'] for r in d['records']}
+        self.assertEqual(statuses['EMP001'], 'CONFIRMED')
+
+        # 일괄 확정(QuerySet.update)
+        etag = res['ETag']
+        PayrollService.confirm_bulk(2024, 5, confirmed_by=None)
+        self.assertNotEqual(self._get()['ETag'], etag)
+
+        # 다른 달 변경은 영향 없음
+        etag = self._get()['ETag']
+        PayrollRecord.objects.create(
+            employee=self.emp1, year=2024, month=6, base_salary='3000000',
+        )
+        self.assertEqual(self._get(HTTP_IF_NONE_MATCH=etag).status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_invalidated_by_other_process(self):
+        from django.core.cache.backends.locmem import LocMemCache
+        from . import ledger_cache
+        from .services import PayrollService
+        res = self._get()
+        # 작업 워커·관리 명령처럼 캐시 메모리를 공유하지 않는 프로세스에서 일괄 확정
+        with patch.object(ledger_cache, 'cache', LocMemCache('other-process', {})):
+            PayrollService.confirm_bulk(2024, 5, confirmed_by=None)
+        stale = self._get(HTTP_IF_NONE_MATCH=res['ETag'])
+        self.assertEqual(stale.status_code, status.HTTP_200_OK)
+        self.assertEqual(stale['X-Cache'], 'MISS')
+        statuses = {r['status'] for d in stale.data['data']['departments'] for r in d['records']}
+        self.assertEqual(statuses, {'CONFIRMED'})
+
+    def test_invalidated_by_bulk_run_and_employee_rename(self):
+        from .services import PayrollService
+        res = self.client.get(LEDGER_URL, {'year': 2024, 'month': 7})
+        self.assertEqual(res.data['data']['total_count'], 0)
+        PayrollService.run_month(2024, 7)
+        res = self.client.get(LEDGER_URL, {'year': 2024, 'month': 7})
+        self.assertEqual(res.data['data']['total_count'], 3)
+
+        self.emp1.name = '홍길순'
+        self.emp1.save()
+        res = self._get()
+        self.assertEqual(res['X-Cache'], 'MISS')
+        self.assertIn('홍길순', str(res.data['data']))
+
+
+class PayrollAnnualReportTest(LedgerFixtureMixin, APITestCase):
+    """연간 누계(PayrollYearToDate) 갱신과 연간 리포트."""
+
+    def setUp(self):
+        super().setUp()
+        from .services import PayrollService
+        self.admin = make_user('admin_annual', role='ADMIN')
+        # 6월: 홍길동·박민수만
+        for emp, gross, ded in [(self.emp1, '3000000', '300000'), (self.emp3, '3500000', '350000')]:
+            PayrollRecord.objects.create(
+                employee=emp, year=2024, month=6, base_salary=emp.base_salary,
+                gross_pay=gross, total_deduction=ded, net_pay=str(Decimal(gross) - Decimal(ded)),
+                overtime_minutes=60,
+            )
+        record = PayrollRecord.objects.get(employee=self.emp1, year=2024, month=5)
+        PayrollService.confirm(record, confirmed_by=self.admin)   # 단건 확정 (시그널)
+        PayrollService.confirm_bulk(2024, 5, confirmed_by=self.admin)
+        PayrollService.confirm_bulk(2024, 6, confirmed_by=self.admin, ids=[
+            PayrollRecord.objects.get(employee=self.emp1, year=2024, month=6).id,
+        ])
+
+    def _ytd(self):
+        return {
+            row.employee.employee_no: row
+            for row in PayrollYearToDate.objects.filter(year=2024).select_related('employee')
+        }
+
+    def test_year_to_date_updated_on_confirm(self):
+        ytd = self._ytd()
+        self.assertEqual(ytd['EMP001'].months, 2)
+        self.assertEqual(ytd['EMP001'].gross_pay, Decimal('6300000'))
+        self.assertEqual(ytd['EMP001'].overtime_minutes, 60)
+        # 박민수 6월은 초안이라 누계에 포함되지 않음
+        self.assertEqual(ytd['EMP003'].months, 1)
+        self.assertEqual(ytd['EMP003'].gross_pay, Decimal('3800000'))
+
+        # 다시 확정해도(이미 확정) 누계가 두 번 더해지지 않음
+        from .services import PayrollService
+        PayrollService.confirm_bulk(2024, 5, confirmed_by=self.admin)
+        self.assertEqual(self._ytd()['EMP001'].gross_pay, Decimal('6300000'))
+
+        # 확정 급여 삭제 시 해당 직원 누계 재계산, 남은 확정 급여가 없으면 행 삭제
+        PayrollRecord.objects.filter(employee=self.emp2, year=2024, month=5).get().delete()
+        self.assertNotIn('EMP002', self._ytd())
+
+    def test_rebuild_matches_incremental(self):
+        from django.core.management import call_command
+        from .services import YearToDateService
+        fields = ['employee_id', 'months', *YearToDateService.FIELDS]
+        before = list(PayrollYearToDate.objects.order_by('employee_id').values(*fields))
+        PayrollYearToDate.objects.all().delete()
+        call_command('rebuild_payroll_ytd', '--year', '2024', stdout=open(os.devnull, 'w'))
+        after = list(PayrollYearToDate.objects.order_by('employee_id').values(*fields))
+        self.assertEqual(before, after)
+
+    def test_report_with_department_rollup(self):
+        with self.assertNumQueries(2):  # 부서 소계 + 직원 누계
+            from . import annual
+            data = annual.build_report(2024)
+        self.assertEqual(data['total_count'], 3)
+        self.assertEqual(data['totals']['gross_pay'], '14400000.00')
+        dev = data['departments'][0]
+        self.assertEqual((dev['name'], dev['count']), ('개발팀', 2))
+        self.assertEqual(dev['totals']['gross_pay'], '10600000.00')
+        self.assertEqual([e['employee_no'] for e in dev['employees']], ['EMP001', 'EMP002'])
+        self.assertEqual(dev['employees'][0]['months'], 2)
+
+        res = self.client.get(ANNUAL_URL, {'year': 2024, 'department': self.emp3.department_id,
+                                           'detail': 'false'})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        data = res.data['data']
+        self.assertEqual(data['total_count'], 1)
+        self.assertNotIn('employees', data['departments'][0])
+
+    def test_rows_read_in_keyset_chunks(self):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        from . import annual
+        expected = list(annual.detail_rows(2024))
+        with CaptureQueriesContext(connection) as ctx:
+            rows = list(annual.detail_rows(2024, chunk_size=1))
+        self.assertEqual(rows, expected)
+        self.assertEqual([r['employee_no'] for r in rows], ['EMP001', 'EMP002', 'EMP003'])
+        self.assertEqual(len(ctx.captured_queries), len(rows) + 1)
+
+    def test_csv_export(self):
+        import csv
+        import io
+        res = self.client.get(ANNUAL_EXPORT_URL, {'year': 2024})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertTrue(res.streaming)
+        self.assertIn('payroll_annual_2024.csv', res['Content-Disposition'])
+        rows = list(csv.reader(io.StringIO(b''.join(res.streaming_content).decode('utf-8')[1:])))
+        self.assertEqual(
+            [(r[0], r[1]) for r in rows[1:]],
+            [('개발팀', 'EMP001'), ('개발팀', 'EMP002'), ('개발팀', '소계'),
+             ('인사팀', 'EMP003'), ('인사팀', '소계'), ('합계', '')],
+        )
+        gross = rows[0].index('총지급액')
+        self.assertEqual(rows[1][rows[0].index('확정월수')], '2')
+        self.assertEqual(Decimal(rows[-1][gross]), Decimal('14400000'))
+
+    def test_validation_and_permission(self):
+        self.assertFalse(self.client.get(ANNUAL_URL).data['success'])
+        self.assertFalse(self.client.get(ANNUAL_URL, {'year': 'x'}).data['success'])
+        self.assertFalse(self.client.get(ANNUAL_URL, {'year': 2024, 'department': 'a'}).data['success'])
+        auth(self.client, get_token(self.client, 'emp6'))
+        self.assertEqual(self.client.get(ANNUAL_URL, {'year': 2024}).status_code, status.HTTP_403_FORBIDDEN)
+
+
+class PayrollVarianceTest(APITestCase):
+    """전월 대비 급여 변동 리포트."""
+
+    def setUp(self):
+        dept = make_dept()
+        pos  = make_pos()
+        make_user('hr_var', role='HR_MANAGER')
+        # (사번, 4월 (총지급, 실수령, 초과분), 5월 (총지급, 실수령, 초과분))
+        for no, april, may in [
+            ('EMP001', ('3000000', '2700000', 0),   ('3050000', '2745000', 0)),     # 기준 미만
+            ('EMP002', ('3000000', '2700000', 0),   ('3500000', '3150000', 0)),     # 총지급 +50만
+            ('EMP003', ('3000000', '2700000', 0),   ('3000000', '2500000', 0)),     # 실수령 -20만
+            ('EMP004', ('3000000', '2700000', 900), ('3000000', '2700000', 100)),   # 초과근무 -800분
+            ('EMP005', None,                        ('2800000', '2520000', 0)),     # 5월 입사
+            ('EMP006', ('3000000', '2700000', 0),   None),                          # 4월 퇴사
+        ]:
+            emp = make_employee(dept, pos, no, no)
+            for month, values in ((4, april), (5, may)):
+                if values:
+                    gross, net, minutes = values
+                    PayrollRecord.objects.create(
+                        employee=emp, year=2024, month=month, base_salary='3000000',
+                        gross_pay=gross, net_pay=net, overtime_minutes=minutes,
+                        total_deduction=str(Decimal(gross) - Decimal(net)),
+                    )
+        auth(self.client, get_token(self.client, 'hr_var'))
+
+    def _nos(self, data):
+        return [r['employee_no'] for r in data['rows']]
+
+    def test_single_query_with_default_thresholds(self):
+        from . import variance
+        with self.assertNumQueries(1):
+            data = variance.build_variance(2024, 5)
+        # 총지급 변동 크기 순, 같은 크기는 사번 순, 신규 입사자는 맨 뒤
+        self.assertEqual(self._nos(data), ['EMP002', 'EMP003', 'EMP004', 'EMP005'])
+        row = data['rows'][0]
+        self.assertEqual(row['delta']['gross_pay'], '500000.00')
+        self.assertEqual(row['previous']['gross_pay'], '3000000.00')
+        self.assertEqual(data['rows'][2]['delta']['overtime_minutes'], -800)
+        self.assertTrue(data['rows'][3]['is_new'])
+        self.assertIsNone(data['rows'][3]['delta'])
+        self.assertFalse(data['truncated'])
+
+    def test_thresholds_sort_and_limit_params(self):
+        res = self.client.get(VARIANCE_URL, {'year': 2024, 'month': 5, 'gross': 10000})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertIn('EMP001', self._nos(res.data['data']))
+        self.assertEqual(res.data['data']['thresholds']['gross_pay'], 10000)
+
+        res = self.client.get(VARIANCE_URL, {'year': 2024, 'month': 5, 'sort': 'net'})
+        self.assertEqual(self._nos(res.data['data'])[:2], ['EMP002', 'EMP003'])
+
+        res = self.client.get(VARIANCE_URL, {'year': 2024, 'month': 5, 'sort': 'overtime', 'limit': 1})
+        self.assertEqual(self._nos(res.data['data']), ['EMP004'])
+        self.assertTrue(res.data['data']['truncated'])
+
+    def test_january_compares_with_previous_december(self):
+        from . import variance
+        self.assertEqual(variance.previous_month(2024, 1), (2023, 12))
+        emp = Employee.objects.get(employee_no='EMP001')
+        for year, month, gross in [(2023, 12, '3000000'), (2024, 1, '4000000')]:
+            PayrollRecord.objects.create(
+                employee=emp, year=year, month=month, base_salary='3000000',
+                gross_pay=gross, net_pay=gross,
+            )
+        data = variance.build_variance(2024, 1)
+        self.assertEqual(self._nos(data), ['EMP001'])
+        self.assertEqual(data['rows'][0]['delta']['gross_pay'], '1000000.00')
+
+    def test_validation_and_permission(self):
+        for params in [{'year': 2024}, {'year': 2024, 'month': 13},
+                       {'year': 2024, 'month': 5, 'gross': '-1'},
+                       {'year': 2024, 'month': 5, 'sort': 'tax'},
+                       {'year': 2024, 'month': 5, 'limit': 0}]:
+            self.assertFalse(self.client.get(VARIANCE_URL, params).data['success'], params)
+        make_user('emp_var')
+        auth(self.client, get_token(self.client, 'emp_var'))
+        res = self.client.get(VARIANCE_URL, {'year': 2024, 'month': 5})
+        self.assertEqual(res.status_code, status.HTTP_403_FORBIDDEN)
+
+
+
+class PayrollBankTransferTest(LedgerFixtureMixin, APITestCase):
+    """확정 급여 대량이체 파일 (고정길이 / CSV)."""
+
+    def setUp(self):
+        super().setUp()
+        for emp, code, account, holder in [
+            (self.emp1, '004', '11012345678901', ''),
+            (self.emp2, '088', '1002987654321', '주식회사한국급여지급대행'),
+        ]:
+            emp.bank_code, emp.bank_account_no, emp.account_holder = code, encrypt(account), holder
+            emp.save()
+        # 개발팀 2명만 확정, 인사팀(계좌 없음)은 DRAFT
+        PayrollRecord.objects.filter(employee__in=[self.emp1, self.emp2]).update(
+            status=PayrollRecord.Status.CONFIRMED,
+        )
+        make_user('admin7', role='ADMIN')
+        auth(self.client, get_token(self.client, 'admin7'))
+
+    def _get(self, **params):
+        return self.client.get(BANK_TRANSFER_URL, {'year': 2024, 'month': 5, **params})
+
+    @staticmethod
+    def _checksum(rows):
+        import hashlib
+        raw = ''.join(f'{code}|{account}|{amount}\n' for code, account, amount in rows)
+        return hashlib.sha256(raw.encode()).hexdigest()[:32].upper()
+
+    def test_fixed_width_file(self):
+        from . import bank_transfer
+        res = self._get()
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertTrue(res.streaming)
+        self.assertIn('attachment; filename="bank_transfer_202405.txt"', res['Content-Disposition'])
+
+        lines = b''.join(res.streaming_content).split(b'\r\n')
+        self.assertEqual(lines[-1], b'')
+        records = lines[:-1]
+        self.assertTrue(all(len(r) == bank_transfer.RECORD_LENGTH for r in records))
+        self.assertEqual([r[:1] for r in records], [b'H', b'D', b'D', b'T'])
+        self.assertEqual(records[0][1:7], b'202405')
+
+        first, second = records[1], records[2]
+        self.assertEqual(first[1:7], b'000001')
+        self.assertEqual(first[7:10], b'004')
+        self.assertEqual(first[10:26].rstrip(), b'11012345678901')
+        self.assertEqual(first[26:46].decode('cp949').rstrip(), '홍길동')
+        self.assertEqual(int(first[46:59]), 2970000)
+        self.assertEqual(first[59:79].rstrip(), b'EMP001')
+        # 예금주는 CP949 20바이트(한글 10자)에서 잘린다
+        self.assertEqual(second[26:46].decode('cp949'), '주식회사한국급여지급')
+
+        trailer = records[3]
+        self.assertEqual(int(trailer[1:7]), 2)
+        self.assertEqual(int(trailer[7:22]), 2970000 + 3870000)
+        self.assertEqual(
+            trailer[22:54].decode(),
+            self._checksum([('004', '11012345678901', 2970000), ('088', '1002987654321', 3870000)]),
+        )
+
+    def test_csv_file_has_same_checksum(self):
+        import csv
+        import io
+        res = self._get(format='csv')
+        self.assertIn('bank_transfer_202405.csv', res['Content-Disposition'])
+        body = b''.join(res.streaming_content).decode('utf-8')
+        rows = list(csv.reader(io.StringIO(body[1:])))
+        self.assertEqual(rows[0][:3], ['순번', '은행코드', '계좌번호'])
+        self.assertEqual(rows[1][:5], ['1', '004', '11012345678901', '홍길동', '2970000'])
+        self.assertEqual(rows[2][3], '주식회사한국급여지급대행')
+        self.assertEqual(rows[3][:3], ['TRAILER', '2', '6840000'])
+        self.assertEqual(
+            rows[3][3],
+            self._checksum([('004', '11012345678901', 2970000), ('088', '1002987654321', 3870000)]),
+        )
+
+    def test_rows_decrypted_per_chunk(self):
+        """chunk 경계와 관계없이 같은 행 (chunk마다 복호화)"""
+        from . import bank_transfer
+        rows = list(bank_transfer.transfer_rows(2024, 5, chunk_size=1))
+        self.assertEqual([r['account_no'] for r in rows], ['11012345678901', '1002987654321'])
+        self.assertEqual(rows, list(bank_transfer.transfer_rows(2024, 5)))
+
+    def test_missing_account_blocks_file(self):
+        PayrollRecord.objects.filter(employee=self.emp3).update(status=PayrollRecord.Status.CONFIRMED)
+        res = self._get()
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(res.data['data']['missing_accounts'], ['EMP003'])
+        self.assertIn('EMP003', res.data['message'])
+
+    def test_undecryptable_account_blocks_file(self):
+        from apps.utils.encryption import decrypt_many
+        from . import bank_transfer
+        # 다른 SECRET_KEY로 암호화된 계좌번호
+        with override_settings(SECRET_KEY='another-secret-key'):
+            foreign = encrypt('3333012345678')
+        self.assertEqual(decrypt_many([foreign, '', encrypt('1')]), [None, '', '1'])
+        Employee.objects.filter(pk=self.emp1.pk).update(bank_account_no=foreign)
+
+        res = self._get()
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(res.data['data']['invalid_accounts'], ['EMP001'])
+        self.assertIn('EMP001', res.data['message'])
+        # 확인 뒤 바뀐 경우에도 빈 계좌번호로 이체 파일을 만들지 않는다
+        with self.assertRaises(ValueError):
+            list(bank_transfer.transfer_rows(2024, 5))
+
+    def test_empty_month_and_validation(self):
+        res = self._get(month=6, format='csv')
+        body = b''.join(res.streaming_content).decode('utf-8')
+        self.assertTrue(body.rstrip().endswith('TRAILER,0,0,' + self._checksum([])))
+
+        self.assertEqual(self._get(format='xlsx').status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self._get(month=13).status_code, status.HTTP_400_BAD_REQUEST)
+
+        auth(self.client, get_token(self.client, 'hr5'))
+        self.assertEqual(self._get().status_code, status.HTTP_403_FORBIDDEN)
+
+
+@override_settings(PAYSLIP_RENDER_WORKERS=1, PAYSLIP_FONT_PATH='')
+class PayrollPayslipBatchTest(LedgerFixtureMixin, APITestCase):
+    """확정 급여명세서 PDF 일괄 생성 (ZIP 스트리밍 / 백그라운드 작업)."""
+
+    def setUp(self):
+        super().setUp()
+        # 개발팀 2명만 확정
+        PayrollRecord.objects.filter(employee__in=[self.emp1, self.emp2]).update(
+            status=PayrollRecord.Status.CONFIRMED,
+        )
+
+    @staticmethod
+    def _zip(data: bytes):
+        import io
+        import zipfile
+        archive = zipfile.ZipFile(io.BytesIO(data))
+        return archive, archive.namelist()
+
+    def test_rows_read_in_keyset_chunks(self):
+        from . import payslip
+        PayrollRecord.objects.filter(year=2024, month=5).update(status=PayrollRecord.Status.CONFIRMED)
+        expected = list(payslip.payslip_rows(2024, 5))
+        with self.assertNumQueries(len(expected) + 1):
+            rows = list(payslip.payslip_rows(2024, 5, chunk_size=1))
+        self.assertEqual(rows, expected)
+        self.assertEqual([r['employee_no'] for r in rows], ['EMP001', 'EMP002', 'EMP003'])
+
+    def test_zip_stream_of_confirmed_payslips(self):
+        from . import payslip
+        # 다운로드 API는 작업자 설정과 무관하게 요청 스레드에서 그린다 (요청마다 프로세스 풀을 띄우지 않음)
+        with override_settings(PAYSLIP_RENDER_WORKERS=4), \
+                patch.object(payslip, 'ProcessPoolExecutor', side_effect=AssertionError('process pool in request')):
+            res = self.client.get(PAYSLIPS_URL, {'year': 2024, 'month': 5})
+            data = b''.join(res.streaming_content)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertTrue(res.streaming)
+        self.assertEqual(res['Content-Type'], 'application/zip')
+        self.assertIn('payslips_202405.zip', res['Content-Disposition'])
+
+        archive, names = self._zip(data)
+        self.assertIsNone(archive.testzip())
+        self.assertEqual(names, ['EMP001_홍길동_202405.pdf', 'EMP002_이영희_202405.pdf'])
+        for name in names:
+            pdf = archive.read(name)
+            self.assertTrue(pdf.startswith(b'%PDF-'))
+            self.assertIn(b'%%EOF', pdf[-32:])
+
+        # 부서 필터, 확정 급여가 없는 달
+        dept2 = self.emp3.department_id
+        _, names = self._zip(b''.join(self.client.get(
+            PAYSLIPS_URL, {'year': 2024, 'month': 5, 'department': dept2}).streaming_content))
+        self.assertEqual(names, [])
+
+    def test_validation_and_permission(self):
+        self.assertEqual(self.client.get(PAYSLIPS_URL, {'year': 2024}).status_code, status.HTTP_400_BAD_REQUEST)
+        res = self.client.get(PAYSLIPS_URL, {'year': 2024, 'month': 5, 'department': 'DEV'})
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        auth(self.client, get_token(self.client, 'emp6'))
+        res = self.client.get(PAYSLIPS_URL, {'year': 2024, 'month': 5})
+        self.assertEqual(res.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_process_pool_keeps_order(self):
+        """작업자 2개·chunk 1건이어도 입력 순서대로, 완료 건수를 보고하며 생성"""
+        from . import payslip
+        rows = list(payslip.payslip_rows(2024, 5)) * 3
+        done = []
+        outputs = list(payslip.iter_pdfs(rows, workers=2, chunk_size=1, on_chunk=done.append))
+        self.assertEqual([name for name, _ in outputs], [payslip.entry_name(r) for r in rows])
+        self.assertEqual(done, list(range(1, 7)))
+        self.assertTrue(all(pdf.startswith(b'%PDF-') for _, pdf in outputs))
+
+    def test_payslip_batch_job(self):
+        import tempfile
+        from apps.jobs.services import JobService
+
+        with tempfile.TemporaryDirectory() as directory, self.settings(JOB_RESULT_DIR=directory):
+            job = JobService.enqueue('payslip_batch', {'year': 2024, 'month': 5}, user=self.hr_user)
+            job = JobService.run_next('test')
+            self.assertEqual(job.state, 'SUCCEEDED', job.error)
+            self.assertEqual(job.result['count'], 2)
+            self.assertTrue(job.result_path.startswith(directory))
+
+            res = self.client.get(f'/api/v1/jobs/{job.pk}/result/')
+            self.assertEqual(res.status_code, status.HTTP_200_OK)
+            _, names = self._zip(b''.join(res.streaming_content))
+            self.assertEqual(len(names), 2)
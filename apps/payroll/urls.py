@@ -2,17 +2,37 @@ from django.urls import path
 
 from .views import (
     CalculatePayrollView,
+    PayrollRunView,
+    PayrollSimulationView,
     PayrollListView,
     PayrollDetailView,
     ConfirmPayrollView,
+    ConfirmBulkPayrollView,
     MyPayrollView,
     PayrollLedgerView,
+    PayrollLedgerExportView,
+    PayrollLedgerCacheStatsView,
+    PayrollVarianceView,
+    PayrollAnnualReportView,
+    PayrollAnnualExportView,
+    PayrollBankTransferView,
+    PayrollPayslipBatchView,
 )
 
 urlpatterns = [
     path('calculate/',              CalculatePayrollView.as_view()),
+    path('runs/',                   PayrollRunView.as_view()),
+    path('simulate/',               PayrollSimulationView.as_view()),
+    path('confirm-bulk/',           ConfirmBulkPayrollView.as_view()),
     path('my/',                     MyPayrollView.as_view()),
     path('reports/ledger/',         PayrollLedgerView.as_view()),
+    path('reports/ledger/export/',  PayrollLedgerExportView.as_view()),
+    path('reports/ledger/cache-stats/', PayrollLedgerCacheStatsView.as_view()),
+    path('reports/variance/',       PayrollVarianceView.as_view()),
+    path('reports/annual/',         PayrollAnnualReportView.as_view()),
+    path('reports/annual/export/',  PayrollAnnualExportView.as_view()),
+    path('reports/bank-transfer/',  PayrollBankTransferView.as_view()),
+    path('reports/payslips/',       PayrollPayslipBatchView.as_view()),
     path('',                        PayrollListView.as_view()),
     path('<int:pk>/',               PayrollDetailView.as_view()),
     path('<int:pk>/confirm/',       ConfirmPayrollView.as_view()),
@@ -0,0 +1,123 @@
+"""
+전월 대비 급여 변동 리포트 (확정 전 점검용).
+
+해당 월 PayrollRecord를 직원 → 전월 PayrollRecord로 LEFT JOIN(FilteredRelation)하여
+총지급액·실수령액·초과근무 변동을 SQL에서 계산하고, 임계값 이상인 행만 변동 크기 순으로 읽는다.
+- 해당 월: (year, month, employee) 인덱스, 전월: (employee, year, month) 유니크 인덱스
+- 조회는 항상 쿼리 1회이며 전체 건수(COUNT)는 세지 않는다 (limit+1 행으로 잘림 여부만 판단)
+전월 급여가 없는 직원(신규 입사 등)은 임계값과 관계없이 is_new=True로 포함한다.
+"""
+from django.conf import settings
+from django.db.models import F, FilteredRelation, IntegerField, Q
+from django.db.models.functions import Abs, Cast
+
+from .ledger import _money
+from .models import PayrollRecord
+
+# 비교 항목 → 응답/파라미터 이름
+FIELDS = {
+    'gross_pay':        'gross',
+    'net_pay':          'net',
+    'overtime_minutes': 'overtime',
+}
+
+DEFAULT_LIMIT = 500
+MAX_LIMIT     = 5000
+
+
+def previous_month(year: int, month: int) -> tuple:
+    return (year - 1, 12) if month == 1 else (year, month - 1)
+
+
+def default_thresholds() -> dict:
+    return dict(settings.PAYROLL_VARIANCE_THRESHOLDS)
+
+
+def _delta(field: str):
+    if field == 'overtime_minutes':
+        # MariaDB UNSIGNED 정수끼리의 뺄셈은 음수가 되면 오류이므로 부호 있는 정수로 변환
+        return Cast(field, IntegerField()) - Cast(f'prev__{field}', IntegerField())
+    return F(field) - F(f'prev__{field}')
+
+
+def variance_queryset(year: int, month: int, thresholds: dict, sort: str = 'gross_pay',
+                      department_id: int = None):
+    """임계값 이상 변동 행 values() 쿼리셋. sort 항목의 변동 절대값 내림차순."""
+    prev_year, prev_month = previous_month(year, month)
+    qs = PayrollRecord.objects.filter(year=year, month=month).annotate(
+        prev=FilteredRelation(
+            'employee__payroll_records',
+            condition=Q(
+                employee__payroll_records__year=prev_year,
+                employee__payroll_records__month=prev_month,
+            ),
+        ),
+    )
+    if department_id is not None:
+        qs = qs.filter(employee__department_id=department_id)
+
+    # 전월 행이 없으면 변동값은 NULL (정렬 시 맨 뒤)
+    qs = qs.annotate(
+        prev_id=F('prev__id'),
+        **{f'prev_{field}':  F(f'prev__{field}') for field in FIELDS},
+        **{f'{field}_delta': _delta(field) for field in FIELDS},
+    ).annotate(
+        **{f'{field}_abs': Abs(f'{field}_delta') for field in FIELDS},
+    )
+
+    exceeds = Q(prev_id__isnull=True)
+    for field in FIELDS:
+        exceeds |= Q(**{f'{field}_abs__gte': thresholds[field]})
+
+    return (
+        qs.filter(exceeds)
+        .order_by(F(f'{sort}_abs').desc(nulls_last=True), 'employee__employee_no')
+        .values(
+            'id', 'employee_id', 'status', 'prev_id',
+            *FIELDS,
+            *(f'prev_{field}'  for field in FIELDS),
+            *(f'{field}_delta' for field in FIELDS),
+            employee_no     = F('employee__employee_no'),
+            employee_name   = F('employee__name'),
+            department_name = F('employee__department__name'),
+        )
+    )
+
+
+def _amount(field: str, value):
+    if value is None:
+        return None
+    return value if field == 'overtime_minutes' else _money(value)
+
+
+def _row_data(row: dict) -> dict:
+    is_new = row['prev_id'] is None
+    return {
+        'id':              row['id'],
+        'employee_id':     row['employee_id'],
+        'employee_no':     row['employee_no'],
+        'employee_name':   row['employee_name'],
+        'department_name': row['department_name'],
+        'status':          row['status'],
+        'is_new':          is_new,
+        'current':  {field: _amount(field, row[field]) for field in FIELDS},
+        'previous': None if is_new else {field: _amount(field, row[f'prev_{field}']) for field in FIELDS},
+        'delta':    None if is_new else {field: _amount(field, row[f'{field}_delta']) for field in FIELDS},
+    }
+
+
+def build_variance(year: int, month: int, thresholds: dict = None, sort: str = 'gross_pay',
+                   limit: int = DEFAULT_LIMIT, department_id: int = None) -> dict:
+    """변동 리포트 응답 데이터. thresholds는 기본값(settings)에 덮어쓸 항목만 넘긴다."""
+    thresholds = {**default_thresholds(), **(thresholds or {})}
+    rows = list(variance_queryset(year, month, thresholds, sort, department_id)[:limit + 1])
+    prev_year, prev_month = previous_month(year, month)
+    return {
+        'year':           year,
+        'month':          month,
+        'previous':       {'year': prev_year, 'month': prev_month},
+        'thresholds':     thresholds,
+        'sort':           sort,
+        'truncated':      len(rows) > limit,
+        'rows':           [_row_data(r) for r in rows[:limit]],
+    }
@@ -1,16 +1,20 @@
+from django.http import FileResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from rest_framework.negotiation import DefaultContentNegotiation
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 
-from itertools import groupby
-
-from django.utils import timezone
+from dataclasses import fields
 
 from apps.accounts.permissions import IsAdmin, IsHRManager, IsEmployee, IsOwnerOrHRManager
+from apps.utils.pagination import InvalidCursor, paginate, paginated_response
+from . import annual, bank_transfer, export, ledger_cache, payslip, variance
 from .models import PayrollRecord
-from .serializers import PayrollRecordSerializer, LedgerRecordSerializer
-from .services import PayrollService
+from .serializers import PayrollRecordSerializer, RateSetSerializer
+from .services import PayrollService, RunConflict
 
 
 def ok(data, message='', status_code=status.HTTP_200_OK):
@@ -35,9 +39,27 @@ def _extract_error(exc) -> str:
     return str(exc)
 
 
+def _flag(value) -> bool:
+    """요청 본문의 불리언 값 (JSON true 또는 'true'/'1'/'yes' 문자열)."""
+    return str(value).lower() in ('true', '1', 'yes', 'on')
+
+
+def _rates_data(rates) -> dict:
+    """RateSet → 응답용 dict. 간이세액표는 사용 여부만 표시한다."""
+    data = {
+        f.name: None if getattr(rates, f.name) is None else str(getattr(rates, f.name))
+        for f in fields(rates) if f.name != 'withholding'
+    }
+    data['withholding_table'] = rates.withholding is not None
+    return data
+
+
 # ── 급여 계산 ────────────────────────────────────────────────────────
 class CalculatePayrollView(APIView):
-    """POST /api/v1/payroll/calculate/"""
+    """POST /api/v1/payroll/calculate/  {employee_id, year, month, recalculate?}
+
+    recalculate=true이면 기존 DRAFT 급여를 다시 계산해 값이 바뀐 필드만 갱신한다 (확정 급여는 오류).
+    """
     permission_classes = [IsHRManager]
 
     def post(self, request):
@@ -60,6 +82,16 @@ class CalculatePayrollView(APIView):
         from apps.employees.models import Employee
         employee = get_object_or_404(Employee, pk=employee_id, is_active=True)
 
+        if _flag(request.data.get('recalculate')):
+            try:
+                record, changed = PayrollService.recalculate(employee, year, month)
+            except Exception as e:
+                return err(_extract_error(e))
+            return ok(
+                {**PayrollRecordSerializer(record).data, 'changed_fields': changed},
+                f'{year}년 {month}월 급여가 재계산되었습니다 (변경 항목 {len(changed)}개).',
+            )
+
         try:
             record = PayrollService.calculate(employee, year, month)
         except Exception as e:
@@ -72,9 +104,127 @@ class CalculatePayrollView(APIView):
         )
 
 
+# ── 급여 일괄 계산 ────────────────────────────────────────────────────
+class PayrollRunView(APIView):
+    """POST /api/v1/payroll/runs/  {year, month, department?, recalculate?}
+
+    recalculate=true이면 기존 DRAFT 급여를 다시 계산해 값이 바뀐 행만 갱신한다 (확정 급여는 건너뜀).
+    """
+    permission_classes = [IsHRManager]
+
+    def post(self, request):
+        year       = request.data.get('year')
+        month      = request.data.get('month')
+        department = request.data.get('department')
+
+        if not all([year, month]):
+            return err('year, month 값이 필요합니다.')
+
+        try:
+            year  = int(year)
+            month = int(month)
+        except (TypeError, ValueError):
+            return err('year, month는 정수여야 합니다.')
+
+        if not (1 <= month <= 12):
+            return err('month는 1~12 사이여야 합니다.')
+
+        if department:
+            from apps.employees.models import Department
+            department = get_object_or_404(Department, pk=department)
+
+        recalculate = _flag(request.data.get('recalculate'))
+        try:
+            summary = PayrollService.run_month(year, month, department=department, recalculate=recalculate)
+        except RunConflict as e:
+            return err(_extract_error(e), status.HTTP_409_CONFLICT)
+        if recalculate:
+            return ok(
+                summary,
+                f'{year}년 {month}월 급여 재계산 완료: '
+                f'생성 {summary["created"]}건, 변경 {summary["updated"]}건, 변경 없음 {summary["unchanged"]}건, '
+                f'건너뜀 {summary["skipped"]}건, 오류 {summary["errors"]}건',
+            )
+        return ok(
+            summary,
+            f'{year}년 {month}월 급여 일괄 계산 완료: '
+            f'생성 {summary["created"]}건, 건너뜀 {summary["skipped"]}건, 오류 {summary["errors"]}건',
+            status.HTTP_201_CREATED,
+        )
+
+
+# ── 요율 변경 시뮬레이션 ──────────────────────────────────────────────
+class PayrollSimulationView(APIView):
+    """POST /api/v1/payroll/simulate/  {year, month, department?, rates: {...}}
+
+    현행 요율 대비 대체 요율(rates)을 적용했을 때의 전체·부서별 지급/공제 합계와
+    차액을 반환한다. 아무것도 저장하지 않는다.
+    """
+    permission_classes = [IsHRManager]
+
+    def post(self, request):
+        from dataclasses import replace
+
+        from apps.employees.models import Department
+        from . import simulation
+        from .rates import rates_for_month
+
+        year       = request.data.get('year')
+        month      = request.data.get('month')
+        department = request.data.get('department')
+
+        if not all([year, month]):
+            return err('year, month 값이 필요합니다.')
+
+        try:
+            year  = int(year)
+            month = int(month)
+        except (TypeError, ValueError):
+            return err('year, month는 정수여야 합니다.')
+
+        if not (1 <= month <= 12):
+            return err('month는 1~12 사이여야 합니다.')
+
+        rates_serializer = RateSetSerializer(data=request.data.get('rates') or {})
+        if not rates_serializer.is_valid():
+            field, msgs = next(iter(rates_serializer.errors.items()))
+            return err(f'rates.{field}: {msgs[0]}')
+
+        if department:
+            department = get_object_or_404(Department, pk=department)
+
+        baseline    = rates_for_month(year, month)
+        alternative = replace(baseline, **rates_serializer.validated_data)
+
+        workforce = simulation.load_workforce(year, month, department=department)
+        try:
+            result = simulation.compare(workforce, baseline, alternative)
+        except ValueError as e:
+            return err(str(e))
+
+        names = dict(
+            Department.objects.filter(id__in=[d['department_id'] for d in result['departments']])
+            .values_list('id', 'name')
+        )
+        for dept in result['departments']:
+            dept['name'] = names.get(dept['department_id'], '')
+
+        return ok({
+            'year':              year,
+            'month':             month,
+            'baseline_rates':    _rates_data(baseline),
+            'alternative_rates': _rates_data(alternative),
+            **result,
+        })
+
+
+# 급여 목록 정렬 키 (employee, year, month 유일)
+PAYROLL_LIST_ORDERING = ('-year', '-month', 'employee_id')
+
+
 # ── 급여 목록 ────────────────────────────────────────────────────────
 class PayrollListView(APIView):
-    """GET /api/v1/payroll/?year=2024&month=1"""
+    """GET /api/v1/payroll/?year=2024&month=1[&cursor=&page_size=]"""
     permission_classes = [IsHRManager]
 
     def get(self, request):
@@ -89,7 +239,11 @@ class PayrollListView(APIView):
         if month:
             qs = qs.filter(month=month)
 
-        return ok(PayrollRecordSerializer(qs, many=True).data)
+        try:
+            page, next_cursor = paginate(request, qs, PAYROLL_LIST_ORDERING)
+        except InvalidCursor as e:
+            return err(str(e))
+        return paginated_response(PayrollRecordSerializer(page, many=True).data, next_cursor)
 
 
 # ── 급여 상세 ────────────────────────────────────────────────────────
@@ -129,26 +283,77 @@ class ConfirmPayrollView(APIView):
         return ok(PayrollRecordSerializer(record).data, '급여가 확정되었습니다.')
 
 
+# ── 급여 일괄 확정 ────────────────────────────────────────────────────
+class ConfirmBulkPayrollView(APIView):
+    """POST /api/v1/payroll/confirm-bulk/  {year, month, department?, ids?}"""
+    permission_classes = [IsAdmin]
+
+    def post(self, request):
+        year       = request.data.get('year')
+        month      = request.data.get('month')
+        department = request.data.get('department')
+        ids        = request.data.get('ids')
+
+        if not all([year, month]):
+            return err('year, month 값이 필요합니다.')
+
+        try:
+            year  = int(year)
+            month = int(month)
+        except (TypeError, ValueError):
+            return err('year, month는 정수여야 합니다.')
+
+        if not (1 <= month <= 12):
+            return err('month는 1~12 사이여야 합니다.')
+
+        if ids is not None:
+            if not isinstance(ids, list):
+                return err('ids는 급여 id 목록이어야 합니다.')
+            try:
+                ids = sorted({int(i) for i in ids})
+            except (TypeError, ValueError):
+                return err('ids는 정수 목록이어야 합니다.')
+
+        if department:
+            from apps.employees.models import Department
+            department = get_object_or_404(Department, pk=department)
+
+        summary = PayrollService.confirm_bulk(
+            year, month, confirmed_by=request.user, department=department, ids=ids,
+        )
+        return ok(
+            summary,
+            f'{year}년 {month}월 급여 일괄 확정 완료: '
+            f'확정 {summary["confirmed"]}건, 이미 확정 {summary["already_confirmed"]}건',
+        )
+
+
 # ── 내 급여 목록 ─────────────────────────────────────────────────────
 class MyPayrollView(APIView):
-    """GET /api/v1/payroll/my/"""
+    """GET /api/v1/payroll/my/[?cursor=&page_size=]"""
     permission_classes = [IsEmployee]
 
     def get(self, request):
         if not request.user.employee_id:
-            return ok([])
+            return paginated_response([], None)
         qs = PayrollRecord.objects.filter(
             employee_id=request.user.employee_id
-        ).select_related('employee', 'employee__department', 'confirmed_by').order_by('-year', '-month')
-        return ok(PayrollRecordSerializer(qs, many=True).data)
+        ).select_related('employee', 'employee__department', 'confirmed_by')
+        try:
+            page, next_cursor = paginate(request, qs, PAYROLL_LIST_ORDERING)
+        except InvalidCursor as e:
+            return err(str(e))
+        return paginated_response(PayrollRecordSerializer(page, many=True).data, next_cursor)
 
 
 # ── 급여대장 (리포트) ──────────────────────────────────────────────────
 class PayrollLedgerView(APIView):
-    """GET /api/v1/payroll/reports/ledger/?year=2024&month=1
+    """GET /api/v1/payroll/reports/ledger/?year=2024&month=1[&detail=false]
 
     부서별로 그룹화된 급여대장 데이터를 반환한다.
-    각 부서 소계와 전체 합계를 포함한다.
+    각 부서 소계와 전체 합계를 포함한다 (DB 집계, apps/payroll/ledger.py).
+    detail=false이면 직원별 records 없이 소계·합계만 반환한다.
+    결과는 캐시되며(ledger_cache) ETag / Last-Modified가 같으면 304를 반환한다.
     """
     permission_classes = [IsHRManager]
 
@@ -168,37 +373,296 @@ class PayrollLedgerView(APIView):
         if not (1 <= month <= 12):
             return err('month는 1~12 사이여야 합니다.')
 
-        records = list(
-            PayrollRecord.objects.filter(year=year, month=month)
-            .select_related(
-                'employee',
-                'employee__department',
-                'employee__position',
+        detail = request.query_params.get('detail', 'true').lower() not in ('false', '0', 'no')
+
+        ver      = ledger_cache.version(year, month)
+        etag     = ledger_cache.etag(year, month, detail, ver)
+        modified = ledger_cache.last_modified(ver)
+        response = get_conditional_response(request, etag=etag, last_modified=modified)
+        if response is None:
+            data, hit = ledger_cache.get_ledger(year, month, detail=detail, ver=ver)
+            response  = ok(data)
+            response['X-Cache'] = 'HIT' if hit else 'MISS'
+        response['ETag']          = etag
+        response['Last-Modified'] = http_date(modified)
+        response['Cache-Control'] = 'private, no-cache'
+        return response
+
+
+class PayrollVarianceView(APIView):
+    """GET /api/v1/payroll/reports/variance/?year=2024&month=5
+        [&gross=&net=&overtime=&sort=gross|net|overtime&limit=&department=<id>]
+
+    해당 월 급여를 전월 급여와 비교하여 총지급액(gross)·실수령액(net, 원)·초과근무(overtime, 분)
+    변동의 절대값이 임계값 이상인 직원만 sort 항목 변동 크기 순으로 반환한다 (쿼리 1회).
+    임계값 기본값은 settings.PAYROLL_VARIANCE_THRESHOLDS, 전월 급여가 없는 직원은 is_new로 포함한다.
+    """
+    permission_classes = [IsHRManager]
+
+    def get(self, request):
+        params = request.query_params
+        year   = params.get('year')
+        month  = params.get('month')
+
+        if not year or not month:
+            return err('year, month 파라미터가 필요합니다.')
+
+        try:
+            year  = int(year)
+            month = int(month)
+        except (TypeError, ValueError):
+            return err('year, month는 정수여야 합니다.')
+
+        if not (1 <= month <= 12):
+            return err('month는 1~12 사이여야 합니다.')
+
+        thresholds = {}
+        for field, name in variance.FIELDS.items():
+            value = params.get(name)
+            if value in (None, ''):
+                continue
+            if not value.isdigit():
+                return err(f'{name} 임계값은 0 이상의 정수여야 합니다.')
+            thresholds[field] = int(value)
+
+        sort_fields = {name: field for field, name in variance.FIELDS.items()}
+        sort = params.get('sort', 'gross')
+        if sort not in sort_fields:
+            return err(f'sort는 {", ".join(sort_fields)} 중 하나여야 합니다.')
+
+        limit = params.get('limit', str(variance.DEFAULT_LIMIT))
+        if not limit.isdigit() or not (1 <= int(limit) <= variance.MAX_LIMIT):
+            return err(f'limit는 1~{variance.MAX_LIMIT} 사이의 정수여야 합니다.')
+
+        department = params.get('department')
+        if department and not department.isdigit():
+            return err('department 파라미터는 부서 id(정수)여야 합니다.')
+
+        return ok(variance.build_variance(
+            year, month, thresholds, sort=sort_fields[sort], limit=int(limit),
+            department_id=int(department) if department else None,
+        ))
+
+
+class PayrollLedgerCacheStatsView(APIView):
+    """GET /api/v1/payroll/reports/ledger/cache-stats/  급여대장 캐시 적중/실패 횟수"""
+    permission_classes = [IsAdmin]
+
+    def get(self, request):
+        return ok(ledger_cache.stats())
+
+
+# ── 급여대장 파일 내보내기 ──────────────────────────────────────────────
+class IgnoreFormatParamNegotiation(DefaultContentNegotiation):
+    """?format=을 파일 형식(csv/xlsx)으로 쓰므로 렌더러 선택에는 사용하지 않는다 (오류 응답은 JSON)."""
+
+    def select_renderer(self, request, renderers, format_suffix=None):
+        renderer = renderers[0]
+        return renderer, renderer.media_type
+
+
+class PayrollLedgerExportView(APIView):
+    """GET /api/v1/payroll/reports/ledger/export/?year=2024&month=1&format=csv|xlsx
+
+    급여대장을 부서 소계·합계 행을 포함한 파일로 내려받는다.
+    명세 행을 chunk 단위로 읽어 바로 내보내므로 인원수와 관계없이 메모리 사용량이 일정하다.
+    """
+    permission_classes = [IsHRManager]
+    content_negotiation_class = IgnoreFormatParamNegotiation
+
+    def get(self, request):
+        year        = request.query_params.get('year')
+        month       = request.query_params.get('month')
+        file_format = request.query_params.get('format', 'csv').lower()
+
+        if not year or not month:
+            return err('year, month 파라미터가 필요합니다.')
+
+        try:
+            year  = int(year)
+            month = int(month)
+        except (TypeError, ValueError):
+            return err('year, month는 정수여야 합니다.')
+
+        if not (1 <= month <= 12):
+            return err('month는 1~12 사이여야 합니다.')
+
+        if file_format not in export.FORMATS:
+            return err(f'format은 {", ".join(export.FORMATS)} 중 하나여야 합니다.')
+
+        rows = export.ledger_rows(year, month)
+        name = export.filename(year, month, file_format)
+        if file_format == 'csv':
+            response = StreamingHttpResponse(
+                export.iter_csv(rows), content_type=export.CONTENT_TYPES['csv'],
+            )
+            response['Content-Disposition'] = f'attachment; filename="{name}"'
+            return response
+        return FileResponse(
+            export.write_xlsx(rows, year, month),
+            as_attachment=True, filename=name, content_type=export.CONTENT_TYPES['xlsx'],
+        )
+
+
+# ── 급여 대량이체 파일 ────────────────────────────────────────────────
+def _account_error(key: str, employee_nos: list, message: str):
+    """이체 파일을 만들 수 없는 직원 사번 목록 응답 (최대 MISSING_LIMIT건, 더 있으면 '외')."""
+    shown = employee_nos[:bank_transfer.MISSING_LIMIT]
+    more  = ' 외' if len(employee_nos) > len(shown) else ''
+    return Response(
+        {'success': False, 'data': {key: shown}, 'message': f'{message}: {", ".join(shown)}{more}'},
+        status=status.HTTP_400_BAD_REQUEST,
+    )
+
+
+class PayrollBankTransferView(APIView):
+    """GET /api/v1/payroll/reports/bank-transfer/?year=2024&month=1&format=fixed|csv
+
+    해당 월 확정 급여의 실수령액 대량이체 파일(고정길이 또는 CSV, 건수·총액·체크섬 트레일러 포함)을
+    chunk 단위로 복호화하며 스트리밍한다. 전체 계좌번호가 포함되므로 관리자 전용이다.
+    계좌 정보가 없거나 계좌번호를 복호화할 수 없는 이체 대상 직원이 있으면
+    스트리밍 전에 400과 해당 사번 목록(missing_accounts / invalid_accounts)을 반환한다.
+    """
+    permission_classes = [IsAdmin]
+    content_negotiation_class = IgnoreFormatParamNegotiation
+
+    def get(self, request):
+        year        = request.query_params.get('year')
+        month       = request.query_params.get('month')
+        file_format = request.query_params.get('format', 'fixed').lower()
+
+        if not year or not month:
+            return err('year, month 파라미터가 필요합니다.')
+
+        try:
+            year  = int(year)
+            month = int(month)
+        except (TypeError, ValueError):
+            return err('year, month는 정수여야 합니다.')
+
+        if not (1 <= month <= 12):
+            return err('month는 1~12 사이여야 합니다.')
+
+        if file_format not in bank_transfer.FORMATS:
+            return err(f'format은 {", ".join(bank_transfer.FORMATS)} 중 하나여야 합니다.')
+
+        missing = bank_transfer.missing_accounts(year, month)
+        if missing:
+            return _account_error('missing_accounts', missing, '급여 계좌가 등록되지 않은 직원이 있습니다')
+        invalid = bank_transfer.invalid_accounts(year, month)
+        if invalid:
+            return _account_error(
+                'invalid_accounts', invalid, '계좌번호를 복호화할 수 없는 직원이 있습니다. 계좌를 다시 등록해주세요',
             )
-            .order_by('employee__department__name', 'employee__employee_no')
+
+        response = StreamingHttpResponse(
+            bank_transfer.stream(year, month, file_format),
+            content_type=bank_transfer.CONTENT_TYPES[file_format],
         )
+        name = bank_transfer.filename(year, month, file_format)
+        response['Content-Disposition'] = f'attachment; filename="{name}"'
+        return response
+
+
+# ── 급여명세서 PDF 일괄 생성 ───────────────────────────────────────────
+class PayrollPayslipBatchView(APIView):
+    """GET /api/v1/payroll/reports/payslips/?year=2024&month=1[&department=<id>]
+
+    해당 월 확정 급여의 직원별 급여명세서 PDF를 요청 스레드에서 만들어 ZIP으로 스트리밍한다.
+    명세서가 완성되는 순서(사번 순)대로 ZIP에 기록하므로 전체 PDF를 메모리에 모아두지 않는다.
+    요청마다 프로세스 풀을 띄우면 동시 다운로드 수 × 작업자 수만큼 인터프리터가 생기므로 풀은 쓰지 않는다.
+    오래 걸리는 월은 백그라운드 작업(kind=payslip_batch, 프로세스 풀 사용)으로 등록해 결과 파일로 받는다.
+    """
+    permission_classes = [IsHRManager]
 
-        # 부서별 그룹화 및 소계 계산
-        departments = []
-        for dept_name, group in groupby(records, key=lambda r: r.employee.department.name):
-            dept_records = list(group)
-            departments.append({
-                'name':               dept_name,
-                'count':              len(dept_records),
-                'subtotal_gross_pay': str(sum(r.gross_pay       for r in dept_records)),
-                'subtotal_deduction': str(sum(r.total_deduction for r in dept_records)),
-                'subtotal_net_pay':   str(sum(r.net_pay         for r in dept_records)),
-                'records':            LedgerRecordSerializer(dept_records, many=True).data,
-            })
-
-        data = {
-            'year':            year,
-            'month':           month,
-            'generated_at':    timezone.now().isoformat(),
-            'total_count':     len(records),
-            'total_gross_pay': str(sum(r.gross_pay       for r in records)),
-            'total_deduction': str(sum(r.total_deduction for r in records)),
-            'total_net_pay':   str(sum(r.net_pay         for r in records)),
-            'departments':     departments,
-        }
-        return ok(data)
+    def get(self, request):
+        from django.conf import settings
+
+        year  = request.query_params.get('year')
+        month = request.query_params.get('month')
+        department = request.query_params.get('department')
+
+        if not year or not month:
+            return err('year, month 파라미터가 필요합니다.')
+
+        try:
+            year  = int(year)
+            month = int(month)
+        except (TypeError, ValueError):
+            return err('year, month는 정수여야 합니다.')
+
+        if not (1 <= month <= 12):
+            return err('month는 1~12 사이여야 합니다.')
+
+        if department:
+            if not department.isdigit():
+                return err('department 파라미터는 부서 id(정수)여야 합니다.')
+            department = int(department)
+        else:
+            department = None
+
+        pdfs = payslip.iter_pdfs(
+            payslip.payslip_rows(year, month, department),
+            workers=1,
+            font_path=settings.PAYSLIP_FONT_PATH,
+        )
+        response = StreamingHttpResponse(payslip.stream_zip(pdfs), content_type='application/zip')
+        response['Content-Disposition'] = f'attachment; filename="{payslip.filename(year, month)}"'
+        return response
+
+
+# ── 연간 급여 리포트 ──────────────────────────────────────────────────
+def _annual_params(request):
+    """(year, department_id, 오류 응답). 오류가 없으면 세 번째 값은 None."""
+    year       = request.query_params.get('year')
+    department = request.query_params.get('department')
+
+    if not year:
+        return None, None, err('year 파라미터가 필요합니다.')
+    try:
+        year = int(year)
+    except (TypeError, ValueError):
+        return None, None, err('year는 정수여야 합니다.')
+
+    if department:
+        if not department.isdigit():
+            return None, None, err('department 파라미터는 부서 id(정수)여야 합니다.')
+        department = int(department)
+    else:
+        department = None
+    return year, department, None
+
+
+class PayrollAnnualReportView(APIView):
+    """GET /api/v1/payroll/reports/annual/?year=2024[&department=<id>&detail=false]
+
+    직원별 연간 누계(확정 급여 기준, PayrollYearToDate)와 부서별 소계·전체 합계를 반환한다.
+    detail=false이면 직원별 employees 없이 부서 소계·합계만 반환한다.
+    """
+    permission_classes = [IsHRManager]
+
+    def get(self, request):
+        year, department, error = _annual_params(request)
+        if error:
+            return error
+        detail = request.query_params.get('detail', 'true').lower() not in ('false', '0', 'no')
+        return ok(annual.build_report(year, department, detail=detail))
+
+
+class PayrollAnnualExportView(APIView):
+    """GET /api/v1/payroll/reports/annual/export/?year=2024[&department=<id>]
+
+    연간 리포트를 부서 소계·합계 행을 포함한 CSV로 스트리밍한다.
+    """
+    permission_classes = [IsHRManager]
+
+    def get(self, request):
+        year, department, error = _annual_params(request)
+        if error:
+            return error
+        response = StreamingHttpResponse(
+            export.iter_csv(export.annual_rows(year, department)),
+            content_type=export.CONTENT_TYPES['csv'],
+        )
+        response['Content-Disposition'] = f'attachment; filename="{export.annual_filename(year)}"'
+        return response
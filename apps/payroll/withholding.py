@@ -0,0 +1,193 @@
+"""
+근로소득 간이세액표 조회.
+
+국세청 간이세액표 CSV → 바이너리 파일로 한 번 변환해 두고,
+실행 중에는 파일을 mmap 하여 int64 열 배열(lower / upper / 세액)을 복사 없이 사용한다.
+조회는 월 과세급여로 구간을 이분 탐색하고(O(log n)) 공제대상 가족 수 열의 세액을 읽는다.
+DB 접근은 없다.
+
+CSV 형식 (헤더 1줄, 금액은 원 단위)
+    lower,upper,1,2,3,...,11
+    1060000,1065000,1040,0,0,...,0
+    ...
+- lower 이상 upper 미만 구간의 공제대상 가족 수별 세액. 구간은 빈틈 없이 이어져야 한다
+- 첫 구간 미만은 0원
+- 마지막 구간의 lower가 1천만원(EXCESS_FROM)이면 그 행을 '1천만원인 경우의 세액'으로 보고,
+  1천만원 초과분은 소득세법 시행령 별표2의 산식(EXCESS_BRACKETS)으로 더한다
+- 그 밖에 표 범위(마지막 upper 이상)나 구간 사이에 해당하는 급여는 ValueError
+- 가족 수가 열 수보다 많으면 마지막 열, 1명 미만이면 1명 열을 사용한다
+
+바이너리 형식 (리틀 엔디언)
+    magic b'HRWT' | version u32 | rows u32 | dependents u32 |
+    lower[rows] q | upper[rows] q | tax[rows × dependents] q
+"""
+import csv
+import mmap
+import os
+import struct
+from array import array
+from bisect import bisect_left, bisect_right
+
+from django.conf import settings
+
+MAGIC   = b'HRWT'
+VERSION = 1
+_HEADER = struct.Struct('<4sIII')
+
+# 월 과세급여 1천만원 초과분 산식 (소득세법 시행령 별표2, 2024년 적용)
+# 1천만원인 경우의 세액 + 가산액 + (기준금액 초과분 × 비율/10000)
+EXCESS_FROM = 10_000_000
+EXCESS_BRACKETS = (
+    # 기준금액,    가산액,     비율(만분율)
+    (10_000_000,     25_000,    3430),   # 초과분의 98% × 35%
+    (14_000_000,  1_397_000,    3724),   # 98% × 38%
+    (28_000_000,  6_610_600,    3920),   # 98% × 40%
+    (30_000_000,  7_394_600,    4000),   # 40%
+    (45_000_000, 13_394_600,    4200),   # 42%
+    (87_000_000, 31_034_600,    4500),   # 45%
+)
+_EXCESS_THRESHOLDS = [b[0] for b in EXCESS_BRACKETS]
+
+
+def excess_tax(taxable_pay: int) -> int:
+    """1천만원 초과 월 과세급여에서 '1천만원인 경우의 세액'에 더할 금액(원)."""
+    threshold, base, rate = EXCESS_BRACKETS[bisect_left(_EXCESS_THRESHOLDS, taxable_pay) - 1]
+    return base + (taxable_pay - threshold) * rate // 10000
+
+
+class WithholdingTable:
+    """
+    mmap 기반 간이세액표. lower/upper/taxes는 'q' memoryview(또는 array).
+    이분 탐색용 구간 하한은 별도 list(_index)로 한 번 컴파일해 둔다
+    (수백 개 정수라 메모리 부담이 없고 memoryview보다 bisect가 2배가량 빠르다).
+    """
+    __slots__ = ('lowers', 'uppers', 'taxes', 'dependents', 'statutory', '_index', '_buffer', 'path')
+
+    def __init__(self, lowers, uppers, taxes, dependents: int, buffer=None, path=None):
+        self.lowers     = lowers
+        self.uppers     = uppers
+        self.taxes      = taxes
+        self.dependents = dependents
+        self._index     = list(lowers)
+        # 마지막 구간이 1천만원 행이면 그 이상은 별표2 산식으로 계산한다
+        self.statutory  = self._index[-1] == EXCESS_FROM
+        self._buffer    = buffer
+        self.path       = path
+
+    def __len__(self):
+        return len(self.lowers)
+
+    def __deepcopy__(self, memo):
+        # 읽기 전용 테이블이므로 dataclasses.asdict 등에서 복사하지 않고 공유한다
+        return self
+
+    def lookup(self, taxable_pay: int, dependents: int = 1) -> int:
+        """
+        월 과세급여(원)와 공제대상 가족 수로 소득세(원)를 반환한다.
+        표에 없는 급여(구간 사이, 1천만원 행이 없는 표의 마지막 구간 이상)는 ValueError.
+        """
+        i = bisect_right(self._index, taxable_pay)
+        if not i:
+            return 0
+        columns = self.dependents
+        if dependents > columns:
+            dependents = columns
+        elif dependents < 1:
+            dependents = 1
+        tax = self.taxes[(i - 1) * columns + dependents - 1]
+        if self.statutory and taxable_pay > EXCESS_FROM:
+            return tax + excess_tax(taxable_pay)
+        if taxable_pay >= self.uppers[i - 1]:
+            raise ValueError(f'과세급여 {taxable_pay:,}원에 해당하는 간이세액표 구간이 없습니다.')
+        return tax
+
+    # ── 생성 / 저장 / 적재 ───────────────────────────────────────────
+    @classmethod
+    def from_csv(cls, path) -> 'WithholdingTable':
+        lowers, uppers, taxes = array('q'), array('q'), array('q')
+        dependents = None
+        with open(path, newline='', encoding='utf-8-sig') as f:
+            reader = csv.reader(f)
+            header = next(reader)
+            dependents = len(header) - 2
+            if dependents < 1:
+                raise ValueError('간이세액표 CSV에는 lower, upper와 1개 이상의 가족 수 열이 필요합니다.')
+            for line_no, row in enumerate(reader, start=2):
+                if not row or not ''.join(row).strip():
+                    continue
+                if len(row) != dependents + 2:
+                    raise ValueError(f'{line_no}행: 열 개수가 헤더와 다릅니다.')
+                try:
+                    values = [int(v.replace(',', '').strip() or 0) for v in row]
+                except ValueError:
+                    raise ValueError(f'{line_no}행: 정수가 아닌 값이 있습니다.')
+                lower, upper = values[0], values[1]
+                if lowers and lower < uppers[-1]:
+                    raise ValueError(f'{line_no}행: 구간이 정렬되어 있지 않거나 겹칩니다.')
+                if lowers and lower > uppers[-1]:
+                    raise ValueError(f'{line_no}행: 이전 구간과의 사이가 비어 있습니다.')
+                if upper <= lower:
+                    raise ValueError(f'{line_no}행: upper는 lower보다 커야 합니다.')
+                lowers.append(lower)
+                uppers.append(upper)
+                taxes.extend(values[2:])
+        if not lowers:
+            raise ValueError('간이세액표 CSV에 구간이 없습니다.')
+        return cls(lowers, uppers, taxes, dependents)
+
+    def save(self, path):
+        """바이너리 파일로 저장 (임시 파일에 쓴 뒤 교체)."""
+        tmp = f'{path}.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(_HEADER.pack(MAGIC, VERSION, len(self.lowers), self.dependents))
+            for column in (self.lowers, self.uppers, self.taxes):
+                col = column if isinstance(column, array) else array('q', column)
+                if col.itemsize != 8:
+                    raise ValueError('int64 열만 저장할 수 있습니다.')
+                col.tofile(f)
+        os.replace(tmp, path)
+
+    @classmethod
+    def open(cls, path) -> 'WithholdingTable':
+        """바이너리 파일을 mmap 하여 복사 없이 적재한다."""
+        with open(path, 'rb') as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, rows, dependents = _HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC or version != VERSION:
+            buffer.close()
+            raise ValueError(f'간이세액표 파일 형식이 올바르지 않습니다: {path}')
+        expected = _HEADER.size + 8 * rows * (2 + dependents)
+        if len(buffer) != expected:
+            buffer.close()
+            raise ValueError(f'간이세액표 파일 크기가 올바르지 않습니다: {path}')
+
+        view   = memoryview(buffer)[_HEADER.size:].cast('q')
+        lowers = view[:rows]
+        uppers = view[rows:2 * rows]
+        taxes  = view[2 * rows:]
+        return cls(lowers, uppers, taxes, dependents, buffer=buffer, path=str(path))
+
+
+_loaded = {}
+
+
+def default_path() -> str:
+    """요율에 간이세액표가 지정되지 않았을 때 쓰는 settings.WITHHOLDING_TAX_TABLE (없으면 '')."""
+    return str(getattr(settings, 'WITHHOLDING_TAX_TABLE', '') or '')
+
+
+def get_table(path=None):
+    """
+    간이세액표 파일을 경로별로 프로세스당 한 번 mmap 한다 (파일이 바뀌면 다시 연다).
+    path를 생략하면 settings.WITHHOLDING_TAX_TABLE. 둘 다 없으면 None.
+    """
+    path = path or default_path()
+    if not path:
+        return None
+    path  = str(path)
+    mtime = os.stat(path).st_mtime_ns
+    cached = _loaded.get(path)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, WithholdingTable.open(path))
+        _loaded[path] = cached
+    return cached[1]
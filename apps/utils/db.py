@@ -0,0 +1,126 @@
+"""
+DB 백엔드 차이를 흡수하는 ORM 헬퍼
+
+- upsert_options: bulk_create(update_conflicts=True) 기반 upsert (급여 누계 등)
+  MariaDB/MySQL은 ON DUPLICATE KEY UPDATE라 충돌 대상(unique_fields)을 지정할 수 없고,
+  SQLite/PostgreSQL은 ON CONFLICT (...) 대상 지정이 필수이다.
+- create_unique: 사전 exists() 확인 없이 INSERT 하고 unique 제약 위반을 검증 오류로 바꾼다
+  (출근 처리, 급여 계산)
+- MinutesBetween: 두 시각 사이 경과 분(내림)을 SQL에서 계산한다 (퇴근 처리 UPDATE)
+- month_range / year_range / overlaps: 월·연 조건을 날짜 컬럼의 범위 비교로 만든다 (근태·급여 월 조회)
+  work_date__month=5 같은 조회는 MariaDB에서 EXTRACT(MONTH FROM work_date)가 되어
+  (employee, work_date) 같은 인덱스로 범위 탐색을 할 수 없으므로 월 조건은 모두 이 헬퍼로 만든다.
+- keyset_chunks / keyset_rows: 대량 values() 조회를 키셋 조건 + LIMIT 쿼리 여러 번으로 나눠 읽는다
+  (급여대장·연간 리포트 내보내기, 이체 파일, 명세서 일괄 생성).
+  PyMySQL 기본 커서는 서버 결과를 한 번에 모두 받아 두므로 QuerySet.iterator(chunk_size)로는
+  메모리가 줄지 않는다. 쿼리마다 chunk_size 행만 받으면 인원수와 관계없이 메모리 사용량이 일정하다.
+"""
+import calendar
+import datetime
+
+from django.db import IntegrityError, connections, transaction
+from django.db.models import Func, IntegerField, Q
+from rest_framework.exceptions import ValidationError
+
+
+def upsert_options(unique_fields, update_fields, using='default') -> dict:
+    """bulk_create(**upsert_options(...))에 넘길 upsert 인자."""
+    options = {'update_conflicts': True, 'update_fields': list(update_fields)}
+    if connections[using].features.supports_update_conflicts_with_target:
+        options['unique_fields'] = list(unique_fields)
+    return options
+
+
+def create_unique(model, lookup: dict, conflict_message: str, **fields):
+    """
+    model.objects.create(**lookup, **fields)를 savepoint 안에서 바로 시도한다.
+    lookup은 unique 제약을 이루는 필드 값이며, 이미 같은 행이 있으면(동시 요청 포함)
+    ValidationError(conflict_message)를 발생시킨다. 확인 쿼리는 INSERT가 실패했을 때만 실행한다.
+    post_save 시그널의 변경도 같은 savepoint에 포함된다.
+    """
+    try:
+        with transaction.atomic():
+            return model.objects.create(**lookup, **fields)
+    except IntegrityError:
+        # FK 위반 등 다른 제약 오류는 그대로 전달
+        if model.objects.filter(**lookup).exists():
+            raise ValidationError(conflict_message)
+        raise
+
+
+class MinutesBetween(Func):
+    """
+    MinutesBetween(start, end) → (end - start)의 분 단위 값, 초 이하는 버린다
+    (Python int((end - start).total_seconds() // 60)과 같은 값, end >= start 기준).
+    """
+    output_field = IntegerField()
+    arity = 2
+
+    def _compile(self, compiler):
+        (start, start_params), (end, end_params) = (
+            compiler.compile(expr) for expr in self.get_source_expressions()
+        )
+        return start, end, tuple(start_params), tuple(end_params)
+
+    def as_mysql(self, compiler, connection, **extra_context):
+        start, end, start_params, end_params = self._compile(compiler)
+        return f'(TIMESTAMPDIFF(MICROSECOND, {start}, {end}) DIV 60000000)', start_params + end_params
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        # django_timestamp_diff: Django가 SQLite 연결에 등록하는 함수 (마이크로초 정수)
+        start, end, start_params, end_params = self._compile(compiler)
+        return f'(django_timestamp_diff({end}, {start}) / 60000000)', end_params + start_params
+
+    def as_sql(self, compiler, connection, **extra_context):
+        start, end, start_params, end_params = self._compile(compiler)
+        return f'CAST(FLOOR(EXTRACT(EPOCH FROM ({end} - {start})) / 60) AS INTEGER)', end_params + start_params
+
+
+def month_range(year: int, month: int) -> tuple:
+    """(해당 월 1일, 말일). filter(work_date__range=month_range(...))로 쓴다. 잘못된 연·월은 ValueError."""
+    first = datetime.date(year, month, 1)
+    return first, first.replace(day=calendar.monthrange(year, month)[1])
+
+
+def year_range(year: int) -> tuple:
+    """(해당 연도 1월 1일, 12월 31일)."""
+    return datetime.date(year, 1, 1), datetime.date(year, 12, 31)
+
+
+def overlaps(start_field: str, end_field: str, first: datetime.date, last: datetime.date) -> Q:
+    """start_field~end_field 기간이 first~last와 하루라도 겹치는 조건 (휴가 등 기간 데이터)."""
+    return Q(**{f'{start_field}__lte': last, f'{end_field}__gte': first})
+
+
+def keyset_chunks(queryset, keys, chunk_size: int):
+    """
+    values() queryset을 keys 순으로 정렬해 chunk_size 행씩 list로 생성한다.
+    두 번째 쿼리부터는 '(keys) > 직전 chunk 마지막 행의 keys' 조건을 붙인다.
+    keys는 values()의 키(필드명 또는 별칭)이며 NULL이 없고 조합이 행마다 유일해야 한다 (보통 마지막 키가 사번).
+    비교·정렬을 모두 DB에서 하므로 문자열 키도 DB 정렬 규칙(collation)대로 이어서 읽는다.
+    """
+    keys = tuple(keys)
+    queryset = queryset.order_by(*keys)
+    last = None
+    while True:
+        page = queryset if last is None else queryset.filter(_after(keys, last))
+        rows = list(page[:chunk_size])
+        if rows:
+            yield rows
+        if len(rows) < chunk_size:
+            return
+        last = tuple(rows[-1][key] for key in keys)
+
+
+def keyset_rows(queryset, keys, chunk_size: int):
+    """keyset_chunks의 행을 하나씩 생성한다."""
+    for rows in keyset_chunks(queryset, keys, chunk_size):
+        yield from rows
+
+
+def _after(keys: tuple, values: tuple) -> Q:
+    """(k1, k2, ...) > (v1, v2, ...) 행 비교를 OR 조건으로 펼친다 (Django 4.2 ORM에는 튜플 비교가 없다)."""
+    condition = Q()
+    for i, key in enumerate(keys):
+        condition |= Q(**dict(zip(keys[:i], values[:i])), **{f'{key}__gt': values[i]})
+    return condition
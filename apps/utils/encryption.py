@@ -1,24 +1,31 @@
 """
 대칭키 암호화 유틸리티 (Fernet / AES-128-CBC)
 
-사용처: 주민등록번호 등 개인정보 필드 암호화
+사용처: 주민등록번호·급여 계좌번호 등 개인정보 필드 암호화
 키 도출: settings.SECRET_KEY → SHA-256 → base64url (Fernet 키 형식)
+Fernet 객체는 SECRET_KEY별로 한 번만 만들어 재사용한다 (이체 파일 등 대량 복호화).
 """
 import re
 import base64
 import hashlib
+from functools import lru_cache
 
-from cryptography.fernet import Fernet
+from cryptography.fernet import Fernet, InvalidToken
 from django.conf import settings
 
 
-def _fernet() -> Fernet:
-    """settings.SECRET_KEY로부터 안정적인 Fernet 키를 생성"""
-    raw = hashlib.sha256(settings.SECRET_KEY.encode()).digest()
+@lru_cache(maxsize=4)
+def _fernet_for(secret_key: str) -> Fernet:
+    raw = hashlib.sha256(secret_key.encode()).digest()
     key = base64.urlsafe_b64encode(raw)
     return Fernet(key)
 
 
+def _fernet() -> Fernet:
+    """settings.SECRET_KEY로부터 안정적인 Fernet 키를 생성 (캐시)"""
+    return _fernet_for(settings.SECRET_KEY)
+
+
 def encrypt(plain: str) -> str:
     """평문 → 암호문(base64 문자열)"""
     if not plain:
@@ -36,6 +43,21 @@ def decrypt(cipher: str) -> str:
         return ''
 
 
+def decrypt_many(ciphers) -> list:
+    """
+    암호문 목록 → 평문 목록. 같은 Fernet 객체 하나로 복호화한다.
+    빈 값은 빈 문자열, 복호화할 수 없는 값(다른 SECRET_KEY로 암호화·손상)은 None.
+    """
+    fernet = _fernet()
+    plains = []
+    for cipher in ciphers:
+        try:
+            plains.append(fernet.decrypt(cipher.encode()).decode() if cipher else '')
+        except InvalidToken:
+            plains.append(None)
+    return plains
+
+
 def mask_resident_no(plain: str) -> str:
     """980101-1234567  →  980101-*******"""
     if not plain:
@@ -44,3 +66,11 @@ def mask_resident_no(plain: str) -> str:
     if len(clean) == 13:
         return f'{clean[:6]}-*******'
     return '***-*******'
+
+
+def mask_account_no(plain: str) -> str:
+    """110-123-456789  →  ********6789"""
+    clean = re.sub(r'[^0-9]', '', plain or '')
+    if not clean:
+        return ''
+    return '*' * max(len(clean) - 4, 0) + clean[-4:]
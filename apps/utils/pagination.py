@@ -0,0 +1,107 @@
+"""
+키셋(cursor) 페이지네이션 유틸리티
+
+사용처: 직원·급여·휴가 목록 APIView
+방식: 고유한 정렬 키(마지막 필드는 유일해야 함)의 마지막 행 값을 cursor로 넘기고,
+      다음 페이지는 WHERE (정렬 키) > (cursor 값) 조건 + LIMIT page_size+1 로 조회한다.
+      COUNT(*)와 OFFSET을 쓰지 않으므로 깊은 페이지도 첫 페이지와 비용이 같다.
+
+응답: {"success": true, "data": [...], "message": "", "next": "<cursor>" | null}
+"""
+import base64
+import json
+
+from django.conf import settings
+from django.db.models import Q
+from rest_framework import status
+from rest_framework.response import Response
+
+MAX_PAGE_SIZE = 200
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def _encode(values: list) -> str:
+    raw = json.dumps(values, separators=(',', ':'), default=str).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def _decode(cursor: str) -> list:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (ValueError, TypeError):
+        raise InvalidCursor('잘못된 cursor입니다.')
+    if not isinstance(values, list):
+        raise InvalidCursor('잘못된 cursor입니다.')
+    return values
+
+
+def page_size(request) -> int:
+    """?page_size= (기본 REST_FRAMEWORK['PAGE_SIZE'], 최대 MAX_PAGE_SIZE)"""
+    default = settings.REST_FRAMEWORK.get('PAGE_SIZE', 20)
+    try:
+        size = int(request.query_params.get('page_size', default))
+    except (TypeError, ValueError):
+        return default
+    return max(1, min(size, MAX_PAGE_SIZE))
+
+
+def _after(model, ordering: tuple, values: list) -> Q:
+    """정렬 키 ordering 기준으로 values 다음 행들의 조건 (정렬 방향 혼합 지원)."""
+    if len(values) != len(ordering):
+        raise InvalidCursor('잘못된 cursor입니다.')
+    condition = Q()
+    equal     = Q()
+    for key, raw in zip(ordering, values):
+        name  = key.lstrip('-')
+        field = model._meta.get_field(name)
+        try:
+            value = field.to_python(raw)
+        except Exception:
+            raise InvalidCursor('잘못된 cursor입니다.')
+        lookup = 'lt' if key.startswith('-') else 'gt'
+        condition |= equal & Q(**{f'{name}__{lookup}': value})
+        equal     &= Q(**{name: value})
+    return condition
+
+
+def paginate(request, queryset, ordering: tuple):
+    """
+    (현재 페이지 객체 목록, 다음 cursor 또는 None)을 반환한다.
+    ordering의 마지막 필드는 유일해야 한다 (예: ('-created_at', '-id')).
+    cursor가 올바르지 않으면 InvalidCursor.
+    """
+    size   = page_size(request)
+    cursor = request.query_params.get('cursor')
+    queryset = queryset.order_by(*ordering)
+    if cursor:
+        queryset = queryset.filter(_after(queryset.model, ordering, _decode(cursor)))
+
+    rows = list(queryset[:size + 1])
+    if len(rows) <= size:
+        return rows, None
+    rows = rows[:size]
+    last = rows[-1]
+    next_cursor = _encode([
+        _serialize(getattr(last, key.lstrip('-'))) for key in ordering
+    ])
+    return rows, next_cursor
+
+
+def _serialize(value):
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    if isinstance(value, (int, str)) or value is None:
+        return value
+    return str(value)
+
+
+def paginated_response(data, next_cursor, message='', status_code=status.HTTP_200_OK):
+    """공통 응답 형식 + next cursor"""
+    return Response(
+        {'success': True, 'data': data, 'message': message, 'next': next_cursor},
+        status=status_code,
+    )
@@ -0,0 +1,119 @@
+"""
+테스트 헬퍼
+
+동시성 (concurrency_skip_reason, run_concurrently)
+- 사용처: 출근 처리·급여 계산 등 unique 제약에 기대는 경로의 경쟁 조건 테스트
+- 각 스레드는 자신의 DB 연결을 쓰므로 TransactionTestCase에서 사용해야 한다
+  (TestCase의 트랜잭션 안 데이터는 다른 연결에서 보이지 않는다).
+
+실행 계획 (explain_skip_reason, query_plan, explain_queries)
+- 사용처: 월 단위 근태·급여 조회가 인덱스를 타는지 확인하는 회귀 테스트
+- SQLite는 EXPLAIN QUERY PLAN, MariaDB/MySQL은 EXPLAIN 결과를 테이블별 단계로 정리한다.
+  테스트 데이터는 작아서 MariaDB 옵티마이저가 인덱스가 있어도 전체 스캔을 고를 수 있으므로,
+  MariaDB에서 full_scan은 "쓸 수 있는 인덱스가 없는 전체 스캔"(type=ALL, possible_keys 없음)만 뜻한다.
+"""
+import re
+import threading
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+def concurrency_skip_reason():
+    """동시 쓰기 테스트를 실행할 수 없는 DB이면 사유 문자열, 아니면 None."""
+    if connection.vendor == 'sqlite' and connection.is_in_memory_db():
+        # 공유 캐시 in-memory DB는 동시 쓰기를 대기 없이 'table is locked'로 실패시킨다
+        return '동시성 테스트는 MariaDB 또는 파일 SQLite(TEST NAME 지정)에서만 실행합니다.'
+    return None
+
+
+def run_concurrently(func, threads: int = 8, timeout: float = 30) -> list:
+    """
+    func()를 threads개의 스레드에서 Barrier로 맞춰 동시에 실행한다.
+    스레드별 결과를 ('ok', 반환값) 또는 ('error', 예외) 튜플 목록으로 반환한다.
+    """
+    barrier = threading.Barrier(threads)
+    results = [None] * threads
+
+    def worker(index):
+        try:
+            barrier.wait(timeout)
+            results[index] = ('ok', func())
+        except Exception as e:  # 호출 측에서 예외 종류를 검사한다
+            results[index] = ('error', e)
+        finally:
+            connection.close()
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join(timeout)
+    return results
+
+
+# ── 실행 계획 ────────────────────────────────────────────────────────
+# SCAN attendance_record / SEARCH attendance_record USING INDEX att_record_work_date (work_date>? AND work_date<?)
+_SQLITE_STEP = re.compile(
+    r'^(?P<op>SCAN|SEARCH) (?:TABLE )?(?P<table>\S+)(?: AS \S+)?'
+    r'(?: USING (?P<automatic>AUTOMATIC )?(?:COVERING |PARTIAL COVERING )?INDEX (?P<index>\S+))?'
+    r'(?: USING INTEGER PRIMARY KEY)?'
+    r'(?: \((?P<condition>.*)\))?'
+)
+
+
+def explain_skip_reason():
+    """실행 계획 테스트를 지원하지 않는 DB이면 사유 문자열, 아니면 None."""
+    if connection.vendor not in ('sqlite', 'mysql'):
+        return '실행 계획 테스트는 SQLite, MariaDB/MySQL에서만 실행합니다.'
+    return None
+
+
+def query_plan(sql: str, params=()) -> list:
+    """
+    SELECT 문의 실행 계획을 테이블 단위 단계 목록으로 반환한다.
+    [{'table', 'index', 'full_scan', 'range', 'sql'}, ...]
+    full_scan: 인덱스 조건 없이 테이블(또는 인덱스) 전체를 읽음
+    range: 인덱스의 범위 조건(>, <, BETWEEN)으로 탐색함
+    sql: 계획을 구한 SELECT 문 (조건절 검사용)
+    """
+    steps = []
+    with connection.cursor() as cursor:
+        if connection.vendor == 'sqlite':
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params or None)
+            for row in cursor.fetchall():
+                match = _SQLITE_STEP.match(row[-1])
+                if not match:
+                    continue  # USE TEMP B-TREE 등 테이블 접근이 아닌 단계
+                condition = match['condition'] or ''
+                steps.append({
+                    'table':     match['table'],
+                    'index':     match['index'],
+                    'full_scan': match['op'] == 'SCAN' or bool(match['automatic']),
+                    'range':     '>' in condition or '<' in condition,
+                    'sql':       sql,
+                })
+        else:
+            cursor.execute(f'EXPLAIN {sql}', params or None)
+            columns = [col[0].lower() for col in cursor.description]
+            for row in cursor.fetchall():
+                row = dict(zip(columns, row))
+                steps.append({
+                    'table':     row['table'],
+                    'index':     row['key'],
+                    'full_scan': row['type'] in ('ALL', 'index') and not row['possible_keys'],
+                    'range':     row['type'] == 'range',
+                    'sql':       sql,
+                })
+    return steps
+
+
+def explain_queries(func) -> list:
+    """func()가 실행한 SELECT 문들의 실행 계획 단계를 모두 모아 반환한다."""
+    with CaptureQueriesContext(connection) as captured:
+        func()
+    steps = []
+    for query in captured.captured_queries:
+        if query['sql'].lstrip().upper().startswith('SELECT'):
+            steps += query_plan(query['sql'])
+    return steps
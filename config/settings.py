@@ -50,6 +50,7 @@ INSTALLED_APPS = [
     'apps.employees',
     'apps.attendance',
     'apps.payroll',
+    'apps.jobs',
 
 ]
 
@@ -127,6 +128,8 @@ SIMPLE_JWT = {
     'ROTATE_REFRESH_TOKENS' : True,   # 갱신 시 Refresh도 새로 발급
     'BLACKLIST_AFTER_ROTATION': True,
     'AUTH_HEADER_TYPES'     : ('Bearer',),
+    # 갱신 시 사용자를 다시 읽어 role·employee_id 클레임을 현재 값으로 발급 (apps.accounts.authentication 참고)
+    'TOKEN_REFRESH_SERIALIZER': 'apps.accounts.serializers.ClaimsTokenRefreshSerializer',
 }
 
 # ── CORS 설정 ─────────────────────────────────────────
@@ -138,6 +141,55 @@ CORS_ALLOWED_ORIGINS = [
 CORS_ALLOW_CREDENTIALS = True
 
 
+# ── 급여 계산 엔진 ─────────────────────────────────────
+# decimal: Decimal 연산 (기본)  |  fixed: 정수 원 단위 고정소수점 (결과 동일, 대량 계산용)
+PAYROLL_ENGINE = os.getenv('PAYROLL_ENGINE', 'decimal')
+
+# 근로소득 간이세액표 바이너리 파일 (manage.py build_withholding_table로 생성)
+# 비워두면 소득세는 요율(PayrollRateSet.income_tax_rate) 근사값으로 계산
+WITHHOLDING_TAX_TABLE = os.getenv('WITHHOLDING_TAX_TABLE', '')
+
+# ── 캐시 (급여대장 등) ──────────────────────────────────
+# locmem: 프로세스 메모리 (기본, 단일 프로세스 waitress)  |  file: CACHE_LOCATION 디렉터리 (다중 프로세스 공유)
+# 급여대장 무효화 기준(버전)은 DB(PayrollLedgerVersion)에 있으므로 작업 워커·관리 명령이 급여를 바꿔도
+# locmem 캐시의 이전 대장이 웹 프로세스에서 응답되지 않는다 (캐시 백엔드는 적중률에만 영향).
+if os.getenv('CACHE_BACKEND', 'locmem') == 'file':
+    CACHES = {
+        'default': {
+            'BACKEND' : 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': os.getenv('CACHE_LOCATION', str(BASE_DIR / '.cache')),
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND' : 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'hrpay',
+        }
+    }
+
+# 급여대장 캐시 보관 시간(초). 변경 시 DB 버전이 올라가 즉시 무효화되므로 길게 두어도 된다.
+PAYROLL_LEDGER_CACHE_TIMEOUT = int(os.getenv('PAYROLL_LEDGER_CACHE_TIMEOUT', 60 * 60 * 24))
+
+# 전월 대비 급여 변동 리포트 기본 임계값 (절대값 이상 변동만 표시, 요청 파라미터로 덮어쓸 수 있다)
+PAYROLL_VARIANCE_THRESHOLDS = {
+    'gross_pay':        int(os.getenv('PAYROLL_VARIANCE_GROSS', 100000)),     # 원
+    'net_pay':          int(os.getenv('PAYROLL_VARIANCE_NET', 100000)),       # 원
+    'overtime_minutes': int(os.getenv('PAYROLL_VARIANCE_OVERTIME', 600)),     # 분
+}
+
+# 급여명세서 PDF 일괄 생성: 백그라운드 작업(payslip_batch)의 프로세스 풀 작업자 수 (0이면 CPU 코어 수,
+# 다운로드 API는 요청 스레드에서 그린다), 포함할 한글 TTF 글꼴 (비우면 뷰어 내장 글꼴)
+PAYSLIP_RENDER_WORKERS = int(os.getenv('PAYSLIP_RENDER_WORKERS', 0))
+PAYSLIP_FONT_PATH      = os.getenv('PAYSLIP_FONT_PATH', '')
+
+# 백그라운드 작업의 대용량 결과 파일(명세서 ZIP 등) 저장 디렉터리
+JOB_RESULT_DIR = os.getenv('JOB_RESULT_DIR') or str(BASE_DIR / 'job_results')
+# 이 크기(바이트) 이하의 결과 파일만 DB(Job.result_file)에 저장하고, 큰 파일은 JOB_RESULT_DIR에 둔다
+# (MariaDB max_allowed_packet 기본 16MB보다 충분히 작게)
+JOB_RESULT_INLINE_BYTES = int(os.getenv('JOB_RESULT_INLINE_BYTES', 1024 * 1024))
+
+
 # ── 커스텀 User 모델 ───────────────────────────────────
 AUTH_USER_MODEL = 'accounts.CustomUser'
 
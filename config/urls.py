@@ -27,4 +27,7 @@ urlpatterns = [
 
     # Phase 5 — 급여관리
     path('api/v1/payroll/', include('apps.payroll.urls')),
+
+    # 백그라운드 작업 (급여 일괄 계산·내보내기 등)
+    path('api/v1/jobs/', include('apps.jobs.urls')),
 ]
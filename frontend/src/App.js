@@ -11,6 +11,7 @@ import PayrollListPage    from './pages/PayrollListPage';
 import PayrollDetailPage  from './pages/PayrollDetailPage';
 import MyPayrollPage      from './pages/MyPayrollPage';
 import PayrollLedgerPage  from './pages/PayrollLedgerPage';
+import PayrollAnnualPage  from './pages/PayrollAnnualPage';
 
 const queryClient = new QueryClient({
   defaultOptions: {
@@ -40,6 +41,7 @@ export default function App() {
           {/* 급여 관리 */}
           <Route path="/payroll"        element={<PayrollListPage />} />
           <Route path="/payroll/ledger" element={<PayrollLedgerPage />} />
+          <Route path="/payroll/annual" element={<PayrollAnnualPage />} />
           <Route path="/payroll/:id"    element={<PayrollDetailPage />} />
           <Route path="/my-payroll"     element={<MyPayrollPage />} />
 
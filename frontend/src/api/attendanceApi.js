@@ -1,13 +1,18 @@
 import axiosInstance from './axiosInstance';
+import { fetchPage } from './pagination';
 
 // ── 출퇴근 ────────────────────────────────────────────────────────
 export const checkIn  = ()           => axiosInstance.post('/attendance/check-in/');
 export const checkOut = ()           => axiosInstance.post('/attendance/check-out/');
 export const getMonthlyAttendance = (year, month) =>
   axiosInstance.get('/attendance/monthly/', { params: { year, month } });
+export const getMonthlySummary = (year, month, department) =>
+  axiosInstance.get('/attendance/monthly/summary/', { params: { year, month, department } });
+export const getAttendanceMatrix = (year, month, department) =>
+  axiosInstance.get('/attendance/matrix/', { params: { year, month, department } });
 
 // ── 휴가 ──────────────────────────────────────────────────────────
-export const getLeaves      = ()     => axiosInstance.get('/attendance/leaves/');
+export const getLeaves      = (params, cursor) => fetchPage('/attendance/leaves/', params, cursor);
 export const requestLeave   = (data) => axiosInstance.post('/attendance/leaves/', data);
 export const approveLeave   = (id, data) =>
   axiosInstance.post(`/attendance/leaves/${id}/approve/`, data);
@@ -1,8 +1,13 @@
 import axiosInstance from './axiosInstance';
+import { fetchAllPages, fetchPage } from './pagination';
 
 // ── 직원 ─────────────────────────────────────────────────────────
-export const getEmployees = (params) =>
-  axiosInstance.get('/employees/', { params });
+export const getEmployees = (params, cursor) =>
+  fetchPage('/employees/', params, cursor);
+
+// 직원 선택 목록용 (모든 행이 필요한 곳에서만 사용)
+export const getAllEmployees = (params) =>
+  fetchAllPages('/employees/', params);
 
 export const getEmployee = (id) =>
   axiosInstance.get(`/employees/${id}/`);
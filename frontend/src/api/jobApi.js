@@ -0,0 +1,40 @@
+import axiosInstance from './axiosInstance';
+import { fetchPage } from './pagination';
+
+export const createJob = (kind, params) => axiosInstance.post('/jobs/', { kind, params });
+export const getJob    = (id)     => axiosInstance.get(`/jobs/${id}/`);
+export const getJobs   = (params, cursor) => fetchPage('/jobs/', params, cursor);
+export const downloadJobResult = (id) =>
+  axiosInstance.get(`/jobs/${id}/result/`, { responseType: 'blob' });
+
+// ── 작업 등록 + 진행률 polling ──────────────────────────────────────
+// 작업이 끝날 때까지 interval마다 상태를 조회해 onProgress(job)를 호출하고,
+// 완료되면 job을 반환한다. 실패하면 job.error를 메시지로 하는 Error를 던진다.
+const POLL_INTERVAL = 1000;
+
+const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+
+export const runJob = async (kind, params, onProgress = () => {}) => {
+  let job = (await createJob(kind, params)).data.data;
+  onProgress(job);
+  while (job.state === 'QUEUED' || job.state === 'RUNNING') {
+    await sleep(POLL_INTERVAL);
+    job = (await getJob(job.id)).data.data;
+    onProgress(job);
+  }
+  if (job.state === 'FAILED') {
+    throw new Error(job.error || '작업이 실패했습니다.');
+  }
+  return job;
+};
+
+// 완료된 작업의 결과 파일을 브라우저 다운로드로 저장 (JWT 헤더가 필요하므로 blob으로 받음)
+export const saveJobResult = async (job, filename) => {
+  const res = await downloadJobResult(job.id);
+  const url = URL.createObjectURL(res.data);
+  const a = document.createElement('a');
+  a.href = url;
+  a.download = filename || job.result_filename;
+  a.click();
+  URL.revokeObjectURL(url);
+};
@@ -0,0 +1,25 @@
+import axiosInstance from './axiosInstance';
+
+// ── 커서 페이지네이션 ─────────────────────────────────────────────
+// 목록 API는 { success, data, message, next } 형식이며 next가 null이 아니면
+// ?cursor=next 로 다음 페이지를 조회한다.
+// 목록 화면은 fetchPage로 한 페이지씩 받아 '더 보기'로 이어 붙인다 (hooks/useCursorList).
+// fetchAllPages는 선택 목록처럼 모든 행이 꼭 필요한 곳에서만 쓴다.
+const PAGE_SIZE = 200;
+
+export const fetchPage = (url, params, cursor) =>
+  axiosInstance.get(url, {
+    params: { ...params, page_size: PAGE_SIZE, ...(cursor ? { cursor } : {}) },
+  });
+
+export const fetchAllPages = async (url, params) => {
+  const rows = [];
+  let cursor = null;
+  let last;
+  do {
+    last = await fetchPage(url, params, cursor);
+    rows.push(...last.data.data);
+    cursor = last.data.next;
+  } while (cursor);
+  return { ...last, data: { ...last.data, data: rows, next: null } };
+};
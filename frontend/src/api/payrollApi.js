@@ -1,8 +1,20 @@
 import axiosInstance from './axiosInstance';
+import { fetchPage } from './pagination';
 
-export const getPayrolls    = (params) => axiosInstance.get('/payroll/', { params });
+export const getPayrolls    = (params, cursor) => fetchPage('/payroll/', params, cursor);
 export const calculatePayroll = (data) => axiosInstance.post('/payroll/calculate/', data);
+export const runPayroll     = (data)  => axiosInstance.post('/payroll/runs/', data);
+export const simulatePayroll = (data) => axiosInstance.post('/payroll/simulate/', data);
 export const getPayroll     = (id)    => axiosInstance.get(`/payroll/${id}/`);
 export const confirmPayroll = (id)    => axiosInstance.post(`/payroll/${id}/confirm/`);
-export const getMyPayrolls   = ()       => axiosInstance.get('/payroll/my/');
+export const confirmPayrollBulk = (data) => axiosInstance.post('/payroll/confirm-bulk/', data);
+export const getMyPayrolls   = (cursor) => fetchPage('/payroll/my/', {}, cursor);
 export const getPayrollLedger = (params) => axiosInstance.get('/payroll/reports/ledger/', { params });
+export const downloadPayrollLedger = (params) =>
+  axiosInstance.get('/payroll/reports/ledger/export/', { params, responseType: 'blob' });
+export const getPayrollVariance = (params) => axiosInstance.get('/payroll/reports/variance/', { params });
+export const getPayrollAnnual = (params) => axiosInstance.get('/payroll/reports/annual/', { params });
+export const downloadPayrollAnnual = (params) =>
+  axiosInstance.get('/payroll/reports/annual/export/', { params, responseType: 'blob' });
+export const downloadBankTransfer = (params) =>
+  axiosInstance.get('/payroll/reports/bank-transfer/', { params, responseType: 'blob' });
@@ -0,0 +1,18 @@
+import { Button } from 'antd';
+
+/**
+ * 커서 목록 '더 보기' 버튼 (다음 페이지가 없으면 렌더링하지 않음)
+ *
+ * Props:
+ *   hasMore  - 다음 페이지 여부
+ *   loading  - 다음 페이지 조회 중 여부
+ *   onClick  - 다음 페이지 조회
+ */
+export default function LoadMoreButton({ hasMore = false, loading = false, onClick }) {
+  if (!hasMore) return null;
+  return (
+    <div style={{ textAlign: 'center', marginTop: 12 }}>
+      <Button onClick={onClick} loading={loading}>더 보기</Button>
+    </div>
+  );
+}
@@ -0,0 +1,31 @@
+import { useMemo } from 'react';
+import { useInfiniteQuery } from '@tanstack/react-query';
+
+/**
+ * 커서 페이지 목록 조회 (첫 페이지만 받고 loadMore로 다음 페이지를 이어 붙임)
+ *
+ * fetchPage(cursor) - api 모듈의 목록 함수 (axios 응답, data.next가 다음 cursor)
+ * 반환: { rows, isLoading, hasMore, loadMore, loadingMore }
+ * queryKey를 invalidate하면 지금까지 받은 페이지를 다시 조회한다.
+ */
+export default function useCursorList(queryKey, fetchPage) {
+  const query = useInfiniteQuery({
+    queryKey,
+    queryFn:          ({ pageParam }) => fetchPage(pageParam).then((res) => res.data),
+    initialPageParam: null,
+    getNextPageParam: (last) => last.next ?? undefined,
+  });
+
+  const rows = useMemo(
+    () => query.data?.pages.flatMap((page) => page.data ?? []) ?? [],
+    [query.data],
+  );
+
+  return {
+    rows,
+    isLoading:   query.isLoading,
+    hasMore:     query.hasNextPage,
+    loadMore:    () => query.fetchNextPage(),
+    loadingMore: query.isFetchingNextPage,
+  };
+}
@@ -1,8 +1,8 @@
 import { useState } from 'react';
 import { useMutation, useQuery, useQueryClient } from '@tanstack/react-query';
-import { Button, Space, Typography, Select, message, Card } from 'antd';
+import { Button, Space, Typography, Select, message, Card, Statistic } from 'antd';
 
-import { checkIn, checkOut, getMonthlyAttendance } from '../api/attendanceApi';
+import { checkIn, checkOut, getMonthlyAttendance, getMonthlySummary } from '../api/attendanceApi';
 import MonthlyCalendar from '../components/MonthlyCalendar';
 
 const { Title } = Typography;
@@ -21,6 +21,13 @@ export default function AttendancePage() {
     select:   (res) => res.data.data,
   });
 
+  // 월 합계는 요약 테이블 1행으로 조회
+  const { data: summary } = useQuery({
+    queryKey: ['attendance-summary', year, month],
+    queryFn:  () => getMonthlySummary(year, month),
+    select:   (res) => res.data.data[0],
+  });
+
   const checkInMutation = useMutation({
     mutationFn: checkIn,
     onSuccess: (res) => {
@@ -38,6 +45,7 @@ export default function AttendancePage() {
     onSuccess: (res) => {
       message.success(res.data.message || '퇴근 처리되었습니다.');
       queryClient.invalidateQueries({ queryKey: ['attendance-monthly'] });
+      queryClient.invalidateQueries({ queryKey: ['attendance-summary'] });
     },
     onError: (err) => {
       const msg = err.response?.data?.message;
@@ -80,6 +88,12 @@ export default function AttendancePage() {
         </Select>
       </Space>
 
+      <Space size="large" style={{ marginBottom: 16, display: 'flex' }}>
+        <Statistic title="근무일수" value={summary?.days_worked ?? 0} suffix="일" />
+        <Statistic title="실근무" value={Math.floor((summary?.work_minutes ?? 0) / 60)} suffix="시간" />
+        <Statistic title="초과근무" value={summary?.overtime_minutes ?? 0} suffix="분" />
+      </Space>
+
       <MonthlyCalendar records={records} year={year} month={month} isLoading={isLoading} />
     </div>
   );
@@ -70,6 +70,11 @@ export default function EmployeeDetailPage() {
           {Number(employee.base_salary).toLocaleString()}원
         </Descriptions.Item>
         <Descriptions.Item label="주민번호">{employee.resident_no || '-'}</Descriptions.Item>
+        <Descriptions.Item label="급여 계좌">
+          {employee.bank_account_no
+            ? `${employee.bank_code} ${employee.bank_account_no} (${employee.account_holder || employee.name})`
+            : '-'}
+        </Descriptions.Item>
         <Descriptions.Item label="등록일">{employee.created_at?.slice(0, 10)}</Descriptions.Item>
         <Descriptions.Item label="최종 수정">{employee.updated_at?.slice(0, 10)}</Descriptions.Item>
       </Descriptions>
@@ -52,8 +52,13 @@ export default function EmployeeFormPage() {
         position:    employee.position?.id,
         hire_date:   employee.hire_date,
         base_salary: Number(employee.base_salary),
+        dependents:  employee.dependents,
         // 주민번호: 마스킹 상태로 표시 (수정 시 재입력 가능)
         resident_no: '',
+        bank_code:       employee.bank_code,
+        account_holder:  employee.account_holder,
+        // 계좌번호도 주민번호와 같이 재입력할 때만 전송
+        bank_account_no: '',
       });
     }
   }, [employee, isEdit, form]);
@@ -82,6 +87,7 @@ export default function EmployeeFormPage() {
   const handleSubmit = (values) => {
     // 빈 주민번호는 전송하지 않음 (수정 시 변경하지 않으려는 경우)
     if (!values.resident_no) delete values.resident_no;
+    if (!values.bank_account_no) delete values.bank_account_no;
     mutation.mutate(values);
   };
 
@@ -183,6 +189,41 @@ export default function EmployeeFormPage() {
           />
         </Form.Item>
 
+        <Form.Item
+          label="공제대상 가족 수"
+          name="dependents"
+          initialValue={1}
+          tooltip="간이세액표 소득세 계산에 사용됩니다 (본인 포함)."
+          rules={[{ type: 'number', min: 1, message: '본인을 포함해 1명 이상이어야 합니다.' }]}
+        >
+          <InputNumber style={{ width: '100%' }} min={1} precision={0} />
+        </Form.Item>
+
+        <Form.Item
+          label="급여 이체 은행코드"
+          name="bank_code"
+          rules={[{ pattern: /^[0-9]{3}$/, message: '숫자 3자리 (예: 004)' }]}
+        >
+          <Input placeholder="004" maxLength={3} />
+        </Form.Item>
+
+        <Form.Item
+          label="계좌번호"
+          name="bank_account_no"
+          rules={[{ pattern: /^[0-9-]{10,20}$/, message: '숫자와 -만 입력 (10~16자리)' }]}
+          extra={
+            isEdit
+              ? `변경하지 않으려면 비워두세요. ${employee?.bank_account_no ? `(현재 ${employee.bank_account_no})` : ''}`
+              : ''
+          }
+        >
+          <Input placeholder="110-123-456789" maxLength={20} />
+        </Form.Item>
+
+        <Form.Item label="예금주" name="account_holder" extra="비워두면 직원 이름으로 이체합니다.">
+          <Input maxLength={50} />
+        </Form.Item>
+
         <Form.Item>
           <Button
             type="primary"
@@ -6,6 +6,8 @@ import { useNavigate } from 'react-router-dom';
 import { getEmployees, getDepartments } from '../api/employeeApi';
 import EmployeeTable     from '../components/EmployeeTable';
 import EmployeeSearchBar from '../components/EmployeeSearchBar';
+import LoadMoreButton    from '../components/LoadMoreButton';
+import useCursorList     from '../hooks/useCursorList';
 
 const { Title } = Typography;
 
@@ -13,12 +15,10 @@ export default function EmployeeListPage() {
   const navigate = useNavigate();
   const [queryParams, setQueryParams] = useState({});
 
-  const { data: empRes, isLoading: empLoading } = useQuery({
-    queryKey: ['employees', queryParams],
-    queryFn:  () => getEmployees(queryParams),
-    select:   (res) => res.data.data,
-    onError:  () => message.error('직원 목록 조회에 실패했습니다.'),
-  });
+  const employees = useCursorList(
+    ['employees', queryParams],
+    (cursor) => getEmployees(queryParams, cursor),
+  );
 
   const { data: deptRes } = useQuery({
     queryKey: ['departments'],
@@ -42,8 +42,13 @@ export default function EmployeeListPage() {
       />
 
       <EmployeeTable
-        data={empRes ?? []}
-        loading={empLoading}
+        data={employees.rows}
+        loading={employees.isLoading}
+      />
+      <LoadMoreButton
+        hasMore={employees.hasMore}
+        loading={employees.loadingMore}
+        onClick={employees.loadMore}
       />
     </div>
   );
@@ -1,9 +1,11 @@
 import { useState } from 'react';
-import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
+import { useMutation, useQueryClient } from '@tanstack/react-query';
 import { Table, Select, Typography, Space, Button, message, Popconfirm } from 'antd';
 
 import { getLeaves, approveLeave } from '../api/attendanceApi';
 import LeaveStatusBadge from '../components/LeaveStatusBadge';
+import LoadMoreButton   from '../components/LoadMoreButton';
+import useCursorList    from '../hooks/useCursorList';
 
 const { Title } = Typography;
 const { Option } = Select;
@@ -15,11 +17,11 @@ export default function MyAttendancePage() {
   const [filter, setFilter] = useState('ALL');
   const queryClient = useQueryClient();
 
-  const { data: leaves = [], isLoading } = useQuery({
-    queryKey: ['leaves'],
-    queryFn:  () => getLeaves(),
-    select:   (res) => res.data.data,
-  });
+  // 상태 필터는 서버에서 적용한다 (받은 페이지만 거르면 아직 받지 않은 신청이 빠짐)
+  const leaves = useCursorList(
+    ['leaves', filter],
+    (cursor) => getLeaves(filter === 'ALL' ? {} : { status: filter }, cursor),
+  );
 
   const approveMutation = useMutation({
     mutationFn: ({ id, action, reject_reason }) =>
@@ -34,10 +36,6 @@ export default function MyAttendancePage() {
     },
   });
 
-  const filtered = filter === 'ALL'
-    ? leaves
-    : leaves.filter((l) => l.status === filter);
-
   const columns = [
     { title: '직원명', dataIndex: 'employee_name', key: 'employee_name' },
     { title: '종류',   dataIndex: 'leave_type_display', key: 'leave_type_display' },
@@ -92,12 +90,13 @@ export default function MyAttendancePage() {
 
       <Table
         columns={columns}
-        dataSource={filtered}
+        dataSource={leaves.rows}
         rowKey="id"
-        loading={isLoading}
+        loading={leaves.isLoading}
         size="small"
         locale={{ emptyText: '휴가 신청 내역이 없습니다.' }}
       />
+      <LoadMoreButton hasMore={leaves.hasMore} loading={leaves.loadingMore} onClick={leaves.loadMore} />
     </div>
   );
 }
@@ -1,9 +1,10 @@
-import { useQuery } from '@tanstack/react-query';
 import { Table, Typography } from 'antd';
 import { useNavigate } from 'react-router-dom';
 
 import { getMyPayrolls } from '../api/payrollApi';
 import PayrollStatusBadge from '../components/PayrollStatusBadge';
+import LoadMoreButton     from '../components/LoadMoreButton';
+import useCursorList      from '../hooks/useCursorList';
 
 const { Title } = Typography;
 
@@ -12,11 +13,7 @@ const fmt = (v) => Number(v).toLocaleString('ko-KR') + '원';
 export default function MyPayrollPage() {
   const navigate = useNavigate();
 
-  const { data: records = [], isLoading } = useQuery({
-    queryKey: ['my-payrolls'],
-    queryFn:  getMyPayrolls,
-    select:   (res) => res.data.data,
-  });
+  const records = useCursorList(['my-payrolls'], getMyPayrolls);
 
   const columns = [
     { title: '연도', dataIndex: 'year',  key: 'year' },
@@ -44,12 +41,13 @@ export default function MyPayrollPage() {
       <Title level={3}>내 급여 내역</Title>
       <Table
         columns={columns}
-        dataSource={records}
+        dataSource={records.rows}
         rowKey="id"
-        loading={isLoading}
+        loading={records.isLoading}
         size="small"
         locale={{ emptyText: '급여 내역이 없습니다.' }}
       />
+      <LoadMoreButton hasMore={records.hasMore} loading={records.loadingMore} onClick={records.loadMore} />
     </div>
   );
 }
@@ -0,0 +1,104 @@
+import { useState } from 'react';
+import { useQuery } from '@tanstack/react-query';
+import {
+  Button, Select, Space, Table, Typography, Descriptions, message,
+} from 'antd';
+
+import { getPayrollAnnual, downloadPayrollAnnual } from '../api/payrollApi';
+
+const { Title } = Typography;
+const { Option } = Select;
+
+const now = new Date();
+
+// ── 숫자 포맷 (천단위 콤마) ──────────────────────────────────────────
+const fmt = (v) => (v != null ? Number(v).toLocaleString('ko-KR') : '0');
+
+const money = (title, key) => ({
+  title, key, align: 'right', render: (_, row) => fmt(row.totals[key]),
+});
+
+// ── 부서 소계 컬럼 (직원별 누계는 CSV로 내려받는다) ──────────────────
+const COLUMNS = [
+  { title: '부서', dataIndex: 'name',  key: 'name' },
+  { title: '인원', dataIndex: 'count', key: 'count', align: 'right', render: (v) => `${v}명` },
+  money('기본급',       'base_salary'),
+  money('초과근무수당', 'overtime_pay'),
+  money('총지급액',     'gross_pay'),
+  money('국민연금',     'national_pension'),
+  money('건강보험',     'health_insurance'),
+  money('고용보험',     'employment_insurance'),
+  money('소득세',       'income_tax'),
+  money('지방소득세',   'local_income_tax'),
+  money('총공제액',     'total_deduction'),
+  money('실수령액',     'net_pay'),
+];
+
+// ── 메인 페이지 ──────────────────────────────────────────────────────
+export default function PayrollAnnualPage() {
+  const [year,  setYear]  = useState(now.getFullYear());
+  const [query, setQuery] = useState(now.getFullYear());
+
+  const { data: report, isFetching } = useQuery({
+    queryKey: ['payroll-annual', query],
+    queryFn:  () => getPayrollAnnual({ year: query, detail: false }),
+    select:   (res) => res.data.data,
+    onError:  () => message.error('연간 급여 리포트 조회에 실패했습니다.'),
+  });
+
+  const handleDownload = async () => {
+    try {
+      const res = await downloadPayrollAnnual({ year: query });
+      const url = URL.createObjectURL(res.data);
+      const a = document.createElement('a');
+      a.href = url;
+      a.download = `연간급여_${query}년.csv`;
+      a.click();
+      URL.revokeObjectURL(url);
+    } catch {
+      message.error('연간 급여 파일 다운로드에 실패했습니다.');
+    }
+  };
+
+  const years = [now.getFullYear() - 2, now.getFullYear() - 1, now.getFullYear()];
+
+  return (
+    <div style={{ padding: 24 }}>
+      <Title level={3}>연간 급여 리포트 (확정 급여 기준)</Title>
+
+      <Space style={{ marginBottom: 24 }} wrap>
+        <Select value={year} onChange={setYear} style={{ width: 100 }}>
+          {years.map((y) => <Option key={y} value={y}>{y}년</Option>)}
+        </Select>
+        <Button type="primary" onClick={() => setQuery(year)} loading={isFetching}>
+          조회
+        </Button>
+        <Button onClick={handleDownload} disabled={!report || report.total_count === 0}>
+          직원별 CSV 다운로드
+        </Button>
+      </Space>
+
+      {report && (
+        <>
+          <Descriptions bordered size="small" column={4} style={{ marginBottom: 20 }}>
+            <Descriptions.Item label="인원">{report.total_count}명</Descriptions.Item>
+            <Descriptions.Item label="총 지급액">{fmt(report.totals.gross_pay)}원</Descriptions.Item>
+            <Descriptions.Item label="총 공제액">{fmt(report.totals.total_deduction)}원</Descriptions.Item>
+            <Descriptions.Item label="총 실수령액">
+              <strong style={{ color: '#1677ff' }}>{fmt(report.totals.net_pay)}원</strong>
+            </Descriptions.Item>
+          </Descriptions>
+
+          <Table
+            columns={COLUMNS}
+            dataSource={report.departments}
+            rowKey="department_id"
+            pagination={false}
+            size="small"
+            scroll={{ x: 'max-content' }}
+          />
+        </>
+      )}
+    </div>
+  );
+}
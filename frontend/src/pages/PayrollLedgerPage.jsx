@@ -2,10 +2,11 @@ import { useRef, useState } from 'react';
 import { useQuery } from '@tanstack/react-query';
 import { useReactToPrint } from 'react-to-print';
 import {
-  Button, Select, Space, Table, Typography, Descriptions, message,
+  Button, Select, Space, Table, Typography, Descriptions, Progress, message,
 } from 'antd';
 
 import { getPayrollLedger } from '../api/payrollApi';
+import { runJob, saveJobResult } from '../api/jobApi';
 
 const { Title, Text } = Typography;
 const { Option } = Select;
@@ -149,6 +150,7 @@ export default function PayrollLedgerPage() {
   const [year,   setYear]   = useState(now.getFullYear());
   const [month,  setMonth]  = useState(now.getMonth() + 1);
   const [params, setParams] = useState({ year: now.getFullYear(), month: now.getMonth() + 1 });
+  const [exportJob, setExportJob] = useState(null);
 
   const { data: ledger, isLoading, isFetching } = useQuery({
     queryKey: ['payroll-ledger', params.year, params.month],
@@ -163,6 +165,19 @@ export default function PayrollLedgerPage() {
     pageStyle:     PAGE_STYLE,
   });
 
+  // CSV/XLSX 파일은 백그라운드 작업으로 만들고 진행률을 표시한 뒤 내려받는다
+  const handleDownload = async (format) => {
+    try {
+      const job = await runJob('ledger_export', { ...params, format }, setExportJob);
+      await saveJobResult(job, `급여대장_${params.year}년_${params.month}월.${format}`);
+    } catch (e) {
+      const msg = e.response?.data?.message ?? e.message;
+      message.error(typeof msg === 'string' ? msg : '급여대장 파일 다운로드에 실패했습니다.');
+    } finally {
+      setExportJob(null);
+    }
+  };
+
   const years  = [now.getFullYear() - 1, now.getFullYear()];
   const months = Array.from({ length: 12 }, (_, i) => i + 1);
 
@@ -194,6 +209,20 @@ export default function PayrollLedgerPage() {
         >
           PDF 출력
         </Button>
+        <Button onClick={() => handleDownload('xlsx')} disabled={!hasDepts || !!exportJob}>
+          Excel 다운로드
+        </Button>
+        <Button onClick={() => handleDownload('csv')} disabled={!hasDepts || !!exportJob}>
+          CSV 다운로드
+        </Button>
+        {exportJob && (
+          <Space>
+            <Progress type="circle" size={28} percent={exportJob.progress} />
+            <Text type="secondary">
+              {exportJob.state === 'QUEUED' ? '대기 중' : exportJob.progress_message || '파일 생성 중'}
+            </Text>
+          </Space>
+        )}
       </Space>
 
       {/* ── 프린트 대상 영역 ── */}
@@ -243,7 +272,7 @@ export default function PayrollLedgerPage() {
               </div>
             ) : (
               ledger.departments.map((dept) => (
-                <DeptTable key={dept.name} dept={dept} />
+                <DeptTable key={dept.department_id} dept={dept} />
               ))
             )}
 
@@ -1,13 +1,19 @@
 import { useState } from 'react';
 import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
-import { Table, Select, Typography, Space, Button, InputNumber, message, Popconfirm } from 'antd';
+import { Table, Select, Typography, Space, Button, InputNumber, message, Popconfirm, Modal, Tag, Progress } from 'antd';
 import { useNavigate } from 'react-router-dom';
 
-import { getPayrolls, calculatePayroll, confirmPayroll } from '../api/payrollApi';
-import { getEmployees } from '../api/employeeApi';
+import {
+  getPayrolls, calculatePayroll, confirmPayroll, confirmPayrollBulk, getPayrollVariance,
+  downloadBankTransfer,
+} from '../api/payrollApi';
+import { getAllEmployees } from '../api/employeeApi';
+import { runJob, saveJobResult } from '../api/jobApi';
 import PayrollStatusBadge from '../components/PayrollStatusBadge';
+import LoadMoreButton     from '../components/LoadMoreButton';
+import useCursorList      from '../hooks/useCursorList';
 
-const { Title } = Typography;
+const { Title, Text } = Typography;
 const { Option } = Select;
 
 const now = new Date();
@@ -18,19 +24,29 @@ export default function PayrollListPage() {
   const [year,  setYear]       = useState(now.getFullYear());
   const [month, setMonth]      = useState(now.getMonth() + 1);
   const [calcEmpId, setCalcEmpId] = useState(null);
+  const [varianceOpen, setVarianceOpen] = useState(false);
+  const [runningJob, setRunningJob] = useState(null);
 
-  const { data: records = [], isLoading } = useQuery({
-    queryKey: ['payrolls', year, month],
-    queryFn:  () => getPayrolls({ year, month }),
-    select:   (res) => res.data.data,
-  });
+  const records = useCursorList(
+    ['payrolls', year, month],
+    (cursor) => getPayrolls({ year, month }, cursor),
+  );
 
+  // 급여 계산 직원 선택 목록은 재직자 전체가 필요하다
   const { data: employees = [] } = useQuery({
     queryKey: ['employees-all'],
-    queryFn:  () => getEmployees({ is_active: true }),
+    queryFn:  () => getAllEmployees({ is_active: true }),
     select:   (res) => res.data.data ?? [],
   });
 
+  // 확정 전 점검: 전월 대비 임계값 이상 변동 직원
+  const { data: variance, isFetching: varianceLoading } = useQuery({
+    queryKey: ['payroll-variance', year, month],
+    queryFn:  () => getPayrollVariance({ year, month }),
+    select:   (res) => res.data.data,
+    enabled:  varianceOpen,
+  });
+
   const calcMutation = useMutation({
     mutationFn: (data) => calculatePayroll(data),
     onSuccess: (res) => {
@@ -55,6 +71,73 @@ export default function PayrollListPage() {
     },
   });
 
+  const confirmBulkMutation = useMutation({
+    mutationFn: (data) => confirmPayrollBulk(data),
+    onSuccess: (res) => {
+      message.success(res.data.message || '급여가 일괄 확정되었습니다.');
+      queryClient.invalidateQueries({ queryKey: ['payrolls'] });
+    },
+    onError: (err) => {
+      const msg = err.response?.data?.message;
+      message.error(typeof msg === 'string' ? msg : '급여 일괄 확정 중 오류가 발생했습니다.');
+    },
+  });
+
+  // 근태 정정 후 DRAFT 급여 재계산 (확정 급여는 건너뜀)
+  // 전 직원 대상이라 오래 걸리므로 백그라운드 작업으로 실행하고 부서 단위 진행률을 표시한다
+  const recalcMutation = useMutation({
+    mutationFn: (data) => runJob('payroll_run', { ...data, recalculate: true }, setRunningJob),
+    onSuccess: (job) => {
+      const r = job.result;
+      message.success(
+        `${r.year}년 ${r.month}월 급여 재계산 완료: 생성 ${r.created}건, 변경 ${r.updated}건, `
+        + `변경 없음 ${r.unchanged}건, 건너뜀 ${r.skipped}건, 오류 ${r.errors}건`,
+      );
+      queryClient.invalidateQueries({ queryKey: ['payrolls'] });
+    },
+    onError: (err) => {
+      const msg = err.response?.data?.message ?? err.message;
+      message.error(typeof msg === 'string' ? msg : '급여 재계산 중 오류가 발생했습니다.');
+    },
+    onSettled: () => setRunningJob(null),
+  });
+
+  // 확정 급여 대량이체 파일 (관리자). 오류 응답도 blob이므로 JSON으로 풀어 메시지를 보여준다
+  const handleBankTransfer = async (format) => {
+    try {
+      const res = await downloadBankTransfer({ year, month, format });
+      const url = URL.createObjectURL(res.data);
+      const a = document.createElement('a');
+      a.href = url;
+      a.download = `급여이체_${year}년_${month}월.${format === 'csv' ? 'csv' : 'txt'}`;
+      a.click();
+      URL.revokeObjectURL(url);
+    } catch (err) {
+      let msg;
+      try {
+        msg = JSON.parse(await err.response.data.text()).message;
+      } catch {
+        msg = null;
+      }
+      message.error(msg || '이체 파일 다운로드에 실패했습니다.');
+    }
+  };
+
+  // 확정 급여명세서 PDF 일괄 생성 (백그라운드 작업 → ZIP 다운로드)
+  const payslipMutation = useMutation({
+    mutationFn: async (data) => {
+      const job = await runJob('payslip_batch', data, setRunningJob);
+      await saveJobResult(job, `급여명세서_${data.year}년_${data.month}월.zip`);
+      return job;
+    },
+    onSuccess: (job) => message.success(`급여명세서 ${job.result.count}건을 내려받았습니다.`),
+    onError: (err) => {
+      const msg = err.response?.data?.message ?? err.message;
+      message.error(typeof msg === 'string' ? msg : '급여명세서 생성 중 오류가 발생했습니다.');
+    },
+    onSettled: () => setRunningJob(null),
+  });
+
   const handleCalculate = () => {
     if (!calcEmpId) {
       message.warning('직원을 선택해주세요.');
@@ -98,6 +181,24 @@ export default function PayrollListPage() {
     },
   ];
 
+  const deltaText = (v, unit = '원') =>
+    v == null ? '-' : `${Number(v) > 0 ? '+' : ''}${Number(v).toLocaleString('ko-KR')}${unit}`;
+
+  const varianceColumns = [
+    { title: '사번',   dataIndex: 'employee_no',     key: 'employee_no' },
+    { title: '직원명', dataIndex: 'employee_name',   key: 'employee_name' },
+    { title: '부서',   dataIndex: 'department_name', key: 'department_name' },
+    {
+      title: '총지급 변동', key: 'gross', align: 'right',
+      render: (_, r) => (r.is_new ? <Tag color="blue">전월 없음</Tag> : deltaText(r.delta.gross_pay)),
+    },
+    { title: '실수령 변동', key: 'net', align: 'right', render: (_, r) => deltaText(r.delta?.net_pay) },
+    {
+      title: '초과근무 변동', key: 'overtime', align: 'right',
+      render: (_, r) => deltaText(r.delta?.overtime_minutes, '분'),
+    },
+  ];
+
   const years  = [now.getFullYear() - 1, now.getFullYear()];
   const months = Array.from({ length: 12 }, (_, i) => i + 1);
 
@@ -112,6 +213,40 @@ export default function PayrollListPage() {
         <Select value={month} onChange={setMonth} style={{ width: 80 }}>
           {months.map((m) => <Option key={m} value={m}>{m}월</Option>)}
         </Select>
+        <Popconfirm
+          title={`${year}년 ${month}월 DRAFT 급여를 모두 확정하시겠습니까?`}
+          onConfirm={() => confirmBulkMutation.mutate({ year, month })}
+          okText="확정"
+          cancelText="취소"
+        >
+          <Button loading={confirmBulkMutation.isPending}>월 일괄 확정</Button>
+        </Popconfirm>
+        <Popconfirm
+          title={`${year}년 ${month}월 DRAFT 급여를 다시 계산하시겠습니까?`}
+          onConfirm={() => recalcMutation.mutate({ year, month })}
+          okText="재계산"
+          cancelText="취소"
+        >
+          <Button loading={recalcMutation.isPending} disabled={payslipMutation.isPending}>월 재계산</Button>
+        </Popconfirm>
+        {runningJob && (
+          <Space>
+            <Progress percent={runningJob.progress} size="small" style={{ width: 120 }} />
+            <Text type="secondary">
+              {runningJob.state === 'QUEUED' ? '대기 중' : runningJob.progress_message}
+            </Text>
+          </Space>
+        )}
+        <Button onClick={() => setVarianceOpen(true)}>전월 대비 변동</Button>
+        <Button
+          loading={payslipMutation.isPending}
+          disabled={recalcMutation.isPending}
+          onClick={() => payslipMutation.mutate({ year, month })}
+        >
+          명세서 일괄 PDF
+        </Button>
+        <Button onClick={() => handleBankTransfer('fixed')}>이체 파일</Button>
+        <Button onClick={() => handleBankTransfer('csv')}>이체 파일(CSV)</Button>
       </Space>
 
       <Space style={{ marginBottom: 16 }} wrap>
@@ -138,12 +273,32 @@ export default function PayrollListPage() {
 
       <Table
         columns={columns}
-        dataSource={records}
+        dataSource={records.rows}
         rowKey="id"
-        loading={isLoading}
+        loading={records.isLoading}
         size="small"
         locale={{ emptyText: '급여 내역이 없습니다.' }}
       />
+      <LoadMoreButton hasMore={records.hasMore} loading={records.loadingMore} onClick={records.loadMore} />
+
+      <Modal
+        title={`${year}년 ${month}월 전월 대비 변동`}
+        open={varianceOpen}
+        onCancel={() => setVarianceOpen(false)}
+        footer={null}
+        width={900}
+      >
+        <Table
+          columns={varianceColumns}
+          dataSource={variance?.rows ?? []}
+          rowKey="id"
+          loading={varianceLoading}
+          size="small"
+          pagination={false}
+          scroll={{ y: 480 }}
+          locale={{ emptyText: '임계값 이상 변동이 없습니다.' }}
+        />
+      </Modal>
     </div>
   );
 }
@@ -3,15 +3,19 @@ echo ============================================================
 echo  인사보수시스템 전체 시작
 echo  Backend : http://localhost:8000
 echo  Frontend: http://localhost:3000
+echo  Worker  : 백그라운드 작업 실행기 (run_jobs)
 echo ============================================================
 
 echo.
-echo [1/2] Backend 서버 시작...
-start "HR-Backend" cmd /k "call %~dp0start_backend.bat"
+echo [1/3] Backend 서버 시작...
+start "HR-Backend" cmd /k "call %~dp0start_backend.bat --no-worker"
 
 timeout /t 3 /nobreak > nul
 
-echo [2/2] Frontend 서버 시작...
+echo [2/3] 작업 실행기 시작...
+start "HR-Worker" cmd /k "call %~dp0start_worker.bat"
+
+echo [3/3] Frontend 서버 시작...
 start "HR-Frontend" cmd /k "call %~dp0start_frontend.bat"
 
 echo.
@@ -15,6 +15,14 @@ echo.
 echo 정적 파일 수집 중...
 python manage.py collectstatic --noinput
 
+echo.
+:: 화면의 재계산·내보내기는 작업 실행기가 처리한다. start_all.bat·서비스 등록처럼
+:: 실행기를 따로 띄우는 경우에는 --no-worker로 호출한다.
+if /i not "%~1"=="--no-worker" (
+    echo 작업 실행기 시작...
+    start "HR-Worker" cmd /k "call %~dp0start_worker.bat"
+)
+
 echo.
 echo waitress 서버 실행 중 (port 8000)...
 waitress-serve --host=0.0.0.0 --port=8000 --threads=4 config.wsgi:application
@@ -0,0 +1,15 @@
+@echo off
+echo ============================================================
+echo  [Worker] 인사보수시스템 — 백그라운드 작업 실행기 시작
+echo  급여 일괄 계산·재계산, 급여대장 CSV/XLSX 내보내기, 명세서 일괄 생성 등
+echo ============================================================
+
+cd /d %~dp0..
+
+call .venv\Scripts\activate.bat
+
+echo.
+echo 작업 실행기 실행 중 (manage.py run_jobs)...
+python manage.py run_jobs
+
+pause